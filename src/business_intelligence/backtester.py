@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Backtester Module"""
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from src.business_intelligence.forecast_engine import ForecastEngine
+
+# ForecastEngine training method per model type
+TRAIN_METHODS = {
+    'arima': 'train_arima_model',
+    'sarima': 'train_sarima_model',
+    'linear': 'train_linear_regression',
+    'fast': 'train_fast_model'
+}
+
+METRICS = ('mse', 'rmse', 'mae', 'mape', 'smape')
+
+
+def forecast_metrics(y_true, y_pred):
+    """
+    Calculate forecast accuracy metrics
+
+    Parameters:
+    -----------
+    y_true : array-like
+        Actual values
+    y_pred : array-like
+        Forecasted values
+
+    Returns:
+    --------
+    dict
+        MSE, RMSE, MAE, MAPE and sMAPE (percentages); MAPE ignores zero
+        actuals and sMAPE pairs where both values are zero
+    """
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    errors = y_true - y_pred
+    abs_errors = np.abs(errors)
+    mse = np.mean(errors ** 2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ape = np.where(y_true != 0, abs_errors / np.abs(y_true), np.nan)
+        denominator = np.abs(y_true) + np.abs(y_pred)
+        sape = np.where(denominator != 0, 2 * abs_errors / denominator, np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return {
+            'mse': mse,
+            'rmse': np.sqrt(mse),
+            'mae': np.mean(abs_errors),
+            'mape': 100 * np.nanmean(ape),
+            'smape': 100 * np.nanmean(sape)
+        }
+
+
+def _train(engine, name, spec, horizon):
+    """Train the model described by spec on column name"""
+    params = dict(spec)
+    model_type = params.pop('type')
+    if model_type not in TRAIN_METHODS:
+        raise ValueError(f"Unsupported model type: {model_type}")
+
+    if model_type == 'fast':
+        params.setdefault('columns', name)
+    else:
+        params.setdefault('column', name)
+    if model_type == 'linear' and params.get('strategy') == 'direct':
+        params.setdefault('horizon', horizon)
+
+    getattr(engine, TRAIN_METHODS[model_type])(**params)
+
+
+def _backtest_series(series, model_name, spec, cutoffs, horizon, refit_every):
+    """
+    Run all folds of one model on one series
+
+    The model is trained at the first cutoff only; later folds update the
+    fitted model with the observations up to their cutoff, so models that
+    support incremental updates are not re-estimated from scratch.
+    """
+    name = series.name
+    engine = None
+    records = []
+
+    for fold, cutoff in enumerate(cutoffs):
+        record = {
+            'series': name,
+            'model': model_name,
+            'fold': fold,
+            'cutoff': series.index[cutoff - 1],
+            'train_size': cutoff,
+            'refit': True,
+            'time': np.nan,
+            'error': None
+        }
+        record.update(dict.fromkeys(METRICS, np.nan))
+        start_time = time.perf_counter()
+
+        try:
+            history = series.iloc[:cutoff].to_frame()
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                if engine is None:
+                    engine = ForecastEngine(history, refit_every=refit_every)
+                    _train(engine, name, spec, horizon)
+                else:
+                    record['refit'] = engine.update(history)['refit']
+
+                forecast = engine.forecast_future(steps=horizon, column=name)
+            record.update(forecast_metrics(series.iloc[cutoff:cutoff + horizon], forecast))
+        except Exception as e:
+            # A failing fold must not abort an overnight run; refit from scratch next time
+            record['error'] = str(e)
+            engine = None
+
+        record['time'] = time.perf_counter() - start_time
+        records.append(record)
+
+    return records
+
+
+class Backtester:
+    def __init__(self, horizon=12, n_folds=5, step=None, initial=None, refit_every=None, n_jobs=None):
+        if horizon < 1 or n_folds < 1:
+            raise ValueError("Horizon and number of folds must be positive")
+
+        self.horizon = horizon
+        self.n_folds = n_folds
+        self.step = step if step is not None else horizon
+        self.initial = initial
+        self.refit_every = refit_every
+        self.n_jobs = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+
+    def cutoffs(self, n_obs):
+        """
+        Compute the rolling forecast origins
+
+        Parameters:
+        -----------
+        n_obs : int
+            Length of the series
+
+        Returns:
+        --------
+        list
+            Training sizes of the folds in ascending order; the last fold
+            ends with the series
+        """
+        last = n_obs - self.horizon
+        initial = self.initial if self.initial is not None else 2 * self.horizon
+        cutoffs = [last - i * self.step for i in reversed(range(self.n_folds))]
+        cutoffs = [c for c in cutoffs if c >= initial]
+        if not cutoffs:
+            raise ValueError(f"Series of {n_obs} observations is too short for backtesting")
+        return cutoffs
+
+    def run(self, data, models, columns=None):
+        """
+        Run rolling-origin cross-validation
+
+        Each (series, model) pair is one task; tasks run in a process pool
+        and the folds of a task run in order so fitted state carries over.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or pd.Series
+            Series to backtest, one per column, indexed by date
+        models : dict
+            Model specifications by name, e.g. {'ets': {'type': 'fast',
+            'method': 'holt_winters', 'season_length': 12}}; the other keys
+            are passed to the ForecastEngine training method
+        columns : list
+            Columns to backtest (if None, use all numeric columns)
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per series, model and fold with the forecast metrics
+        """
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+
+        cutoffs = self.cutoffs(len(data))
+        tasks = [(data[column], model_name, spec) for column in columns for model_name, spec in models.items()]
+
+        if self.n_jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(tasks))) as executor:
+                futures = [
+                    executor.submit(_backtest_series, series, model_name, spec, cutoffs, self.horizon,
+                                    self.refit_every)
+                    for series, model_name, spec in tasks
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                _backtest_series(series, model_name, spec, cutoffs, self.horizon, self.refit_every)
+                for series, model_name, spec in tasks
+            ]
+
+        return pd.DataFrame([record for records in results for record in records])
+
+    @staticmethod
+    def summarize(results, metric='rmse'):
+        """
+        Average the fold metrics and pick the best model per series
+
+        Parameters:
+        -----------
+        results : pd.DataFrame
+            Output of run
+        metric : str
+            Metric used to rank the models
+
+        Returns:
+        --------
+        pd.DataFrame
+            Mean metrics per series and model, with a 'best' flag
+        """
+        aggregations = {metric_name: (metric_name, 'mean') for metric_name in METRICS}
+        aggregations['failed_folds'] = ('failed', 'sum')
+        summary = (results.assign(failed=results['error'].notna())
+                   .groupby(['series', 'model']).agg(**aggregations).reset_index())
+        best = summary.groupby('series')[metric].transform('min')
+        summary['best'] = summary[metric] == best
+        return summary
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Batch Trend Analyzer Module"""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from src.business_intelligence.trend_analyzer import (
+    TrendAnalyzer, DEFAULT_CONFIG, MAD_WINDOWS, robust_scale, rolling_median_window
+)
+from src.utils.ingestion import load_frame
+from src.utils.memory_budget import active_budget, estimate_bytes
+
+# Per-series columns of the summary, filled with NaN for skipped analyses
+SUMMARY_COLUMNS = ('n_obs', 'mean', 'std', 'n_outliers', 'period', 'trend_strength', 'seasonal_strength',
+                   'test_statistic', 'p_value', 'lags', 'is_stationary', 'kpss_statistic', 'kpss_p_value',
+                   'conclusion', 'n_change_points', 'error')
+
+# Per-observation columns computed by the per-series analyses
+SERIES_COLUMNS = ('trend', 'seasonal', 'resid', 'segment', 'outlier')
+
+# Outlier methods that need the per-series decomposition
+SERIES_OUTLIER_METHODS = ('seasonal',)
+
+# Chunks per worker process, so slow series do not leave workers idle
+CHUNKS_PER_WORKER = 4
+
+
+def _strength(component, resid):
+    """Strength of a decomposition component relative to the residuals (0 to 1)"""
+    mask = np.isfinite(component) & np.isfinite(resid)
+    total = np.var(component[mask] + resid[mask])
+    if total == 0:
+        return np.nan
+    return max(0.0, 1.0 - np.var(resid[mask]) / total)
+
+
+def _analyze_chunk(chunk, config):
+    """
+    Run the per-series analyses (decomposition, ADF test, change points,
+    seasonal outliers) on a chunk of series
+
+    Parameters:
+    -----------
+    chunk : list
+        (start, dates, values) tuples; start is the position of the series
+        in the sorted batch
+    config : dict
+        Analysis configuration
+
+    Returns:
+    --------
+    list
+        (start, stats, columns) tuples; columns maps SERIES_COLUMNS names
+        to arrays aligned to dates
+    """
+    series_outliers = config['detect_outliers'] and config['outlier_method'] in SERIES_OUTLIER_METHODS
+    series_config = dict(config, moving_average=False, exponential_smoothing=False, detect_outliers=series_outliers)
+    results = []
+
+    for start, dates, values in chunk:
+        stats = {}
+        columns = {}
+        analyzer = TrendAnalyzer(pd.DataFrame({'value': values}, index=pd.DatetimeIndex(dates)), use_cache=False)
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                analysis = analyzer.analyze(config=series_config)
+        except Exception as e:
+            # One short or constant series must not abort the batch
+            stats['error'] = str(e)
+            results.append((start, stats, columns))
+            continue
+
+        if 'decomposition' in analysis:
+            decomposition = analysis['decomposition']
+            # Regularized series may have extra dates; align back to the observations
+            for name in ('trend', 'seasonal', 'resid'):
+                columns[name] = decomposition[name].reindex(analyzer.data.index).to_numpy()
+            trend, seasonal, resid = (decomposition[name].to_numpy() for name in ('trend', 'seasonal', 'resid'))
+            stats.update({
+                'period': decomposition['period'],
+                'trend_strength': _strength(trend, resid),
+                'seasonal_strength': _strength(seasonal, resid)
+            })
+
+        if 'stationarity' in analysis:
+            stationarity = analysis['stationarity']
+            stats.update({name: stationarity[name] for name in ('test_statistic', 'p_value', 'lags', 'is_stationary')})
+            if 'kpss' in stationarity:
+                stats.update({
+                    'kpss_statistic': stationarity['kpss']['test_statistic'],
+                    'kpss_p_value': stationarity['kpss']['p_value'],
+                    'conclusion': stationarity['conclusion']
+                })
+
+        if 'change_points' in analysis:
+            change_points = np.asarray(analysis['change_points']['change_points'], dtype=dates.dtype)
+            stats['n_change_points'] = len(change_points)
+            columns['segment'] = np.searchsorted(change_points, dates, side='right').astype(float)
+
+        if 'outliers' in analysis:
+            columns['outlier'] = analysis['outliers'].to_numpy()
+
+        results.append((start, stats, columns))
+
+    return results
+
+
+class BatchTrendAnalyzer:
+    def __init__(self, config=None, n_jobs=None):
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self.n_jobs = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+
+    def _observation_features(self, grouped, keys, values):
+        """Compute the rolling, EWM and outlier features of all series at once"""
+        config = self.config
+        features = {}
+
+        # Grouped window operations run over all series in one pass; the data is
+        # sorted by key, so results come back in row order
+        if config['moving_average']:
+            features['moving_average'] = grouped.rolling(window=config['ma_window']).mean().to_numpy()
+        if config['exponential_smoothing']:
+            features['exponential_smoothing'] = grouped.ewm(alpha=config['es_alpha']).mean().to_numpy()
+
+        if config['detect_outliers']:
+            threshold = config['outlier_threshold']
+            if config['outlier_method'] == 'zscore':
+                zscore = (values - grouped.transform('mean')) / grouped.transform('std')
+                features['zscore'] = zscore.to_numpy()
+                features['outlier'] = (zscore.abs() > threshold).to_numpy()
+            elif config['outlier_method'] == 'iqr':
+                q1 = grouped.transform('quantile', 0.25)
+                q3 = grouped.transform('quantile', 0.75)
+                iqr = q3 - q1
+                features['outlier'] = ((values < q1 - threshold * iqr) | (values > q3 + threshold * iqr)).to_numpy()
+            elif config['outlier_method'] == 'rolling_mad':
+                window = config['outlier_window']
+                median = grouped.rolling(**rolling_median_window(window)).median().to_numpy()
+                deviation = (values - median).abs()
+                scale = robust_scale(deviation.groupby(keys, sort=False)
+                                     .rolling(**rolling_median_window(MAD_WINDOWS * window)))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    features['outlier'] = (deviation.to_numpy() / scale.to_numpy()) > threshold
+            elif config['outlier_method'] not in SERIES_OUTLIER_METHODS:
+                raise ValueError(f"Unsupported method: {config['outlier_method']}")
+
+        return features
+
+    def _series_analyses(self, dates, values, starts, ends):
+        """Run the per-series analyses, in a process pool if n_jobs > 1"""
+        items = [(start, dates[start:end], values[start:end]) for start, end in zip(starts, ends)]
+
+        n_chunks = min(len(items), max(1, self.n_jobs * CHUNKS_PER_WORKER))
+        if self.n_jobs > 1 and n_chunks > 1:
+            chunks = [items[i::n_chunks] for i in range(n_chunks)]
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, n_chunks)) as executor:
+                results = list(executor.map(_analyze_chunk, chunks, [self.config] * n_chunks))
+        else:
+            results = [_analyze_chunk(items, self.config)]
+
+        return {start: (stats, columns) for chunk_results in results for start, stats, columns in chunk_results}
+
+    def run(self, data, key_col, date_col, value_col):
+        """
+        Analyze the trends of many series stored in long format
+
+        Rolling, EWM and outlier features are computed for all series with
+        single grouped operations; decomposition, stationarity tests and
+        change-point detection run per series in a process pool.
+
+        Above the active memory budget, series are partitioned by key and
+        spilled to disk, and the partitions analyzed one at a time.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or str
+            Long-format data with one row per series and date, or path to a
+            file in a format read by read_data
+        key_col : str or list
+            Column(s) identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+
+        Returns:
+        --------
+        tuple
+            (features, summary): one row per observation with the value,
+            'moving_average', 'exponential_smoothing', 'zscore', 'outlier',
+            'trend', 'seasonal', 'resid' and 'segment' columns of the enabled
+            analyses, and one row per series with the SUMMARY_COLUMNS statistics
+        """
+        key_cols = [key_col] if isinstance(key_col, str) else list(key_col)
+        columns = key_cols + [date_col, value_col]
+        budget = active_budget()
+        if budget is not None and budget.exceeds(data, columns):
+            return self._run_spilled(budget, data, key_cols, date_col, value_col)
+        return self._run(load_frame(data, columns=columns), key_cols, date_col, value_col)
+
+    def _run_spilled(self, budget, data, key_cols, date_col, value_col):
+        """Run the analyses on partitions of series spilled to disk, one partition at a time"""
+        columns = key_cols + [date_col, value_col]
+        results = []
+        with budget.spill('analyze_trends_batch', key_cols, estimate_bytes(data, columns)) as partitions:
+            for chunk in budget.iter_chunks(data, columns):
+                partitions.add(chunk)
+            for part in partitions:
+                results.append(self._run(part, key_cols, date_col, value_col))
+        if not results:
+            return self._run(load_frame(data, columns=columns).iloc[:0], key_cols, date_col, value_col)
+
+        # Partitions hold whole series, so merging restores the order of a single run
+        features = pd.concat([result[0] for result in results], ignore_index=True)
+        features = features.sort_values(key_cols + [date_col], kind='mergesort').reset_index(drop=True)
+        summary = pd.concat([result[1] for result in results], ignore_index=True)
+        summary = summary.sort_values(key_cols, kind='mergesort').reset_index(drop=True)
+        return features, summary
+
+    def _run(self, data, key_cols, date_col, value_col):
+        """Analyze the series of data in memory (see run)"""
+        config = self.config
+
+        frame = data[key_cols + [date_col, value_col]].dropna(subset=key_cols)
+        if not pd.api.types.is_datetime64_any_dtype(frame[date_col]):
+            frame = frame.assign(**{date_col: pd.to_datetime(frame[date_col])})
+        frame = frame.sort_values(key_cols + [date_col], kind='mergesort').reset_index(drop=True)
+
+        values = frame[value_col].astype(float)
+        keys = [frame[col] for col in key_cols]
+        grouped = values.groupby(keys, sort=False)
+        features = frame.assign(**self._observation_features(grouped, keys, values))
+
+        # Series boundaries in the sorted frame
+        codes = grouped.ngroup().to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=int)
+        ends = np.r_[starts[1:], len(codes)].astype(int)
+
+        summary = frame.iloc[starts][key_cols].reset_index(drop=True)
+        summary['n_obs'] = ends - starts
+        summary['mean'] = grouped.mean().to_numpy()
+        summary['std'] = grouped.std().to_numpy()
+
+        series_outliers = config['detect_outliers'] and config['outlier_method'] in SERIES_OUTLIER_METHODS
+        if (config['decompose'] or config['test_stationarity'] or config['detect_change_points']
+                or series_outliers) and len(starts):
+            analyses = self._series_analyses(frame[date_col].to_numpy(), values.to_numpy(), starts, ends)
+            stats = pd.DataFrame([analyses[start][0] for start in starts])
+            for column in SUMMARY_COLUMNS:
+                if column in stats.columns:
+                    summary[column] = stats[column].to_numpy()
+
+            enabled = {'trend': config['decompose'], 'seasonal': config['decompose'], 'resid': config['decompose'],
+                       'segment': config['detect_change_points'], 'outlier': series_outliers}
+            for name in SERIES_COLUMNS:
+                if not enabled[name]:
+                    continue
+                # Series that could not be analyzed have no outliers and missing components
+                column = np.zeros(len(frame), dtype=bool) if name == 'outlier' else np.full(len(frame), np.nan)
+                for start, end in zip(starts, ends):
+                    series_columns = analyses[start][1]
+                    if name in series_columns:
+                        column[start:end] = series_columns[name]
+                features[name] = column
+
+        summary['n_outliers'] = (np.add.reduceat(features['outlier'].to_numpy(dtype=int), starts)
+                                 if config['detect_outliers'] and len(starts) else np.nan)
+
+        return features, summary.reindex(columns=key_cols + list(SUMMARY_COLUMNS))
+
+    @staticmethod
+    def segment_statistics(features, key_col, date_col, value_col):
+        """
+        Summarize the segments between change points of all series
+
+        Parameters:
+        -----------
+        features : pd.DataFrame
+            Features returned by run with change-point detection enabled
+        key_col : str or list
+            Column(s) identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per series and segment with 'start', 'end', 'n_obs',
+            'mean', 'std' and 'change' (difference from the previous mean)
+        """
+        key_cols = [key_col] if isinstance(key_col, str) else list(key_col)
+        segments = (features.dropna(subset=['segment'])
+                    .astype({'segment': int})
+                    .groupby(key_cols + ['segment'], sort=False)
+                    .agg(start=(date_col, 'first'), end=(date_col, 'last'), n_obs=(value_col, 'count'),
+                         mean=(value_col, 'mean'), std=(value_col, 'std'))
+                    .reset_index())
+        segments['change'] = segments.groupby(key_cols, sort=False)['mean'].diff()
+        return segments
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Fast Forecasters Module"""
+import itertools
+import numpy as np
+
+# Smoothing parameter grids searched per series; every combination is
+# evaluated for all series at once
+DEFAULT_GRIDS = {
+    'alpha': (0.05, 0.1, 0.2, 0.3, 0.5, 0.8),
+    'beta': (0.01, 0.05, 0.2),
+    'gamma': (0.01, 0.1, 0.3)
+}
+
+METHODS = ('naive', 'seasonal_naive', 'ses', 'holt', 'holt_winters')
+
+
+class FastForecaster:
+    def __init__(self, method='holt_winters', season_length=None, grids=None):
+        if method not in METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        if method in ('seasonal_naive', 'holt_winters') and (season_length is None or season_length < 2):
+            raise ValueError(f"Method {method} requires season_length >= 2")
+
+        self.method = method
+        self.season_length = season_length
+        self.grids = dict(DEFAULT_GRIDS, **(grids or {}))
+
+        # Per-series smoothing parameters and end-of-sample state
+        self.alpha = None
+        self.beta = None
+        self.gamma = None
+        self.level = None
+        self.trend = None
+        self.season = None
+        self.last_season = None
+        self.sse = None
+        self.nobs = 0
+
+    def _parameter_grid(self):
+        """Candidate (alpha, beta, gamma) combinations as arrays of shape (G, 1)"""
+        alphas = self.grids['alpha']
+        betas = self.grids['beta'] if self.method in ('holt', 'holt_winters') else (0.0,)
+        gammas = self.grids['gamma'] if self.method == 'holt_winters' else (0.0,)
+        grid = np.array(list(itertools.product(alphas, betas, gammas)), dtype=float)
+        return grid[:, 0:1], grid[:, 1:2], grid[:, 2:3]
+
+    def _initial_state(self, values):
+        """Initial level, trend and seasonal components for every series"""
+        n_series = values.shape[0]
+        m = self.season_length
+
+        if self.method == 'holt_winters':
+            first = np.nanmean(values[:, :m], axis=1)
+            second = np.nanmean(values[:, m:2 * m], axis=1)
+            level = first
+            trend = (second - first) / m
+            season = values[:, :m] - first[:, None]
+            start = m
+        else:
+            level = values[:, 0].copy()
+            trend = values[:, 1] - values[:, 0] if self.method == 'holt' else np.zeros(n_series)
+            season = np.zeros((n_series, 1))
+            start = 1
+
+        return level, trend, season, start
+
+    def _smooth(self, values, alpha, beta, gamma, level, trend, season, start, offset=0):
+        """
+        Run the additive exponential smoothing recursion
+
+        The loop runs over time only; each step updates all parameter
+        combinations and all series at once. Missing values leave the state
+        unchanged apart from the trend step.
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Observations of shape (N, T)
+        alpha, beta, gamma : np.ndarray
+            Smoothing parameters broadcastable to (G, N)
+        level, trend : np.ndarray
+            Components at time start - 1, broadcastable to (G, N)
+        season : np.ndarray
+            Seasonal components of shape (..., N, m), slot t % m holding time t
+        start : int
+            First time step to process
+        offset : int
+            Number of observations preceding values (aligns seasonal slots)
+
+        Returns:
+        --------
+        tuple
+            Final (level, trend, season) and the sum of squared one-step errors
+        """
+        m = season.shape[-1]
+        shape = np.broadcast_shapes(np.shape(alpha), np.shape(level))
+        level = np.broadcast_to(level, shape).copy()
+        trend = np.broadcast_to(trend, shape).copy()
+        alpha_beta = alpha * beta
+        sse = np.zeros(shape)
+        use_season = self.method == 'holt_winters'
+
+        # Time-major, contiguous layouts so each step reads whole rows
+        values = np.ascontiguousarray(values.T)
+        season = np.moveaxis(np.broadcast_to(season, shape + (m,)), -1, 0).copy()
+        error = np.empty(shape)
+
+        for t in range(start, values.shape[0]):
+            slot = (t + offset) % m
+            np.subtract(values[t], level, out=error)
+            error -= trend
+            if use_season:
+                error -= season[slot]
+            np.nan_to_num(error, copy=False, nan=0.0)
+
+            sse += error * error
+            level += trend
+            level += alpha * error
+            trend += alpha_beta * error
+            if use_season:
+                season[slot] += gamma * error
+
+        return level, trend, np.moveaxis(season, 0, -1), sse
+
+    def fit(self, values):
+        """
+        Fit the forecaster to many series at once
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Observations of shape (n_series, n_time); a 1-D array is one series
+
+        Returns:
+        --------
+        FastForecaster
+            Fitted forecaster
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        n_series, n_time = values.shape
+        m = self.season_length
+        self.nobs = n_time
+
+        if self.method in ('naive', 'seasonal_naive'):
+            lag = 1 if self.method == 'naive' else m
+            if n_time <= lag:
+                raise ValueError(f"At least {lag + 1} observations are required")
+            self.last_season = values[:, -lag:].copy()
+            self.sse = np.nansum((values[:, lag:] - values[:, :-lag]) ** 2, axis=1)
+            return self
+
+        min_obs = 2 * m if self.method == 'holt_winters' else 2
+        if n_time < min_obs:
+            raise ValueError(f"At least {min_obs} observations are required")
+
+        alpha, beta, gamma = self._parameter_grid()
+        level, trend, season, start = self._initial_state(values)
+        level, trend, season, sse = self._smooth(values, alpha, beta, gamma, level, trend, season, start)
+
+        # Pick the parameter combination with the smallest one-step SSE per series
+        best = np.argmin(sse, axis=0)
+        columns = np.arange(n_series)
+        self.alpha = np.broadcast_to(alpha, sse.shape)[best, columns]
+        self.beta = np.broadcast_to(beta, sse.shape)[best, columns]
+        self.gamma = np.broadcast_to(gamma, sse.shape)[best, columns]
+        self.level = level[best, columns]
+        self.trend = trend[best, columns]
+        self.season = season[best, columns]
+        self.sse = sse[best, columns]
+
+        return self
+
+    def update(self, values):
+        """
+        Filter new observations into the fitted state without re-estimating
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            New observations of shape (n_series, k)
+
+        Returns:
+        --------
+        FastForecaster
+            Updated forecaster
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+
+        if self.method in ('naive', 'seasonal_naive'):
+            self.last_season = np.concatenate([self.last_season, values], axis=1)[:, -self.last_season.shape[1]:]
+        else:
+            self.level, self.trend, self.season, sse = self._smooth(
+                values, self.alpha, self.beta, self.gamma, self.level, self.trend,
+                self.season, 0, offset=self.nobs
+            )
+            self.sse = self.sse + sse
+
+        self.nobs += values.shape[1]
+        return self
+
+    def forecast(self, steps=10):
+        """
+        Forecast all series
+
+        Parameters:
+        -----------
+        steps : int
+            Number of steps to forecast
+
+        Returns:
+        --------
+        np.ndarray
+            Forecasts of shape (n_series, steps)
+        """
+        if self.sse is None:
+            raise ValueError("No model fitted")
+
+        horizon = np.arange(1, steps + 1)
+
+        if self.method in ('naive', 'seasonal_naive'):
+            lag = self.last_season.shape[1]
+            return self.last_season[:, (horizon - 1) % lag]
+
+        forecast = self.level[:, None] + horizon[None, :] * self.trend[:, None]
+        if self.method == 'holt_winters':
+            slots = (self.nobs + horizon - 1) % self.season_length
+            forecast = forecast + self.season[:, slots]
+
+        return forecast
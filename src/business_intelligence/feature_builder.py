@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Feature Builder Module"""
+import numpy as np
+import pandas as pd
+
+# Calendar components and their levels; each is one-hot encoded without its first level
+CALENDAR_LEVELS = {
+    'hour': range(24),
+    'dayofweek': range(7),
+    'month': range(1, 13),
+    'quarter': range(1, 5)
+}
+
+STRATEGIES = ('recursive', 'direct')
+
+
+def _least_squares(blocks, y):
+    """
+    Solve ordinary least squares with an intercept via the normal equations
+
+    The design matrix is given as column blocks so that slices of larger
+    feature matrices are used without being copied into one array.
+
+    Parameters:
+    -----------
+    blocks : list
+        Feature arrays of shape (n, k_i)
+    y : np.ndarray
+        Target values of shape (n,)
+
+    Returns:
+    --------
+    tuple
+        Coefficients and intercept
+    """
+    blocks = [b for b in blocks if b.shape[1] > 0]
+    n = len(y)
+    mean = np.concatenate([b.mean(axis=0) for b in blocks])
+    y_mean = y.mean()
+
+    gram = np.block([[a.T @ b for b in blocks] for a in blocks]) - n * np.outer(mean, mean)
+    rhs = np.concatenate([b.T @ y for b in blocks]) - n * mean * y_mean
+    coef = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+
+    return coef, y_mean - mean @ coef
+
+
+class FeatureBuilder:
+    def __init__(self, lags=(1,), windows=(), calendar=(), trend=False):
+        unknown = [c for c in calendar if c not in CALENDAR_LEVELS]
+        if unknown:
+            raise ValueError(f"Unsupported calendar features: {unknown}")
+        if any(k < 1 for k in lags) or any(w < 2 for w in windows):
+            raise ValueError("Lags must be positive and rolling windows at least 2")
+        if not lags and not windows:
+            raise ValueError("At least one lag or rolling window is required")
+
+        self.lags = tuple(lags)
+        self.windows = tuple(windows)
+        self.calendar = tuple(calendar)
+        self.trend = trend
+
+    @property
+    def lookback(self):
+        """Number of past observations needed to build one row of features"""
+        return max(self.lags + self.windows)
+
+    @property
+    def feature_names(self):
+        """Names of the generated features, in column order"""
+        names = [f'lag_{k}' for k in self.lags]
+        for w in self.windows:
+            names += [f'rolling_mean_{w}', f'rolling_std_{w}']
+        for component in self.calendar:
+            names += [f'{component}_{level}' for level in list(CALENDAR_LEVELS[component])[1:]]
+        if self.trend:
+            names.append('trend')
+        return names
+
+    def history_features(self, values):
+        """
+        Build lag and rolling-window features for every origin at once
+
+        Row t only uses observations up to and including t, so it can be
+        paired with the target at any time t + h.
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Series values
+
+        Returns:
+        --------
+        np.ndarray
+            Features of shape (len(values), n_history_features), NaN where
+            the history is too short
+        """
+        series = pd.Series(values, dtype=float)
+        columns = [series.shift(k - 1).to_numpy() for k in self.lags]
+        for w in self.windows:
+            rolling = series.rolling(w)
+            columns += [rolling.mean().to_numpy(), rolling.std().to_numpy()]
+        return np.column_stack(columns)
+
+    def history_row(self, tail):
+        """
+        Build lag and rolling-window features for a single origin
+
+        Parameters:
+        -----------
+        tail : np.ndarray
+            The last lookback observations up to the origin
+
+        Returns:
+        --------
+        np.ndarray
+            Features matching one row of history_features
+        """
+        row = [tail[-k] for k in self.lags]
+        for w in self.windows:
+            window = tail[-w:]
+            row += [window.mean(), window.std(ddof=1)]
+        return np.array(row)
+
+    def target_features(self, index, positions):
+        """
+        Build calendar and trend features of target times
+
+        Parameters:
+        -----------
+        index : pd.Index
+            Target timestamps (only used for calendar features)
+        positions : np.ndarray
+            Target positions counted from the start of the history
+
+        Returns:
+        --------
+        np.ndarray
+            Features of shape (len(positions), n_target_features)
+        """
+        columns = []
+        if self.calendar:
+            if not isinstance(index, pd.DatetimeIndex):
+                raise ValueError("Calendar features require a DatetimeIndex")
+            for component in self.calendar:
+                values = np.asarray(getattr(index, component))
+                levels = np.array(list(CALENDAR_LEVELS[component])[1:])
+                columns.append((values[:, None] == levels[None, :]).astype(float))
+        if self.trend:
+            columns.append(np.asarray(positions, dtype=float)[:, None])
+        if not columns:
+            return np.empty((len(positions), 0))
+        return np.hstack(columns)
+
+    def get_config(self):
+        """Constructor arguments, e.g. to store with a model"""
+        return {
+            'lags': list(self.lags),
+            'windows': list(self.windows),
+            'calendar': list(self.calendar),
+            'trend': self.trend
+        }
+
+
+class LagRegressor:
+    def __init__(self, builder, strategy='recursive', horizon=1):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unsupported strategy: {strategy}")
+        if horizon < 1:
+            raise ValueError("Horizon must be positive")
+
+        self.builder = builder
+        self.strategy = strategy
+        self.horizon = horizon if strategy == 'direct' else 1
+
+        # One row of coefficients per horizon
+        self.coef_ = None
+        self.intercept_ = None
+        self.tail = None
+        self.nobs = 0
+
+    def fit(self, series):
+        """
+        Fit one linear model per horizon on generated features
+
+        The feature matrices are built once; each horizon pairs the history
+        features at origin t with the target features and value at t + h,
+        using slices of the same matrices.
+
+        Parameters:
+        -----------
+        series : pd.Series
+            Series to model
+
+        Returns:
+        --------
+        LagRegressor
+            Fitted model
+        """
+        values = series.to_numpy(dtype=float)
+        n = len(values)
+        start = self.builder.lookback - 1
+        if n - start <= self.horizon:
+            raise ValueError(f"At least {start + self.horizon + 1} observations are required")
+
+        history = self.builder.history_features(values)
+        target = self.builder.target_features(series.index, np.arange(n))
+
+        # Center once so the normal equations of every horizon are well conditioned
+        history_mean = np.nanmean(history[start:], axis=0)
+        target_mean = target.mean(axis=0)
+        values_mean = np.nanmean(values)
+        history -= history_mean
+        target -= target_mean
+        centered = values - values_mean
+        feature_mean = np.concatenate([history_mean, target_mean])
+
+        coefs, intercepts = [], []
+        for h in range(1, self.horizon + 1):
+            X_history = history[start:n - h]
+            X_target = target[start + h:]
+            y = centered[start + h:]
+            valid = np.isfinite(X_history).all(axis=1) & np.isfinite(y)
+            if not valid.all():
+                X_history, X_target, y = X_history[valid], X_target[valid], y[valid]
+            coef, intercept = _least_squares([X_history, X_target], y)
+            coefs.append(coef)
+            intercepts.append(values_mean + intercept - feature_mean @ coef)
+
+        self.coef_ = np.vstack(coefs)
+        self.intercept_ = np.array(intercepts)
+        self.tail = values[-self.builder.lookback:].copy()
+        self.nobs = n
+
+        return self
+
+    def update(self, values):
+        """
+        Append new observations without re-estimating the coefficients
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            New observations
+
+        Returns:
+        --------
+        LagRegressor
+            Updated model
+        """
+        values = np.asarray(values, dtype=float)
+        self.tail = np.concatenate([self.tail, values])[-self.builder.lookback:]
+        self.nobs += len(values)
+        return self
+
+    def forecast(self, steps=10, index=None):
+        """
+        Forecast future values
+
+        Parameters:
+        -----------
+        steps : int
+            Number of steps to forecast
+        index : pd.Index
+            Timestamps of the forecast horizon (required for calendar features)
+
+        Returns:
+        --------
+        np.ndarray
+            Forecasted values
+        """
+        if self.coef_ is None:
+            raise ValueError("No model fitted")
+
+        target = self.builder.target_features(index, self.nobs + np.arange(steps))
+
+        if self.strategy == 'direct':
+            if steps > self.horizon:
+                raise ValueError(f"Direct model was trained for at most {self.horizon} steps")
+            # All horizons share the features of the last origin
+            history = np.tile(self.builder.history_row(self.tail), (steps, 1))
+            X = np.hstack([history, target])
+            return np.einsum('ij,ij->i', X, self.coef_[:steps]) + self.intercept_[:steps]
+
+        # Recursive: feed each one-step forecast back as an observation
+        tail = list(self.tail)
+        forecast = np.empty(steps)
+        for i in range(steps):
+            x = np.concatenate([self.builder.history_row(np.array(tail)), target[i]])
+            forecast[i] = x @ self.coef_[0] + self.intercept_[0]
+            tail.append(forecast[i])
+            tail.pop(0)
+
+        return forecast
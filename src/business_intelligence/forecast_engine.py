@@ -1,18 +1,51 @@
 #!/usr/bin/env python3
 """Forecast Engine Module"""
+from collections import deque
 import pandas as pd
 import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.statespace.sarimax import SARIMAX
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, mean_absolute_error
-import matplotlib.pyplot as plt
+from statsmodels.tsa.statespace.mlemodel import MLEResultsWrapper
+
+from src.utils.dataset import Dataset, time_indexed
+from src.utils.ingestion import load_frame
+from src.business_intelligence.order_selector import OrderSelector, warm_start_params
+from src.business_intelligence.fast_forecasters import FastForecaster
+from src.business_intelligence.feature_builder import FeatureBuilder, LagRegressor
+
+# scikit-learn and matplotlib are imported by the methods that use them, so
+# ARIMA and fast-path forecasts do not pay for loading them
 
 class ForecastEngine:
-    def __init__(self, data=None):
+    def __init__(self, data=None, refit_every=None, drift_threshold=3.0, drift_window=24):
         self.data = data
         self.model = None
         self.forecast = None
+        self.order_selection = None
+        self.model_spec = None
+        
+        # Incremental update policy: new observations are filtered into the
+        # fitted model and a full re-estimation only happens every
+        # refit_every observations or when drift is detected
+        self.refit_every = refit_every
+        self.drift_threshold = drift_threshold
+        self.drift_window = drift_window
+        self._observations_since_fit = 0
+        self._standardized_errors = deque(maxlen=drift_window)
+        
+    @property
+    def data(self):
+        """Training history, including the observations added by update"""
+        # Updates only append their rows; the history is assembled when it is read
+        if self._new_rows:
+            self._data = pd.concat([self._data, *self._new_rows])
+            self._new_rows = []
+        return self._data
+        
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._new_rows = []
         
     def load_data(self, data, date_col=None, value_col=None):
         """
@@ -33,35 +66,21 @@ class ForecastEngine:
             True if successful
         """
         try:
-            if isinstance(data, str):
-                if data.endswith('.csv'):
-                    self.data = pd.read_csv(data)
-                elif data.endswith(('.xls', '.xlsx')):
-                    self.data = pd.read_excel(data)
-                else:
-                    raise ValueError(f"Unsupported file format: {data}")
+            if date_col and isinstance(data, Dataset):
+                # Steps sharing a dataset share its indexed series
+                self.data = data.time_indexed(date_col, value_col)
+            elif date_col:
+                # Index by the date column without modifying the caller's frame
+                self.data = time_indexed(load_frame(data), date_col, value_col)
             else:
-                self.data = data
-                
-            # Set index to date column if specified
-            if date_col:
-                # Convert date column to datetime if it's not already
-                if not pd.api.types.is_datetime64_dtype(self.data[date_col]):
-                    self.data[date_col] = pd.to_datetime(self.data[date_col])
-                    
-                # Set index
-                self.data = self.data.set_index(date_col)
-                
-                # If value column is specified, keep only that column
-                if value_col:
-                    self.data = self.data[[value_col]]
+                self.data = load_frame(data)
                     
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
             
-    def train_arima_model(self, column=None, order=(1, 1, 1)):
+    def train_arima_model(self, column=None, order=(1, 1, 1), criterion='aic', selector_params=None):
         """
         Train ARIMA model
         
@@ -69,8 +88,12 @@ class ForecastEngine:
         -----------
         column : str
             Column name to forecast (if None, use the first column)
-        order : tuple
-            ARIMA order (p, d, q)
+        order : tuple or str
+            ARIMA order (p, d, q), or 'auto' to select it by information criterion
+        criterion : str
+            Information criterion used by the order search ('aic' or 'bic')
+        selector_params : dict
+            Additional OrderSelector arguments (search bounds, n_jobs, stepwise, ...)
             
         Returns:
         --------
@@ -84,13 +107,27 @@ class ForecastEngine:
         if column is None:
             column = self.data.columns[0]
             
-        # Train ARIMA model
-        self.model = ARIMA(self.data[column], order=order)
-        self.model = self.model.fit()
+        # Select the order automatically if requested
+        selected_params = None
+        trend = None
+        if isinstance(order, str):
+            if order != 'auto':
+                raise ValueError(f"Unsupported order: {order}")
+            selector = OrderSelector(seasonal=False, information_criterion=criterion,
+                                     **(selector_params or {}))
+            self.order_selection = selector.select(self.data[column])
+            order = self.order_selection['order']
+            selected_params = self.order_selection['params']
+            trend = self.order_selection['trend']
+            
+        # Train ARIMA model with the trend of the search, warm-started from its estimates if available
+        self.model_spec = {'type': 'arima', 'column': column, 'order': order, 'trend': trend}
+        self.model = self._fit_state_space(selected_params)
         
         return self.model
         
-    def train_sarima_model(self, column=None, order=(1, 1, 1), seasonal_order=(1, 1, 1, 12)):
+    def train_sarima_model(self, column=None, order=(1, 1, 1), seasonal_order=(1, 1, 1, 12),
+                           seasonal_period=12, criterion='aic', selector_params=None):
         """
         Train SARIMA model
         
@@ -98,10 +135,16 @@ class ForecastEngine:
         -----------
         column : str
             Column name to forecast (if None, use the first column)
-        order : tuple
-            ARIMA order (p, d, q)
-        seasonal_order : tuple
-            Seasonal order (P, D, Q, s)
+        order : tuple or str
+            ARIMA order (p, d, q), or 'auto' to select it by information criterion
+        seasonal_order : tuple or str
+            Seasonal order (P, D, Q, s), or 'auto' to select it by information criterion
+        seasonal_period : int
+            Seasonal period s searched when seasonal_order is 'auto'
+        criterion : str
+            Information criterion used by the order search ('aic' or 'bic')
+        selector_params : dict
+            Additional OrderSelector arguments (search bounds, n_jobs, stepwise, ...)
             
         Returns:
         --------
@@ -115,26 +158,69 @@ class ForecastEngine:
         if column is None:
             column = self.data.columns[0]
             
-        # Train SARIMA model
-        self.model = SARIMAX(self.data[column], order=order, seasonal_order=seasonal_order)
-        self.model = self.model.fit(disp=False)
+        # Select the orders automatically if requested
+        selected_params = None
+        trend = None
+        auto_order = isinstance(order, str)
+        auto_seasonal = isinstance(seasonal_order, str)
+        for value in (order, seasonal_order):
+            if isinstance(value, str) and value != 'auto':
+                raise ValueError(f"Unsupported order: {value}")
+                
+        if auto_order or auto_seasonal:
+            period = seasonal_period if auto_seasonal else seasonal_order[3]
+            selector = OrderSelector(seasonal_period=period, information_criterion=criterion,
+                                     **(selector_params or {}))
+            self.order_selection = selector.select(
+                self.data[column],
+                fixed_order=None if auto_order else order,
+                fixed_seasonal_order=None if auto_seasonal else seasonal_order
+            )
+            order = self.order_selection['order']
+            seasonal_order = self.order_selection['seasonal_order']
+            selected_params = self.order_selection['params']
+            trend = self.order_selection['trend']
+            
+        # Train SARIMA model with the trend of the search, warm-started from its estimates if available
+        self.model_spec = {'type': 'sarima', 'column': column, 'order': order, 'seasonal_order': seasonal_order,
+                           'trend': trend}
+        self.model = self._fit_state_space(selected_params)
         
         return self.model
         
-    def train_linear_regression(self, column=None, features=None):
+    def train_linear_regression(self, column=None, features=None, lags=None, windows=None, calendar=None,
+                                trend=False, strategy='recursive', horizon=1):
         """
         Train linear regression model
         
+        With lags, windows, calendar or trend, the model is trained on
+        features generated from the series itself and can be forecast;
+        otherwise it regresses on the given feature columns.
+        
         Parameters:
         -----------
         column : str
             Column name to forecast (if None, use the first column)
         features : list
             List of feature column names (if None, use all columns except target)
+        lags : list
+            Lags of the series used as features (1 is the last observation)
+        windows : list
+            Rolling window lengths whose mean and standard deviation are used as features
+        calendar : list
+            Calendar components of the target date to one-hot encode
+            ('hour', 'dayofweek', 'month', 'quarter')
+        trend : bool
+            Whether to add the time position as a feature
+        strategy : str
+            'recursive' (one model, forecasts fed back as lags) or 'direct'
+            (one model per step up to horizon)
+        horizon : int
+            Number of steps the direct strategy is trained for
             
         Returns:
         --------
-        sklearn.linear_model.LinearRegression
+        sklearn.linear_model.LinearRegression or LagRegressor
             Trained model
         """
         if self.data is None:
@@ -144,17 +230,328 @@ class ForecastEngine:
         if column is None:
             column = self.data.columns[0]
             
+        if lags is not None or windows is not None or calendar is not None or trend:
+            # Future values of other columns are unknown, so only generated features are used
+            if features is not None:
+                raise ValueError("Feature columns cannot be combined with generated features")
+            builder = FeatureBuilder(lags=lags or (), windows=windows or (), calendar=calendar or (), trend=trend)
+            self.model = LagRegressor(builder, strategy=strategy, horizon=horizon).fit(self.data[column])
+            
+            self.model_spec = dict(builder.get_config(), type='lag_linear', column=column,
+                                   strategy=strategy, horizon=horizon)
+            self._reset_update_state()
+            
+            return self.model
+            
         # If features are not specified, use all columns except target
         if features is None:
             features = [col for col in self.data.columns if col != column]
+        if not features:
+            raise ValueError("Linear regression requires feature columns, or lags, windows, calendar or trend")
             
         # Train linear regression model
         X = self.data[features]
         y = self.data[column]
         
+        from sklearn.linear_model import LinearRegression
+        
         self.model = LinearRegression()
         self.model.fit(X, y)
         
+        self.model_spec = {'type': 'linear', 'column': column, 'features': features}
+        self._reset_update_state()
+        
+        return self.model
+        
+    def train_fast_model(self, columns=None, method='holt_winters', season_length=None, grids=None):
+        """
+        Train a vectorized fast-path model on one or many series at once
+        
+        Exponential smoothing (simple, Holt, additive Holt-Winters) and naive
+        models are fitted to every column in a single pass over time; the
+        smoothing parameters are chosen per series from a grid by one-step SSE.
+        
+        Parameters:
+        -----------
+        columns : str or list
+            Column(s) to forecast, one series per column (if None, use all numeric columns)
+        method : str
+            'naive', 'seasonal_naive', 'ses', 'holt' or 'holt_winters'
+        season_length : int
+            Seasonal period (required for 'seasonal_naive' and 'holt_winters')
+        grids : dict
+            Smoothing parameter grids overriding the defaults ('alpha', 'beta', 'gamma')
+            
+        Returns:
+        --------
+        FastForecaster
+            Trained model
+        """
+        if self.data is None:
+            raise ValueError("No data loaded")
+            
+        # If columns are not specified, use all numeric columns
+        if columns is None:
+            columns = self.data.select_dtypes(include=['number']).columns.tolist()
+        elif isinstance(columns, str):
+            columns = [columns]
+            
+        # Train on a (series x time) array
+        values = self.data[columns].to_numpy(dtype=float).T
+        self.model = FastForecaster(method=method, season_length=season_length, grids=grids).fit(values)
+        
+        self.model_spec = {
+            'type': 'fast',
+            'column': columns[0],
+            'columns': columns,
+            'method': method,
+            'season_length': season_length,
+            'grids': grids
+        }
+        self._reset_update_state()
+        
+        return self.model
+        
+    def _future_index(self, steps):
+        """
+        Build the index of the forecast horizon
+        
+        Parameters:
+        -----------
+        steps : int
+            Number of steps to forecast
+            
+        Returns:
+        --------
+        pd.Index
+            Dates following the history, or positions if no frequency is known
+        """
+        index = self.data.index
+        if isinstance(index, pd.DatetimeIndex) and len(index) > 2:
+            freq = index.freq or pd.infer_freq(index)
+            if freq is not None:
+                return pd.date_range(start=index[-1], periods=steps + 1, freq=freq)[1:]
+        return pd.RangeIndex(len(index), len(index) + steps)
+        
+    def _fit_state_space(self, start_params=None):
+        """
+        Fit the ARIMA/SARIMA model described by model_spec on the full history
+        
+        Parameters:
+        -----------
+        start_params : dict
+            Parameter estimates used to warm-start the optimizer
+            
+        Returns:
+        --------
+        statsmodels.tsa.statespace.mlemodel.MLEResults
+            Fitted model
+        """
+        spec = self.model_spec
+        endog = self.data[spec['column']]
+        
+        if spec['type'] == 'arima':
+            model = ARIMA(endog, order=spec['order'], trend=spec.get('trend'))
+            result = model.fit(start_params=warm_start_params(model, start_params))
+        else:
+            model = SARIMAX(endog, order=spec['order'], seasonal_order=spec['seasonal_order'], trend=spec.get('trend'))
+            result = model.fit(start_params=warm_start_params(model, start_params), disp=False)
+            
+        self._reset_update_state()
+        
+        return result
+        
+    def _reset_update_state(self):
+        """Reset the incremental update counters after a full fit"""
+        self._observations_since_fit = 0
+        self._standardized_errors.clear()
+        
+    def _drift_detected(self, new_errors):
+        """
+        Check the one-step-ahead forecast errors of new observations for drift
+        
+        While the model holds, standardized one-step errors are approximately
+        independent N(0, 1); a shift of their mean or an inflation of their
+        variance over drift_window observations signals drift. Every window
+        ending at a new observation is checked, so a change early in a batch
+        longer than drift_window is not missed. The new errors are then kept
+        for the windows of later batches.
+        
+        Parameters:
+        -----------
+        new_errors : np.ndarray
+            Standardized one-step errors of the new observations
+            
+        Returns:
+        --------
+        bool
+            True if drift is detected
+        """
+        previous = len(self._standardized_errors)
+        errors = np.r_[np.asarray(self._standardized_errors, dtype=float), new_errors]
+        self._standardized_errors.extend(new_errors)
+        
+        n = self.drift_window
+        if len(errors) < n or len(new_errors) == 0:
+            return False
+            
+        # Sums over the windows ending at each new observation, from cumulative sums
+        ends = np.arange(max(n, previous + 1), len(errors) + 1)
+        sums = np.r_[0.0, np.cumsum(errors)]
+        squares = np.r_[0.0, np.cumsum(errors ** 2)]
+        mean_shift = np.abs(sums[ends] - sums[ends - n]) / np.sqrt(n)
+        variance_shift = (squares[ends] - squares[ends - n] - n) / np.sqrt(2 * n)
+        
+        return bool(np.max(np.maximum(mean_shift, variance_shift)) > self.drift_threshold)
+        
+    def update(self, new_data, refit=False):
+        """
+        Update the fitted model with new observations
+        
+        For ARIMA/SARIMA models the new observations are filtered into the
+        state-space state with the current parameters, without re-estimation.
+        The parameters are re-estimated (warm-started from the current ones)
+        every refit_every observations, when drift is detected or when refit
+        is True. Fast-path models continue their smoothing recursions and
+        lag-feature regressions extend their lag buffer, both re-estimated
+        only on schedule. Linear regressions on feature columns are always
+        refitted.
+        
+        Parameters:
+        -----------
+        new_data : pd.DataFrame or pd.Series
+            New observations indexed by date; rows not later than the current
+            history are ignored, so the full history can be passed as well
+        refit : bool
+            Force a full re-estimation
+            
+        Returns:
+        --------
+        dict
+            Number of new observations, whether the model was refitted and why
+        """
+        if self.model is None:
+            raise ValueError("No model trained")
+            
+        column = self.model_spec['column']
+        if isinstance(new_data, pd.Series):
+            new_data = new_data.to_frame(column)
+            
+        # Keep only observations after the current history
+        last = self._new_rows[-1].index[-1] if self._new_rows else self._data.index[-1]
+        new_data = new_data[new_data.index > last]
+        status = {'observations': len(new_data), 'refit': False, 'reason': None}
+        if new_data.empty and not refit:
+            return status
+            
+        # Filtering the new rows into a state-space model does not need the
+        # history, so it is only concatenated when a refit or forecast reads it
+        if not new_data.empty:
+            self._new_rows.append(new_data[self._data.columns])
+        self._observations_since_fit += len(new_data)
+        
+        if refit:
+            status['reason'] = 'requested'
+        elif isinstance(self.model, FastForecaster):
+            # Continue the smoothing recursions from the fitted state
+            self.model.update(new_data[self.model_spec['columns']].to_numpy(dtype=float).T)
+            if self.refit_every and self._observations_since_fit >= self.refit_every:
+                status['reason'] = 'schedule'
+        elif isinstance(self.model, LagRegressor):
+            # Append the new observations to the lag buffer
+            self.model.update(new_data[column].to_numpy(dtype=float))
+            if self.refit_every and self._observations_since_fit >= self.refit_every:
+                status['reason'] = 'schedule'
+        elif not isinstance(self.model, MLEResultsWrapper):
+            status['reason'] = 'not_incremental'
+        else:
+            # Filter the new observations in with the current parameters
+            self.model = self.model.extend(new_data[column])
+            errors = self.model.forecasts_error[0] / np.sqrt(self.model.forecasts_error_cov[0, 0])
+            if self._drift_detected(errors[np.isfinite(errors)]):
+                status['reason'] = 'drift'
+            elif self.refit_every and self._observations_since_fit >= self.refit_every:
+                status['reason'] = 'schedule'
+                
+        if status['reason'] is not None:
+            status['refit'] = True
+            spec = self.model_spec
+            if spec['type'] == 'linear':
+                self.train_linear_regression(column=column, features=spec['features'])
+            elif spec['type'] == 'lag_linear':
+                self.train_linear_regression(column=column, lags=spec['lags'], windows=spec['windows'],
+                                             calendar=spec['calendar'], trend=spec['trend'],
+                                             strategy=spec['strategy'], horizon=spec['horizon'])
+            elif spec['type'] == 'fast':
+                self.train_fast_model(columns=spec['columns'], method=spec['method'],
+                                      season_length=spec['season_length'], grids=spec['grids'])
+            else:
+                params = dict(zip(self.model.model.param_names, np.asarray(self.model.params)))
+                self.model = self._fit_state_space(params)
+                
+        return status
+        
+    def save_model(self, registry, name, metrics=None):
+        """
+        Save the trained model to a model registry
+        
+        Parameters:
+        -----------
+        registry : ModelRegistry
+            Registry to save to
+        name : str
+            Model name
+        metrics : dict
+            Evaluation metrics to store with the model
+            
+        Returns:
+        --------
+        int
+            Version number of the saved model
+        """
+        return registry.save(name, self, metrics=metrics)
+        
+    def load_model(self, registry, name, version=None):
+        """
+        Load a trained model from a model registry instead of fitting it
+        
+        Parameters:
+        -----------
+        registry : ModelRegistry
+            Registry to load from
+        name : str
+            Model name
+        version : int
+            Version to load (if None, the latest version)
+            
+        Returns:
+        --------
+        object
+            Restored model
+        """
+        registered = registry.load(name, version=version)
+        meta = registered.metadata
+        
+        self.data = registered.history()
+        self.model = registered.model
+        self.model_spec = {'type': meta['model_type'], 'column': meta['column']}
+        for key in ('order', 'seasonal_order'):
+            if meta.get(key) is not None:
+                self.model_spec[key] = tuple(meta[key])
+        self.model_spec['trend'] = meta.get('trend')
+        if meta.get('features') is not None:
+            self.model_spec['features'] = meta['features']
+        if meta['model_type'] == 'lag_linear':
+            self.model_spec.update(meta['builder'], strategy=meta['strategy'], horizon=meta['horizon'])
+        if meta['model_type'] == 'fast':
+            self.model_spec.update({
+                'columns': meta['columns'],
+                'method': meta['method'],
+                'season_length': meta['season_length'],
+                'grids': None
+            })
+        self._reset_update_state()
+        
         return self.model
         
     def forecast_future(self, steps=10, column=None):
@@ -166,30 +563,50 @@ class ForecastEngine:
         steps : int
             Number of steps to forecast
         column : str
-            Column name to forecast (if None, use the first column)
+            Column name to forecast (if None, use the first column; fast-path
+            models trained on several columns forecast all of them)
             
         Returns:
         --------
-        pd.Series
-            Forecasted values
+        pd.Series or pd.DataFrame
+            Forecasted values (one column per series for multi-series fast-path models)
         """
         if self.model is None:
             raise ValueError("No model trained")
             
+        # Forecast
+        if isinstance(self.model, FastForecaster):
+            # For fast-path models, all series at once
+            columns = self.model_spec['columns']
+            forecast = pd.DataFrame(self.model.forecast(steps=steps).T, index=self._future_index(steps),
+                                    columns=columns)
+            if column is not None:
+                self.forecast = forecast[column]
+            elif len(columns) == 1:
+                self.forecast = forecast[columns[0]]
+            else:
+                self.forecast = forecast
+            return self.forecast
+            
         # If column is not specified, use the first column
         if column is None:
             column = self.data.columns[0]
             
-        # Forecast
-        if isinstance(self.model, (ARIMA, SARIMAX)):
+        if isinstance(self.model, MLEResultsWrapper):
             # For ARIMA/SARIMA models
             self.forecast = self.model.forecast(steps=steps)
-        elif isinstance(self.model, LinearRegression):
-            # For linear regression models
-            # This is a simplified implementation
-            # In a real scenario, you would need to generate future feature values
-            raise NotImplementedError("Forecasting with linear regression is not implemented")
+        elif isinstance(self.model, LagRegressor):
+            # For linear regression on generated features
+            index = self._future_index(steps)
+            self.forecast = pd.Series(self.model.forecast(steps=steps, index=index), index=index, name=column)
         else:
+            from sklearn.linear_model import LinearRegression
+            
+            if isinstance(self.model, LinearRegression):
+                # Future values of the feature columns are unknown
+                raise ValueError(
+                    "Forecasting requires a linear regression trained on lags, windows, calendar or trend"
+                )
             raise ValueError(f"Unsupported model type: {type(self.model)}")
             
         return self.forecast
@@ -203,23 +620,40 @@ class ForecastEngine:
         test_data : pd.DataFrame
             Test data
         column : str
-            Column name to evaluate (if None, use the first column)
+            Column name to evaluate (if None, use the first column; multi-series
+            forecasts are evaluated for every series)
             
         Returns:
         --------
-        dict
-            Dictionary with evaluation metrics
+        dict or pd.DataFrame
+            Dictionary with evaluation metrics, or one row of metrics per
+            series for multi-series forecasts
         """
         if self.forecast is None:
             raise ValueError("No forecast available")
             
+        # Evaluate all series of a multi-series forecast at once
+        if isinstance(self.forecast, pd.DataFrame):
+            if column is None:
+                errors = test_data[self.forecast.columns].to_numpy(dtype=float) - self.forecast.to_numpy()
+                mse = np.mean(errors ** 2, axis=0)
+                return pd.DataFrame({
+                    'mse': mse,
+                    'rmse': np.sqrt(mse),
+                    'mae': np.mean(np.abs(errors), axis=0)
+                }, index=self.forecast.columns)
+            y_pred = self.forecast[column]
+        else:
+            y_pred = self.forecast
+            
         # If column is not specified, use the first column
         if column is None:
             column = test_data.columns[0]
             
         # Evaluate
         y_true = test_data[column]
-        y_pred = self.forecast
+        
+        from sklearn.metrics import mean_squared_error, mean_absolute_error
         
         # Calculate metrics
         mse = mean_squared_error(y_true, y_pred)
@@ -236,6 +670,9 @@ class ForecastEngine:
         """
         Plot forecast
         
+        The figure is rendered with the Agg canvas and is not registered with
+        pyplot, so it is released as soon as it is no longer referenced.
+        
         Parameters:
         -----------
         test_data : pd.DataFrame
@@ -255,23 +692,56 @@ class ForecastEngine:
         if column is None:
             column = self.data.columns[0]
             
-        # Create figure
-        fig, ax = plt.subplots(figsize=(12, 6))
+        forecast = self.forecast[column] if isinstance(self.forecast, pd.DataFrame) else self.forecast
+        test = test_data[column] if test_data is not None else None
         
-        # Plot training data
-        ax.plot(self.data.index, self.data[column], label='Training Data')
+        from src.visualization.forecast_renderer import ForecastRenderer
         
-        # Plot test data if provided
-        if test_data is not None:
-            ax.plot(test_data.index, test_data[column], label='Test Data')
+        renderer = ForecastRenderer(figsize=(12, 6))
+        return renderer.draw(self.data[column], forecast, test=test, ylabel=column)
+        
+    def render_forecasts(self, output_dir, test_data=None, columns=None, format='png', n_jobs=None):
+        """
+        Render the forecast of every series to image files
+        
+        Parameters:
+        -----------
+        output_dir : str
+            Directory to write the files to (one file per column)
+        test_data : pd.DataFrame
+            Test data (if None, only plot forecasts)
+        columns : list
+            Columns to render (if None, all forecasted columns)
+        format : str
+            'png' or 'svg'
+        n_jobs : int
+            Number of worker processes (if None, the number of CPUs)
+            
+        Returns:
+        --------
+        list
+            Paths of the written files
+        """
+        if self.forecast is None:
+            raise ValueError("No forecast available")
+            
+        forecast = self.forecast
+        if isinstance(forecast, pd.Series):
+            forecast = forecast.to_frame(self.model_spec['column'] if self.model_spec else self.data.columns[0])
+            
+        # If columns are not specified, use all forecasted columns
+        if columns is None:
+            columns = list(forecast.columns)
             
-        # Plot forecast
-        ax.plot(self.forecast.index, self.forecast, label='Forecast', color='red')
+        jobs = [{
+            'name': str(column),
+            'history': self.data[column],
+            'forecast': forecast[column],
+            'test': test_data[column] if test_data is not None else None,
+            'title': f'Time Series Forecast: {column}',
+            'ylabel': column
+        } for column in columns]
         
-        # Add labels and legend
-        ax.set_title('Time Series Forecast')
-        ax.set_xlabel('Date')
-        ax.set_ylabel(column)
-        ax.legend()
+        from src.visualization.forecast_renderer import render_forecasts
         
-        return fig
+        return render_forecasts(jobs, output_dir, format=format, n_jobs=n_jobs)
@@ -4,6 +4,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from src.utils.ingestion import load_frame
+from src.utils.memory_budget import active_budget, estimate_bytes
+
 class KPICalculator:
     def __init__(self, data=None):
         self.data = data
@@ -23,20 +26,28 @@ class KPICalculator:
             True if successful
         """
         try:
-            if isinstance(data, str):
-                if data.endswith('.csv'):
-                    self.data = pd.read_csv(data)
-                elif data.endswith(('.xls', '.xlsx')):
-                    self.data = pd.read_excel(data)
-                else:
-                    raise ValueError(f"Unsupported file format: {data}")
-            else:
+            # Files above the memory budget are read in chunks by the grouped KPIs
+            budget = active_budget()
+            if isinstance(data, str) and budget is not None and budget.exceeds(data):
                 self.data = data
+            else:
+                self.data = load_frame(data)
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
             
+    def _period_frame(self, columns, period_col, periods=None):
+        """The columns of the loaded data, filtered to periods and sorted by period"""
+        df = load_frame(self.data)[list(dict.fromkeys(columns))]
+        
+        # Filter periods if specified
+        if periods:
+            df = df[df[period_col].isin(periods)]
+            
+        # Sort by period
+        return df.sort_values(period_col)
+        
     def calculate_revenue_growth(self, period_col, revenue_col, periods=None):
         """
         Calculate revenue growth
@@ -58,20 +69,12 @@ class KPICalculator:
         if self.data is None:
             raise ValueError("No data loaded")
             
-        # Create a copy of the data
-        df = self.data.copy()
-        
-        # Filter periods if specified
-        if periods:
-            df = df[df[period_col].isin(periods)]
-            
-        # Sort by period
-        df = df.sort_values(period_col)
+        # Select the used columns; sorting and filtering build new frames, so
+        # the loaded data is never modified
+        df = self._period_frame([period_col, revenue_col], period_col, periods)
         
         # Calculate revenue growth
-        df['revenue_growth'] = df[revenue_col].pct_change() * 100
-        
-        return df[[period_col, revenue_col, 'revenue_growth']]
+        return df.assign(revenue_growth=df[revenue_col].pct_change() * 100)
         
     def calculate_customer_acquisition_cost(self, period_col, marketing_expense_col, new_customers_col, periods=None):
         """
@@ -96,20 +99,10 @@ class KPICalculator:
         if self.data is None:
             raise ValueError("No data loaded")
             
-        # Create a copy of the data
-        df = self.data.copy()
-        
-        # Filter periods if specified
-        if periods:
-            df = df[df[period_col].isin(periods)]
-            
-        # Sort by period
-        df = df.sort_values(period_col)
+        df = self._period_frame([period_col, marketing_expense_col, new_customers_col], period_col, periods)
         
         # Calculate customer acquisition cost
-        df['cac'] = df[marketing_expense_col] / df[new_customers_col]
-        
-        return df[[period_col, marketing_expense_col, new_customers_col, 'cac']]
+        return df.assign(cac=df[marketing_expense_col] / df[new_customers_col])
         
     def calculate_customer_lifetime_value(self, customer_id_col, revenue_col, date_col=None, time_period=365):
         """
@@ -134,23 +127,19 @@ class KPICalculator:
         if self.data is None:
             raise ValueError("No data loaded")
             
-        # Create a copy of the data
-        df = self.data.copy()
+        columns = [customer_id_col, revenue_col] + ([date_col] if date_col else [])
+        budget = active_budget()
+        if budget is not None and budget.exceeds(self.data, columns):
+            customer_stats = self._customer_totals_spilled(budget, customer_id_col, revenue_col, date_col)
+        else:
+            customer_stats = self._customer_totals(load_frame(self.data)[columns], customer_id_col, revenue_col,
+                                                   date_col)
         
-        # Group by customer
         if date_col:
-            # Convert date column to datetime if it's not already
-            if not pd.api.types.is_datetime64_dtype(df[date_col]):
-                df[date_col] = pd.to_datetime(df[date_col])
-                
             # Calculate customer lifespan
-            customer_stats = df.groupby(customer_id_col).agg({
-                date_col: lambda x: (x.max() - x.min()).days,
-                revenue_col: 'sum'
-            }).reset_index()
-            
-            # Rename columns
-            customer_stats.columns = [customer_id_col, 'lifespan_days', 'total_revenue']
+            customer_stats['lifespan_days'] = (customer_stats.pop('last_purchase')
+                                               - customer_stats.pop('first_purchase')).dt.days
+            customer_stats = customer_stats[[customer_id_col, 'lifespan_days', 'total_revenue']]
             
             # Calculate CLV (annualized)
             customer_stats['clv'] = customer_stats['total_revenue'] / customer_stats['lifespan_days'] * time_period
@@ -159,15 +148,46 @@ class KPICalculator:
             customer_stats.loc[customer_stats['lifespan_days'] == 0, 'clv'] = customer_stats.loc[customer_stats['lifespan_days'] == 0, 'total_revenue']
         else:
             # If no date column, just sum revenue by customer
-            customer_stats = df.groupby(customer_id_col).agg({
-                revenue_col: 'sum'
-            }).reset_index()
-            
-            # Rename columns
-            customer_stats.columns = [customer_id_col, 'clv']
+            customer_stats = customer_stats.rename(columns={'total_revenue': 'clv'})
             
         return customer_stats
         
+    @staticmethod
+    def _customer_totals(df, customer_id_col, revenue_col, date_col=None):
+        """Revenue and first and last purchase dates per customer, or their partial values over a chunk"""
+        if date_col:
+            # Convert date column to datetime if it's not already
+            if not pd.api.types.is_datetime64_dtype(df[date_col]):
+                df = df.assign(**{date_col: pd.to_datetime(df[date_col])})
+            grouped = df.groupby(customer_id_col)
+            return pd.DataFrame({
+                'first_purchase': grouped[date_col].min(),
+                'last_purchase': grouped[date_col].max(),
+                'total_revenue': grouped[revenue_col].sum()
+            }).reset_index()
+        return df.groupby(customer_id_col)[revenue_col].sum().rename('total_revenue').reset_index()
+        
+    def _customer_totals_spilled(self, budget, customer_id_col, revenue_col, date_col=None):
+        """
+        Compute _customer_totals in chunks that fit the memory budget
+
+        Per-chunk totals are partitioned by customer and spilled to disk,
+        then every partition's totals are combined on their own.
+        """
+        columns = [customer_id_col, revenue_col] + ([date_col] if date_col else [])
+        combine = {'first_purchase': 'min', 'last_purchase': 'max', 'total_revenue': 'sum'}
+        totals = []
+        with budget.spill('customer_lifetime_value', [customer_id_col],
+                          estimate_bytes(self.data, columns)) as partitions:
+            for chunk in budget.iter_chunks(self.data, columns):
+                partitions.add(self._customer_totals(chunk, customer_id_col, revenue_col, date_col))
+            for part in partitions:
+                totals.append(part.groupby(customer_id_col).agg(
+                    {column: how for column, how in combine.items() if column in part.columns}))
+        if not totals:
+            return self._customer_totals(pd.DataFrame(columns=columns), customer_id_col, revenue_col, date_col)
+        return pd.concat(totals).sort_index().reset_index()
+        
     def calculate_conversion_rate(self, period_col, visitors_col, conversions_col, periods=None):
         """
         Calculate conversion rate
@@ -191,20 +211,10 @@ class KPICalculator:
         if self.data is None:
             raise ValueError("No data loaded")
             
-        # Create a copy of the data
-        df = self.data.copy()
-        
-        # Filter periods if specified
-        if periods:
-            df = df[df[period_col].isin(periods)]
-            
-        # Sort by period
-        df = df.sort_values(period_col)
+        df = self._period_frame([period_col, visitors_col, conversions_col], period_col, periods)
         
         # Calculate conversion rate
-        df['conversion_rate'] = df[conversions_col] / df[visitors_col] * 100
-        
-        return df[[period_col, visitors_col, conversions_col, 'conversion_rate']]
+        return df.assign(conversion_rate=df[conversions_col] / df[visitors_col] * 100)
         
     def calculate_churn_rate(self, period_col, customers_start_col, customers_end_col, new_customers_col, periods=None):
         """
@@ -231,20 +241,11 @@ class KPICalculator:
         if self.data is None:
             raise ValueError("No data loaded")
             
-        # Create a copy of the data
-        df = self.data.copy()
-        
-        # Filter periods if specified
-        if periods:
-            df = df[df[period_col].isin(periods)]
-            
-        # Sort by period
-        df = df.sort_values(period_col)
+        df = self._period_frame([period_col, customers_start_col, customers_end_col, new_customers_col], period_col,
+                                periods)
         
         # Calculate churned customers
-        df['churned_customers'] = df[customers_start_col] + df[new_customers_col] - df[customers_end_col]
+        churned = df[customers_start_col] + df[new_customers_col] - df[customers_end_col]
         
         # Calculate churn rate
-        df['churn_rate'] = df['churned_customers'] / df[customers_start_col] * 100
-        
-        return df[[period_col, customers_start_col, customers_end_col, new_customers_col, 'churned_customers', 'churn_rate']]
+        return df.assign(churned_customers=churned, churn_rate=churned / df[customers_start_col] * 100)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""Model Registry Module"""
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.mlemodel import MLEResultsWrapper
+from sklearn.linear_model import LinearRegression
+
+from src.utils.cache import data_fingerprint
+from src.business_intelligence.fast_forecasters import FastForecaster
+from src.business_intelligence.feature_builder import FeatureBuilder, LagRegressor
+
+METADATA_FILE = 'metadata.json'
+
+# Fitted state of a FastForecaster, stored as one array each
+FAST_STATE = ('alpha', 'beta', 'gamma', 'level', 'trend', 'season', 'last_season', 'sse')
+
+
+def _to_json(value):
+    """Convert numpy scalars and tuples into JSON-serializable values"""
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class RegisteredModel:
+    def __init__(self, path, metadata):
+        self.path = path
+        self.metadata = metadata
+        self._arrays = {}
+        self._model = None
+
+    @property
+    def name(self):
+        return self.metadata['name']
+
+    @property
+    def version(self):
+        return self.metadata['version']
+
+    def array(self, key):
+        """
+        Get a stored array, memory-mapped on first access
+
+        Parameters:
+        -----------
+        key : str
+            Array name (e.g. 'params', 'state', 'history')
+
+        Returns:
+        --------
+        np.ndarray
+            Read-only memory-mapped array
+        """
+        if key not in self._arrays:
+            self._arrays[key] = np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode='r')
+        return self._arrays[key]
+
+    @property
+    def model(self):
+        """Fitted model, reconstructed from the stored arrays on first access"""
+        if self._model is None:
+            self._model = self._restore_model()
+        return self._model
+
+    def _restore_model(self):
+        """Rebuild the fitted model without re-estimating it"""
+        meta = self.metadata
+
+        if meta['model_type'] == 'linear':
+            model = LinearRegression()
+            model.coef_ = np.array(self.array('coef'))
+            model.intercept_ = meta['intercept']
+            model.n_features_in_ = len(meta['features'])
+            model.feature_names_in_ = np.array(meta['features'], dtype=object)
+            return model
+
+        if meta['model_type'] == 'lag_linear':
+            model = LagRegressor(FeatureBuilder(**meta['builder']), strategy=meta['strategy'],
+                                 horizon=meta['horizon'])
+            model.coef_ = np.array(self.array('coef'))
+            model.intercept_ = np.array(self.array('intercept'))
+            model.tail = np.array(self.array('tail'))
+            model.nobs = meta['nobs']
+            return model
+
+        if meta['model_type'] == 'fast':
+            model = FastForecaster(method=meta['method'], season_length=meta['season_length'])
+            model.nobs = meta['nobs']
+            for key in meta['fast_state']:
+                setattr(model, key, np.array(self.array(key)))
+            return model
+
+        # Filtering the last observation from the stored predicted state
+        # reproduces the end-of-sample state of the original fit exactly
+        if meta['index_kind'] == 'datetime':
+            index = pd.DatetimeIndex([pd.Timestamp(meta['last_index'])], freq=meta['freq'])
+        else:
+            index = pd.RangeIndex(meta['last_index'], meta['last_index'] + 1)
+        endog = pd.Series([meta['last_value']], index=index, name=meta['column'])
+
+        if meta['model_type'] == 'arima':
+            model = ARIMA(endog, order=tuple(meta['order']), trend=meta.get('trend'))
+        else:
+            model = SARIMAX(endog, order=tuple(meta['order']), seasonal_order=tuple(meta['seasonal_order']),
+                            trend=meta.get('trend'))
+        model.initialize_known(np.array(self.array('state')), np.array(self.array('state_cov')))
+
+        return model.filter(np.array(self.array('params')))
+
+    def history(self):
+        """
+        Get the training history stored with the model
+
+        Returns:
+        --------
+        pd.DataFrame
+            History indexed by date (backed by the memory-mapped arrays)
+        """
+        index = self.array('history_index')
+        if self.metadata['index_kind'] == 'datetime':
+            index = pd.DatetimeIndex(index.view('datetime64[ns]'))
+        return pd.DataFrame(self.array('history'), index=index, columns=self.metadata['history_columns'])
+
+    def forecast(self, steps=10):
+        """
+        Forecast future values with the stored model
+
+        Parameters:
+        -----------
+        steps : int
+            Number of steps to forecast
+
+        Returns:
+        --------
+        pd.Series or np.ndarray
+            Forecasted values (an array of shape (n_series, steps) for fast-path
+            models, and of shape (steps,) for lag-feature regressions)
+        """
+        if self.metadata['model_type'] == 'linear':
+            # The model can still predict from given feature values (see model)
+            raise ValueError("Cannot forecast a linear regression on feature columns: "
+                             "future values of the feature columns are unknown")
+        if self.metadata['model_type'] == 'lag_linear':
+            index = None
+            if self.metadata['builder']['calendar']:
+                last = pd.Timestamp(self.metadata['last_index'])
+                index = pd.date_range(last, periods=steps + 1, freq=self.metadata['freq'])[1:]
+            return self.model.forecast(steps=steps, index=index)
+        return self.model.forecast(steps=steps)
+
+
+class ModelRegistry:
+    def __init__(self, root_dir='models'):
+        self.root_dir = root_dir
+        self._metadata_cache = {}
+
+    def _model_dir(self, name):
+        return os.path.join(self.root_dir, name)
+
+    def list_models(self):
+        """
+        List registered model names
+
+        Returns:
+        --------
+        list
+            Model names
+        """
+        if not os.path.isdir(self.root_dir):
+            return []
+        return sorted(d for d in os.listdir(self.root_dir) if os.path.isdir(self._model_dir(d)))
+
+    def list_versions(self, name):
+        """
+        List the versions of a model
+
+        Parameters:
+        -----------
+        name : str
+            Model name
+
+        Returns:
+        --------
+        list
+            Version numbers in ascending order
+        """
+        model_dir = self._model_dir(name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(int(d[1:]) for d in os.listdir(model_dir) if d.startswith('v') and d[1:].isdigit())
+
+    def save(self, name, engine, metrics=None):
+        """
+        Save the fitted model of a ForecastEngine as a new version
+
+        Parameters:
+        -----------
+        name : str
+            Model name
+        engine : ForecastEngine
+            Engine with a trained model
+        metrics : dict
+            Evaluation metrics to store with the model
+
+        Returns:
+        --------
+        int
+            Version number of the saved model
+        """
+        if engine.model is None or engine.model_spec is None:
+            raise ValueError("No model trained")
+
+        spec = engine.model_spec
+        column = spec['column']
+        history = engine.data.select_dtypes(include=['number'])
+        index = engine.data.index
+        is_datetime = isinstance(index, pd.DatetimeIndex)
+
+        metadata = {
+            'name': name,
+            'model_type': spec['type'],
+            'column': column,
+            'order': spec.get('order'),
+            'seasonal_order': spec.get('seasonal_order'),
+            'trend': spec.get('trend'),
+            'features': spec.get('features'),
+            'data_fingerprint': data_fingerprint(engine.data[spec.get('columns', column)]),
+            'nobs': len(engine.data),
+            'metrics': metrics or {},
+            'history_columns': list(history.columns),
+            'index_kind': 'datetime' if is_datetime else 'range',
+            'created_at': datetime.now().isoformat()
+        }
+
+        arrays = {
+            'history': history.to_numpy(dtype=float),
+            'history_index': (index.values.astype('datetime64[ns]').view('int64') if is_datetime
+                              else np.asarray(index))
+        }
+
+        if is_datetime:
+            metadata['last_index'] = index[-1].isoformat()
+            metadata['freq'] = index.freqstr or (pd.infer_freq(index) if len(index) > 2 else None)
+        else:
+            metadata['last_index'] = len(index) - 1
+            metadata['freq'] = None
+
+        model = engine.model
+        if isinstance(model, MLEResultsWrapper):
+            metadata['last_value'] = engine.data[column].iloc[-1]
+            arrays['params'] = np.asarray(model.params, dtype=float)
+            # Predicted state and covariance for the last observation
+            arrays['state'] = np.asarray(model.predicted_state[:, -2])
+            arrays['state_cov'] = np.asarray(model.predicted_state_cov[:, :, -2])
+        elif isinstance(model, LinearRegression):
+            metadata['intercept'] = model.intercept_
+            arrays['coef'] = np.asarray(model.coef_, dtype=float)
+        elif isinstance(model, LagRegressor):
+            metadata['builder'] = model.builder.get_config()
+            metadata['strategy'] = model.strategy
+            metadata['horizon'] = model.horizon
+            arrays['coef'] = model.coef_
+            arrays['intercept'] = model.intercept_
+            arrays['tail'] = model.tail
+        elif isinstance(model, FastForecaster):
+            metadata['columns'] = spec['columns']
+            metadata['method'] = model.method
+            metadata['season_length'] = model.season_length
+            metadata['fast_state'] = [key for key in FAST_STATE if getattr(model, key) is not None]
+            for key in metadata['fast_state']:
+                arrays[key] = np.asarray(getattr(model, key), dtype=float)
+        else:
+            raise ValueError(f"Unsupported model type: {type(model)}")
+
+        os.makedirs(self._model_dir(name), exist_ok=True)
+        versions = self.list_versions(name)
+        version = versions[-1] + 1 if versions else 1
+        metadata['version'] = version
+
+        # Write into a temporary directory and rename it so readers never see
+        # a partially written version
+        tmp_dir = tempfile.mkdtemp(dir=self._model_dir(name), prefix='.tmp-')
+        try:
+            for key, value in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{key}.npy"), value)
+            with open(os.path.join(tmp_dir, METADATA_FILE), 'w') as f:
+                json.dump(_to_json(metadata), f, indent=2)
+            os.rename(tmp_dir, os.path.join(self._model_dir(name), f"v{version:04d}"))
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        return version
+
+    def load(self, name, version=None, data_fingerprint=None):
+        """
+        Load a registered model lazily
+
+        Only the metadata is read; parameter arrays are memory-mapped and the
+        model is rebuilt on first use.
+
+        Parameters:
+        -----------
+        name : str
+            Model name
+        version : int
+            Version to load (if None, the latest version)
+        data_fingerprint : str
+            If given, load the latest version trained on data with this fingerprint
+
+        Returns:
+        --------
+        RegisteredModel
+            Registered model handle
+        """
+        versions = self.list_versions(name)
+        if version is not None:
+            versions = [v for v in versions if v == version]
+
+        for candidate in reversed(versions):
+            path = os.path.join(self._model_dir(name), f"v{candidate:04d}")
+            metadata = self._read_metadata(path)
+            if data_fingerprint is None or metadata['data_fingerprint'] == data_fingerprint:
+                return RegisteredModel(path, metadata)
+
+        raise KeyError(f"No registered model found: {name}")
+
+    def delete(self, name, version=None):
+        """
+        Delete a model version, or all versions of a model
+
+        Parameters:
+        -----------
+        name : str
+            Model name
+        version : int
+            Version to delete (if None, delete all versions)
+        """
+        path = self._model_dir(name)
+        if version is not None:
+            path = os.path.join(path, f"v{version:04d}")
+        self._metadata_cache = {k: v for k, v in self._metadata_cache.items() if not k.startswith(path)}
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _read_metadata(self, path):
+        """Read version metadata; versions are immutable, so it is cached"""
+        if path not in self._metadata_cache:
+            with open(os.path.join(path, METADATA_FILE)) as f:
+                self._metadata_cache[path] = json.load(f)
+        return self._metadata_cache[path]
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""Order Selector Module"""
+import itertools
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.seasonal import seasonal_decompose
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.stattools import kpss
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+
+from src.utils.cache import LRUCache, data_fingerprint
+
+# Differencing decisions depend only on the data, so they are shared by every
+# candidate of a search and by repeated searches over the same series
+_DIFFERENCING_CACHE = LRUCache(maxsize=256)
+
+# Seasonal strength above which a seasonal difference is taken (Wang, Smith & Hyndman)
+SEASONAL_STRENGTH_THRESHOLD = 0.64
+
+# Names of the same parameter in ARIMA and SARIMAX
+PARAM_ALIASES = {'const': 'intercept', 'intercept': 'const'}
+
+
+def warm_start_params(model, params):
+    """
+    Build starting parameters for model from a neighbouring model's estimates
+
+    Parameters:
+    -----------
+    model : statsmodels.tsa.statespace.mlemodel.MLEModel
+        Model to be fitted
+    params : dict
+        Parameter estimates keyed by parameter name
+
+    Returns:
+    --------
+    np.ndarray or None
+        Starting parameters, with terms missing from params set to zero, or
+        None if not usable
+    """
+    if not params:
+        return None
+
+    start = np.array([params.get(name, params.get(PARAM_ALIASES.get(name), 0.0)) for name in model.param_names])
+    if 'sigma2' in model.param_names and 'sigma2' not in params:
+        start[model.param_names.index('sigma2')] = np.nanvar(model.endog)
+
+    # Reject starting values that violate the stationarity/invertibility constraints
+    try:
+        model.untransform_params(start)
+    except Exception:
+        return None
+
+    return start
+
+
+def _fit_candidate(endog, order, seasonal_order, trend, maxiter, start_params=None):
+    """Fit one SARIMAX candidate and return its information criteria"""
+    record = {
+        'order': order,
+        'seasonal_order': seasonal_order,
+        'aic': np.inf,
+        'bic': np.inf,
+        'converged': False,
+        'error': None,
+        'params': None
+    }
+    try:
+        with warnings.catch_warnings():
+            # Turn convergence problems into an immediate failure of the candidate
+            warnings.simplefilter('error', ConvergenceWarning)
+            warnings.simplefilter('ignore', UserWarning)
+            # Differencing outside the state space and concentrating the scale
+            # shrink the filter; all candidates share d and D, so scores stay comparable
+            model = SARIMAX(endog, order=order, seasonal_order=seasonal_order, trend=trend,
+                            simple_differencing=True, concentrate_scale=True)
+            if model.k_params == 0:
+                # Nothing to estimate (e.g. a pure differencing model)
+                result = model.filter(np.array([]), low_memory=True)
+            else:
+                result = model.fit(start_params=warm_start_params(model, start_params), disp=False,
+                                   maxiter=maxiter, cov_type='none', low_memory=True)
+
+        retvals = getattr(result, 'mle_retvals', None) or {}
+        record['converged'] = bool(retvals.get('converged', True))
+        if record['converged'] and np.isfinite(result.aic):
+            record['aic'] = float(result.aic)
+            record['bic'] = float(result.bic)
+            record['params'] = dict(zip(model.param_names, np.asarray(result.params)))
+            record['params']['sigma2'] = float(result.scale)
+    except Exception as e:
+        record['error'] = str(e)
+
+    return record
+
+
+class OrderSelector:
+    def __init__(self, max_p=5, max_d=2, max_q=5, max_P=2, max_D=1, max_Q=2, max_order=5,
+                 seasonal=True, seasonal_period=12, information_criterion='aic', stepwise=True,
+                 n_jobs=None, maxiter=50, max_failures=10, alpha=0.05):
+        self.max_p = max_p
+        self.max_d = max_d
+        self.max_q = max_q
+        self.max_P = max_P
+        self.max_D = max_D
+        self.max_Q = max_Q
+        self.max_order = max_order
+        self.seasonal = seasonal and seasonal_period is not None and seasonal_period > 1
+        self.seasonal_period = seasonal_period if self.seasonal else 0
+        self.information_criterion = information_criterion
+        self.stepwise = stepwise
+        self.n_jobs = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+        self.maxiter = maxiter
+        self.max_failures = max_failures
+        self.alpha = alpha
+
+        if information_criterion not in ('aic', 'bic'):
+            raise ValueError(f"Unsupported information criterion: {information_criterion}")
+
+    def seasonal_strength(self, values):
+        """
+        Measure the strength of seasonality of a series
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Series values
+
+        Returns:
+        --------
+        float
+            Seasonal strength between 0 (none) and 1 (purely seasonal)
+        """
+        m = self.seasonal_period
+        if not self.seasonal or len(values) < 2 * m:
+            return 0.0
+
+        decomposition = seasonal_decompose(values, period=m, extrapolate_trend='freq')
+        resid = decomposition.resid
+        detrended = decomposition.seasonal + resid
+        variance = np.nanvar(detrended)
+        if variance == 0:
+            return 0.0
+
+        return max(0.0, 1.0 - np.nanvar(resid) / variance)
+
+    def differencing(self, values, fixed_d=None, fixed_D=None):
+        """
+        Determine the number of regular and seasonal differences
+
+        Seasonal differencing is chosen from the seasonal strength and regular
+        differencing from repeated KPSS tests on the seasonally differenced
+        series. Results are cached by data fingerprint.
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Series values
+        fixed_d : int
+            Regular differencing order to use instead of testing
+        fixed_D : int
+            Seasonal differencing order to use instead of testing
+
+        Returns:
+        --------
+        tuple
+            (d, D)
+        """
+        key = (data_fingerprint(values), self.seasonal_period, self.max_d, self.max_D,
+               self.alpha, fixed_d, fixed_D)
+
+        def compute():
+            series = values
+            D = fixed_D
+            if D is None:
+                D = 0
+                while D < self.max_D and self.seasonal_strength(series) > SEASONAL_STRENGTH_THRESHOLD:
+                    series = series[self.seasonal_period:] - series[:-self.seasonal_period]
+                    D += 1
+            else:
+                for _ in range(D):
+                    series = series[self.seasonal_period:] - series[:-self.seasonal_period]
+
+            d = fixed_d
+            if d is None:
+                d = 0
+                while d < self.max_d and len(series) > 10 and not self._is_level_stationary(series):
+                    series = np.diff(series)
+                    d += 1
+
+            return d, D
+
+        return _DIFFERENCING_CACHE.get_or_compute(key, compute)
+
+    def _is_level_stationary(self, values):
+        """Run a KPSS level-stationarity test"""
+        if np.ptp(values) == 0:
+            return True
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            p_value = kpss(values, regression='c', nlags='auto')[1]
+        return p_value >= self.alpha
+
+    def select(self, series, fixed_order=None, fixed_seasonal_order=None):
+        """
+        Select ARIMA/SARIMA orders by information criterion
+
+        Parameters:
+        -----------
+        series : pd.Series or np.ndarray
+            Series to model
+        fixed_order : tuple
+            (p, d, q) to keep fixed while searching the seasonal part
+        fixed_seasonal_order : tuple
+            (P, D, Q, s) to keep fixed while searching the non-seasonal part
+
+        Returns:
+        --------
+        dict
+            Selected orders, the trend they were fitted with ('c' without
+            differencing, 'n' otherwise), their scores and a table of all
+            fitted candidates
+        """
+        values = np.asarray(pd.Series(series).dropna(), dtype=float)
+
+        d, D = self.differencing(
+            values,
+            fixed_d=fixed_order[1] if fixed_order is not None else None,
+            fixed_D=fixed_seasonal_order[1] if fixed_seasonal_order is not None else None
+        )
+        if not self.seasonal:
+            D = 0
+        trend = 'c' if d + D == 0 else 'n'
+
+        # Search bounds per dimension (p, q, P, Q); fixed orders collapse a range
+        bounds = [(0, self.max_p), (0, self.max_q), (0, self.max_P), (0, self.max_Q)]
+        if fixed_order is not None:
+            bounds[0] = (fixed_order[0], fixed_order[0])
+            bounds[1] = (fixed_order[2], fixed_order[2])
+        if fixed_seasonal_order is not None:
+            bounds[2] = (fixed_seasonal_order[0], fixed_seasonal_order[0])
+            bounds[3] = (fixed_seasonal_order[2], fixed_seasonal_order[2])
+        if not self.seasonal:
+            bounds[2] = bounds[3] = (0, 0)
+
+        if self.stepwise:
+            frontier = self._initial_candidates(bounds)
+        else:
+            frontier = self._grid(bounds)
+
+        tried = {}
+        best = None
+        failures = 0
+        executor = None
+
+        try:
+            if self.n_jobs > 1:
+                executor = ProcessPoolExecutor(max_workers=self.n_jobs)
+
+            start_params = None
+            while frontier:
+                records = self._fit_batch(executor, values, frontier, d, D, trend, start_params)
+                improved = False
+                for key, record in zip(frontier, records):
+                    tried[key] = record
+                    score = record[self.information_criterion]
+                    if np.isfinite(score) and (best is None or score < best[self.information_criterion]):
+                        best = record
+                        best['key'] = key
+                        improved = True
+
+                # Stop early once too many candidates have failed to converge
+                failures += sum(not np.isfinite(r[self.information_criterion]) for r in records)
+                if failures >= self.max_failures:
+                    break
+
+                if not self.stepwise or best is None or not improved:
+                    break
+
+                # Neighbours of the incumbent are warm-started from its estimates
+                start_params = best['params']
+                frontier = [c for c in self._neighbours(best['key'], bounds) if c not in tried]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if best is None:
+            raise ValueError("No ARIMA candidate converged")
+
+        candidates = pd.DataFrame([
+            {k: v for k, v in record.items() if k not in ('key', 'params')} for record in tried.values()
+        ]).sort_values(self.information_criterion).reset_index(drop=True)
+
+        return {
+            'order': best['order'],
+            'seasonal_order': best['seasonal_order'],
+            'trend': trend,
+            'criterion': self.information_criterion,
+            'aic': best['aic'],
+            'bic': best['bic'],
+            'params': best['params'],
+            'n_fits': len(tried),
+            'candidates': candidates
+        }
+
+    def _fit_batch(self, executor, values, keys, d, D, trend, start_params=None):
+        """Fit a batch of candidates, in parallel when an executor is available"""
+        m = self.seasonal_period
+        orders = [(p, d, q) for p, q, _, _ in keys]
+        seasonal_orders = [(P, D, Q, m) if self.seasonal else (0, 0, 0, 0) for _, _, P, Q in keys]
+        n = len(keys)
+
+        if executor is None or n == 1:
+            return [
+                _fit_candidate(values, order, seasonal_order, trend, self.maxiter, start_params)
+                for order, seasonal_order in zip(orders, seasonal_orders)
+            ]
+
+        return list(executor.map(
+            _fit_candidate, [values] * n, orders, seasonal_orders, [trend] * n,
+            [self.maxiter] * n, [start_params] * n
+        ))
+
+    def _valid(self, key, bounds):
+        """Check a candidate against the search bounds and the maximum total order"""
+        return (all(lo <= v <= hi for v, (lo, hi) in zip(key, bounds))
+                and sum(key) <= max(self.max_order, sum(lo for lo, _ in bounds)))
+
+    def _clip(self, key, bounds):
+        """Clip a candidate into the search bounds"""
+        return tuple(min(max(v, lo), hi) for v, (lo, hi) in zip(key, bounds))
+
+    def _initial_candidates(self, bounds):
+        """Starting models of the Hyndman-Khandakar stepwise search"""
+        starts = [(2, 2, 1, 1), (0, 0, 0, 0), (1, 0, 1, 0), (0, 1, 0, 1)]
+        candidates = []
+        for start in starts:
+            key = self._clip(start, bounds)
+            if key not in candidates and self._valid(key, bounds):
+                candidates.append(key)
+        return candidates
+
+    def _neighbours(self, key, bounds):
+        """Candidates one step away from key in the stepwise search"""
+        p, q, P, Q = key
+        moves = []
+        for i in range(4):
+            for step in (-1, 1):
+                move = list(key)
+                move[i] += step
+                moves.append(tuple(move))
+        for step in (-1, 1):
+            moves.append((p + step, q + step, P, Q))
+            moves.append((p, q, P + step, Q + step))
+
+        neighbours = []
+        for move in moves:
+            if move not in neighbours and self._valid(move, bounds):
+                neighbours.append(move)
+        return neighbours
+
+    def _grid(self, bounds):
+        """All candidates of the brute-force search"""
+        ranges = [range(lo, hi + 1) for lo, hi in bounds]
+        return [key for key in itertools.product(*ranges) if self._valid(key, bounds)]
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Seasonality Module"""
+import numpy as np
+import pandas as pd
+
+# Typical seasonal periods per sampling interval, checked alongside the periodogram peak
+CALENDAR_PERIODS = {
+    'min': (60, 1440),
+    'h': (24, 168),
+    'D': (7, 365),
+    'B': (5, 260),
+    'W': (52,),
+    'MS': (12,),
+    'ME': (12,),
+    'QS': (4,),
+    'QE': (4,),
+    'YS': (),
+    'YE': ()
+}
+
+# Legacy and alternative aliases of the sampling intervals above
+ALIASES = {'T': 'min', 'H': 'h', 'M': 'ME', 'BM': 'ME', 'BMS': 'MS', 'Q': 'QE', 'A': 'YE', 'Y': 'YE', 'AS': 'YS'}
+
+# Candidates whose seasonal strength is this close to the best one are
+# considered equivalent; the shortest is kept, so multiples of the true
+# period (e.g. 168 for a daily cycle in hourly data) are not selected
+MULTIPLE_TOLERANCE = 0.9
+
+# Minimum adjusted seasonal strength of a detected period
+MIN_STRENGTH = 0.4
+
+
+def _base_interval(freq):
+    """Reduce an offset alias such as '2D' or 'W-SUN' to its base interval"""
+    if freq is None:
+        return None
+    base = freq.split('-')[0].lstrip('0123456789')
+    return ALIASES.get(base, base)
+
+def infer_sampling_interval(index):
+    """
+    Infer the sampling interval of a datetime index
+
+    Parameters:
+    -----------
+    index : pd.DatetimeIndex
+        Index of the series (may be irregular or have gaps)
+
+    Returns:
+    --------
+    str or None
+        Offset alias (e.g. 'h', 'D', 'W', 'MS'), or None if not a datetime index
+    """
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+        return None
+
+    if index.freqstr is not None:
+        return index.freqstr
+    if len(index) >= 3 and index.is_monotonic_increasing:
+        freq = pd.infer_freq(index)
+        if freq is not None:
+            return freq
+
+    # Irregular index: classify the median spacing
+    step = pd.TimedeltaIndex(np.diff(index.sort_values().values)).median()
+    days = step / pd.Timedelta(days=1)
+    month_start = bool((index.day == 1).all())
+
+    if step < pd.Timedelta(minutes=30):
+        return 'min'
+    if step < pd.Timedelta(hours=12):
+        return 'h'
+    if days < 3:
+        return 'D'
+    if days < 14:
+        return 'W'
+    if days < 60:
+        return 'MS' if month_start else 'ME'
+    if days < 180:
+        return 'QS' if month_start else 'QE'
+    return 'YS' if month_start else 'YE'
+
+
+def regularize(series, freq=None):
+    """
+    Put a series on a regular grid and fill gaps
+
+    Irregular or gappy indices are resampled to the sampling interval by
+    averaging (vectorized); missing values are interpolated in time.
+
+    Parameters:
+    -----------
+    series : pd.Series
+        Series to regularize
+    freq : str
+        Sampling interval (if None, inferred)
+
+    Returns:
+    --------
+    pd.Series
+        Regular series without missing values
+    """
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        freq = freq or infer_sampling_interval(index)
+        if freq is not None:
+            expected = pd.date_range(index.min(), index.max(), freq=freq)
+            if len(expected) != len(index) or not expected.equals(index):
+                series = series.resample(freq).mean()
+            elif index.freq is None:
+                series = series.asfreq(freq)
+
+    if series.isna().any():
+        method = 'time' if isinstance(series.index, pd.DatetimeIndex) else 'linear'
+        series = series.interpolate(method=method, limit_direction='both')
+
+    return series
+
+
+def autocorrelation(values, max_lag=None):
+    """
+    Compute the autocorrelation function with the FFT in O(n log n)
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Series values
+    max_lag : int
+        Largest lag returned (if None, n - 1)
+
+    Returns:
+    --------
+    np.ndarray
+        Autocorrelations for lags 0..max_lag
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    max_lag = n - 1 if max_lag is None else min(max_lag, n - 1)
+    centered = values - values.mean()
+
+    # Zero-pad to avoid circular correlation
+    size = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(centered, size)
+    acov = np.fft.irfft(spectrum * np.conj(spectrum), size)[:max_lag + 1]
+    if acov[0] == 0:
+        return np.zeros(max_lag + 1)
+    return acov / acov[0]
+
+
+def seasonal_strength(values, period):
+    """
+    Measure how much of the detrended variance a seasonal period explains
+
+    The series is detrended with a centered moving average over one period
+    and the seasonal component is the mean per phase; the strength is
+    adjusted for the number of phase means, like an adjusted R-squared, so
+    noise scores close to zero for any period.
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Regularly spaced series values without missing values
+    period : int
+        Seasonal period
+
+    Returns:
+    --------
+    float
+        Seasonal strength, at most 1
+    """
+    series = pd.Series(values, dtype=float)
+    window = period if period % 2 else period + 1
+    detrended = (series - series.rolling(window, center=True).mean()).to_numpy()
+
+    valid = np.isfinite(detrended)
+    phase = np.arange(len(values))[valid] % period
+    detrended = detrended[valid]
+    n = len(detrended)
+    # At least two detrended cycles are needed to separate seasonality from noise
+    if n < 2 * period:
+        return 0.0
+
+    counts = np.bincount(phase, minlength=period)
+    means = np.bincount(phase, weights=detrended, minlength=period) / np.maximum(counts, 1)
+    resid = detrended - means[phase]
+
+    total = np.sum((detrended - detrended.mean()) ** 2) / (n - 1)
+    if total == 0:
+        return 0.0
+    return 1.0 - (np.sum(resid ** 2) / (n - period)) / total
+
+
+def detect_seasonal_period(values, freq=None, max_period=None):
+    """
+    Detect the dominant seasonal period of a series
+
+    The periodogram peak of the detrended series (FFT, O(n log n)) and the
+    usual calendar periods of the sampling interval are scored by their
+    seasonal strength; the strongest significant candidate is returned.
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Regularly spaced series values without missing values
+    freq : str
+        Sampling interval, used to add calendar candidates
+    max_period : int
+        Largest period considered (if None, a quarter of the series length,
+        so at least four cycles are observed; fewer let trending series such
+        as random walks pass for seasonal)
+
+    Returns:
+    --------
+    int or None
+        Seasonal period, or None if no significant seasonality is found
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    max_period = min(max_period or n // 4, n // 3)
+    if max_period < 2 or np.ptp(values) == 0:
+        return None
+
+    candidates = {p for p in CALENDAR_PERIODS.get(_base_interval(freq), ()) if p <= max_period}
+
+    # Remove the linear trend, which otherwise dominates the spectrum; zero-padding
+    # refines the frequency grid so the peak period is not off by one
+    t = np.arange(n)
+    detrended = values - np.polyval(np.polyfit(t, values, 1), t)
+    size = 1 << (4 * n - 1).bit_length()
+    power = np.abs(np.fft.rfft(detrended, size)) ** 2
+    k_min = int(np.ceil(size / max_period))
+    if k_min < len(power):
+        peak = int(round(size / (k_min + np.argmax(power[k_min:]))))
+        if 2 <= peak <= max_period:
+            candidates.add(peak)
+    if not candidates:
+        return None
+
+    scores = {p: seasonal_strength(values, p) for p in candidates}
+    best_period = max(scores, key=scores.get)
+    best = scores[best_period]
+    if best < MIN_STRENGTH:
+        return None
+
+    # Prefer a divisor of the best period that explains the series almost as well
+    return min(p for p, score in scores.items() if best_period % p == 0 and score >= MULTIPLE_TOLERANCE * best)
+
+
+def infer_period(series, max_period=None):
+    """
+    Infer the sampling interval and seasonal period of a series
+
+    Parameters:
+    -----------
+    series : pd.Series
+        Series to analyze (irregular or gappy indices are regularized first)
+    max_period : int
+        Largest period considered
+
+    Returns:
+    --------
+    dict
+        'freq' (offset alias or None), 'period' (detected period or None),
+        'default_period' (usual calendar period fitting the series, or None)
+        and 'series' (the regularized series)
+    """
+    freq = infer_sampling_interval(series.index)
+    regular = regularize(series.dropna() if freq is not None else series, freq)
+    period = detect_seasonal_period(regular.to_numpy(), freq=freq, max_period=max_period)
+
+    default_period = None
+    for candidate in CALENDAR_PERIODS.get(_base_interval(freq), ()):
+        if 2 * candidate <= len(regular):
+            default_period = candidate
+            break
+
+    return {'freq': freq, 'period': period, 'default_period': default_period, 'series': regular}
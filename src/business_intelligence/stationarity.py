@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Stationarity Module"""
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
+from statsmodels.tsa.stattools import kpss
+
+from src.utils.cache import LRUCache, data_fingerprint
+
+AUTOLAG_METHODS = ('AIC', 'BIC', 't-stat')
+REGRESSIONS = ('c', 'ct', 'n')
+
+# Critical value of the 't-stat' lag selection (5% one-sided normal quantile, as in statsmodels)
+T_STAT_STOP = 1.6448536269514722
+
+# Test results shared by all testers, keyed by series fingerprint and options; sized
+# for whole catalogs since entries are small dicts
+_STATIONARITY_CACHE = LRUCache(maxsize=65536)
+
+# Chunks per worker process, so slow series do not leave workers idle
+CHUNKS_PER_WORKER = 4
+
+
+def _ols(X, y):
+    """Least squares via QR: coefficients, residual sum of squares and standard errors"""
+    Q, R = np.linalg.qr(X)
+    beta = np.linalg.solve(R, Q.T @ y)
+    ssr = float(np.sum((y - X @ beta) ** 2))
+    R_inv = np.linalg.inv(R)
+    scale = ssr / (len(y) - X.shape[1])
+    return beta, ssr, np.sqrt(scale * np.sum(R_inv ** 2, axis=1))
+
+
+def _adf_design(x, xdiff, lags, maxlag, regression):
+    """Design matrix [trend terms, level, lagged differences] on the sample after maxlag"""
+    n_diff = len(xdiff)
+    nobs = n_diff - maxlag
+    columns = []
+    if regression in ('c', 'ct'):
+        columns.append(np.ones(nobs))
+    if regression == 'ct':
+        columns.append(np.arange(1, nobs + 1, dtype=float))
+    columns.append(x[maxlag:n_diff])
+    columns.extend(xdiff[maxlag - k:n_diff - k] for k in range(1, lags + 1))
+    return np.column_stack(columns), xdiff[maxlag:]
+
+
+def adf_test(values, max_lags=None, autolag='AIC', regression='c'):
+    """
+    Augmented Dickey-Fuller test with a fast lag search
+
+    Gives the same results as statsmodels' adfuller: every candidate lag is
+    fitted on the common sample with one QR decomposition instead of a
+    statsmodels OLS model, and the selected lag is refitted on the full
+    sample. Capping max_lags shortens the search further.
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Series values without missing values
+    max_lags : int
+        Largest lag searched (if None, 12 * (n / 100) ** (1 / 4), as in adfuller)
+    autolag : str
+        Lag selection ('AIC', 'BIC', 't-stat', or None to use max_lags)
+    regression : str
+        Deterministic terms ('c' constant, 'ct' constant and trend, 'n' none)
+
+    Returns:
+    --------
+    dict
+        Test statistic, p-value, lags used, number of observations,
+        critical values and stationarity at the 5% level
+    """
+    if autolag is not None and autolag not in AUTOLAG_METHODS:
+        raise ValueError(f"Unsupported autolag method: {autolag}")
+    if regression not in REGRESSIONS:
+        raise ValueError(f"Unsupported regression: {regression}")
+
+    x = np.asarray(values, dtype=float)
+    if len(x) == 0 or x.max() == x.min():
+        raise ValueError("Invalid input, x is constant")
+    nobs = len(x)
+    ntrend = len(regression) if regression != 'n' else 0
+    limit = nobs // 2 - ntrend - 1
+    if max_lags is None:
+        max_lags = min(limit, int(np.ceil(12.0 * np.power(nobs / 100.0, 1 / 4.0))))
+        if max_lags < 0:
+            raise ValueError("sample size is too short to use selected regression component")
+    elif max_lags > limit:
+        raise ValueError("max_lags must be less than (nobs/2 - 1 - ntrend)")
+
+    xdiff = np.diff(x)
+    lags = max_lags
+    if autolag is not None:
+        # Compare the candidates on the same observations, like adfuller
+        X, y = _adf_design(x, xdiff, max_lags, max_lags, regression)
+        n = len(y)
+        best = None
+        candidates = range(max_lags, -1, -1) if autolag == 't-stat' else range(max_lags + 1)
+        for lag in candidates:
+            k = ntrend + 1 + lag
+            beta, ssr, se = _ols(X[:, :k], y)
+            if autolag == 't-stat':
+                lags = lag
+                if lag == 0 or abs(beta[-1] / se[-1]) >= T_STAT_STOP:
+                    break
+                continue
+            llf = -n / 2 * (np.log(2 * np.pi) + np.log(ssr / n) + 1)
+            penalty = 2 * k if autolag == 'AIC' else np.log(n) * k
+            criterion = -2 * llf + penalty
+            if best is None or criterion < best:
+                best, lags = criterion, lag
+
+    X, y = _adf_design(x, xdiff, lags, lags, regression)
+    beta, _, se = _ols(X, y)
+    statistic = float(beta[ntrend] / se[ntrend])
+    p_value = float(mackinnonp(statistic, regression=regression, N=1))
+    critical = mackinnoncrit(N=1, regression=regression, nobs=len(y))
+
+    return {
+        'test_statistic': statistic,
+        'p_value': p_value,
+        'lags': lags,
+        'observations': len(y),
+        'critical_values': {'1%': critical[0], '5%': critical[1], '10%': critical[2]},
+        'is_stationary': bool(p_value < 0.05)
+    }
+
+
+def kpss_test(values, regression='c'):
+    """
+    KPSS test, whose null hypothesis is stationarity (the reverse of ADF)
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Series values without missing values
+    regression : str
+        'c' (level stationarity) or 'ct' (trend stationarity)
+
+    Returns:
+    --------
+    dict
+        Test statistic, p-value (interpolated within 0.01 to 0.1), lags,
+        critical values and stationarity at the 5% level
+    """
+    with warnings.catch_warnings():
+        # p-values outside the lookup table only produce an InterpolationWarning
+        warnings.simplefilter('ignore')
+        statistic, p_value, lags, critical = kpss(np.asarray(values, dtype=float), regression=regression,
+                                                  nlags='auto')
+
+    return {
+        'test_statistic': float(statistic),
+        'p_value': float(p_value),
+        'lags': lags,
+        'critical_values': critical,
+        'is_stationary': bool(p_value >= 0.05)
+    }
+
+
+def stationarity_conclusion(adf_stationary, kpss_stationary):
+    """Combine the ADF and KPSS verdicts"""
+    if adf_stationary and kpss_stationary:
+        return 'stationary'
+    if not adf_stationary and not kpss_stationary:
+        return 'non-stationary'
+    # ADF rejects a unit root while KPSS rejects stationarity: differencing helps; the
+    # reverse means stationary around a deterministic trend
+    return 'difference-stationary' if adf_stationary else 'trend-stationary'
+
+
+def stationarity_tests(values, max_lags=None, autolag='AIC', regression='c', kpss=False):
+    """
+    Run the ADF test and optionally KPSS, timing each
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Series values without missing values
+    max_lags : int
+        Largest ADF lag searched (if None, the adfuller default)
+    autolag : str
+        ADF lag selection ('AIC', 'BIC', 't-stat' or None)
+    regression : str
+        Deterministic terms ('c', 'ct' or 'n'; KPSS uses 'c' for 'n')
+    kpss : bool
+        Whether to run the KPSS test too
+
+    Returns:
+    --------
+    dict
+        ADF results; with kpss, a 'kpss' entry and a 'conclusion'; and the
+        seconds spent per test in 'timings'
+    """
+    start = time.perf_counter()
+    results = adf_test(values, max_lags=max_lags, autolag=autolag, regression=regression)
+    timings = {'adf': time.perf_counter() - start}
+
+    if kpss:
+        start = time.perf_counter()
+        results['kpss'] = kpss_test(values, regression='ct' if regression == 'ct' else 'c')
+        timings['kpss'] = time.perf_counter() - start
+        results['conclusion'] = stationarity_conclusion(results['is_stationary'], results['kpss']['is_stationary'])
+
+    results['timings'] = timings
+    return results
+
+
+def _test_chunk(chunk, options):
+    """Run stationarity_tests on a chunk of (position, values) pairs"""
+    results = []
+    for position, values in chunk:
+        try:
+            results.append((position, stationarity_tests(values, **options)))
+        except Exception as e:
+            # One short or constant series must not abort the batch
+            results.append((position, {'error': str(e)}))
+    return results
+
+
+class StationarityTester:
+    def __init__(self, max_lags=None, autolag='AIC', regression='c', kpss=False, n_jobs=None, use_cache=True):
+        if autolag is not None and autolag not in AUTOLAG_METHODS:
+            raise ValueError(f"Unsupported autolag method: {autolag}")
+        if regression not in REGRESSIONS:
+            raise ValueError(f"Unsupported regression: {regression}")
+
+        self.options = {'max_lags': max_lags, 'autolag': autolag, 'regression': regression, 'kpss': kpss}
+        self.n_jobs = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+        self.use_cache = use_cache
+
+    def _run_tests(self, items):
+        """Test (position, values) pairs, in a process pool if n_jobs > 1"""
+        n_chunks = min(len(items), max(1, self.n_jobs * CHUNKS_PER_WORKER))
+        if self.n_jobs > 1 and n_chunks > 1:
+            chunks = [items[i::n_chunks] for i in range(n_chunks)]
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, n_chunks)) as executor:
+                results = list(executor.map(_test_chunk, chunks, [self.options] * n_chunks))
+        else:
+            results = [_test_chunk(items, self.options)]
+        return dict(result for chunk_results in results for result in chunk_results)
+
+    def run(self, data, key_col, date_col, value_col):
+        """
+        Test the stationarity of many series stored in long format
+
+        Series whose values were tested before with the same options are
+        served from the cache; the others run in a process pool.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame
+            Long-format data with one row per series and date
+        key_col : str or list
+            Column(s) identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per series with the ADF (and KPSS) statistics, p-values
+            and lags, 'is_stationary', 'conclusion' (with KPSS), the test
+            timings, 'cached' and 'error'
+        """
+        key_cols = [key_col] if isinstance(key_col, str) else list(key_col)
+        frame = data[key_cols + [date_col, value_col]].dropna()
+        frame = frame.sort_values(key_cols + [date_col], kind='mergesort')
+
+        keys, series_values = [], []
+        for key, group in frame.groupby(key_cols, sort=True):
+            keys.append(key)
+            series_values.append(group[value_col].to_numpy(dtype=float))
+
+        options_key = tuple(sorted(self.options.items()))
+        fingerprints = [data_fingerprint(values) for values in series_values] if self.use_cache else None
+        results = {}
+        if self.use_cache:
+            for position, fingerprint in enumerate(fingerprints):
+                cached = _STATIONARITY_CACHE.get(('stationarity', fingerprint, options_key))
+                if cached is not None:
+                    results[position] = cached
+
+        misses = [(position, values) for position, values in enumerate(series_values) if position not in results]
+        computed = self._run_tests(misses) if misses else {}
+        if self.use_cache:
+            for position, result in computed.items():
+                if 'error' not in result:
+                    _STATIONARITY_CACHE.put(('stationarity', fingerprints[position], options_key), result)
+
+        records = []
+        for position, key in enumerate(keys):
+            result = results.get(position, computed.get(position))
+            record = dict(zip(key_cols, key))
+            record['cached'] = position in results
+            record['error'] = result.get('error')
+            if record['error'] is None:
+                record.update({
+                    'adf_statistic': result['test_statistic'],
+                    'adf_p_value': result['p_value'],
+                    'adf_lags': result['lags'],
+                    'is_stationary': result['is_stationary'],
+                    'adf_time': result['timings']['adf']
+                })
+                if 'kpss' in result:
+                    record.update({
+                        'kpss_statistic': result['kpss']['test_statistic'],
+                        'kpss_p_value': result['kpss']['p_value'],
+                        'kpss_lags': result['kpss']['lags'],
+                        'conclusion': result['conclusion'],
+                        'kpss_time': result['timings']['kpss']
+                    })
+            records.append(record)
+
+        columns = key_cols + ['adf_statistic', 'adf_p_value', 'adf_lags', 'is_stationary', 'adf_time']
+        if self.options['kpss']:
+            columns += ['kpss_statistic', 'kpss_p_value', 'kpss_lags', 'conclusion', 'kpss_time']
+        return pd.DataFrame(records).reindex(columns=columns + ['cached', 'error'])
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Streaming Trends Module"""
+import math
+import pandas as pd
+
+# Columns of the event frames returned by StreamingTrendMonitor.update_batch
+EVENT_COLUMNS = ('series', 'timestamp', 'type', 'value', 'method', 'score', 'direction', 'previous')
+
+
+class P2Quantile:
+    def __init__(self, p):
+        """
+        Streaming quantile estimator (P-square algorithm, Jain & Chlamtac 1985)
+
+        Five markers track the minimum, the quantile, the maximum and two
+        intermediate quantiles; their heights are adjusted with piecewise-
+        parabolic interpolation, so memory is constant.
+
+        Parameters:
+        -----------
+        p : float
+            Quantile to estimate (0 < p < 1)
+        """
+        if not 0 < p < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def update(self, x):
+        """Add an observation"""
+        self.count += 1
+        heights = self.heights
+
+        # The first five observations initialize the markers
+        if self.count <= 5:
+            heights.append(x)
+            heights.sort()
+            return
+
+        positions = self.positions
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + d * (heights[i + d] - heights[i]) / (positions[i + d] - positions[i])
+                heights[i] = height
+                positions[i] += d
+
+    def _parabolic(self, i, d):
+        """Piecewise-parabolic prediction of marker i moved by d"""
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self):
+        """Current quantile estimate (NaN before the first observation)"""
+        if self.count == 0:
+            return math.nan
+        if self.count < 5:
+            # Exact quantile with linear interpolation, like pandas
+            position = self.p * (self.count - 1)
+            lower = int(position)
+            upper = min(lower + 1, self.count - 1)
+            return self.heights[lower] + (position - lower) * (self.heights[upper] - self.heights[lower])
+        return self.heights[2]
+
+
+class OnlineTrendDetector:
+    def __init__(self, name=None, alpha=0.3, slow_alpha=0.05, outlier_method='zscore', outlier_threshold=3,
+                 trend_threshold=1.5, min_periods=20):
+        """
+        Online trend and outlier detector for one series
+
+        All statistics are updated in O(1) time and memory per observation:
+        fast and slow EWMAs, and the running mean and variance (Welford) or
+        P-square quartile estimates of the residuals from the fast EWMA.
+        Observations are scored by their residual, so a steady trend does
+        not turn every new value into an outlier, and outliers are clipped
+        to the outlier bounds before updating the statistics, so a single
+        spike does not register as a trend change.
+
+        Parameters:
+        -----------
+        name : str
+            Series name reported in events
+        alpha : float
+            Smoothing factor of the fast EWMA, the level residuals are
+            measured from (0 < alpha < 1)
+        slow_alpha : float
+            Smoothing factor of the slow EWMA (0 < slow_alpha < alpha)
+        outlier_method : str
+            Method to detect outliers ('zscore' or 'iqr')
+        outlier_threshold : float
+            Threshold for outlier detection (residual z-score or IQR multiple)
+        trend_threshold : float
+            Gap between the fast and slow EWMA, in residual standard
+            deviations, that marks an upward or downward trend
+        min_periods : int
+            Number of observations before events are emitted
+        """
+        if outlier_method not in ('zscore', 'iqr'):
+            raise ValueError(f"Unsupported method: {outlier_method}")
+        if not 0 < slow_alpha < alpha < 1:
+            raise ValueError("Smoothing factors must satisfy 0 < slow_alpha < alpha < 1")
+
+        self.name = name
+        self.alpha = alpha
+        self.slow_alpha = slow_alpha
+        self.outlier_method = outlier_method
+        self.outlier_threshold = outlier_threshold
+        self.trend_threshold = trend_threshold
+        self.min_periods = min_periods
+
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.ewma = math.nan
+        self.slow_ewma = math.nan
+        self.direction = 'flat'
+        self.q1 = P2Quantile(0.25) if outlier_method == 'iqr' else None
+        self.q3 = P2Quantile(0.75) if outlier_method == 'iqr' else None
+
+    @property
+    def n_residuals(self):
+        """Number of residuals seen (every observation after the first)"""
+        return max(self.count - 1, 0)
+
+    @property
+    def std(self):
+        """Sample standard deviation of the residuals so far"""
+        n = self.n_residuals
+        return math.sqrt(self._m2 / (n - 1)) if n > 1 else math.nan
+
+    def _event(self, event_type, timestamp, value, **fields):
+        """Build an event record"""
+        event = {'series': self.name, 'timestamp': timestamp, 'type': event_type, 'value': value}
+        event.update(fields)
+        return event
+
+    def _outlier_bounds(self):
+        """Residual range outside which observations are outliers (None until defined)"""
+        threshold = self.outlier_threshold
+        if self.outlier_method == 'zscore':
+            std = self.std
+            if not std > 0:
+                return None
+            return self.mean - threshold * std, self.mean + threshold * std
+
+        q1, q3 = self.q1.value, self.q3.value
+        iqr = q3 - q1
+        if not iqr > 0:
+            return None
+        return q1 - threshold * iqr, q3 + threshold * iqr
+
+    def _score(self, resid):
+        """Residual z-score, or distance from the quartiles in IQRs"""
+        if self.outlier_method == 'zscore':
+            return (resid - self.mean) / self.std
+        q1, q3 = self.q1.value, self.q3.value
+        return (resid - q1 if resid < q1 else resid - q3) / (q3 - q1)
+
+    def _check_trend(self, value, timestamp):
+        """Classify the gap between the fast and slow EWMA, with hysteresis"""
+        std = self.std
+        if not std > 0:
+            return None
+
+        gap = (self.ewma - self.slow_ewma) / std
+        direction = self.direction
+        if gap > self.trend_threshold:
+            direction = 'up'
+        elif gap < -self.trend_threshold:
+            direction = 'down'
+        elif abs(gap) < self.trend_threshold / 2:
+            direction = 'flat'
+
+        if direction == self.direction:
+            return None
+        previous, self.direction = self.direction, direction
+        return self._event('trend_change', timestamp, value, score=gap, direction=direction, previous=previous)
+
+    def update(self, value, timestamp=None):
+        """
+        Consume one observation
+
+        Parameters:
+        -----------
+        value : float
+            Observed value (NaN values are ignored)
+        timestamp : object
+            Time of the observation, reported in events
+
+        Returns:
+        --------
+        list
+            Outlier and trend-change events triggered by the observation
+        """
+        value = float(value)
+        if math.isnan(value):
+            return []
+
+        self.count += 1
+        if self.count == 1:
+            self.ewma = self.slow_ewma = value
+            return []
+
+        events = []
+        warmed_up = self.count > self.min_periods
+        observed = value
+        resid = value - self.ewma
+        if warmed_up:
+            bounds = self._outlier_bounds()
+            if bounds is not None and not bounds[0] <= resid <= bounds[1]:
+                events.append(self._event('outlier', timestamp, value, method=self.outlier_method,
+                                          score=self._score(resid)))
+                resid = min(max(resid, bounds[0]), bounds[1])
+                value = self.ewma + resid
+
+        # Welford's update of the running residual mean and variance
+        n = self.n_residuals
+        delta = resid - self.mean
+        self.mean += delta / n
+        self._m2 += delta * (resid - self.mean)
+        if self.q1 is not None:
+            self.q1.update(resid)
+            self.q3.update(resid)
+
+        self.ewma += self.alpha * resid
+        self.slow_ewma += self.slow_alpha * (value - self.slow_ewma)
+
+        if warmed_up:
+            trend = self._check_trend(observed, timestamp)
+            if trend is not None:
+                events.append(trend)
+
+        return events
+
+    def update_batch(self, values, timestamps=None):
+        """
+        Consume a micro-batch of observations in order
+
+        Parameters:
+        -----------
+        values : array-like
+            Observed values
+        timestamps : array-like
+            Times of the observations (if None, events have no timestamp)
+
+        Returns:
+        --------
+        list
+            Events triggered by the batch
+        """
+        if timestamps is None:
+            timestamps = [None] * len(values)
+
+        events = []
+        for value, timestamp in zip(values, timestamps):
+            events.extend(self.update(value, timestamp))
+        return events
+
+    def get_state(self):
+        """
+        Get the current running statistics
+
+        Returns:
+        --------
+        dict
+            Count, EWMAs, trend direction, and the mean, standard deviation
+            and quartile estimates (IQR method) of the residuals
+        """
+        state = {
+            'count': self.count,
+            'resid_mean': self.mean if self.n_residuals else math.nan,
+            'resid_std': self.std,
+            'ewma': self.ewma,
+            'slow_ewma': self.slow_ewma,
+            'direction': self.direction
+        }
+        if self.q1 is not None:
+            state['resid_q1'] = self.q1.value
+            state['resid_q3'] = self.q3.value
+        return state
+
+
+class StreamingTrendMonitor:
+    def __init__(self, **detector_params):
+        """
+        Online trend detection for many series, one detector per key
+
+        Parameters:
+        -----------
+        **detector_params
+            Parameters of every OnlineTrendDetector
+        """
+        # Validate the parameters once rather than on the first observation of a series
+        OnlineTrendDetector(**detector_params)
+        self.detector_params = detector_params
+        self.detectors = {}
+
+    def detector(self, key):
+        """Get the detector of a series, creating it on first use"""
+        detector = self.detectors.get(key)
+        if detector is None:
+            detector = OnlineTrendDetector(name=key, **self.detector_params)
+            self.detectors[key] = detector
+        return detector
+
+    def update(self, key, value, timestamp=None):
+        """
+        Consume one observation of a series
+
+        Parameters:
+        -----------
+        key : hashable
+            Series identifier
+        value : float
+            Observed value
+        timestamp : object
+            Time of the observation
+
+        Returns:
+        --------
+        list
+            Events triggered by the observation
+        """
+        return self.detector(key).update(value, timestamp)
+
+    def update_batch(self, data, key_col, date_col, value_col):
+        """
+        Consume a micro-batch of observations in long format
+
+        Rows are processed in date order; each series only sees its own rows.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame
+            Observations with one row per series and date
+        key_col : str
+            Column name identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per event with the EVENT_COLUMNS
+        """
+        data = data.sort_values(date_col, kind='mergesort')
+
+        events = []
+        for key, group in data.groupby(key_col, sort=False):
+            events.extend(self.detector(key).update_batch(group[value_col].tolist(), group[date_col].tolist()))
+
+        events = pd.DataFrame(events, columns=list(EVENT_COLUMNS))
+        return events.sort_values('timestamp', kind='mergesort').reset_index(drop=True)
+
+    def get_state(self):
+        """
+        Get the running statistics of all series
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per series
+        """
+        return pd.DataFrame.from_dict({key: detector.get_state() for key, detector in self.detectors.items()},
+                                      orient='index')
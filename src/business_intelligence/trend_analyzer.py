@@ -1,14 +1,158 @@
 #!/usr/bin/env python3
 """Trend Analyzer Module"""
+import time
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.tsa.stattools import adfuller
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
+from statsmodels.tsa.seasonal import DecomposeResult, seasonal_decompose
+
+from src.utils.cache import LRUCache, data_fingerprint
+from src.utils.dataset import Dataset, share, time_indexed
+from src.utils.ingestion import load_frame
+from src.business_intelligence.seasonality import infer_period, regularize
+from src.business_intelligence.changepoints import detect_change_points, segment_statistics
+from src.business_intelligence.stationarity import stationarity_tests
+
+# Analysis results shared by all analyzers, keyed by series fingerprint and
+# parameters, so refreshing a dashboard on unchanged data recomputes nothing
+_ANALYSIS_CACHE = LRUCache(maxsize=128)
+
+# Defaults of the analyses run by analyze()
+DEFAULT_CONFIG = {
+    'decompose': True,
+    'model': 'additive',
+    'period': None,
+    'test_stationarity': True,
+    'adf_max_lags': None,
+    'adf_autolag': 'AIC',
+    'kpss': False,
+    'moving_average': True,
+    'ma_window': 7,
+    'exponential_smoothing': True,
+    'es_alpha': 0.3,
+    'detect_outliers': True,
+    'outlier_method': 'zscore',
+    'outlier_threshold': 3,
+    'outlier_window': 31,
+    'detect_change_points': False,
+    'change_point_method': 'binseg',
+    'change_point_cost': 'l2',
+    'change_point_penalty': None
+}
+
+# The MAD of the rolling method is taken over this many baseline windows; a
+# MAD over a single short window is so noisy that scores become heavy-tailed
+MAD_WINDOWS = 4
+
+# Scale factors turning the median and mean absolute deviation into normal standard deviations
+MAD_SCALE = 1.4826
+MEAN_AD_SCALE = 1.2533
+
+
+def robust_scale(abs_deviation):
+    """
+    Robust standard deviation from absolute deviations around a median
+    
+    Parameters:
+    -----------
+    abs_deviation : pd.Series or Rolling
+        Absolute deviations, or a rolling window over them
+        
+    Returns:
+    --------
+    float or pd.Series
+        Scaled median absolute deviation; where it is zero (more than half
+        of the values are equal), the scaled mean absolute deviation
+    """
+    mad = abs_deviation.median() * MAD_SCALE
+    mean_ad = abs_deviation.mean() * MEAN_AD_SCALE
+    if isinstance(mad, pd.Series):
+        return mad.where(mad > 0, mean_ad)
+    return mad if mad > 0 else mean_ad
+
+
+def copy_result(value):
+    """
+    Copy a cached analysis result, so changes by one caller do not reach the cache
+    
+    Containers are copied recursively. Series and DataFrames are shallow
+    copies under copy-on-write, which are independent of the cached objects
+    without copying their data up front (see share).
+    
+    Parameters:
+    -----------
+    value : object
+        Result, or part of a result
+        
+    Returns:
+    --------
+    object
+        Copy of value; immutable values are returned as is
+    """
+    if isinstance(value, dict):
+        return {key: copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_result(item) for item in value]
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return share(value)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, DecomposeResult):
+        return DecomposeResult(*(copy_result(getattr(value, name))
+                                 for name in ('observed', 'seasonal', 'trend', 'resid', 'weights')))
+    return value
+
+
+def rolling_median_window(window):
+    """Centered rolling window options for median-based baselines"""
+    # At least half a window at the edges keeps the baseline stable
+    return {'window': window, 'center': True, 'min_periods': window // 2 + 1}
 
 class TrendAnalyzer:
-    def __init__(self, data=None):
+    def __init__(self, data=None, use_cache=True):
         self.data = data
+        self.use_cache = use_cache
+        
+    def _series(self, column=None):
+        """Get a column (the first column if None) of the loaded data"""
+        if self.data is None:
+            raise ValueError("No data loaded")
+            
+        # If column is not specified, use the first column
+        if column is None:
+            column = self.data.columns[0]
+            
+        return self.data[column]
+        
+    def _cached(self, name, series, params, compute):
+        """
+        Run compute through the analysis cache
+        
+        Parameters:
+        -----------
+        name : str
+            Analysis name
+        series : pd.Series
+            Analyzed series
+        params : tuple
+            Analysis parameters (hashable)
+        compute : callable
+            Zero-argument function computing the result
+            
+        Returns:
+        --------
+        object
+            Cached or freshly computed result; cached results are copied
+            (see copy_result), so callers may modify them
+        """
+        if not self.use_cache:
+            return compute()
+            
+        # The fingerprint is recomputed on every call, so reassigned or
+        # modified data is never served another series' results; one hashing
+        # pass is far cheaper than any cached analysis
+        fingerprint = data_fingerprint(series)
+        
+        return copy_result(_ANALYSIS_CACHE.get_or_compute((name, fingerprint, params), compute))
         
     def load_data(self, data, date_col=None, value_col=None):
         """
@@ -29,35 +173,21 @@ class TrendAnalyzer:
             True if successful
         """
         try:
-            if isinstance(data, str):
-                if data.endswith('.csv'):
-                    self.data = pd.read_csv(data)
-                elif data.endswith(('.xls', '.xlsx')):
-                    self.data = pd.read_excel(data)
-                else:
-                    raise ValueError(f"Unsupported file format: {data}")
+            if date_col and isinstance(data, Dataset):
+                # Steps sharing a dataset share its indexed series
+                self.data = data.time_indexed(date_col, value_col)
+            elif date_col:
+                # Index by the date column without modifying the caller's frame
+                self.data = time_indexed(load_frame(data), date_col, value_col)
             else:
-                self.data = data
-                
-            # Set index to date column if specified
-            if date_col:
-                # Convert date column to datetime if it's not already
-                if not pd.api.types.is_datetime64_dtype(self.data[date_col]):
-                    self.data[date_col] = pd.to_datetime(self.data[date_col])
-                    
-                # Set index
-                self.data = self.data.set_index(date_col)
-                
-                # If value column is specified, keep only that column
-                if value_col:
-                    self.data = self.data[[value_col]]
+                self.data = load_frame(data)
                     
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
             
-    def decompose_time_series(self, column=None, model='additive', period=None):
+    def decompose_time_series(self, column=None, model='additive', period=None, extrapolate_trend=0):
         """
         Decompose time series into trend, seasonal, and residual components
         
@@ -68,44 +198,67 @@ class TrendAnalyzer:
         model : str
             Decomposition model ('additive' or 'multiplicative')
         period : int
-            Period for seasonal decomposition (if None, infer from data)
+            Period for seasonal decomposition (if None, infer from data, falling
+            back to the usual calendar period when no seasonality is detected)
+        extrapolate_trend : int
+            Extrapolate the trend at the ends from this many points instead
+            of leaving half a period missing (0 to disable)
             
         Returns:
         --------
         statsmodels.tsa.seasonal.DecomposeResult
             Decomposition result
         """
-        if self.data is None:
-            raise ValueError("No data loaded")
+        series = self._series(column)
             
-        # If column is not specified, use the first column
-        if column is None:
-            column = self.data.columns[0]
-            
-        # If period is not specified, infer from data
-        if period is None:
-            # For monthly data, use 12
-            if self.data.index.freqstr == 'M':
-                period = 12
-            # For quarterly data, use 4
-            elif self.data.index.freqstr == 'Q':
-                period = 4
-            # For weekly data, use 52
-            elif self.data.index.freqstr == 'W':
-                period = 52
-            # For daily data, use 7
-            elif self.data.index.freqstr == 'D':
-                period = 7
-            # Default to 12
-            else:
-                period = 12
+        # If period is not specified, infer it from the sampling interval and the data
+        period = self._resolve_period(series.name, period)
                 
-        # Decompose
-        result = seasonal_decompose(self.data[column], model=model, period=period)
+        # Decompose the series on a regular grid without gaps
+        result = self._cached('decompose', series, (model, period, extrapolate_trend),
+                              lambda: seasonal_decompose(regularize(series), model=model, period=period,
+                                                         extrapolate_trend=extrapolate_trend))
         
         return result
         
-    def test_stationarity(self, column=None):
+    def _resolve_period(self, column, period, required=True):
+        """Return period, or the inferred period (calendar default if none is detected)"""
+        if period is not None:
+            return period
+            
+        inferred = self.infer_period(column)
+        period = inferred['period'] or inferred['default_period']
+        if period is None and required:
+            raise ValueError("No seasonal period could be inferred; pass period explicitly")
+            
+        return period
+        
+    def infer_period(self, column=None, max_period=None):
+        """
+        Infer the sampling interval and dominant seasonal period
+        
+        The period is the periodogram peak or calendar period (e.g. 7 for
+        daily data) with the strongest significant seasonal strength, found
+        in O(n log n); irregular or gappy indices are resampled first.
+        
+        Parameters:
+        -----------
+        column : str
+            Column name to analyze (if None, use the first column)
+        max_period : int
+            Largest period considered (if None, a quarter of the series length)
+            
+        Returns:
+        --------
+        dict
+            'freq', 'period' (None if no seasonality was found),
+            'default_period' (usual calendar period) and the regularized 'series'
+        """
+        series = self._series(column)
+        
+        return self._cached('period', series, (max_period,), lambda: infer_period(series, max_period=max_period))
+        
+    def test_stationarity(self, column=None, max_lags=None, autolag='AIC', kpss=False):
         """
         Test stationarity of time series
         
@@ -113,33 +266,25 @@ class TrendAnalyzer:
         -----------
         column : str
             Column name to test (if None, use the first column)
+        max_lags : int
+            Largest ADF lag searched (if None, 12 * (n / 100) ** (1 / 4));
+            a small cap makes the lag search much faster
+        autolag : str
+            ADF lag selection ('AIC', 'BIC', 't-stat' or None to use max_lags)
+        kpss : bool
+            Whether to run the KPSS test as well
             
         Returns:
         --------
         dict
-            Dictionary with test results
+            Dictionary with test results; with kpss, the KPSS results in
+            'kpss' and the combined 'conclusion'; seconds per test in 'timings'
         """
-        if self.data is None:
-            raise ValueError("No data loaded")
-            
-        # If column is not specified, use the first column
-        if column is None:
-            column = self.data.columns[0]
+        series = self._series(column)
             
-        # Run Augmented Dickey-Fuller test
-        result = adfuller(self.data[column].dropna())
-        
-        # Format results
-        output = {
-            'test_statistic': result[0],
-            'p_value': result[1],
-            'lags': result[2],
-            'observations': result[3],
-            'critical_values': result[4],
-            'is_stationary': result[1] < 0.05
-        }
-        
-        return output
+        return self._cached('stationarity', series, (max_lags, autolag, kpss),
+                            lambda: stationarity_tests(series.dropna().to_numpy(dtype=float), max_lags=max_lags,
+                                                       autolag=autolag, kpss=kpss))
         
     def calculate_moving_average(self, column=None, window=7):
         """
@@ -197,18 +342,32 @@ class TrendAnalyzer:
         
         return es
         
-    def detect_outliers(self, column=None, method='zscore', threshold=3):
+    def detect_outliers(self, column=None, method='zscore', threshold=3, window=31, model='additive', period=None):
         """
         Detect outliers in time series
         
+        'zscore' and 'iqr' compare every value with global statistics, so
+        seasonal peaks and trends are flagged too. 'rolling_mad' compares
+        each value with the median of a centered window, scaled by the
+        median absolute deviation over MAD_WINDOWS such windows, which
+        follows trends and level shifts; 'seasonal' scores the residuals
+        of the seasonal decomposition by their median and MAD, so regular
+        seasonal peaks are not flagged.
+        
         Parameters:
         -----------
         column : str
             Column name to detect outliers (if None, use the first column)
         method : str
-            Method to detect outliers ('zscore' or 'iqr')
+            Method to detect outliers ('zscore', 'iqr', 'rolling_mad' or 'seasonal')
         threshold : float
-            Threshold for outlier detection
+            Threshold for outlier detection (z-score, IQR multiple or robust z-score)
+        window : int
+            Window size of the 'rolling_mad' baseline
+        model : str
+            Decomposition model of the 'seasonal' method
+        period : int
+            Seasonal period of the 'seasonal' method (if None, inferred)
             
         Returns:
         --------
@@ -235,7 +394,161 @@ class TrendAnalyzer:
             lower_bound = q1 - threshold * iqr
             upper_bound = q3 + threshold * iqr
             outliers = (self.data[column] < lower_bound) | (self.data[column] > upper_bound)
+        elif method == 'rolling_mad':
+            # Rolling median and MAD around it (two vectorized rolling passes)
+            series = self.data[column]
+            median = series.rolling(**rolling_median_window(window)).median()
+            deviation = (series - median).abs()
+            scale = robust_scale(deviation.rolling(**rolling_median_window(MAD_WINDOWS * window)))
+            outliers = deviation / scale > threshold
+        elif method == 'seasonal':
+            # Robust z-score of the decomposition residuals, trend extrapolated to the ends
+            period = self._resolve_period(column, period)
+            decomposition = self.decompose_time_series(column=column, model=model, period=period,
+                                                       extrapolate_trend=period)
+            resid = decomposition.resid.reindex(self.data.index)
+            deviation = (resid - resid.median()).abs()
+            outliers = deviation / robust_scale(deviation) > threshold
         else:
             raise ValueError(f"Unsupported method: {method}")
             
         return outliers
+        
+    def detect_change_points(self, column=None, method='binseg', cost='l2', penalty=None, min_size=3, n_bkps=None):
+        """
+        Detect structural breaks (e.g. a pricing change or an outage)
+        
+        Segment costs are computed in O(1) from cumulative sums, so binary
+        segmentation runs in O(n log n). PELT finds the optimal segmentation
+        but is quadratic when changes are rare. The 'l2' cost assumes a
+        constant noise variance and splits segments whose volatility changes
+        into spurious segments; use 'normal' for such series.
+        
+        Parameters:
+        -----------
+        column : str
+            Column name to analyze (if None, use the first column)
+        method : str
+            'binseg' (greedy, O(n log n)) or 'pelt' (exact, quadratic when changes are rare)
+        cost : str
+            Cost function ('l2' for mean shifts, 'normal' for mean and variance changes)
+        penalty : float
+            Cost of adding a change point (if None, BIC)
+        min_size : int
+            Minimum segment length
+        n_bkps : int
+            Number of change points (binseg only; if None, chosen by the penalty)
+            
+        Returns:
+        --------
+        dict
+            'change_points' (index labels where a new segment starts) and
+            'segments' (statistics per segment)
+        """
+        series = self._series(column)
+        
+        def compute():
+            values = series.dropna()
+            positions = detect_change_points(values.to_numpy(dtype=float), method=method, penalty=penalty,
+                                             cost=cost, min_size=min_size, n_bkps=n_bkps)
+            return {
+                'change_points': list(values.index[positions]),
+                'segments': segment_statistics(values, positions)
+            }
+            
+        return self._cached('change_points', series, (method, cost, penalty, min_size, n_bkps), compute)
+        
+    def analyze(self, column=None, config=None):
+        """
+        Run the trend analyses of a series
+        
+        Results are cached by series fingerprint and configuration, so an
+        unchanged series is analyzed only once.
+        
+        Parameters:
+        -----------
+        column : str
+            Column name to analyze (if None, use the first column)
+        config : dict
+            Analysis configuration overriding DEFAULT_CONFIG
+            
+        Returns:
+        --------
+        dict
+            Trend analysis results
+        """
+        config = dict(DEFAULT_CONFIG, **(config or {}))
+        series = self._series(column)
+        
+        return self._cached('analyze', series, repr(sorted(config.items())),
+                            lambda: self._analyze(series.name, config))
+        
+    def _analyze(self, column, config):
+        """Run the analyses enabled in config, timing each"""
+        results = {}
+        timings = {}
+        skipped = {}
+        
+        # Decompose time series; series without a detectable or calendar period
+        # (e.g. yearly data) are not decomposed
+        if config['decompose']:
+            start = time.perf_counter()
+            period = self._resolve_period(column, config['period'], required=False)
+            if period is None:
+                skipped['decomposition'] = "No seasonal period could be inferred; set 'period' to decompose"
+            else:
+                decomposition = self.decompose_time_series(column=column, model=config['model'], period=period)
+                results['decomposition'] = {
+                    'period': period,
+                    'trend': decomposition.trend,
+                    'seasonal': decomposition.seasonal,
+                    'resid': decomposition.resid
+                }
+            timings['decomposition'] = time.perf_counter() - start
+            
+        # Test stationarity
+        if config['test_stationarity']:
+            start = time.perf_counter()
+            results['stationarity'] = self.test_stationarity(column=column, max_lags=config['adf_max_lags'],
+                                                             autolag=config['adf_autolag'], kpss=config['kpss'])
+            timings['stationarity'] = time.perf_counter() - start
+            
+        # Calculate moving average
+        if config['moving_average']:
+            start = time.perf_counter()
+            results['moving_average'] = self.calculate_moving_average(column=column, window=config['ma_window'])
+            timings['moving_average'] = time.perf_counter() - start
+            
+        # Calculate exponential smoothing
+        if config['exponential_smoothing']:
+            start = time.perf_counter()
+            results['exponential_smoothing'] = self.calculate_exponential_smoothing(
+                column=column, alpha=config['es_alpha']
+            )
+            timings['exponential_smoothing'] = time.perf_counter() - start
+            
+        # Detect outliers
+        if config['detect_outliers']:
+            start = time.perf_counter()
+            results['outliers'] = self.detect_outliers(column=column, method=config['outlier_method'],
+                                                       threshold=config['outlier_threshold'],
+                                                       window=config['outlier_window'], model=config['model'],
+                                                       period=config['period'])
+            timings['outliers'] = time.perf_counter() - start
+            
+        # Detect change points
+        if config['detect_change_points']:
+            start = time.perf_counter()
+            results['change_points'] = self.detect_change_points(column=column,
+                                                                 method=config['change_point_method'],
+                                                                 cost=config['change_point_cost'],
+                                                                 penalty=config['change_point_penalty'])
+            timings['change_points'] = time.perf_counter() - start
+            
+        # Seconds per analysis; a shared cached step takes almost no time, its
+        # 'stationarity' entry keeps the time of the ADF and KPSS runs
+        results['timings'] = timings
+        if skipped:
+            results['skipped'] = skipped
+        
+        return results
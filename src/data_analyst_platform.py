@@ -2,129 +2,217 @@
 """Data Analyst Platform Module"""
 import os
 import sys
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Add src directory to path
-
-
-if __name__ == '__main__':
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-    # Import modules
-    from src.excel.excel_analyzer import ExcelAnalyzer
-    from src.excel.pivot_generator import PivotGenerator
-    from src.visualization.plotly_charts import PlotlyCharts
-    from src.visualization.dashboard_builder import DashboardBuilder
-    from src.business_intelligence.kpi_calculator import KPICalculator
-    from src.business_intelligence.trend_analyzer import TrendAnalyzer
-    from src.business_intelligence.forecast_engine import ForecastEngine
-
-    class DataAnalystPlatform:
-        def __init__(self):
-            self.excel_analyzer = None
-            self.pivot_generator = None
-            self.plotly_charts = None
-            self.dashboard_builder = None
-            self.kpi_calculator = None
-            self.trend_analyzer = None
-            self.forecast_engine = None
-
-        def initialize_modules(self):
-            """Initialize all modules"""
-            self.excel_analyzer = ExcelAnalyzer(None)
-            self.pivot_generator = PivotGenerator(None)
-            self.plotly_charts = PlotlyCharts()
-            self.dashboard_builder = DashboardBuilder("IBM Data Analyst Dashboard")
-            self.kpi_calculator = KPICalculator()
-            self.trend_analyzer = TrendAnalyzer()
-            self.forecast_engine = ForecastEngine()
-
-        def analyze_excel(self, file_path):
-            """
-            Analyze Excel file
-
-            Parameters:
-            -----------
-            file_path : str
-                Path to Excel file
-
-            Returns:
-            --------
-            dict
-                Analysis results
-            """
-            self.excel_analyzer = ExcelAnalyzer(file_path)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.columns import column_list
+from src.utils.profiling import profile_span, profiled
+
+# The analysis modules pull in pandas, plotly, dash, statsmodels and
+# scikit-learn; they are imported by the methods that use them, so a CLI run
+# only loads the modules of its mode
+
+# Chart settings naming data columns
+CHART_COLUMN_KEYS = ('x', 'y', 'color', 'size', 'values', 'names')
+
+# Lags of linear forecasts given neither feature columns nor generated features
+DEFAULT_LINEAR_LAGS = [1]
+
+
+def required_columns(mode, params):
+    """
+    Columns an operation reads, derived from its parameters
+
+    Parameters:
+    -----------
+    mode : str
+        Operation ('pivot', 'dashboard', 'kpi', 'trend' or 'forecast')
+    params : dict
+        Parameters of the operation, as in server requests and pipeline
+        steps: 'index', 'columns', 'values' (pivot); 'charts' (dashboard);
+        'kpi_config' (kpi); 'date_col', 'value_col' (trend, forecast)
+
+    Returns:
+    --------
+    list
+        Column names in first-use order, or None if the operation may read
+        any column (unknown mode, or a pivot without index or values)
+    """
+    if mode == 'pivot':
+        if params.get('index') is None or params.get('values') is None:
+            # pivot_table aggregates every remaining column without values
+            return None
+        columns = column_list(params['index']) + column_list(params.get('columns')) + \
+            column_list(params['values'])
+    elif mode == 'dashboard':
+        columns = [column for chart in params.get('charts') or [] for key in CHART_COLUMN_KEYS
+                   for column in column_list(chart.get(key))]
+    elif mode == 'kpi':
+        # Every KPI names its columns in settings ending with '_col'
+        columns = [column for config in (params.get('kpi_config') or {}).values()
+                   for key, value in config.items() if key.endswith('_col') for column in column_list(value)]
+    elif mode in ('trend', 'forecast'):
+        columns = column_list(params.get('date_col')) + column_list(params.get('value_col'))
+    else:
+        return None
+    return list(dict.fromkeys(columns))
+
+class DataAnalystPlatform:
+    def __init__(self):
+        self.excel_analyzer = None
+        self.pivot_generator = None
+        self.plotly_charts = None
+        self.dashboard_builder = None
+        self.kpi_calculator = None
+        self.trend_analyzer = None
+        self.forecast_engine = None
+        self._forecast_key = None
+
+    def initialize_modules(self):
+        """Initialize all modules"""
+        from src.excel.excel_analyzer import ExcelAnalyzer
+        from src.excel.pivot_generator import PivotGenerator
+        from src.visualization.plotly_charts import PlotlyCharts
+        from src.visualization.dashboard_builder import DashboardBuilder
+        from src.business_intelligence.kpi_calculator import KPICalculator
+        from src.business_intelligence.trend_analyzer import TrendAnalyzer
+        from src.business_intelligence.forecast_engine import ForecastEngine
+
+        self.excel_analyzer = ExcelAnalyzer(None)
+        self.pivot_generator = PivotGenerator(None)
+        self.plotly_charts = PlotlyCharts()
+        self.dashboard_builder = DashboardBuilder("IBM Data Analyst Dashboard")
+        self.kpi_calculator = KPICalculator()
+        self.trend_analyzer = TrendAnalyzer()
+        self.forecast_engine = ForecastEngine()
+
+    def load_data(self, path, columns=None, filters=None):
+        """
+        Load a data file
+
+        Parameters:
+        -----------
+        path : str
+            Path to a CSV, Excel, Parquet, Feather or JSON-lines file (the
+            format is detected from the extension or the content)
+        columns : list
+            Columns to read (if None, all columns)
+        filters : list
+            (column, op, value) row filters, pushed down to Parquet files
+
+        Returns:
+        --------
+        pd.DataFrame
+            Loaded data
+        """
+        from src.utils.ingestion import read_data
+
+        return read_data(path, columns=columns, filters=filters)
+
+    @profiled('analyze_excel')
+    def analyze_excel(self, file_path):
+        """
+        Analyze Excel file
+
+        Parameters:
+        -----------
+        file_path : str
+            Path to Excel file
+
+        Returns:
+        --------
+        dict
+            Analysis results
+        """
+        from src.excel.excel_analyzer import ExcelAnalyzer
+
+        self.excel_analyzer = ExcelAnalyzer(file_path)
+        with profile_span('load', file=file_path):
             self.excel_analyzer.load_workbook()
 
-            results = {}
+        results = {}
 
-            # Get sheet names
-            sheet_names = self.excel_analyzer.get_sheet_names()
-            results['sheet_names'] = sheet_names
+        # Get sheet names
+        sheet_names = self.excel_analyzer.get_sheet_names()
+        results['sheet_names'] = sheet_names
 
-            # Analyze each sheet
-            sheet_analyses = {}
-            for sheet_name in sheet_names:
+        # Analyze each sheet
+        sheet_analyses = {}
+        for sheet_name in sheet_names:
+            with profile_span('analyze', sheet=sheet_name):
                 sheet_analyses[sheet_name] = self.excel_analyzer.analyze_sheet(sheet_name)
 
-            results['sheet_analyses'] = sheet_analyses
-
-            return results
-
-        def create_pivot(self, data, index, columns, values, aggfunc='sum'):
-            """
-            Create pivot table
-
-            Parameters:
-            -----------
-            data : pd.DataFrame or str
-                Data to pivot
-            index : str or list
-                Column(s) to use as index
-            columns : str or list
-                Column(s) to use as columns
-            values : str or list
-                Column(s) to aggregate
-            aggfunc : str or function
-                Aggregation function to use
-
-            Returns:
-            --------
-            pd.DataFrame
-                Pivot table
-            """
-            self.pivot_generator = PivotGenerator(data)
+        results['sheet_analyses'] = sheet_analyses
+
+        return results
+
+    @profiled('create_pivot')
+    def create_pivot(self, data, index, columns, values, aggfunc='sum'):
+        """
+        Create pivot table
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or str
+            Data to pivot, or path to a data file; above the active memory
+            budget the pivot runs in chunks and spills to disk
+        index : str or list
+            Column(s) to use as index
+        columns : str or list
+            Column(s) to use as columns
+        values : str or list
+            Column(s) to aggregate
+        aggfunc : str or function
+            Aggregation function to use
+
+        Returns:
+        --------
+        pd.DataFrame
+            Pivot table
+        """
+        from src.excel.pivot_generator import PivotGenerator
+
+        self.pivot_generator = PivotGenerator(data)
+        with profile_span('transform', operation='pivot_table') as span:
             pivot = self.pivot_generator.create_pivot(index, columns, values, aggfunc)
-            return pivot
-
-        def create_dashboard(self, data, charts_config, title="IBM Data Analyst Dashboard"):
-            """
-            Create dashboard
-
-            Parameters:
-            -----------
-            data : pd.DataFrame
-                Data to visualize
-            charts_config : list
-                List of chart configurations
-            title : str
-                Dashboard title
-
-            Returns:
-            --------
-            DashboardBuilder
-                Dashboard builder object
-            """
-            self.dashboard_builder = DashboardBuilder(title)
-
-            # Create charts
-            for config in charts_config:
-                chart_type = config.get('type', 'bar')
-                chart_title = config.get('title', '')
+            span['rows_out'] = len(pivot)
+        return pivot
+
+    @profiled('create_dashboard')
+    def create_dashboard(self, data, charts_config, title="IBM Data Analyst Dashboard"):
+        """
+        Create dashboard
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or Dataset
+            Data to visualize
+        charts_config : list
+            List of chart configurations
+        title : str
+            Dashboard title
+
+        Returns:
+        --------
+        DashboardBuilder
+            Dashboard builder object
+        """
+        from src.visualization.plotly_charts import PlotlyCharts
+        from src.visualization.dashboard_builder import DashboardBuilder
+        from src.utils.ingestion import load_frame
+
+        data = load_frame(data)
+        if self.plotly_charts is None:
+            self.plotly_charts = PlotlyCharts()
+        self.dashboard_builder = DashboardBuilder(title)
 
+        # Create charts
+        for config in charts_config:
+            chart_type = config.get('type', 'bar')
+            chart_title = config.get('title', '')
+
+            with profile_span('render', chart=chart_type):
                 if chart_type == 'bar':
                     fig = self.plotly_charts.create_bar_chart(
                         data,
@@ -162,32 +250,39 @@ if __name__ == '__main__':
 
                 self.dashboard_builder.add_chart(fig, title=chart_title)
 
-            return self.dashboard_builder
+        return self.dashboard_builder
+
+    @profiled('calculate_kpis')
+    def calculate_kpis(self, data, kpi_config):
+        """
+        Calculate KPIs
 
-        def calculate_kpis(self, data, kpi_config):
-            """
-            Calculate KPIs
+        Parameters:
+        -----------
+        data : pd.DataFrame or str
+            Data to analyze, or path to a data file; above the active memory
+            budget customer lifetime values run in chunks and spill to disk
+        kpi_config : dict
+            KPI configuration
 
-            Parameters:
-            -----------
-            data : pd.DataFrame
-                Data to analyze
-            kpi_config : dict
-                KPI configuration
+        Returns:
+        --------
+        dict
+            KPI results
+        """
+        from src.business_intelligence.kpi_calculator import KPICalculator
 
-            Returns:
-            --------
-            dict
-                KPI results
-            """
-            self.kpi_calculator = KPICalculator(data)
+        self.kpi_calculator = KPICalculator()
+        if not self.kpi_calculator.load_data(data):
+            raise ValueError(f"Could not load data: {data}")
 
-            results = {}
+        results = {}
 
-            # Calculate KPIs based on configuration
-            for kpi_name, config in kpi_config.items():
-                kpi_type = config.get('type')
+        # Calculate KPIs based on configuration
+        for kpi_name, config in kpi_config.items():
+            kpi_type = config.get('type')
 
+            with profile_span('transform', kpi=kpi_name):
                 if kpi_type == 'revenue_growth':
                     results[kpi_name] = self.kpi_calculator.calculate_revenue_growth(
                         period_col=config.get('period_col'),
@@ -224,119 +319,263 @@ if __name__ == '__main__':
                         periods=config.get('periods')
                     )
 
-            return results
-
-        def analyze_trends(self, data, date_col, value_col, config=None):
-            """
-            Analyze trends
-
-            Parameters:
-            -----------
-            data : pd.DataFrame
-                Data to analyze
-            date_col : str
-                Column name for date
-            value_col : str
-                Column name for value
-            config : dict
-                Analysis configuration
-
-            Returns:
-            --------
-            dict
-                Trend analysis results
-            """
-            self.trend_analyzer = TrendAnalyzer()
+        return results
+
+    @profiled('analyze_trends')
+    def analyze_trends(self, data, date_col, value_col, config=None):
+        """
+        Analyze trends
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or Dataset
+            Data to analyze; a Dataset shares its date-indexed series with
+            other steps (e.g. forecast) on the same data
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+        config : dict
+            Analysis configuration (see TrendAnalyzer.analyze); results for
+            unchanged data and configuration are served from a cache
+
+        Returns:
+        --------
+        dict
+            Trend analysis results
+        """
+        from src.business_intelligence.trend_analyzer import TrendAnalyzer
+
+        self.trend_analyzer = TrendAnalyzer()
+        with profile_span('transform', operation='load_data'):
             self.trend_analyzer.load_data(data, date_col, value_col)
 
-            results = {}
-
-            # Decompose time series
-            if config is None or config.get('decompose', True):
-                decomposition = self.trend_analyzer.decompose_time_series(
-                    column=value_col,
-                    model=config.get('model', 'additive') if config else 'additive',
-                    period=config.get('period') if config else None
-                )
-
-                results['decomposition'] = {
-                    'trend': decomposition.trend,
-                    'seasonal': decomposition.seasonal,
-                    'resid': decomposition.resid
-                }
-
-            # Test stationarity
-            if config is None or config.get('test_stationarity', True):
-                stationarity = self.trend_analyzer.test_stationarity(column=value_col)
-                results['stationarity'] = stationarity
-
-            # Calculate moving average
-            if config is None or config.get('moving_average', True):
-                window = config.get('ma_window', 7) if config else 7
-                ma = self.trend_analyzer.calculate_moving_average(column=value_col, window=window)
-                results['moving_average'] = ma
-
-            # Calculate exponential smoothing
-            if config is None or config.get('exponential_smoothing', True):
-                alpha = config.get('es_alpha', 0.3) if config else 0.3
-                es = self.trend_analyzer.calculate_exponential_smoothing(column=value_col, alpha=alpha)
-                results['exponential_smoothing'] = es
-
-            # Detect outliers
-            if config is None or config.get('detect_outliers', True):
-                method = config.get('outlier_method', 'zscore') if config else 'zscore'
-                threshold = config.get('outlier_threshold', 3) if config else 3
-                outliers = self.trend_analyzer.detect_outliers(column=value_col, method=method, threshold=threshold)
-                results['outliers'] = outliers
-
-            return results
-
-        def forecast(self, data, date_col, value_col, steps=10, model_type='arima', model_params=None):
-            """
-            Forecast future values
-
-            Parameters:
-            -----------
-            data : pd.DataFrame
-                Data to forecast
-            date_col : str
-                Column name for date
-            value_col : str
-                Column name for value
-            steps : int
-                Number of steps to forecast
-            model_type : str
-                Type of model to use ('arima', 'sarima', 'linear')
-            model_params : dict
-                Model parameters
-
-            Returns:
-            --------
-            pd.Series
-                Forecasted values
-            """
-            self.forecast_engine = ForecastEngine()
+        with profile_span('analyze'):
+            return self.trend_analyzer.analyze(column=value_col, config=config)
+
+    def analyze_trends_batch(self, data, key_col, date_col, value_col, config=None, n_jobs=None):
+        """
+        Analyze trends of many series stored in long format
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or str
+            Long-format data with one row per series and date, or path to a
+            data file; above the active memory budget series are analyzed
+            in partitions spilled to disk
+        key_col : str or list
+            Column(s) identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+        config : dict
+            Analysis configuration (see TrendAnalyzer.analyze)
+        n_jobs : int
+            Number of worker processes for decomposition and stationarity
+            tests (if None, the number of CPUs)
+
+        Returns:
+        --------
+        tuple
+            Features per observation and statistics per series
+        """
+        from src.business_intelligence.batch_trend_analyzer import BatchTrendAnalyzer
+
+        return BatchTrendAnalyzer(config=config, n_jobs=n_jobs).run(data, key_col, date_col, value_col)
+
+    def test_stationarity_batch(self, data, key_col, date_col, value_col, max_lags=None, autolag='AIC', kpss=False,
+                                n_jobs=None):
+        """
+        Test the stationarity of many series stored in long format
+
+        Parameters:
+        -----------
+        data : pd.DataFrame
+            Long-format data with one row per series and date
+        key_col : str or list
+            Column(s) identifying a series
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+        max_lags : int
+            Largest ADF lag searched (if None, the adfuller default)
+        autolag : str
+            ADF lag selection ('AIC', 'BIC', 't-stat' or None)
+        kpss : bool
+            Whether to run the KPSS test too
+        n_jobs : int
+            Number of worker processes (if None, the number of CPUs)
+
+        Returns:
+        --------
+        pd.DataFrame
+            Test results per series; unchanged series are served from a cache
+        """
+        from src.business_intelligence.stationarity import StationarityTester
+
+        tester = StationarityTester(max_lags=max_lags, autolag=autolag, kpss=kpss, n_jobs=n_jobs)
+        return tester.run(data, key_col, date_col, value_col)
+
+    @profiled('forecast')
+    def forecast(self, data, date_col, value_col, steps=10, model_type='arima', model_params=None,
+                 incremental=False):
+        """
+        Forecast future values
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or Dataset
+            Data to forecast; a Dataset shares its date-indexed series with
+            other steps (e.g. analyze_trends) on the same data
+        date_col : str
+            Column name for date
+        value_col : str
+            Column name for value
+        steps : int
+            Number of steps to forecast
+        model_type : str
+            Type of model to use ('arima', 'sarima', 'linear', 'fast')
+        model_params : dict
+            Model parameters ('order' and 'seasonal_order' accept 'auto' to
+            select them by 'criterion'; 'lags', 'windows', 'calendar', 'trend',
+            'strategy' and 'horizon' configure linear regression on generated
+            features; 'method', 'season_length' and 'grids' configure the
+            fast-path model; 'refit_every', 'drift_threshold' and
+            'drift_window' set the incremental update policy)
+        incremental : bool
+            If True and the previous call fitted the same model on the same
+            column, filter only the new observations of data into that model
+            instead of refitting it on the full history
+
+        Returns:
+        --------
+        pd.Series
+            Forecasted values
+        """
+        from src.business_intelligence.forecast_engine import ForecastEngine
+
+        # Set default model parameters
+        if model_params is None:
+            model_params = {}
+
+        # Reuse the fitted model when the data extends the previous history
+        model_key = (value_col, model_type, repr(sorted(model_params.items())))
+        if (incremental and self._forecast_key == model_key
+                and self.forecast_engine is not None and self.forecast_engine.model is not None):
+            incoming = ForecastEngine()
+            with profile_span('transform', operation='load_data'):
+                if not incoming.load_data(data, date_col, value_col):
+                    raise ValueError("Could not load the data to forecast")
+            with profile_span('fit', model=model_type, incremental=True):
+                self.forecast_engine.update(incoming.data)
+            with profile_span('predict', steps=steps):
+                return self.forecast_engine.forecast_future(steps=steps, column=value_col)
+
+        self.forecast_engine = ForecastEngine(
+            refit_every=model_params.get('refit_every'),
+            drift_threshold=model_params.get('drift_threshold', 3.0),
+            drift_window=model_params.get('drift_window', 24)
+        )
+        with profile_span('transform', operation='load_data'):
             self.forecast_engine.load_data(data, date_col, value_col)
 
-            # Set default model parameters
-            if model_params is None:
-                model_params = {}
-
-            # Train model
-            if model_type == 'arima':
-                order = model_params.get('order', (1, 1, 1))
-                self.forecast_engine.train_arima_model(column=value_col, order=order)
-            elif model_type == 'sarima':
-                order = model_params.get('order', (1, 1, 1))
-                seasonal_order = model_params.get('seasonal_order', (1, 1, 1, 12))
-                self.forecast_engine.train_sarima_model(column=value_col, order=order, seasonal_order=seasonal_order)
-            elif model_type == 'linear':
-                features = model_params.get('features')
-                self.forecast_engine.train_linear_regression(column=value_col, features=features)
-            else:
-                raise ValueError(f"Unsupported model type: {model_type}")
-
-            # Forecast
+        # Train model
+        with profile_span('fit', model=model_type):
+            self._train(value_col, steps, model_type, model_params)
+
+        self._forecast_key = model_key
+
+        # Forecast
+        with profile_span('predict', steps=steps):
             forecast = self.forecast_engine.forecast_future(steps=steps, column=value_col)
 
-            return forecast
+        return forecast
+
+    def _train(self, value_col, steps, model_type, model_params):
+        """Train the forecast engine's model"""
+        if model_type == 'arima':
+            order = model_params.get('order', (1, 1, 1))
+            self.forecast_engine.train_arima_model(
+                column=value_col,
+                order=order,
+                criterion=model_params.get('criterion', 'aic'),
+                selector_params=model_params.get('selector_params')
+            )
+        elif model_type == 'sarima':
+            order = model_params.get('order', (1, 1, 1))
+            seasonal_order = model_params.get('seasonal_order', (1, 1, 1, 12))
+            self.forecast_engine.train_sarima_model(
+                column=value_col,
+                order=order,
+                seasonal_order=seasonal_order,
+                seasonal_period=model_params.get('seasonal_period', 12),
+                criterion=model_params.get('criterion', 'aic'),
+                selector_params=model_params.get('selector_params')
+            )
+        elif model_type == 'linear':
+            # Only generated features can be forecast, so default to lags of the series
+            lags = model_params.get('lags')
+            if lags is None and not any(model_params.get(key) for key in ('features', 'windows', 'calendar', 'trend')):
+                lags = DEFAULT_LINEAR_LAGS
+            self.forecast_engine.train_linear_regression(
+                column=value_col,
+                features=model_params.get('features'),
+                lags=lags,
+                windows=model_params.get('windows'),
+                calendar=model_params.get('calendar'),
+                trend=model_params.get('trend', False),
+                strategy=model_params.get('strategy', 'recursive'),
+                horizon=model_params.get('horizon', steps)
+            )
+        elif model_type == 'fast':
+            self.forecast_engine.train_fast_model(
+                columns=value_col,
+                method=model_params.get('method', 'holt_winters'),
+                season_length=model_params.get('season_length', 12),
+                grids=model_params.get('grids')
+            )
+        else:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+    def backtest(self, data, date_col, value_cols, models, horizon=12, n_folds=5, step=None, n_jobs=None):
+        """
+        Backtest forecasting models with rolling-origin cross-validation
+
+        Parameters:
+        -----------
+        data : pd.DataFrame
+            Data with one column per series
+        date_col : str
+            Column name for date
+        value_cols : list
+            Column names of the series to backtest
+        models : dict
+            Model specifications by name, each with a 'type' ('arima',
+            'sarima', 'linear', 'fast') and training parameters
+        horizon : int
+            Number of steps forecast at every origin
+        n_folds : int
+            Number of forecast origins
+        step : int
+            Distance between origins (if None, the horizon)
+        n_jobs : int
+            Number of worker processes (if None, the number of CPUs)
+
+        Returns:
+        --------
+        tuple
+            Metrics per series, model and fold, and their summary with the
+            best model per series
+        """
+        from src.business_intelligence.forecast_engine import ForecastEngine
+        from src.business_intelligence.backtester import Backtester
+
+        engine = ForecastEngine()
+        engine.load_data(data, date_col)
+
+        backtester = Backtester(horizon=horizon, n_folds=n_folds, step=step, n_jobs=n_jobs)
+        results = backtester.run(engine.data, models, columns=value_cols)
+
+        return results, Backtester.summarize(results)
@@ -3,15 +3,32 @@
 import pandas as pd
 import numpy as np
 
+from src.utils.columns import column_list
+from src.utils.dataset import Dataset
+from src.utils.ingestion import read_data
+from src.utils.memory_budget import active_budget, estimate_bytes
+
+# Aggregations computed from per-chunk partial aggregates, and how partials combine
+PARTIAL_AGGREGATES = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max', 'mean': 'sum'}
+
+
 class PivotGenerator:
     def __init__(self, data):
+        self.path = None
         if isinstance(data, str):
-            # Assume it's a file path
-            self.data = pd.read_excel(data)
-        elif isinstance(data, pd.DataFrame):
+            # Assume it's a file path; files above the memory budget are read in chunks when pivoted
+            budget = active_budget()
+            if budget is not None and budget.exceeds(data):
+                self.path = data
+                self.data = None
+            else:
+                self.data = read_data(data)
+        elif isinstance(data, Dataset):
+            self.data = data.frame
+        elif data is None or isinstance(data, pd.DataFrame):
             self.data = data
         else:
-            raise ValueError("Data must be a DataFrame or a file path")
+            raise ValueError("Data must be a DataFrame, a Dataset or a file path")
 
     def create_pivot(self, index, columns, values, aggfunc='sum'):
         """
@@ -33,6 +50,16 @@ class PivotGenerator:
         pd.DataFrame
             Pivot table
         """
+        source = self.data if self.path is None else self.path
+        budget = active_budget()
+        used = column_list(index) + column_list(columns) + column_list(values)
+        # Pivots without values aggregate every column; aggregation lists and
+        # dicts shape the columns differently; both run in memory
+        if (budget is not None and values is not None and index is not None
+                and not isinstance(aggfunc, (list, dict)) and budget.exceeds(source, used)):
+            return self._create_pivot_spilled(budget, source, index, columns, values, aggfunc)
+        if self.data is None:
+            self.data = read_data(self.path)
         return pd.pivot_table(
             self.data,
             index=index,
@@ -41,6 +68,55 @@ class PivotGenerator:
             aggfunc=aggfunc
         )
 
+    def _create_pivot_spilled(self, budget, source, index, columns, values, aggfunc):
+        """
+        Create a pivot table in chunks that fit the memory budget
+
+        Chunks are partitioned by the index and spilled to disk; sums,
+        counts, minimums, maximums and means spill per-chunk partial
+        aggregates instead of rows. Every partition is then aggregated on
+        its own, and the groups pivoted as in create_pivot.
+        """
+        keys = column_list(index) + column_list(columns)
+        value_cols = column_list(values)
+        used = list(dict.fromkeys(keys + value_cols))
+        partial = aggfunc if isinstance(aggfunc, str) and aggfunc in PARTIAL_AGGREGATES else None
+
+        groups = []
+        with budget.spill('create_pivot', column_list(index), estimate_bytes(source, used)) as partitions:
+            for chunk in budget.iter_chunks(source, used):
+                if partial is None:
+                    partitions.add(chunk)
+                    continue
+                grouped = chunk.groupby(keys, observed=True)[value_cols]
+                if partial == 'mean':
+                    partials = grouped.sum().join(grouped.count(), rsuffix='__count')
+                else:
+                    partials = grouped.agg(partial)
+                partitions.add(partials.reset_index())
+
+            for part in partitions:
+                grouped = part.groupby(keys, observed=True)
+                if partial is None:
+                    groups.append(grouped[value_cols].agg(aggfunc))
+                elif partial == 'mean':
+                    totals = grouped.sum()
+                    groups.append(pd.DataFrame({column: totals[column] / totals[column + '__count']
+                                                for column in value_cols}))
+                else:
+                    groups.append(grouped[value_cols].agg(PARTIAL_AGGREGATES[partial]))
+
+        # One row per group remains; pivoting with 'first' keeps every value
+        # (aggregated group values may be NaN, which 'first' passes through)
+        combined = pd.concat(groups).reset_index() if groups else pd.DataFrame(columns=used)
+        return pd.pivot_table(
+            combined,
+            index=index,
+            columns=columns,
+            values=values,
+            aggfunc='first'
+        )
+
     def export_to_excel(self, pivot_table, output_path, sheet_name='Pivot'):
         """
         Export pivot table to Excel
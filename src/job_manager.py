@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Job Manager Module"""
+import asyncio
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.platform_server import MODES, WARM_MODULES, DatasetCache, execute_request
+
+# Concurrent jobs per type; trend and forecast jobs fit models and are the heaviest
+DEFAULT_CONCURRENCY = {'pivot': 4, 'kpi': 4, 'trend': 2, 'forecast': 2}
+
+# Peak memory of a job as a multiple of its input size (file size or inline JSON size)
+MEMORY_FACTORS = {'pivot': 3, 'kpi': 3, 'trend': 5, 'forecast': 8}
+
+# Datasets read by a worker process, kept for its later jobs
+_WORKER_DATASETS = None
+
+
+def _init_worker():
+    """Import the analysis modules once per worker process"""
+    global _WORKER_DATASETS
+    _WORKER_DATASETS = DatasetCache()
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+
+
+def _run_job(mode, request):
+    """Run a job in a worker process"""
+    global _WORKER_DATASETS
+    if _WORKER_DATASETS is None:
+        _WORKER_DATASETS = DatasetCache()
+    return execute_request(mode, request, _WORKER_DATASETS)
+
+
+def estimate_memory(mode, request):
+    """
+    Estimate the peak memory of a job
+
+    Parameters:
+    -----------
+    mode : str
+        Job type ('pivot', 'kpi', 'trend' or 'forecast')
+    request : dict
+        Job parameters; 'memory' (bytes) overrides the estimate
+
+    Returns:
+    --------
+    int
+        Estimated peak memory in bytes
+    """
+    if request.get('memory') is not None:
+        return int(request['memory'])
+    if 'data' in request:
+        size = len(json.dumps(request['data'], default=str))
+    elif 'file' in request:
+        size = os.path.getsize(request['file'])
+    else:
+        size = 0
+    return MEMORY_FACTORS[mode] * size
+
+
+class Job:
+    def __init__(self, job_id, mode, request, memory):
+        self.id = job_id
+        self.mode = mode
+        self.request = request
+        self.memory = memory
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.task = None
+
+    def to_dict(self):
+        """Return the job status without its result"""
+        return {
+            'id': self.id,
+            'mode': self.mode,
+            'status': self.status,
+            'memory': self.memory,
+            'error': self.error,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished
+        }
+
+
+class JobManager:
+    def __init__(self, max_workers=None, concurrency=None, memory_budget=None, memory_budgets=None,
+                 executor=None):
+        """
+        Parameters:
+        -----------
+        max_workers : int
+            Number of worker processes (if None, the number of CPUs)
+        concurrency : dict
+            Maximum running jobs per type, overriding DEFAULT_CONCURRENCY
+        memory_budget : int
+            Bytes of estimated memory all running jobs may use together (if
+            None, unlimited)
+        memory_budgets : dict
+            Bytes of estimated memory the running jobs of a type may use
+            together
+        executor : concurrent.futures.Executor
+            Executor running the jobs (if None, a process pool that is shut
+            down by close)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.concurrency = dict(DEFAULT_CONCURRENCY, **(concurrency or {}))
+        self.memory_budget = memory_budget
+        self.memory_budgets = dict(memory_budgets or {})
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphores = {mode: asyncio.Semaphore(limit) for mode, limit in self.concurrency.items()}
+        self._memory_available = asyncio.Condition()
+        self._reserved = {mode: 0 for mode in MODES}
+        self._running = {mode: 0 for mode in MODES}
+        self._jobs = {}
+        self._ids = itertools.count(1)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _fits(self, job):
+        """Whether the job's memory fits the budgets next to the running jobs"""
+        total = sum(self._reserved.values()) + job.memory
+        if self.memory_budget is not None and total > self.memory_budget:
+            return False
+        budget = self.memory_budgets.get(job.mode)
+        return budget is None or self._reserved[job.mode] + job.memory <= budget
+
+    async def _run(self, job):
+        """Wait for a concurrency slot and memory, then run the job in the executor"""
+        async with self._semaphores[job.mode]:
+            async with self._memory_available:
+                await self._memory_available.wait_for(lambda: self._fits(job))
+                self._reserved[job.mode] += job.memory
+
+            try:
+                job.status = 'running'
+                job.started = time.time()
+                self._running[job.mode] += 1
+                loop = asyncio.get_running_loop()
+                job.result = await loop.run_in_executor(self._get_executor(), _run_job, job.mode, job.request)
+                job.status = 'done'
+            except asyncio.CancelledError:
+                job.status = 'cancelled'
+                raise
+            except Exception as e:
+                job.status = 'failed'
+                job.error = f"{type(e).__name__}: {e}"
+            finally:
+                job.finished = time.time()
+                self._running[job.mode] -= 1
+                async with self._memory_available:
+                    self._reserved[job.mode] -= job.memory
+                    self._memory_available.notify_all()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        return self._executor
+
+    async def submit(self, mode, request):
+        """
+        Queue a job
+
+        Parameters:
+        -----------
+        mode : str
+            Job type ('pivot', 'kpi', 'trend' or 'forecast')
+        request : dict
+            Job parameters (see execute_request); 'memory' overrides the
+            estimated peak memory in bytes
+
+        Returns:
+        --------
+        str
+            Job id
+
+        Raises:
+        -------
+        ValueError
+            If the job type or its parameters are invalid, or the job alone
+            exceeds a memory budget
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unsupported mode: {mode}")
+        missing = [name for name in MODES[mode] if name not in request]
+        if missing:
+            raise ValueError(f"Missing parameters for {mode}: {', '.join(missing)}")
+
+        memory = estimate_memory(mode, request)
+        for budget in (self.memory_budget, self.memory_budgets.get(mode)):
+            if budget is not None and memory > budget:
+                raise ValueError(f"Job needs about {memory} bytes, more than the memory budget of {budget}")
+
+        request = {name: value for name, value in request.items() if name != 'memory'}
+        job = Job(f"job-{next(self._ids)}", mode, request, memory)
+        self._jobs[job.id] = job
+        job.task = asyncio.ensure_future(self._run(job))
+        return job.id
+
+    def status(self, job_id):
+        """
+        Return the status of a job
+
+        Parameters:
+        -----------
+        job_id : str
+            Job id
+
+        Returns:
+        --------
+        dict
+            'id', 'mode', 'status' ('queued', 'running', 'done', 'failed' or
+            'cancelled'), 'memory', 'error' and the submitted, started and
+            finished times
+        """
+        return self._jobs[job_id].to_dict()
+
+    def jobs(self):
+        """Return the status of all jobs in submission order"""
+        return [job.to_dict() for job in self._jobs.values()]
+
+    def stats(self):
+        """Return the running jobs and reserved memory per type"""
+        return {
+            'running': dict(self._running),
+            'reserved_memory': dict(self._reserved),
+            'queued': sum(job.status == 'queued' for job in self._jobs.values())
+        }
+
+    async def result(self, job_id, timeout=None):
+        """
+        Wait for a job and return its result
+
+        Parameters:
+        -----------
+        job_id : str
+            Job id
+        timeout : float
+            Seconds to wait (if None, wait until the job finishes)
+
+        Returns:
+        --------
+        object
+            Result of the platform method
+
+        Raises:
+        -------
+        RuntimeError
+            If the job failed or was cancelled
+        """
+        job = self._jobs[job_id]
+        try:
+            await asyncio.wait_for(asyncio.shield(job.task), timeout)
+        except asyncio.CancelledError:
+            if job.status != 'cancelled':
+                raise
+        if job.status != 'done':
+            raise RuntimeError(f"Job {job_id} {job.status}: {job.error}")
+        return job.result
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued job
+
+        Parameters:
+        -----------
+        job_id : str
+            Job id
+
+        Returns:
+        --------
+        bool
+            True if the job was queued and is now cancelled
+        """
+        job = self._jobs[job_id]
+        if job.status != 'queued':
+            return False
+        job.task.cancel()
+        job.status = 'cancelled'
+        job.finished = time.time()
+        return True
+
+    async def close(self):
+        """Wait for the submitted jobs and shut down the process pool"""
+        tasks = [job.task for job in self._jobs.values()]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -3,341 +3,61 @@
 import argparse
 import os
 import sys
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # Import modules
-from src.excel.excel_analyzer import ExcelAnalyzer
-from src.excel.pivot_generator import PivotGenerator
-from src.visualization.plotly_charts import PlotlyCharts
-from src.visualization.dashboard_builder import DashboardBuilder
-from src.business_intelligence.kpi_calculator import KPICalculator
-from src.business_intelligence.trend_analyzer import TrendAnalyzer
-from src.business_intelligence.forecast_engine import ForecastEngine
+from src.data_analyst_platform import DataAnalystPlatform as BasePlatform, required_columns
+from src.utils.profiling import PROFILE_FORMATS, Profiler, profile_span
 
-class DataAnalystPlatform:
-    def __init__(self):
-        self.excel_analyzer = None
-        self.pivot_generator = None
-        self.plotly_charts = None
-        self.dashboard_builder = None
-        self.kpi_calculator = None
-        self.trend_analyzer = None
-        self.forecast_engine = None
-        
-    def initialize_modules(self):
-        """Initialize all modules"""
-        self.excel_analyzer = ExcelAnalyzer(None)
-        self.pivot_generator = PivotGenerator(None)
-        self.plotly_charts = PlotlyCharts()
-        self.dashboard_builder = DashboardBuilder("IBM Data Analyst Dashboard")
-        self.kpi_calculator = KPICalculator()
-        self.trend_analyzer = TrendAnalyzer()
-        self.forecast_engine = ForecastEngine()
-        
-    def analyze_excel(self, file_path):
+class DataAnalystPlatform(BasePlatform):
+    def load_file(self, path, columns=None):
         """
-        Analyze Excel file
+        Load an input file, reporting errors on the console
         
         Parameters:
         -----------
-        file_path : str
-            Path to Excel file
-            
-        Returns:
-        --------
-        dict
-            Analysis results
-        """
-        self.excel_analyzer = ExcelAnalyzer(file_path)
-        self.excel_analyzer.load_workbook()
-        
-        results = {}
-        
-        # Get sheet names
-        sheet_names = self.excel_analyzer.get_sheet_names()
-        results['sheet_names'] = sheet_names
-        
-        # Analyze each sheet
-        sheet_analyses = {}
-        for sheet_name in sheet_names:
-            sheet_analyses[sheet_name] = self.excel_analyzer.analyze_sheet(sheet_name)
-            
-        results['sheet_analyses'] = sheet_analyses
-        
-        return results
-        
-    def create_pivot(self, data, index, columns, values, aggfunc='sum'):
-        """
-        Create pivot table
-        
-        Parameters:
-        -----------
-        data : pd.DataFrame or str
-            Data to pivot
-        index : str or list
-            Column(s) to use as index
-        columns : str or list
-            Column(s) to use as columns
-        values : str or list
-            Column(s) to aggregate
-        aggfunc : str or function
-            Aggregation function to use
+        path : str
+            Path to a CSV, Excel, Parquet, Feather or JSON-lines file
+        columns : list
+            Columns to read (if None, all columns)
             
         Returns:
         --------
         pd.DataFrame
-            Pivot table
-        """
-        self.pivot_generator = PivotGenerator(data)
-        pivot = self.pivot_generator.create_pivot(index, columns, values, aggfunc)
-        return pivot
-        
-    def create_dashboard(self, data, charts_config, title="IBM Data Analyst Dashboard"):
+            Loaded data, or None if the file cannot be read
         """
-        Create dashboard
-        
-        Parameters:
-        -----------
-        data : pd.DataFrame
-            Data to visualize
-        charts_config : list
-            List of chart configurations
-        title : str
-            Dashboard title
+        try:
+            return self.load_data(path, columns=columns)
+        except (ValueError, ImportError, OSError) as e:
+            print(f"Error: {e}")
+            return None
             
-        Returns:
-        --------
-        DashboardBuilder
-            Dashboard builder object
+    def load_leading_columns(self, path, count):
         """
-        self.dashboard_builder = DashboardBuilder(title)
-        
-        # Create charts
-        for config in charts_config:
-            chart_type = config.get('type', 'bar')
-            chart_title = config.get('title', '')
-            
-            if chart_type == 'bar':
-                fig = self.plotly_charts.create_bar_chart(
-                    data,
-                    x=config.get('x'),
-                    y=config.get('y'),
-                    title=chart_title,
-                    color=config.get('color')
-                )
-            elif chart_type == 'line':
-                fig = self.plotly_charts.create_line_chart(
-                    data,
-                    x=config.get('x'),
-                    y=config.get('y'),
-                    title=chart_title,
-                    color=config.get('color')
-                )
-            elif chart_type == 'scatter':
-                fig = self.plotly_charts.create_scatter_plot(
-                    data,
-                    x=config.get('x'),
-                    y=config.get('y'),
-                    title=chart_title,
-                    color=config.get('color'),
-                    size=config.get('size')
-                )
-            elif chart_type == 'pie':
-                fig = self.plotly_charts.create_pie_chart(
-                    data,
-                    values=config.get('values'),
-                    names=config.get('names'),
-                    title=chart_title
-                )
-            else:
-                continue
-                
-            self.dashboard_builder.add_chart(fig, title=chart_title)
-            
-        return self.dashboard_builder
-        
-    def calculate_kpis(self, data, kpi_config):
-        """
-        Calculate KPIs
-        
-        Parameters:
-        -----------
-        data : pd.DataFrame
-            Data to analyze
-        kpi_config : dict
-            KPI configuration
-            
-        Returns:
-        --------
-        dict
-            KPI results
-        """
-        self.kpi_calculator = KPICalculator(data)
-        
-        results = {}
-        
-        # Calculate KPIs based on configuration
-        for kpi_name, config in kpi_config.items():
-            kpi_type = config.get('type')
-            
-            if kpi_type == 'revenue_growth':
-                results[kpi_name] = self.kpi_calculator.calculate_revenue_growth(
-                    period_col=config.get('period_col'),
-                    revenue_col=config.get('revenue_col'),
-                    periods=config.get('periods')
-                )
-            elif kpi_type == 'customer_acquisition_cost':
-                results[kpi_name] = self.kpi_calculator.calculate_customer_acquisition_cost(
-                    period_col=config.get('period_col'),
-                    marketing_expense_col=config.get('marketing_expense_col'),
-                    new_customers_col=config.get('new_customers_col'),
-                    periods=config.get('periods')
-                )
-            elif kpi_type == 'customer_lifetime_value':
-                results[kpi_name] = self.kpi_calculator.calculate_customer_lifetime_value(
-                    customer_id_col=config.get('customer_id_col'),
-                    revenue_col=config.get('revenue_col'),
-                    date_col=config.get('date_col'),
-                    time_period=config.get('time_period', 365)
-                )
-            elif kpi_type == 'conversion_rate':
-                results[kpi_name] = self.kpi_calculator.calculate_conversion_rate(
-                    period_col=config.get('period_col'),
-                    visitors_col=config.get('visitors_col'),
-                    conversions_col=config.get('conversions_col'),
-                    periods=config.get('periods')
-                )
-            elif kpi_type == 'churn_rate':
-                results[kpi_name] = self.kpi_calculator.calculate_churn_rate(
-                    period_col=config.get('period_col'),
-                    customers_start_col=config.get('customers_start_col'),
-                    customers_end_col=config.get('customers_end_col'),
-                    new_customers_col=config.get('new_customers_col'),
-                    periods=config.get('periods')
-                )
-                
-        return results
-        
-    def analyze_trends(self, data, date_col, value_col, config=None):
-        """
-        Analyze trends
+        Load the first columns of an input file, reporting errors on the console
         
         Parameters:
         -----------
-        data : pd.DataFrame
-            Data to analyze
-        date_col : str
-            Column name for date
-        value_col : str
-            Column name for value
-        config : dict
-            Analysis configuration
+        path : str
+            Path to a CSV, Excel, Parquet, Feather or JSON-lines file
+        count : int
+            Number of leading columns to read
             
         Returns:
         --------
-        dict
-            Trend analysis results
-        """
-        self.trend_analyzer = TrendAnalyzer()
-        self.trend_analyzer.load_data(data, date_col, value_col)
-        
-        results = {}
-        
-        # Decompose time series
-        if config is None or config.get('decompose', True):
-            decomposition = self.trend_analyzer.decompose_time_series(
-                column=value_col,
-                model=config.get('model', 'additive') if config else 'additive',
-                period=config.get('period') if config else None
-            )
-            
-            results['decomposition'] = {
-                'trend': decomposition.trend,
-                'seasonal': decomposition.seasonal,
-                'resid': decomposition.resid
-            }
-            
-        # Test stationarity
-        if config is None or config.get('test_stationarity', True):
-            stationarity = self.trend_analyzer.test_stationarity(column=value_col)
-            results['stationarity'] = stationarity
-            
-        # Calculate moving average
-        if config is None or config.get('moving_average', True):
-            window = config.get('ma_window', 7) if config else 7
-            ma = self.trend_analyzer.calculate_moving_average(column=value_col, window=window)
-            results['moving_average'] = ma
-            
-        # Calculate exponential smoothing
-        if config is None or config.get('exponential_smoothing', True):
-            alpha = config.get('es_alpha', 0.3) if config else 0.3
-            es = self.trend_analyzer.calculate_exponential_smoothing(column=value_col, alpha=alpha)
-            results['exponential_smoothing'] = es
-            
-        # Detect outliers
-        if config is None or config.get('detect_outliers', True):
-            method = config.get('outlier_method', 'zscore') if config else 'zscore'
-            threshold = config.get('outlier_threshold', 3) if config else 3
-            outliers = self.trend_analyzer.detect_outliers(column=value_col, method=method, threshold=threshold)
-            results['outliers'] = outliers
-            
-        return results
-        
-    def forecast(self, data, date_col, value_col, steps=10, model_type='arima', model_params=None):
-        """
-        Forecast future values
-        
-        Parameters:
-        -----------
-        data : pd.DataFrame
-            Data to forecast
-        date_col : str
-            Column name for date
-        value_col : str
-            Column name for value
-        steps : int
-            Number of steps to forecast
-        model_type : str
-            Type of model to use ('arima', 'sarima', 'linear')
-        model_params : dict
-            Model parameters
-            
-        Returns:
-        --------
-        pd.Series
-            Forecasted values
+        pd.DataFrame
+            Loaded data, or None if the file cannot be read
         """
-        self.forecast_engine = ForecastEngine()
-        self.forecast_engine.load_data(data, date_col, value_col)
-        
-        # Set default model parameters
-        if model_params is None:
-            model_params = {}
-            
-        # Train model
-        if model_type == 'arima':
-            order = model_params.get('order', (1, 1, 1))
-            self.forecast_engine.train_arima_model(column=value_col, order=order)
-        elif model_type == 'sarima':
-            order = model_params.get('order', (1, 1, 1))
-            seasonal_order = model_params.get('seasonal_order', (1, 1, 1, 12))
-            self.forecast_engine.train_sarima_model(column=value_col, order=order, seasonal_order=seasonal_order)
-        elif model_type == 'linear':
-            features = model_params.get('features')
-            self.forecast_engine.train_linear_regression(column=value_col, features=features)
-        else:
-            raise ValueError(f"Unsupported model type: {model_type}")
-            
-        # Forecast
-        forecast = self.forecast_engine.forecast_future(steps=steps, column=value_col)
+        from src.utils.ingestion import read_header
         
-        return forecast
+        try:
+            columns = read_header(path)[:count]
+        except (ValueError, ImportError, OSError) as e:
+            print(f"Error: {e}")
+            return None
+        return self.load_file(path, columns=columns)
         
     def run(self, args):
         """
@@ -353,9 +73,35 @@ class DataAnalystPlatform:
         int
             Exit code
         """
-        # Initialize modules
-        self.initialize_modules()
-        
+        if args.mode == 'serve':
+            # Keep the modules and datasets in memory and answer JSON requests
+            from src.platform_server import PlatformServer
+            
+            server = PlatformServer(max_datasets=args.max_datasets)
+            server.warm_up()
+            where = args.socket or f"http://{args.host}:{args.port}"
+            print(f"Serving pivot, kpi, trend and forecast requests on {where}")
+            try:
+                server.serve(host=args.host, port=args.port, socket_path=args.socket)
+            except KeyboardInterrupt:
+                pass
+            return 0
+            
+        if args.mode == 'pipeline':
+            # Run the steps of a pipeline specification as a DAG
+            if not args.file:
+                print("Error: Pipeline specification path is required")
+                return 1
+                
+            from src.pipeline_runner import run_pipeline
+            
+            def report(name, outcome):
+                error = f" ({outcome['error']})" if outcome['error'] else ''
+                print(f"Step {name}: {outcome['status']} in {outcome['seconds']:.2f}s{error}")
+                
+            outcomes = run_pipeline(args.file, max_workers=args.workers, callback=report)
+            return 0 if all(outcome['status'] == 'success' for outcome in outcomes.values()) else 1
+            
         # Process command-line arguments
         if args.mode == 'excel':
             # Analyze Excel file
@@ -372,20 +118,24 @@ class DataAnalystPlatform:
                 print("Error: Data file path is required")
                 return 1
                 
-            # Load data
-            if args.file.endswith('.csv'):
-                data = pd.read_csv(args.file)
-            elif args.file.endswith(('.xls', '.xlsx')):
-                data = pd.read_excel(args.file)
-            else:
-                print(f"Error: Unsupported file format: {args.file}")
-                return 1
-                
-            # Create pivot table
             if not args.index or not args.values:
                 print("Error: Index and values are required for pivot table")
                 return 1
                 
+            # Load only the columns the pivot table uses; files above the memory
+            # budget are pivoted in chunks straight from disk
+            from src.utils.memory_budget import active_budget
+            
+            columns = required_columns('pivot', {'index': args.index, 'columns': args.columns, 'values': args.values})
+            budget = active_budget()
+            if budget is not None and os.path.exists(args.file) and budget.exceeds(args.file, columns):
+                data = args.file
+            else:
+                data = self.load_file(args.file, columns=columns)
+            if data is None:
+                return 1
+                
+            # Create pivot table
             pivot = self.create_pivot(
                 data,
                 index=args.index,
@@ -398,7 +148,8 @@ class DataAnalystPlatform:
             
             # Export to Excel if output path is provided
             if args.output:
-                self.pivot_generator.export_to_excel(pivot, args.output)
+                with profile_span('render', output=args.output):
+                    self.pivot_generator.export_to_excel(pivot, args.output)
                 print(f"Pivot table exported to: {args.output}")
                 
         elif args.mode == 'dashboard':
@@ -407,13 +158,9 @@ class DataAnalystPlatform:
                 print("Error: Data file path is required")
                 return 1
                 
-            # Load data
-            if args.file.endswith('.csv'):
-                data = pd.read_csv(args.file)
-            elif args.file.endswith(('.xls', '.xlsx')):
-                data = pd.read_excel(args.file)
-            else:
-                print(f"Error: Unsupported file format: {args.file}")
+            # Load data; the default charts plot the first two columns
+            data = self.load_leading_columns(args.file, 2)
+            if data is None:
                 return 1
                 
             # Create dashboard
@@ -438,7 +185,8 @@ class DataAnalystPlatform:
             
             # Export dashboard if output path is provided
             if args.output:
-                dashboard.create_html_dashboard(args.output)
+                with profile_span('render', output=args.output):
+                    dashboard.create_html_dashboard(args.output)
                 print(f"Dashboard exported to: {args.output}")
                 
             # Run dashboard if requested
@@ -451,13 +199,9 @@ class DataAnalystPlatform:
                 print("Error: Data file path is required")
                 return 1
                 
-            # Load data
-            if args.file.endswith('.csv'):
-                data = pd.read_csv(args.file)
-            elif args.file.endswith(('.xls', '.xlsx')):
-                data = pd.read_excel(args.file)
-            else:
-                print(f"Error: Unsupported file format: {args.file}")
+            # Load data; the default KPI uses the first two columns
+            data = self.load_leading_columns(args.file, 2)
+            if data is None:
                 return 1
                 
             # Calculate KPIs
@@ -480,21 +224,22 @@ class DataAnalystPlatform:
                 print("Error: Data file path is required")
                 return 1
                 
-            # Load data
-            if args.file.endswith('.csv'):
-                data = pd.read_csv(args.file)
-            elif args.file.endswith(('.xls', '.xlsx')):
-                data = pd.read_excel(args.file)
-            else:
-                print(f"Error: Unsupported file format: {args.file}")
-                return 1
-                
-            # Analyze trends
             if not args.date_col or not args.value_col:
                 print("Error: Date and value columns are required for trend analysis")
                 return 1
                 
-            trend_results = self.analyze_trends(data, args.date_col, args.value_col)
+            # Load only the date and value columns
+            data = self.load_file(args.file, columns=required_columns('trend', {
+                'date_col': args.date_col, 'value_col': args.value_col}))
+            if data is None:
+                return 1
+                
+            # Analyze trends
+            trend_config = {'kpss': args.kpss}
+            if args.max_lags is not None:
+                trend_config['adf_max_lags'] = args.max_lags
+                
+            trend_results = self.analyze_trends(data, args.date_col, args.value_col, config=trend_config)
             print(f"Trend analysis results: {trend_results}")
             
         elif args.mode == 'forecast':
@@ -503,26 +248,36 @@ class DataAnalystPlatform:
                 print("Error: Data file path is required")
                 return 1
                 
-            # Load data
-            if args.file.endswith('.csv'):
-                data = pd.read_csv(args.file)
-            elif args.file.endswith(('.xls', '.xlsx')):
-                data = pd.read_excel(args.file)
-            else:
-                print(f"Error: Unsupported file format: {args.file}")
-                return 1
-                
-            # Forecast
             if not args.date_col or not args.value_col:
                 print("Error: Date and value columns are required for forecasting")
                 return 1
                 
+            # Load only the date and value columns
+            data = self.load_file(args.file, columns=required_columns('forecast', {
+                'date_col': args.date_col, 'value_col': args.value_col}))
+            if data is None:
+                return 1
+                
+            # Forecast
+            model_params = {}
+            if args.auto_order:
+                model_params.update({'order': 'auto', 'seasonal_order': 'auto'})
+            if args.lags:
+                model_params['lags'] = [int(lag) for lag in args.lags.split(',')]
+            if args.strategy:
+                model_params['strategy'] = args.strategy
+            if args.method:
+                model_params['method'] = args.method
+            if args.season_length:
+                model_params['season_length'] = args.season_length
+                
             forecast = self.forecast(
                 data,
                 args.date_col,
                 args.value_col,
                 steps=args.steps or 10,
-                model_type=args.model_type or 'arima'
+                model_type=args.model_type or 'arima',
+                model_params=model_params or None
             )
             
             print(f"Forecast: {forecast}")
@@ -538,7 +293,7 @@ def parse_args():
     parser = argparse.ArgumentParser(description='IBM Data Analyst Platform')
     
     # Mode
-    parser.add_argument('--mode', choices=['excel', 'pivot', 'dashboard', 'kpi', 'trend', 'forecast'], required=True, help='Mode to run')
+    parser.add_argument('--mode', choices=['excel', 'pivot', 'dashboard', 'kpi', 'trend', 'forecast', 'serve', 'pipeline'], required=True, help='Mode to run')
     
     # Input file
     parser.add_argument('--file', help='Input file path')
@@ -565,18 +320,68 @@ def parse_args():
     # Trend mode
     parser.add_argument('--date-col', help='Column name for date')
     parser.add_argument('--value-col', help='Column name for value')
+    parser.add_argument('--max-lags', type=int, help='Largest lag searched by the ADF test')
+    parser.add_argument('--kpss', action='store_true', help='Run the KPSS test alongside ADF')
     
     # Forecast mode
     parser.add_argument('--steps', type=int, help='Number of steps to forecast')
-    parser.add_argument('--model-type', choices=['arima', 'sarima', 'linear'], help='Type of model to use')
+    parser.add_argument('--model-type', choices=['arima', 'sarima', 'linear', 'fast'], help='Type of model to use')
+    parser.add_argument('--auto-order', action='store_true', help='Select ARIMA/SARIMA orders automatically')
+    parser.add_argument('--lags', help='Comma-separated lags used as features by the linear model (default: 1)')
+    parser.add_argument('--strategy', choices=['recursive', 'direct'], help='Multi-step strategy of the linear model')
+    parser.add_argument('--method', choices=['naive', 'seasonal_naive', 'ses', 'holt', 'holt_winters'],
+                        help='Method of the fast model (default: holt_winters)')
+    parser.add_argument('--season-length', type=int, help='Seasonal period of the fast model (default: 12)')
+    
+    # Serve mode
+    parser.add_argument('--host', default='127.0.0.1', help='Address the server listens on')
+    parser.add_argument('--port', type=int, default=8765, help='Port the server listens on')
+    parser.add_argument('--socket', help='Unix socket path the server listens on instead of TCP')
+    parser.add_argument('--max-datasets', type=int, default=16, help='Datasets kept in memory by the server')
+    
+    # Pipeline mode
+    parser.add_argument('--workers', type=int, help='Number of pipeline steps run at once')
+    
+    # Profiling
+    parser.add_argument('--profile', help='Write a timing and memory profile of the run to this path')
+    parser.add_argument('--profile-format', choices=PROFILE_FORMATS, default='json',
+                        help='Profile format: JSON report or Chrome trace')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Measure the peak memory of every profiled step (slower)')
+    
+    # Memory budget
+    parser.add_argument('--memory-budget', help='Memory operations may use, e.g. 2GB; larger inputs spill to disk')
+    parser.add_argument('--spill-dir', help='Directory of spill files, created if missing (default: the temporary directory)')
     
     return parser.parse_args()
 
+def run_profiled(platform, args):
+    """Run the platform, with a profile if requested"""
+    if not args.profile:
+        return platform.run(args)
+        
+    with Profiler(memory=args.profile_memory) as profiler:
+        with profile_span('run', mode=args.mode):
+            exit_code = platform.run(args)
+    profiler.save(args.profile, format=args.profile_format)
+    print(f"Profile written to: {args.profile}")
+    return exit_code
+
 def main():
     """Main function"""
     args = parse_args()
     platform = DataAnalystPlatform()
-    return platform.run(args)
+    if not args.memory_budget:
+        return run_profiled(platform, args)
+        
+    from src.utils.memory_budget import MemoryBudget
+    
+    with MemoryBudget(args.memory_budget, spill_dir=args.spill_dir) as budget:
+        exit_code = run_profiled(platform, args)
+    for operation, spill in budget.report().items():
+        print(f"Spilled to disk: {operation} ({spill['partitions']} partitions, {spill['rows']} rows, "
+              f"{spill['bytes'] / 2 ** 20:.1f} MB)")
+    return exit_code
 
 if __name__ == '__main__':
     sys.exit(main())
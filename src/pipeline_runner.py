@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Pipeline Runner Module"""
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_analyst_platform import DataAnalystPlatform, required_columns
+from src.platform_server import DatasetCache
+from src.utils.profiling import profile_span
+
+# Step modes with their required parameters
+STEP_MODES = {
+    'excel': ('file',),
+    'pivot': ('index', 'values'),
+    'dashboard': ('charts',),
+    'kpi': ('kpi_config',),
+    'trend': ('date_col', 'value_col'),
+    'forecast': ('date_col', 'value_col')
+}
+
+
+def load_spec(path):
+    """
+    Load a pipeline specification from a YAML or JSON file
+
+    Parameters:
+    -----------
+    path : str
+        Path to a .yaml, .yml or .json file
+
+    Returns:
+    --------
+    dict
+        Pipeline specification, with 'base_dir' set to the file's directory
+        unless given
+    """
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required for YAML pipelines; install it or use a JSON spec")
+            spec = yaml.safe_load(f)
+        elif path.endswith('.json'):
+            spec = json.load(f)
+        else:
+            raise ValueError(f"Unsupported pipeline format: {path}")
+
+    spec.setdefault('base_dir', os.path.dirname(os.path.abspath(path)))
+    return spec
+
+
+def topological_order(steps):
+    """
+    Order steps so that every step follows its dependencies
+
+    Parameters:
+    -----------
+    steps : dict
+        Dependencies (set of step names) by step name
+
+    Returns:
+    --------
+    list
+        Step names in dependency order
+
+    Raises:
+    -------
+    ValueError
+        If the dependencies contain a cycle
+    """
+    remaining = {name: set(dependencies) for name, dependencies in steps.items()}
+    order = []
+    ready = [name for name, dependencies in remaining.items() if not dependencies]
+
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for other, dependencies in remaining.items():
+            if name in dependencies:
+                dependencies.discard(name)
+                if not dependencies:
+                    ready.append(other)
+
+    if len(order) < len(steps):
+        cycle = sorted(name for name in steps if name not in order)
+        raise ValueError(f"Pipeline steps have cyclic dependencies: {', '.join(cycle)}")
+    return order
+
+
+class PipelineRunner:
+    def __init__(self, spec, max_workers=None):
+        """
+        Parameters:
+        -----------
+        spec : dict
+            Pipeline specification: 'datasets' (file path by name) and
+            'steps' (list of dicts with 'name', 'mode', the parameters of the
+            mode, an optional 'data' source and optional 'depends_on')
+        max_workers : int
+            Number of steps run at once (if None, spec 'max_workers' or 4)
+        """
+        self.base_dir = spec.get('base_dir', os.getcwd())
+        self.datasets = {name: source['file'] if isinstance(source, dict) else source
+                         for name, source in (spec.get('datasets') or {}).items()}
+        self.steps = {}
+        for step in spec.get('steps') or []:
+            if 'name' not in step:
+                raise ValueError(f"Pipeline step without a name: {step}")
+            if step['name'] in self.steps:
+                raise ValueError(f"Duplicate pipeline step: {step['name']}")
+            self.steps[step['name']] = step
+        self.max_workers = max_workers or spec.get('max_workers', 4)
+        self._cache = DatasetCache(max_datasets=max(1, len(self.datasets) + len(self.steps)))
+        self.dependencies = self._dependencies()
+        self.order = topological_order(self.dependencies)
+        self.columns = self._columns()
+
+    def _path(self, path):
+        """Resolve a path relative to the pipeline's base directory"""
+        return path if os.path.isabs(path) else os.path.join(self.base_dir, path)
+
+    def _dependencies(self):
+        """Validate the steps and collect their dependencies"""
+        dependencies = {}
+        for name, step in self.steps.items():
+            mode = step.get('mode')
+            if mode not in STEP_MODES:
+                raise ValueError(f"Unsupported mode of step {name}: {mode}")
+            missing = [param for param in STEP_MODES[mode] if param not in step]
+            if mode != 'excel' and 'data' not in step and 'file' not in step:
+                missing.append('data or file')
+            if missing:
+                raise ValueError(f"Missing parameters of step {name}: {', '.join(missing)}")
+
+            depends_on = step.get('depends_on') or []
+            depends_on = {depends_on} if isinstance(depends_on, str) else set(depends_on)
+            # Reading another step's output makes it a dependency
+            if step.get('data') in self.steps:
+                depends_on.add(step['data'])
+            elif 'data' in step and step['data'] not in self.datasets:
+                raise ValueError(f"Unknown data source of step {name}: {step['data']}")
+            unknown = depends_on - set(self.steps)
+            if unknown:
+                raise ValueError(f"Unknown dependencies of step {name}: {', '.join(sorted(unknown))}")
+            dependencies[name] = depends_on
+        return dependencies
+
+    def _source_path(self, step):
+        """Resolved path of the file a step reads, or None if it reads another step's output"""
+        source = step.get('data')
+        if source in self.steps:
+            return None
+        return self._path(self.datasets[source] if source is not None else step['file'])
+
+    def _columns(self):
+        """
+        Columns to read per file: those used by the steps reading it, or
+        None (all columns) if any of them may use any column
+        """
+        columns = {}
+        for step in self.steps.values():
+            if step['mode'] == 'excel':
+                continue
+            path = self._source_path(step)
+            if path is None:
+                continue
+            needed = required_columns(step['mode'], step)
+            if needed is None or (path in columns and columns[path] is None):
+                columns[path] = None
+            else:
+                columns[path] = list(dict.fromkeys(columns.get(path, []) + needed))
+        return columns
+
+    def _data(self, step, results):
+        """Return the input of a step: a dataset, a file or another step's output"""
+        import pandas as pd
+        from src.utils.dataset import Dataset
+
+        source = step.get('data')
+        if source in self.steps:
+            output = results[source]['result']
+            # Steps never modify their input, so readers share output frames through a read-only handle
+            return Dataset(output) if isinstance(output, pd.DataFrame) else output
+        path = self._source_path(step)
+        # All readers of a file share one read of the union of their columns, and its indexed series
+        return self._cache.get_dataset(path, columns=self.columns[path])
+
+    def _run_step(self, step, results):
+        """Run one step with its own platform object"""
+        platform = DataAnalystPlatform()
+        mode = step['mode']
+
+        if mode == 'excel':
+            return platform.analyze_excel(self._path(step['file']))
+
+        data = self._data(step, results)
+        if mode == 'pivot':
+            result = platform.create_pivot(data, index=step['index'], columns=step.get('columns'),
+                                           values=step['values'], aggfunc=step.get('aggfunc', 'sum'))
+            if step.get('output'):
+                platform.pivot_generator.export_to_excel(result, self._path(step['output']))
+        elif mode == 'dashboard':
+            result = platform.create_dashboard(data, step['charts'],
+                                               title=step.get('title', "IBM Data Analyst Dashboard"))
+            if step.get('output'):
+                result.create_html_dashboard(self._path(step['output']))
+        elif mode == 'kpi':
+            result = platform.calculate_kpis(data, step['kpi_config'])
+        elif mode == 'trend':
+            result = platform.analyze_trends(data, step['date_col'], step['value_col'], config=step.get('config'))
+        else:
+            model_params = {name: tuple(value) if name in ('order', 'seasonal_order') and isinstance(value, list)
+                            else value for name, value in (step.get('model_params') or {}).items()} or None
+            result = platform.forecast(data, step['date_col'], step['value_col'], steps=step.get('steps', 10),
+                                       model_type=step.get('model_type', 'arima'), model_params=model_params)
+        return result
+
+    def _timed_step(self, step, results):
+        """Run a step and record its outcome and duration"""
+        start = time.perf_counter()
+        try:
+            with profile_span('step', step=step['name'], mode=step['mode']):
+                result = self._run_step(step, results)
+            outcome = {'status': 'success', 'result': result, 'error': None}
+        except Exception as e:
+            outcome = {'status': 'failed', 'result': None, 'error': f"{type(e).__name__}: {e}"}
+        outcome['seconds'] = time.perf_counter() - start
+        return outcome
+
+    def run(self, callback=None):
+        """
+        Run the pipeline
+
+        Steps start as soon as their dependencies have succeeded, so
+        independent steps run concurrently in threads sharing the loaded
+        datasets. Steps depending on a failed step are skipped.
+
+        Parameters:
+        -----------
+        callback : callable
+            Called with the step name and its outcome when a step finishes
+
+        Returns:
+        --------
+        dict
+            Outcome by step name, in dependency order: 'status' ('success',
+            'failed' or 'skipped'), 'result', 'error' and 'seconds'
+        """
+        results = {}
+        pending = {name: set(dependencies) for name, dependencies in self.dependencies.items()}
+        lock = threading.Lock()
+
+        def finish(name, outcome):
+            with lock:
+                results[name] = outcome
+            if callback is not None:
+                callback(name, outcome)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                for name in [name for name in self.order if name in pending]:
+                    dependencies = pending[name]
+                    if any(results.get(dep, {}).get('status') in ('failed', 'skipped') for dep in dependencies):
+                        del pending[name]
+                        finish(name, {'status': 'skipped', 'result': None,
+                                      'error': 'A dependency did not succeed', 'seconds': 0.0})
+                    elif all(dep in results for dep in dependencies):
+                        del pending[name]
+                        running[executor.submit(self._timed_step, self.steps[name], results)] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), future.result())
+
+        return {name: results[name] for name in self.order}
+
+
+def run_pipeline(path, max_workers=None, callback=None):
+    """
+    Load a pipeline specification and run it
+
+    Parameters:
+    -----------
+    path : str
+        Path to a YAML or JSON pipeline specification
+    max_workers : int
+        Number of steps run at once (if None, spec 'max_workers' or 4)
+    callback : callable
+        Called with the step name and its outcome when a step finishes
+
+    Returns:
+    --------
+    dict
+        Outcome by step name (see PipelineRunner.run)
+    """
+    return PipelineRunner(load_spec(path), max_workers=max_workers).run(callback=callback)
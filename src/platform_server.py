@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Platform Server Module"""
+import http.client
+import importlib
+import json
+import math
+import os
+import socket
+import socketserver
+import sys
+import threading
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.cache import LRUCache
+from src.data_analyst_platform import DataAnalystPlatform, required_columns
+
+# Request types served under POST /<mode>, with their required parameters
+MODES = {
+    'pivot': ('index', 'values'),
+    'kpi': ('kpi_config',),
+    'trend': ('date_col', 'value_col'),
+    'forecast': ('date_col', 'value_col')
+}
+
+# Modules imported at startup, so the first request is as fast as the others
+WARM_MODULES = ('pandas', 'src.excel.pivot_generator', 'src.business_intelligence.kpi_calculator',
+                'src.business_intelligence.trend_analyzer', 'src.business_intelligence.forecast_engine')
+
+DEFAULT_PORT = 8765
+
+
+def to_json_compatible(value):
+    """
+    Convert analysis results to JSON-compatible values
+
+    DataFrames become {'columns', 'index', 'data'}, Series become
+    {'index', 'data'}, timestamps ISO strings, and NaN becomes None.
+
+    Parameters:
+    -----------
+    value : object
+        Value to convert
+
+    Returns:
+    --------
+    object
+        Value made of dicts, lists, strings, numbers, booleans and None
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        return {
+            'columns': [to_json_compatible(column) for column in value.columns],
+            'index': [to_json_compatible(label) for label in value.index],
+            'data': [[to_json_compatible(item) for item in row] for row in value.itertuples(index=False)]
+        }
+    if isinstance(value, pd.Series):
+        return {
+            'index': [to_json_compatible(label) for label in value.index],
+            'data': [to_json_compatible(item) for item in value.tolist()]
+        }
+    if isinstance(value, dict):
+        return {str(to_json_compatible(key)): to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_json_compatible(item) for item in value]
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is pd.NaT:
+        return None
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    # Models, decomposition results and other objects have no JSON form
+    return repr(value)
+
+
+class DatasetCache:
+    def __init__(self, max_datasets=16):
+        self._cache = LRUCache(maxsize=max_datasets)
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, path, columns=None):
+        """
+        Get a dataset, reading it only if it is not cached or changed on disk
+
+        Parameters:
+        -----------
+        path : str
+            Path to a CSV, Excel, Parquet, Feather or JSON-lines file
+        columns : list
+            Columns to read (if None, all columns); every column set is
+            cached separately
+
+        Returns:
+        --------
+        pd.DataFrame
+            The cached data (see Dataset.frame); changes made by a request
+            do not reach the cache
+        """
+        return self.get_dataset(path, columns=columns).frame
+
+    def get_dataset(self, path, columns=None):
+        """
+        Get a dataset as a read-only handle shared by all requests (see get)
+
+        Requests on the same file and columns share the handle's parsed and
+        date-indexed series.
+
+        Parameters:
+        -----------
+        path : str
+            Path to a CSV, Excel, Parquet, Feather or JSON-lines file
+        columns : list
+            Columns to read (if None, all columns)
+
+        Returns:
+        --------
+        Dataset
+            Handle on the cached data
+        """
+        from src.utils.dataset import Dataset
+        from src.utils.ingestion import read_data
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        # A rewritten file changes its modification time or size, so it is read again
+        key = (path, stat.st_mtime_ns, stat.st_size, None if columns is None else tuple(columns))
+
+        # Concurrent requests for the same file wait for one read instead of each reading it
+        with self._locks_lock:
+            lock = self._locks.setdefault(path, threading.Lock())
+        with lock:
+            return self._cache.get_or_compute(key, lambda: Dataset(read_data(path, columns=columns)))
+
+    def stats(self):
+        """Return the number of cached datasets, hits and misses"""
+        return {'datasets': len(self._cache), 'hits': self._cache.hits, 'misses': self._cache.misses}
+
+
+def execute_request(mode, request, datasets):
+    """
+    Run a pivot, kpi, trend or forecast request on a fresh platform object
+
+    Parameters:
+    -----------
+    mode : str
+        Request type ('pivot', 'kpi', 'trend' or 'forecast')
+    request : dict
+        'file' (path) or 'data' (list of records), and the parameters of
+        the platform method: 'index', 'columns', 'values', 'aggfunc'
+        (pivot); 'kpi_config' (kpi); 'date_col', 'value_col', 'config'
+        (trend); 'date_col', 'value_col', 'steps', 'model_type',
+        'model_params' (forecast)
+    datasets : DatasetCache
+        Cache the 'file' is read through
+
+    Returns:
+    --------
+    object
+        Result of the platform method
+    """
+    import pandas as pd
+
+    if mode not in MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    missing = [name for name in MODES[mode] if name not in request]
+    if missing:
+        raise ValueError(f"Missing parameters for {mode}: {', '.join(missing)}")
+
+    if 'data' in request:
+        data = pd.DataFrame(request['data'])
+    elif 'file' in request:
+        # Only the columns the request uses are read, and shared with other requests
+        data = datasets.get_dataset(request['file'], columns=required_columns(mode, request))
+    else:
+        raise ValueError("A 'file' path or inline 'data' records are required")
+
+    # Platform objects keep per-call state, so every request gets its own;
+    # the imported modules and cached datasets are shared
+    platform = DataAnalystPlatform()
+
+    if mode == 'pivot':
+        return platform.create_pivot(data, index=request['index'], columns=request.get('columns'),
+                                     values=request['values'], aggfunc=request.get('aggfunc', 'sum'))
+    if mode == 'kpi':
+        return platform.calculate_kpis(data, request['kpi_config'])
+    if mode == 'trend':
+        return platform.analyze_trends(data, request['date_col'], request['value_col'], config=request.get('config'))
+
+    # JSON has no tuples; the model orders are expected as tuples
+    model_params = {name: tuple(value) if name in ('order', 'seasonal_order') and isinstance(value, list)
+                    else value for name, value in (request.get('model_params') or {}).items()} or None
+    return platform.forecast(data, request['date_col'], request['value_col'], steps=request.get('steps', 10),
+                             model_type=request.get('model_type', 'arima'), model_params=model_params)
+
+
+class PlatformServer:
+    def __init__(self, max_datasets=16):
+        self.datasets = DatasetCache(max_datasets=max_datasets)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def warm_up(self):
+        """Import the modules of all request types"""
+        for module in WARM_MODULES:
+            importlib.import_module(module)
+
+    def handle(self, mode, request):
+        """
+        Run a request
+
+        Parameters:
+        -----------
+        mode : str
+            Request type ('pivot', 'kpi', 'trend' or 'forecast')
+        request : dict
+            Request parameters (see execute_request)
+
+        Returns:
+        --------
+        dict
+            JSON-compatible results under 'result'
+        """
+        result = execute_request(mode, request, self.datasets)
+
+        with self._lock:
+            self.requests += 1
+
+        return {'result': to_json_compatible(result)}
+
+    def status(self):
+        """Return the number of requests served and the dataset cache statistics"""
+        return {'requests': self.requests, 'datasets': self.datasets.stats()}
+
+    def serve(self, host='127.0.0.1', port=DEFAULT_PORT, socket_path=None):
+        """
+        Serve requests until shutdown is called
+
+        Parameters:
+        -----------
+        host : str
+            Address to listen on (ignored with socket_path)
+        port : int
+            Port to listen on (0 picks a free port)
+        socket_path : str
+            Unix socket path to listen on instead of TCP
+        """
+        self._server = self.create_server(host=host, port=port, socket_path=socket_path)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if socket_path is not None and os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+    def create_server(self, host='127.0.0.1', port=DEFAULT_PORT, socket_path=None):
+        """Create the HTTP server bound to a TCP address or a Unix socket"""
+        handler = type('Handler', (PlatformRequestHandler,), {'platform_server': self})
+        if socket_path is not None:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            return UnixHTTPServer(socket_path, handler)
+        return ThreadingHTTPServer((host, port), handler)
+
+    def shutdown(self):
+        """Stop serve from another thread"""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class PlatformRequestHandler(BaseHTTPRequestHandler):
+    platform_server = None
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        # Request lines would flood the log of a busy scheduler
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/health':
+            self._send(200, self.platform_server.status())
+        else:
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        mode = self.path.strip('/')
+        if mode not in MODES:
+            self._send(404, {'error': f"Unsupported mode: {mode}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            self._send(200, self.platform_server.handle(mode, request))
+        except (ValueError, TypeError, KeyError, FileNotFoundError) as e:
+            # Bad parameters, unknown columns and missing files are client errors
+            self._send(400, {'error': f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            self._send(500, {'error': str(e)})
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=60):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def call_server(mode, request=None, host='127.0.0.1', port=DEFAULT_PORT, socket_path=None, timeout=60):
+    """
+    Send a request to a running platform server
+
+    Parameters:
+    -----------
+    mode : str
+        Request type ('pivot', 'kpi', 'trend', 'forecast', or 'health' for
+        the server status)
+    request : dict
+        Request parameters (see PlatformServer.handle)
+    host : str
+        Server address (ignored with socket_path)
+    port : int
+        Server port
+    socket_path : str
+        Unix socket path of the server
+    timeout : float
+        Seconds to wait for the response
+
+    Returns:
+    --------
+    dict
+        Response payload
+
+    Raises:
+    -------
+    RuntimeError
+        If the server reports an error
+    """
+    if socket_path is not None:
+        connection = UnixHTTPConnection(socket_path, timeout=timeout)
+    else:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    try:
+        if mode == 'health':
+            connection.request('GET', '/health')
+        else:
+            connection.request('POST', f'/{mode}', body=json.dumps(request or {}),
+                               headers={'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(f"Server error {response.status}: {payload.get('error')}")
+    return payload
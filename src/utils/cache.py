@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Cache Utilities Module"""
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+def data_fingerprint(data):
+    """
+    Compute a stable content fingerprint for a dataset
+
+    Parameters:
+    -----------
+    data : pd.Series, pd.DataFrame or np.ndarray
+        Data to fingerprint (values, index and column names are included)
+
+    Returns:
+    --------
+    str
+        Hex digest identifying the data content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        # hash_pandas_object is vectorized and covers both values and index
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        names = data.columns if isinstance(data, pd.DataFrame) else [data.name]
+        digest.update(repr(list(names)).encode())
+    else:
+        values = np.ascontiguousarray(data)
+        digest.update(f"{values.dtype}{values.shape}".encode())
+        digest.update(values.tobytes())
+
+    return digest.hexdigest()
+
+
+class LRUCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def get(self, key, default=None):
+        """
+        Get a cached value and mark it as recently used
+
+        Parameters:
+        -----------
+        key : hashable
+            Cache key
+        default : object
+            Value returned when the key is not cached
+
+        Returns:
+        --------
+        object
+            Cached value or default
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry when full
+
+        Parameters:
+        -----------
+        key : hashable
+            Cache key
+        value : object
+            Value to cache
+        """
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_compute(self, key, func):
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        Parameters:
+        -----------
+        key : hashable
+            Cache key
+        func : callable
+            Zero-argument function producing the value
+
+        Returns:
+        --------
+        object
+            Cached or freshly computed value
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
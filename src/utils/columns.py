@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Column Utilities Module"""
+
+# Imported by the CLI before any mode runs, so this module must not import pandas
+
+
+def column_list(value):
+    """
+    Column names of a setting given as one name or a list of names
+
+    Parameters:
+    -----------
+    value : str, list or None
+        Column setting
+
+    Returns:
+    --------
+    list
+        Column names (empty if value is None)
+    """
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Dataset Handle Module"""
+import threading
+import pandas as pd
+
+
+def copy_on_write_enabled():
+    """Whether pandas copies shared column buffers on write (always from pandas 3)"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        # 'warn' only warns about writes to shared buffers
+        return pd.get_option('mode.copy_on_write') is True
+    except KeyError:
+        # The option does not exist before pandas 1.5
+        return False
+
+
+def share(data):
+    """
+    Copy a Series or DataFrame so writes to the copy do not reach data
+
+    With copy-on-write the copy is shallow and shares the buffers of data;
+    without it (pandas 2 and earlier, unless the caller enabled it) the
+    data is copied.
+
+    Parameters:
+    -----------
+    data : pd.Series or pd.DataFrame
+        Data to hand out
+
+    Returns:
+    --------
+    pd.Series or pd.DataFrame
+        Independent copy of data
+    """
+    return data.copy(deep=not copy_on_write_enabled())
+
+
+def time_indexed(frame, date_col, value_col=None):
+    """
+    Index the columns of a DataFrame by its date column, without modifying it
+
+    Parameters:
+    -----------
+    frame : pd.DataFrame
+        Data with a date column
+    date_col : str
+        Column name for date; parsed if it is not datetime already
+    value_col : str
+        Column to keep (if None, all other columns)
+
+    Returns:
+    --------
+    pd.DataFrame
+        Columns indexed by a DatetimeIndex named date_col; with
+        copy-on-write they share the buffers of frame
+    """
+    dates = frame[date_col]
+    if not pd.api.types.is_datetime64_dtype(dates):
+        dates = pd.to_datetime(dates)
+    columns = [value_col] if value_col else [column for column in frame.columns if column != date_col]
+    return frame[columns].set_axis(pd.DatetimeIndex(dates, name=date_col), axis=0)
+
+
+class Dataset:
+    def __init__(self, data):
+        """
+        Read-only handle on a DataFrame shared by several steps
+
+        With copy-on-write, the handle and everything it hands out share
+        the column buffers of data; a write through any of them copies
+        only the written column, so no step sees another's changes. Without
+        copy-on-write the handle copies data once, and hands out copies.
+        Date parsing and indexing are done once per column pair and shared.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame or Dataset
+            Data to share
+        """
+        frame = data.frame if isinstance(data, Dataset) else data
+        if not isinstance(frame, pd.DataFrame):
+            raise ValueError("Data must be a DataFrame or a Dataset")
+        self._frame = share(frame)
+        self._indexed = {}
+        self._lock = threading.Lock()
+
+    @property
+    def frame(self):
+        """The data as a DataFrame sharing the handle's buffers (see share)"""
+        return share(self._frame)
+
+    @property
+    def shape(self):
+        return self._frame.shape
+
+    @property
+    def column_names(self):
+        return list(self._frame.columns)
+
+    def __len__(self):
+        return len(self._frame)
+
+    def select(self, columns):
+        """
+        Return some columns without copying them
+
+        Parameters:
+        -----------
+        columns : list
+            Column names
+
+        Returns:
+        --------
+        pd.DataFrame
+            The columns, sharing the handle's buffers (see share)
+        """
+        return share(self._frame[list(columns)])
+
+    def time_indexed(self, date_col, value_col=None):
+        """
+        Return columns indexed by the date column (see time_indexed)
+
+        The result is computed on the first call for a column pair and
+        shared by later calls, so steps analyzing the same series parse
+        and index its dates once.
+
+        Parameters:
+        -----------
+        date_col : str
+            Column name for date
+        value_col : str
+            Column to keep (if None, all other columns)
+
+        Returns:
+        --------
+        pd.DataFrame
+            Columns indexed by a DatetimeIndex named date_col
+        """
+        key = (date_col, value_col)
+        with self._lock:
+            if key not in self._indexed:
+                self._indexed[key] = time_indexed(self._frame, date_col, value_col)
+            return share(self._indexed[key])
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Ingestion Utilities Module"""
+import csv
+import json
+import operator
+import os
+import pandas as pd
+
+from src.utils.dataset import Dataset
+from src.utils.profiling import profiled
+
+# File formats by extension; other extensions are sniffed from the content
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.txt': 'csv',
+    '.xls': 'excel',
+    '.xlsx': 'excel',
+    '.xlsm': 'excel',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl'
+}
+
+FORMATS = ('csv', 'excel', 'parquet', 'feather', 'jsonl')
+
+# Leading bytes of the binary formats
+MAGIC_BYTES = (
+    (b'PAR1', 'parquet'),
+    (b'ARROW1', 'feather'),
+    (b'PK\x03\x04', 'excel'),
+    (b'\xd0\xcf\x11\xe0', 'excel')
+)
+
+# Filter operators, in the (column, op, value) form of pyarrow's parquet filters
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, values: column.isin(values),
+    'not in': lambda column, values: ~column.isin(values)
+}
+
+# Bytes read to sniff the format and CSV delimiter
+SNIFF_BYTES = 65536
+
+DEFAULT_CHUNKSIZE = 100000
+
+
+def detect_format(path):
+    """
+    Detect the format of a data file
+
+    The extension decides when it is known; otherwise the leading bytes
+    identify Parquet, Feather and Excel files, and text whose first line is
+    a JSON object is JSON lines. Other text is read as CSV.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the file
+
+    Returns:
+    --------
+    str
+        'csv', 'excel', 'parquet', 'feather' or 'jsonl'
+
+    Raises:
+    -------
+    ValueError
+        If the file is binary in an unsupported format
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in EXTENSIONS:
+        return EXTENSIONS[extension]
+
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    for magic, file_format in MAGIC_BYTES:
+        if head.startswith(magic):
+            return file_format
+
+    try:
+        text = head.decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValueError(f"Unsupported file format: {path}")
+    first_line = text.lstrip().split('\n', 1)[0]
+    if first_line.startswith('{'):
+        try:
+            if isinstance(json.loads(first_line), dict):
+                return 'jsonl'
+        except ValueError:
+            pass
+    return 'csv'
+
+
+def sniff_delimiter(path):
+    """Detect the delimiter of a CSV file from its first lines (',' if unclear)"""
+    if path.lower().endswith('.tsv'):
+        return '\t'
+    with open(path, newline='', encoding='utf-8', errors='replace') as f:
+        sample = f.read(SNIFF_BYTES)
+    # Cut at the last complete line so a partial row does not mislead the sniffer
+    if len(sample) == SNIFF_BYTES and '\n' in sample:
+        sample = sample[:sample.rindex('\n')]
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+    except csv.Error:
+        return ','
+
+
+def read_header(path, format=None):
+    """
+    Read the column names of a data file without reading its rows
+
+    Parameters:
+    -----------
+    path : str
+        Path to the file
+    format : str
+        File format (if None, detected with detect_format)
+
+    Returns:
+    --------
+    list
+        Column names in file order
+    """
+    file_format = format or detect_format(path)
+
+    if file_format == 'csv':
+        return list(pd.read_csv(path, sep=sniff_delimiter(path), nrows=0).columns)
+    if file_format == 'excel':
+        return list(pd.read_excel(path, nrows=0).columns)
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        return pq.read_schema(path).names
+    if file_format == 'feather':
+        import pyarrow as pa
+
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).schema.names
+    if file_format == 'jsonl':
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    return list(json.loads(line))
+        return []
+    raise ValueError(f"Unsupported file format: {path}")
+
+
+def filter_mask(data, filters):
+    """
+    Evaluate filters on a DataFrame
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Data to filter
+    filters : list
+        (column, op, value) tuples combined with AND, or a list of such
+        lists combined with OR
+
+    Returns:
+    --------
+    pd.Series
+        Boolean mask of the rows passing the filters
+    """
+    if filters and isinstance(filters[0], (list, tuple)) and filters[0] and isinstance(filters[0][0], (list, tuple)):
+        mask = pd.Series(False, index=data.index)
+        for conjunction in filters:
+            mask |= filter_mask(data, conjunction)
+        return mask
+
+    mask = pd.Series(True, index=data.index)
+    for column, op, value in filters:
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        mask &= FILTER_OPERATORS[op](data[column], value)
+    return mask
+
+
+def _filter_columns(filters):
+    """Columns referenced by filters"""
+    if not filters:
+        return []
+    if isinstance(filters[0][0], (list, tuple)):
+        return [column for conjunction in filters for column in _filter_columns(conjunction)]
+    return [column for column, _, _ in filters]
+
+
+def _read_columns(columns, filters):
+    """Columns to read: the projection plus the columns the filters need"""
+    if columns is None:
+        return None
+    return list(dict.fromkeys(list(columns) + _filter_columns(filters)))
+
+
+def _finish(data, columns, filters):
+    """Apply filters and the projection to data read without them"""
+    if filters:
+        data = data[filter_mask(data, filters).to_numpy()]
+    if columns is not None:
+        data = data[list(columns)]
+    return data
+
+
+@profiled('load')
+def read_data(path, columns=None, filters=None, format=None, **kwargs):
+    """
+    Read a CSV, Excel, Parquet, Feather or JSON-lines file
+
+    Only the requested columns are parsed where the format allows it (CSV,
+    Excel, Parquet and Feather); Parquet filters are pushed down to skip row
+    groups, other formats are filtered after reading.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the file
+    columns : list
+        Columns to read (if None, all columns)
+    filters : list
+        (column, op, value) tuples combined with AND, or a list of such
+        lists combined with OR; op is one of FILTER_OPERATORS
+    format : str
+        File format (if None, detected with detect_format)
+    **kwargs : dict
+        Options passed on to the pandas reader
+
+    Returns:
+    --------
+    pd.DataFrame
+        Data with the requested columns in the requested order
+    """
+    file_format = format or detect_format(path)
+    read_columns = _read_columns(columns, filters)
+
+    if file_format == 'csv':
+        kwargs.setdefault('sep', sniff_delimiter(path))
+        data = pd.read_csv(path, usecols=read_columns, **kwargs)
+    elif file_format == 'excel':
+        data = pd.read_excel(path, usecols=read_columns, **kwargs)
+    elif file_format == 'parquet':
+        # Row groups whose statistics exclude the filters are never read
+        data = pd.read_parquet(path, columns=read_columns, filters=filters or None, **kwargs)
+        return data if columns is None else data[list(columns)]
+    elif file_format == 'feather':
+        data = pd.read_feather(path, columns=read_columns, **kwargs)
+    elif file_format == 'jsonl':
+        data = pd.read_json(path, lines=True, **kwargs)
+    else:
+        raise ValueError(f"Unsupported file format: {path}")
+
+    return _finish(data, columns, filters)
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE, columns=None, filters=None, format=None, **kwargs):
+    """
+    Read a data file in chunks of rows
+
+    CSV, JSON lines and Parquet are streamed, so memory is bounded by the
+    chunk size; Excel and Feather files are read whole and then split.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the file
+    chunksize : int
+        Rows per chunk (Parquet chunks follow record batches of this size)
+    columns : list
+        Columns to read (if None, all columns)
+    filters : list
+        Row filters (see read_data), applied to every chunk
+    format : str
+        File format (if None, detected with detect_format)
+    **kwargs : dict
+        Options passed on to the pandas reader
+
+    Yields:
+    -------
+    pd.DataFrame
+        Chunks of the data (chunks emptied by the filters are skipped)
+    """
+    file_format = format or detect_format(path)
+    read_columns = _read_columns(columns, filters)
+
+    if file_format == 'csv':
+        kwargs.setdefault('sep', sniff_delimiter(path))
+        chunks = pd.read_csv(path, usecols=read_columns, chunksize=chunksize, **kwargs)
+    elif file_format == 'jsonl':
+        chunks = pd.read_json(path, lines=True, chunksize=chunksize, **kwargs)
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=read_columns)
+        chunks = (batch.to_pandas() for batch in batches)
+    elif file_format in ('excel', 'feather'):
+        data = read_data(path, columns=read_columns, format=file_format, **kwargs)
+        chunks = (data.iloc[start:start + chunksize] for start in range(0, len(data), chunksize))
+    else:
+        raise ValueError(f"Unsupported file format: {path}")
+
+    for chunk in chunks:
+        chunk = _finish(chunk, columns, filters)
+        if len(chunk):
+            yield chunk
+
+
+def load_frame(data, **kwargs):
+    """
+    Return data as a DataFrame, reading it if it is a file path
+
+    Parameters:
+    -----------
+    data : pd.DataFrame, Dataset or str
+        DataFrame, dataset handle, or path to a file in a format read by
+        read_data
+    **kwargs : dict
+        Options of read_data
+
+    Returns:
+    --------
+    pd.DataFrame
+        The DataFrame itself, the dataset's data, or the file's data
+    """
+    if isinstance(data, (str, os.PathLike)):
+        return read_data(os.fspath(data), **kwargs)
+    if isinstance(data, Dataset):
+        return data.frame
+    return data
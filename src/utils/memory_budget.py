@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Memory Budget Utilities Module"""
+import importlib.util
+import math
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+
+from src.utils.dataset import Dataset
+from src.utils.ingestion import detect_format, iter_chunks, read_header
+from src.utils.profiling import profile_span
+
+# Peak working memory of a grouped operation as a multiple of its input
+WORKING_FACTOR = 3
+
+# In-memory size of a file's data as a multiple of its size on disk
+FILE_EXPANSION = {'csv': 2, 'jsonl': 1, 'excel': 5, 'parquet': 5, 'feather': 1}
+
+# Assumed in-memory bytes per value when sizing the chunks read from files
+VALUE_BYTES = 64
+
+MIN_CHUNK_ROWS = 1000
+
+MAX_PARTITIONS = 256
+
+# Rows sampled to estimate the memory of string columns
+SAMPLE_ROWS = 1000
+
+SIZE_UNITS = {'': 1, 'b': 1, 'k': 2 ** 10, 'kb': 2 ** 10, 'm': 2 ** 20, 'mb': 2 ** 20, 'g': 2 ** 30, 'gb': 2 ** 30,
+              't': 2 ** 40, 'tb': 2 ** 40}
+
+# Budget the heavy operations of all threads respect, or None when memory is unbounded
+_ACTIVE = None
+
+
+def parse_size(text):
+    """
+    Parse a size such as '512MB', '2g' or '1e9' into bytes
+
+    Parameters:
+    -----------
+    text : str or int
+        Size, with an optional binary unit (KB, MB, GB, TB)
+
+    Returns:
+    --------
+    int
+        Size in bytes
+    """
+    if isinstance(text, (int, float)):
+        return int(text)
+    match = re.fullmatch(r'\s*([0-9.eE+]+)\s*([a-zA-Z]*)\s*', text)
+    if not match or match.group(2).lower() not in SIZE_UNITS:
+        raise ValueError(f"Invalid size: {text}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).lower()])
+
+
+def _column_bytes(column):
+    """In-memory bytes of a Series, sampling the lengths of strings"""
+    if not (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)) or len(column) == 0:
+        return int(column.memory_usage(index=False))
+    sample = column.iloc[::max(1, len(column) // SAMPLE_ROWS)]
+    return int(sample.memory_usage(index=False, deep=True) * len(column) / len(sample))
+
+
+def estimate_bytes(data, columns=None):
+    """
+    Estimate the memory of data
+
+    Parameters:
+    -----------
+    data : pd.DataFrame, Dataset or str
+        DataFrame, dataset handle, or path to a file in a format read by
+        read_data
+    columns : list
+        Columns used (if None, all columns)
+
+    Returns:
+    --------
+    int
+        Estimated bytes of the columns in memory
+    """
+    if isinstance(data, (str, os.PathLike)):
+        path = os.fspath(data)
+        file_format = detect_format(path)
+        size = os.path.getsize(path) * FILE_EXPANSION.get(file_format, 1)
+        if columns is not None:
+            header = read_header(path, format=file_format)
+            size = size * len(columns) / max(1, len(header))
+        return int(size)
+    if isinstance(data, Dataset):
+        data = data.frame
+    names = data.columns if columns is None else columns
+    return sum(_column_bytes(data[name]) for name in names)
+
+
+def active_budget():
+    """The active MemoryBudget, or None"""
+    return _ACTIVE
+
+
+class MemoryBudget:
+    def __init__(self, limit, spill_dir=None):
+        """
+        Parameters:
+        -----------
+        limit : int or str
+            Bytes the working memory of an operation may use (e.g. '2GB');
+            operations on larger inputs run in chunks and spill to disk
+        spill_dir : str
+            Directory of the spill files, created if missing (if None, the
+            system temporary directory)
+        """
+        self.limit = parse_size(limit)
+        if self.limit <= 0:
+            raise ValueError("The memory budget must be positive")
+        self.spill_dir = spill_dir
+        self.spills = []
+        self._previous = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Make heavy operations of all threads respect the budget"""
+        global _ACTIVE
+        self._previous = _ACTIVE
+        _ACTIVE = self
+
+    def stop(self):
+        """Stop applying the budget"""
+        global _ACTIVE
+        _ACTIVE = self._previous
+
+    def exceeds(self, data, columns=None):
+        """Whether an operation on the columns of data would exceed the budget"""
+        return estimate_bytes(data, columns) * WORKING_FACTOR > self.limit
+
+    def chunk_rows(self, row_bytes):
+        """Rows per chunk whose processing fits the budget"""
+        return max(MIN_CHUNK_ROWS, int(self.limit // (WORKING_FACTOR * max(1, row_bytes))))
+
+    def iter_chunks(self, data, columns=None):
+        """
+        Read data in chunks sized to the budget
+
+        Parameters:
+        -----------
+        data : pd.DataFrame, Dataset or str
+            DataFrame, dataset handle, or path to a file in a format read
+            by read_data
+        columns : list
+            Columns to read (if None, all columns)
+
+        Yields:
+        -------
+        pd.DataFrame
+            Chunks of the columns
+        """
+        if isinstance(data, (str, os.PathLike)):
+            path = os.fspath(data)
+            width = len(columns) if columns is not None else len(read_header(path))
+            yield from iter_chunks(path, chunksize=self.chunk_rows(VALUE_BYTES * width), columns=columns)
+            return
+        if isinstance(data, Dataset):
+            data = data.frame
+        columns = list(data.columns) if columns is None else list(columns)
+        rows = self.chunk_rows(estimate_bytes(data, columns) / max(1, len(data)))
+        for start in range(0, len(data), rows):
+            yield data.iloc[start:start + rows][columns]
+
+    def partitions(self, nbytes):
+        """Number of spill partitions whose processing fits the budget"""
+        return min(MAX_PARTITIONS, max(2, math.ceil(nbytes * WORKING_FACTOR / self.limit)))
+
+    @contextmanager
+    def spill(self, operation, keys, nbytes):
+        """
+        Spill rows to disk partitioned by key for the duration of a block
+
+        The operation is recorded in spills, and with the active profiler
+        as a 'spill' span.
+
+        Parameters:
+        -----------
+        operation : str
+            Name of the spilling operation
+        keys : list
+            Columns the rows are partitioned by
+        nbytes : int
+            Estimated bytes of the operation's input
+
+        Yields:
+        -------
+        SpillPartitions
+            Partitions to add chunks to and read back
+        """
+        with profile_span('spill', operation=operation) as span:
+            partitions = SpillPartitions(keys, self.partitions(nbytes), directory=self.spill_dir,
+                                         buffer_bytes=self.limit // WORKING_FACTOR)
+            try:
+                yield partitions
+            finally:
+                partitions.close()
+            record = {'operation': operation, 'partitions': partitions.n_partitions, 'files': partitions.files,
+                      'rows': partitions.rows, 'bytes': partitions.bytes, 'format': partitions.format}
+            span.update(record)
+            self.spills.append(record)
+
+    def report(self):
+        """
+        Summarize the spilled operations
+
+        Returns:
+        --------
+        dict
+            Spills per operation name: 'count', 'partitions', 'files', 'rows'
+            and 'bytes' written
+        """
+        report = {}
+        for record in self.spills:
+            entry = report.setdefault(record['operation'],
+                                      {'count': 0, 'partitions': 0, 'files': 0, 'rows': 0, 'bytes': 0})
+            entry['count'] += 1
+            for key in ('partitions', 'files', 'rows', 'bytes'):
+                entry[key] += record[key]
+        return report
+
+
+class SpillPartitions:
+    def __init__(self, keys, n_partitions, directory=None, buffer_bytes=0):
+        """
+        Parameters:
+        -----------
+        keys : list
+            Columns the rows are hash-partitioned by; rows with equal keys
+            land in the same partition
+        n_partitions : int
+            Number of partitions
+        directory : str
+            Parent directory of the spill files, created if missing (if
+            None, the system temporary directory)
+        buffer_bytes : int
+            Bytes of rows held in memory before they are written, so small
+            chunks do not make many small files
+        """
+        self.keys = list(keys)
+        self.n_partitions = n_partitions
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix='spill-', dir=directory)
+        # Pickle keeps every dtype without pyarrow
+        self.format = 'parquet' if importlib.util.find_spec('pyarrow') is not None else 'pickle'
+        self.files = 0
+        self.rows = 0
+        self.bytes = 0
+        self.buffer_bytes = buffer_bytes
+        self._paths = [[] for _ in range(n_partitions)]
+        self._pending = [[] for _ in range(n_partitions)]
+        self._pending_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, chunk):
+        """Append the rows of a chunk to their partitions' spill files"""
+        if not len(chunk):
+            return
+        keys = chunk[self.keys]
+        # Chunks read from files may parse the same numeric key as int or float
+        numeric = {name: 'float64' for name in self.keys
+                   if pd.api.types.is_numeric_dtype(keys[name]) and not pd.api.types.is_bool_dtype(keys[name])}
+        hashes = pd.util.hash_pandas_object(keys.astype(numeric), index=False).to_numpy()
+        codes = hashes % np.uint64(self.n_partitions)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(self.n_partitions + 1))
+        for partition in range(self.n_partitions):
+            start, end = bounds[partition], bounds[partition + 1]
+            if start == end:
+                continue
+            rows = chunk.take(order[start:end])
+            self._pending[partition].append(rows)
+            self._pending_bytes += int(rows.memory_usage(index=False).sum())
+        if self._pending_bytes > self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows to one spill file per partition"""
+        for partition, pending in enumerate(self._pending):
+            if not pending:
+                continue
+            rows = pd.concat(pending, ignore_index=True)
+            path = os.path.join(self.directory, f"part-{partition:04d}-{len(self._paths[partition]):06d}."
+                                                f"{self.format}")
+            if self.format == 'parquet':
+                rows.to_parquet(path, index=False)
+            else:
+                rows.to_pickle(path)
+            self._paths[partition].append(path)
+            self.files += 1
+            self.rows += len(rows)
+            self.bytes += os.path.getsize(path)
+            pending.clear()
+        self._pending_bytes = 0
+
+    def _read(self, path):
+        """Read a spill file"""
+        return pd.read_parquet(path) if self.format == 'parquet' else pd.read_pickle(path)
+
+    def __iter__(self):
+        """Yield the rows of every non-empty partition, in the order they were added"""
+        self.flush()
+        for paths in self._paths:
+            if paths:
+                yield pd.concat([self._read(path) for path in paths], ignore_index=True)
+
+    def close(self):
+        """Delete the spill files"""
+        shutil.rmtree(self.directory, ignore_errors=True)
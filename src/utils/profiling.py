@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Profiling Utilities Module"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; spans then have no 'max_rss'
+    resource = None
+
+PROFILE_FORMATS = ('json', 'chrome')
+
+# Profiler receiving the spans of all threads, or None when profiling is off
+_ACTIVE = None
+
+
+def _max_rss():
+    """Peak resident set size of the process in bytes, or None if unknown"""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _rows(value):
+    """Number of rows of a DataFrame, Series or array, or None for other values"""
+    shape = getattr(value, 'shape', None)
+    if isinstance(shape, tuple) and shape:
+        return int(shape[0])
+    return None
+
+
+class Profiler:
+    def __init__(self, memory=False):
+        """
+        Parameters:
+        -----------
+        memory : bool
+            Whether to measure the peak memory of every span with
+            tracemalloc, which can slow allocation-heavy code down several
+            times; without it spans only record the process's peak RSS
+        """
+        self.memory = memory
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = None
+        self._previous = None
+        self._owns_tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start receiving the spans of all threads"""
+        global _ACTIVE
+        self._previous = _ACTIVE
+        _ACTIVE = self
+        self._origin = time.perf_counter()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def stop(self):
+        """Stop receiving spans"""
+        global _ACTIVE
+        _ACTIVE = self._previous
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def _stack(self):
+        """Open spans of the current thread"""
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, **metadata):
+        """
+        Record the wall time, CPU time and peak memory of a block
+
+        Parameters:
+        -----------
+        name : str
+            Span name
+        **metadata : dict
+            Values stored with the span
+
+        Yields:
+        -------
+        dict
+            The span record; set 'rows_in' and 'rows_out' (or other entries)
+            on it inside the block
+        """
+        stack = self._stack()
+        record = dict(metadata, name=name, thread=threading.get_ident(), depth=len(stack),
+                      parent=stack[-1]['name'] if stack else None)
+        tracing = self.memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # The enclosing span keeps the peak reached so far before it is reset
+            if stack:
+                stack[-1]['_peak'] = max(stack[-1].get('_peak', 0), peak)
+            tracemalloc.reset_peak()
+            record['_base'] = current
+        stack.append(record)
+
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        finally:
+            record['wall'] = time.perf_counter() - start
+            record['cpu'] = time.thread_time() - cpu_start
+            record['start'] = start - self._origin
+            record['max_rss'] = _max_rss()
+            stack.pop()
+            base = record.pop('_base', None)
+            peak = record.pop('_peak', 0)
+            if tracing and tracemalloc.is_tracing():
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                # Peaks of concurrent threads' spans overlap, as tracemalloc is process-wide
+                record['peak_memory'] = peak - base
+                if stack:
+                    stack[-1]['_peak'] = max(stack[-1].get('_peak', 0), peak)
+            with self._lock:
+                self.records.append(record)
+
+    def summary(self):
+        """
+        Aggregate the spans by name
+
+        Returns:
+        --------
+        dict
+            Count, total wall and CPU seconds, largest peak memory and
+            process peak RSS (bytes) and total rows out per span name
+        """
+        summary = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            entry = summary.setdefault(record['name'], {'count': 0, 'wall': 0.0, 'cpu': 0.0, 'peak_memory': None,
+                                                        'max_rss': None, 'rows_out': None})
+            entry['count'] += 1
+            entry['wall'] += record['wall']
+            entry['cpu'] += record['cpu']
+            if record.get('peak_memory') is not None:
+                entry['peak_memory'] = max(entry['peak_memory'] or 0, record['peak_memory'])
+            if record.get('max_rss') is not None:
+                entry['max_rss'] = max(entry['max_rss'] or 0, record['max_rss'])
+            if record.get('rows_out') is not None:
+                entry['rows_out'] = (entry['rows_out'] or 0) + record['rows_out']
+        return summary
+
+    def report(self):
+        """
+        Return the spans in start order and their summary
+
+        Returns:
+        --------
+        dict
+            'spans' (one dict per span with 'name', 'parent', 'depth',
+            'thread', 'start', 'wall', 'cpu', 'max_rss', 'peak_memory' (with
+            memory), 'rows_in', 'rows_out' and its metadata) and 'summary'
+            (see summary)
+        """
+        with self._lock:
+            spans = sorted(self.records, key=lambda record: record['start'])
+        return {'spans': spans, 'summary': self.summary()}
+
+    def chrome_trace(self):
+        """
+        Return the spans as a Chrome trace, viewable in chrome://tracing or Perfetto
+
+        Returns:
+        --------
+        dict
+            Trace with one complete ('X') event per span
+        """
+        pid = os.getpid()
+        events = []
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            args = {key: value for key, value in record.items()
+                    if key not in ('name', 'thread', 'start', 'wall', 'depth', 'parent')}
+            events.append({
+                'name': record['name'],
+                'cat': 'platform',
+                'ph': 'X',
+                'ts': record['start'] * 1e6,
+                'dur': record['wall'] * 1e6,
+                'pid': pid,
+                'tid': record['thread'],
+                'args': args
+            })
+        return {'traceEvents': sorted(events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def save(self, path, format='json'):
+        """
+        Write the profile to a file
+
+        Parameters:
+        -----------
+        path : str
+            Output path
+        format : str
+            'json' (report) or 'chrome' (Chrome trace)
+        """
+        if format not in PROFILE_FORMATS:
+            raise ValueError(f"Unsupported profile format: {format}")
+        payload = self.report() if format == 'json' else self.chrome_trace()
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2, default=str)
+
+
+@contextmanager
+def profile_span(name, **metadata):
+    """
+    Record a span with the active profiler, if any
+
+    Without an active profiler the block runs unmeasured and the yielded
+    record is discarded.
+
+    Parameters:
+    -----------
+    name : str
+        Span name
+    **metadata : dict
+        Values stored with the span
+
+    Yields:
+    -------
+    dict
+        The span record
+    """
+    profiler = _ACTIVE
+    if profiler is None:
+        yield {}
+        return
+    with profiler.span(name, **metadata) as record:
+        yield record
+
+
+def profiled(name=None):
+    """
+    Decorate a function so its calls are recorded as spans
+
+    The rows of the first argument with a shape are stored as 'rows_in' and
+    the rows of the result as 'rows_out'.
+
+    Parameters:
+    -----------
+    name : str
+        Span name (if None, the function's qualified name)
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            with profile_span(span_name) as record:
+                record['rows_in'] = next((_rows(arg) for arg in list(args) + list(kwargs.values())
+                                          if _rows(arg) is not None), None)
+                result = func(*args, **kwargs)
+                record['rows_out'] = _rows(result)
+                return result
+        return wrapper
+    return decorator
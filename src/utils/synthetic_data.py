@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""Synthetic Data Module"""
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import numpy as np
+import pandas as pd
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'sql', 'create_tables.sql')
+
+# Tables in load order: dimensions before the facts referencing them
+TABLES = ('products', 'customers', 'sales', 'marketing', 'inventory')
+
+# Rows generated per random stream; output does not depend on the chunk size
+BLOCK_ROWS = 1000000
+
+DEFAULT_CHUNKSIZE = 1000000
+
+CATEGORIES = {
+    'Electronics': ('Phones', 'Laptops', 'Accessories'),
+    'Home': ('Kitchen', 'Furniture', 'Decor'),
+    'Clothing': ('Men', 'Women', 'Kids'),
+    'Sports': ('Fitness', 'Outdoor', 'Team Sports'),
+    'Books': ('Fiction', 'Non-Fiction', 'Education')
+}
+
+# (city, state, country) of customers
+LOCATIONS = (
+    ('New York', 'NY', 'USA'), ('Los Angeles', 'CA', 'USA'), ('Chicago', 'IL', 'USA'),
+    ('Houston', 'TX', 'USA'), ('Toronto', 'ON', 'Canada'), ('Vancouver', 'BC', 'Canada'),
+    ('London', 'England', 'UK'), ('Manchester', 'England', 'UK'), ('Sao Paulo', 'SP', 'Brazil'),
+    ('Berlin', 'BE', 'Germany')
+)
+
+SEGMENTS = ('Consumer', 'Corporate', 'Small Business')
+SEGMENT_WEIGHTS = (0.6, 0.25, 0.15)
+
+REGIONS = ('North', 'South', 'East', 'West', 'Central')
+REGION_WEIGHTS = (0.25, 0.2, 0.2, 0.25, 0.1)
+
+CHANNELS = ('Online', 'Retail', 'Partner')
+CHANNEL_WEIGHTS = (0.5, 0.35, 0.15)
+
+MARKETING_CHANNELS = ('Search', 'Social', 'Email', 'Display', 'Affiliate')
+
+WAREHOUSES = ('Warehouse A', 'Warehouse B', 'Warehouse C')
+
+# Price discounts of sales and their probabilities
+DISCOUNTS = (0.0, 0.05, 0.1, 0.2)
+DISCOUNT_WEIGHTS = (0.7, 0.15, 0.1, 0.05)
+
+
+def table_statements(path=SCHEMA_PATH):
+    """
+    Read the table and index definitions of the schema for SQLite
+
+    The schema prefix is dropped and SERIAL keys become INTEGER keys; views
+    and functions use PostgreSQL features and are skipped.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the PostgreSQL schema
+
+    Returns:
+    --------
+    tuple
+        CREATE TABLE statements by table name, and CREATE INDEX statements
+    """
+    with open(path) as f:
+        sql = f.read()
+    sql = sql.replace('data_analyst.', '').replace('SERIAL', 'INTEGER')
+    tables = {match.group(1): match.group(0) for match in
+              re.finditer(r'CREATE TABLE IF NOT EXISTS (\w+) \(.*?\n\);', sql, re.S)}
+    indexes = re.findall(r'CREATE INDEX IF NOT EXISTS .*?;', sql)
+    return tables, indexes
+
+
+def table_columns(path=SCHEMA_PATH):
+    """Column names of every table of the schema"""
+    tables, _ = table_statements(path)
+    columns = {}
+    for name, statement in tables.items():
+        body = statement[statement.index('(') + 1:statement.rindex(')')]
+        columns[name] = [line.split()[0] for line in body.strip().split(',\n')]
+    return columns
+
+
+def _iso_dates(values):
+    """ISO date strings of datetime values, as stored in SQLite"""
+    return np.datetime_as_string(np.asarray(values, dtype='datetime64[D]'))
+
+
+class SyntheticDataGenerator:
+    def __init__(self, seed=0, start_date='2020-01-01', end_date='2023-12-31', n_products=1000,
+                 n_customers=100000, n_campaigns=20, inventory_every=7):
+        """
+        Parameters:
+        -----------
+        seed : int
+            Random seed; the same seed and sizes give the same data
+        start_date : str
+            First date of sales, marketing and inventory
+        end_date : str
+            Last date
+        n_products : int
+            Number of products
+        n_customers : int
+            Number of customers
+        n_campaigns : int
+            Number of marketing campaigns, each running every day
+        inventory_every : int
+            Days between inventory snapshots of every product and warehouse
+        """
+        self.seed = seed
+        self.start = np.datetime64(start_date, 'D')
+        self.days = int((np.datetime64(end_date, 'D') - self.start).astype(int)) + 1
+        if self.days < 1:
+            raise ValueError("end_date must not be before start_date")
+        self.n_products = n_products
+        self.n_customers = n_customers
+        self.n_campaigns = n_campaigns
+        self.inventory_every = inventory_every
+        self._products = None
+        self._activation = None
+
+    def _rng(self, table, block=0):
+        """Random stream of a table block, independent of all other blocks"""
+        return np.random.default_rng([self.seed, TABLES.index(table), block])
+
+    def _popularity(self, n, skew):
+        """Cumulative Zipf-like weights of n items, the first being the most popular"""
+        weights = 1.0 / np.arange(1, n + 1) ** skew
+        return np.cumsum(weights) / weights.sum()
+
+    def products(self):
+        """
+        Generate the products table
+
+        Returns:
+        --------
+        pd.DataFrame
+            product_id, name, category, subcategory, cost and price
+        """
+        if self._products is None:
+            rng = self._rng('products')
+            n = self.n_products
+            product_ids = np.arange(1, n + 1)
+            categories = list(CATEGORIES)
+            category_codes = rng.integers(0, len(categories), n)
+            subcategory_codes = rng.integers(0, 3, n)
+            cost = rng.lognormal(3.5, 0.8, n).round(2)
+            self._products = pd.DataFrame({
+                'product_id': product_ids,
+                'name': 'Product ' + pd.Series(product_ids).astype(str).str.zfill(6),
+                'category': np.asarray(categories)[category_codes],
+                'subcategory': [CATEGORIES[categories[c]][s] for c, s in zip(category_codes, subcategory_codes)],
+                'cost': cost,
+                # Margins of 10% to 80% keep every price above its cost
+                'price': (cost * rng.uniform(1.1, 1.8, n)).round(2)
+            })
+        return self._products.copy()
+
+    def _activation_days(self):
+        """Day (from start) of every customer's first purchase, rising with customer_id"""
+        if self._activation is None:
+            rng = self._rng('customers', 1)
+            # Most customers join early; customer 1 exists from the first day
+            days = np.sort((rng.beta(1.0, 2.0, self.n_customers) * self.days).astype(np.int64))
+            days[0] = 0
+            self._activation = days
+        return self._activation
+
+    def customers(self):
+        """
+        Generate the customers table
+
+        first_purchase_date is the day a customer becomes active; no sale
+        of the customer precedes it.
+
+        Returns:
+        --------
+        pd.DataFrame
+            The columns of the customers table
+        """
+        rng = self._rng('customers')
+        n = self.n_customers
+        customer_ids = np.arange(1, n + 1)
+        padded = pd.Series(customer_ids).astype(str).str.zfill(7)
+        locations = rng.integers(0, len(LOCATIONS), n)
+        city, state, country = (np.asarray([location[i] for location in LOCATIONS])[locations] for i in range(3))
+        return pd.DataFrame({
+            'customer_id': customer_ids,
+            'name': 'Customer ' + padded,
+            'email': 'customer' + padded + '@example.com',
+            'phone': '+1-555-' + pd.Series(rng.integers(0, 10 ** 7, n)).astype(str).str.zfill(7),
+            'address': pd.Series(rng.integers(1, 9999, n)).astype(str) + ' Main Street',
+            'city': city,
+            'state': state,
+            'country': country,
+            'postal_code': pd.Series(rng.integers(0, 10 ** 5, n)).astype(str).str.zfill(5),
+            'segment': np.asarray(SEGMENTS)[rng.choice(len(SEGMENTS), n, p=SEGMENT_WEIGHTS)],
+            'first_purchase_date': self.start + self._activation_days().astype('timedelta64[D]')
+        })
+
+    def _sales_block(self, block, rows):
+        """Rows of one sales block"""
+        first = block * BLOCK_ROWS
+        size = min(BLOCK_ROWS, rows - first)
+        rng = self._rng('sales', block)
+        positions = np.arange(first, first + size)
+
+        # Dates rise with sale_id and spread the sales evenly over the period
+        days = ((positions + rng.random(size)) * (self.days / rows)).astype(np.int64)
+        days = np.minimum(days, self.days - 1)
+
+        # Customers are drawn among those active on the sale's day, favoring early ones
+        active = np.searchsorted(self._activation_days(), days, side='right')
+        customer_ids = (rng.random(size) ** 1.5 * active).astype(np.int64) + 1
+
+        products = self.products()
+        product_ids = np.searchsorted(self._popularity(self.n_products, 0.8), rng.random(size)) + 1
+        quantity = rng.poisson(1.5, size) + 1
+        discount = np.asarray(DISCOUNTS)[rng.choice(len(DISCOUNTS), size, p=DISCOUNT_WEIGHTS)]
+        price = (products['price'].to_numpy()[product_ids - 1] * (1 - discount)).round(2)
+
+        return pd.DataFrame({
+            'sale_id': positions + 1,
+            'date': self.start + days.astype('timedelta64[D]'),
+            'product_id': product_ids,
+            'customer_id': customer_ids,
+            'quantity': quantity,
+            'price': price,
+            'total': (quantity * price).round(2),
+            'region': pd.Categorical.from_codes(rng.choice(len(REGIONS), size, p=REGION_WEIGHTS), REGIONS),
+            'channel': pd.Categorical.from_codes(rng.choice(len(CHANNELS), size, p=CHANNEL_WEIGHTS), CHANNELS)
+        })
+
+    def iter_sales(self, rows, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Generate the sales table in chunks
+
+        Parameters:
+        -----------
+        rows : int
+            Number of sales
+        chunksize : int
+            Rows per chunk
+
+        Yields:
+        -------
+        pd.DataFrame
+            Chunks of sales in sale_id and date order
+        """
+        blocks = (self._sales_block(block, rows) for block in range(-(-rows // BLOCK_ROWS)))
+        return _rechunk(blocks, chunksize)
+
+    def sales(self, rows):
+        """Generate the sales table at once (see iter_sales)"""
+        chunks = list(self.iter_sales(rows))
+        return pd.concat(chunks, ignore_index=True) if chunks else self._sales_block(0, 0)
+
+    def iter_marketing(self, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Generate the marketing table (every campaign on every day) in chunks
+
+        Parameters:
+        -----------
+        chunksize : int
+            Rows per chunk
+
+        Yields:
+        -------
+        pd.DataFrame
+            Chunks of the marketing table in date order
+        """
+        rng = self._rng('marketing')
+        campaign_channels = rng.integers(0, len(MARKETING_CHANNELS), self.n_campaigns)
+        budgets = rng.lognormal(5, 0.5, self.n_campaigns)
+        days_per_block = max(1, BLOCK_ROWS // max(1, self.n_campaigns))
+
+        def blocks():
+            for block, first_day in enumerate(range(0, self.days, days_per_block)):
+                block_rng = self._rng('marketing', block + 1)
+                days = np.arange(first_day, min(self.days, first_day + days_per_block))
+                day_index = np.repeat(days, self.n_campaigns)
+                campaigns = np.tile(np.arange(self.n_campaigns), len(days))
+                size = len(day_index)
+                cost = (budgets[campaigns] * block_rng.uniform(0.5, 1.5, size)).round(2)
+                impressions = block_rng.poisson(cost * 40)
+                clicks = block_rng.binomial(impressions, 0.03)
+                yield pd.DataFrame({
+                    'marketing_id': first_day * self.n_campaigns + np.arange(1, size + 1),
+                    'date': self.start + day_index.astype('timedelta64[D]'),
+                    'campaign': 'Campaign ' + pd.Series(campaigns + 1).astype(str).str.zfill(3),
+                    'channel': np.asarray(MARKETING_CHANNELS)[campaign_channels[campaigns]],
+                    'cost': cost,
+                    'impressions': impressions,
+                    'clicks': clicks,
+                    'conversions': block_rng.binomial(clicks, 0.05)
+                })
+
+        return _rechunk(blocks(), chunksize)
+
+    def iter_inventory(self, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Generate the inventory table (snapshots of every product in every
+        warehouse every inventory_every days) in chunks
+
+        Parameters:
+        -----------
+        chunksize : int
+            Rows per chunk
+
+        Yields:
+        -------
+        pd.DataFrame
+            Chunks of the inventory table in date order
+        """
+        per_snapshot = self.n_products * len(WAREHOUSES)
+        snapshot_days = np.arange(0, self.days, self.inventory_every)
+        # Popular products are stocked deeper
+        stock = 20 + 500 * (1 - self._popularity(self.n_products, 0.8))
+
+        def blocks():
+            for index, day in enumerate(snapshot_days):
+                rng = self._rng('inventory', index)
+                product_ids = np.tile(np.arange(1, self.n_products + 1), len(WAREHOUSES))
+                yield pd.DataFrame({
+                    'inventory_id': index * per_snapshot + np.arange(1, per_snapshot + 1),
+                    'date': np.full(per_snapshot, self.start + np.timedelta64(int(day), 'D')),
+                    'product_id': product_ids,
+                    'quantity': rng.poisson(stock[product_ids - 1]),
+                    'warehouse': np.repeat(np.asarray(WAREHOUSES), self.n_products)
+                })
+
+        return _rechunk(blocks(), chunksize)
+
+    def iter_table(self, table, rows=None, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Generate a table in chunks
+
+        Parameters:
+        -----------
+        table : str
+            One of TABLES
+        rows : int
+            Number of sales (required for 'sales')
+        chunksize : int
+            Rows per chunk
+
+        Yields:
+        -------
+        pd.DataFrame
+            Chunks of the table
+        """
+        if table == 'products':
+            return _rechunk(iter([self.products()]), chunksize)
+        if table == 'customers':
+            return _rechunk(iter([self.customers()]), chunksize)
+        if table == 'sales':
+            if rows is None:
+                raise ValueError("The number of sales rows is required")
+            return self.iter_sales(rows, chunksize)
+        if table == 'marketing':
+            return self.iter_marketing(chunksize)
+        if table == 'inventory':
+            return self.iter_inventory(chunksize)
+        raise ValueError(f"Unknown table: {table}")
+
+    def write(self, directory, rows, format='csv', chunksize=DEFAULT_CHUNKSIZE, tables=TABLES):
+        """
+        Write tables to files chunk by chunk, so memory stays bounded by the chunk size
+
+        Parameters:
+        -----------
+        directory : str
+            Output directory (created if missing)
+        rows : int
+            Number of sales
+        format : str
+            'csv' or 'parquet' (requires pyarrow)
+        chunksize : int
+            Rows per chunk (a Parquet row group)
+        tables : list
+            Tables to write
+
+        Returns:
+        --------
+        dict
+            Path by table name
+        """
+        if format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported format: {format}")
+        if format == 'parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ImportError("pyarrow is required to write Parquet files; install it or use format='csv'")
+
+        os.makedirs(directory, exist_ok=True)
+        paths = {}
+        for table in tables:
+            path = os.path.join(directory, f"{table}.{format}")
+            writer = None
+            try:
+                for index, chunk in enumerate(self.iter_table(table, rows=rows, chunksize=chunksize)):
+                    if format == 'csv':
+                        chunk.to_csv(path, mode='w' if index == 0 else 'a', header=index == 0, index=False)
+                        continue
+                    batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, batch.schema)
+                    writer.write_table(batch)
+            finally:
+                if writer is not None:
+                    writer.close()
+            paths[table] = path
+        return paths
+
+    def load_sqlite(self, database, rows, chunksize=DEFAULT_CHUNKSIZE, tables=TABLES):
+        """
+        Load tables into a SQLite database with the schema of sql/create_tables.sql
+
+        Indexes are created after the rows are inserted.
+
+        Parameters:
+        -----------
+        database : str or sqlite3.Connection
+            Database path or open connection
+        rows : int
+            Number of sales
+        chunksize : int
+            Rows inserted per chunk
+        tables : list
+            Tables to load
+
+        Returns:
+        --------
+        dict
+            Rows loaded by table name
+        """
+        connection = database if isinstance(database, sqlite3.Connection) else sqlite3.connect(database)
+        statements, indexes = table_statements()
+        counts = {}
+        try:
+            for table in tables:
+                connection.execute(statements[table])
+                counts[table] = 0
+                for chunk in self.iter_table(table, rows=rows, chunksize=chunksize):
+                    # SQLite has no date type; dates are stored as ISO strings
+                    for column in chunk.columns:
+                        if pd.api.types.is_datetime64_any_dtype(chunk[column]):
+                            chunk[column] = _iso_dates(chunk[column])
+                    chunk.to_sql(table, connection, if_exists='append', index=False)
+                    counts[table] += len(chunk)
+            for statement in indexes:
+                if re.search(r' ON (\w+)\(', statement).group(1) in tables:
+                    connection.execute(statement)
+            connection.commit()
+        finally:
+            if connection is not database:
+                connection.close()
+        return counts
+
+
+def _rechunk(frames, chunksize):
+    """Regroup a stream of DataFrames into chunks of chunksize rows (the last may be smaller)"""
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    pending = []
+    pending_rows = 0
+    for frame in frames:
+        pending.append(frame)
+        pending_rows += len(frame)
+        while pending_rows >= chunksize:
+            data = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0].reset_index(drop=True)
+            yield data.iloc[:chunksize].reset_index(drop=True)
+            rest = data.iloc[chunksize:]
+            pending = [rest] if len(rest) else []
+            pending_rows = len(rest)
+    if pending_rows:
+        yield pd.concat(pending, ignore_index=True)
+
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Generate synthetic star-schema data for load testing')
+    parser.add_argument('--rows', type=lambda text: int(float(text)), required=True,
+                        help='Number of sales rows, e.g. 1e8')
+    parser.add_argument('--output', help='Directory to write the tables to')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help='Output file format (parquet requires pyarrow)')
+    parser.add_argument('--sqlite', help='SQLite database to load the tables into')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--customers', type=int, default=100000, help='Number of customers')
+    parser.add_argument('--products', type=int, default=1000, help='Number of products')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help='Rows per chunk')
+    parser.add_argument('--tables', default=','.join(TABLES), help='Comma-separated tables to generate')
+    args = parser.parse_args(argv)
+
+    if not args.output and not args.sqlite:
+        parser.error("--output or --sqlite is required")
+
+    generator = SyntheticDataGenerator(seed=args.seed, n_products=args.products, n_customers=args.customers)
+    tables = args.tables.split(',')
+    if args.output:
+        for table, path in generator.write(args.output, args.rows, format=args.format, chunksize=args.chunksize,
+                                           tables=tables).items():
+            print(f"{table}: {path}")
+    if args.sqlite:
+        for table, count in generator.load_sqlite(args.sqlite, args.rows, chunksize=args.chunksize,
+                                                  tables=tables).items():
+            print(f"{table}: {count} rows loaded into {args.sqlite}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Forecast Renderer Module"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.dates as mdates
+import matplotlib.ticker as mticker
+
+FORMATS = ('png', 'svg')
+
+# zlib level for PNG output; the default (6) spends more time compressing than drawing
+PNG_COMPRESS_LEVEL = 1
+
+
+def _x_values(index):
+    """Convert an index to matplotlib x coordinates"""
+    if isinstance(index, pd.DatetimeIndex):
+        return mdates.date2num(index.values)
+    return np.asarray(index, dtype=float)
+
+
+class ForecastRenderer:
+    def __init__(self, figsize=(12, 6), dpi=100):
+        # Agg canvas attached directly: no pyplot figure manager, nothing global to leak
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+
+        # Artists are created once and only their data changes between plots
+        self.history_line, = self.ax.plot([], [], label='Training Data')
+        self.test_line, = self.ax.plot([], [], label='Test Data')
+        self.forecast_line, = self.ax.plot([], [], label='Forecast', color='red')
+        self.ax.set_xlabel('Date')
+
+        self._datetime_axis = None
+
+    def _set_axis_kind(self, datetime_axis):
+        """Switch the x axis between date and numeric ticks"""
+        if datetime_axis == self._datetime_axis:
+            return
+        if datetime_axis:
+            locator = mdates.AutoDateLocator()
+            self.ax.xaxis.set_major_locator(locator)
+            self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        else:
+            self.ax.xaxis.set_major_locator(mticker.AutoLocator())
+            self.ax.xaxis.set_major_formatter(mticker.ScalarFormatter())
+        self._datetime_axis = datetime_axis
+
+    def draw(self, history, forecast, test=None, title='Time Series Forecast', ylabel=None):
+        """
+        Draw a forecast onto the reused figure
+
+        Parameters:
+        -----------
+        history : pd.Series
+            Training data
+        forecast : pd.Series
+            Forecasted values
+        test : pd.Series
+            Test data (if None, not drawn)
+        title : str
+            Plot title
+        ylabel : str
+            Y-axis label (if None, the name of history)
+
+        Returns:
+        --------
+        matplotlib.figure.Figure
+            The renderer's figure
+        """
+        self._set_axis_kind(isinstance(history.index, pd.DatetimeIndex))
+
+        self.history_line.set_data(_x_values(history.index), history.to_numpy(dtype=float))
+        self.forecast_line.set_data(_x_values(forecast.index), forecast.to_numpy(dtype=float))
+        if test is not None:
+            self.test_line.set_data(_x_values(test.index), test.to_numpy(dtype=float))
+        self.test_line.set_visible(test is not None)
+
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        self.ax.set_title(title)
+        self.ax.set_ylabel(ylabel if ylabel is not None else str(history.name))
+        self.ax.legend(handles=[line for line in (self.history_line, self.test_line, self.forecast_line)
+                                if line.get_visible()])
+
+        return self.figure
+
+    def save(self, output_path, format=None):
+        """
+        Write the current figure to disk
+
+        Parameters:
+        -----------
+        output_path : str
+            Path to save the figure
+        format : str
+            'png' or 'svg' (if None, inferred from the file extension)
+
+        Returns:
+        --------
+        str
+            Path of the written file
+        """
+        format = format or os.path.splitext(output_path)[1].lstrip('.').lower()
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+        if format == 'png':
+            self.figure.savefig(output_path, format=format, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        else:
+            self.figure.savefig(output_path, format=format)
+        return output_path
+
+    def close(self):
+        """Release the figure and its artists"""
+        self.figure.clear()
+        self.ax = None
+        self.history_line = self.test_line = self.forecast_line = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _render_chunk(jobs, output_dir, format, figsize, dpi):
+    """Render a chunk of forecast plots with a single reused renderer"""
+    paths = []
+    with ForecastRenderer(figsize=figsize, dpi=dpi) as renderer:
+        for job in jobs:
+            renderer.draw(
+                job['history'],
+                job['forecast'],
+                test=job.get('test'),
+                title=job.get('title', 'Time Series Forecast'),
+                ylabel=job.get('ylabel')
+            )
+            paths.append(renderer.save(os.path.join(output_dir, f"{job['name']}.{format}"), format=format))
+    return paths
+
+
+def render_forecasts(jobs, output_dir, format='png', n_jobs=None, figsize=(12, 6), dpi=100):
+    """
+    Render many forecast plots to disk
+
+    Jobs are split into one chunk per worker process; each worker reuses one
+    figure for all of its plots and closes it when done.
+
+    Parameters:
+    -----------
+    jobs : list
+        Dicts with 'name' (file name without extension), 'history' and
+        'forecast' series, and optionally 'test', 'title' and 'ylabel'
+    output_dir : str
+        Directory to write the files to
+    format : str
+        'png' or 'svg'
+    n_jobs : int
+        Number of worker processes (if None, the number of CPUs)
+    figsize : tuple
+        Figure size in inches
+    dpi : int
+        Resolution of PNG output
+
+    Returns:
+    --------
+    list
+        Paths of the written files, in the order of jobs
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format: {format}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    n_jobs = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+    n_chunks = max(1, min(n_jobs, len(jobs)))
+    chunks = [jobs[i::n_chunks] for i in range(n_chunks)]
+
+    if n_chunks == 1:
+        return _render_chunk(jobs, output_dir, format, figsize, dpi)
+
+    with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+        results = list(executor.map(
+            _render_chunk, chunks, [output_dir] * n_chunks, [format] * n_chunks,
+            [figsize] * n_chunks, [dpi] * n_chunks
+        ))
+
+    # Restore the order of jobs from the interleaved chunks
+    paths = [None] * len(jobs)
+    for i, chunk_paths in enumerate(results):
+        paths[i::n_chunks] = chunk_paths
+    return paths
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Tableau Connector Module"""
-import pandas as pd
 import os
 import subprocess
 import tempfile
 
+from src.utils.ingestion import load_frame
+
 class TableauConnector:
     def __init__(self, tableau_path=None):
         self.tableau_path = tableau_path
@@ -27,15 +28,7 @@ class TableauConnector:
         """
         try:
             # If data is a string, assume it's a file path
-            if isinstance(data, str):
-                if data.endswith('.csv'):
-                    df = pd.read_csv(data)
-                elif data.endswith(('.xls', '.xlsx')):
-                    df = pd.read_excel(data)
-                else:
-                    raise ValueError(f"Unsupported file format: {data}")
-            else:
-                df = data
+            df = load_frame(data)
                 
             # Use pantab if available, otherwise use a simpler approach
             try:
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Benchmark Suite Module"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform as platform_info
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.data_analyst_platform import DataAnalystPlatform
+from src.utils.synthetic_data import SyntheticDataGenerator
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# Largest input each benchmark runs at; model fits, workbooks and charts do not
+# scale to the sizes of the aggregation paths
+MAX_ROWS = {
+    'pivot': 10 ** 7,
+    'kpi': 10 ** 7,
+    'trend': 10 ** 5,
+    'forecast': 10 ** 5,
+    'excel': 10 ** 5,
+    'dashboard': 10 ** 6,
+    'sql': 10 ** 7
+}
+
+BENCHMARKS = tuple(MAX_ROWS)
+
+# Relative slowdown (of the median time) and growth of the peak RSS that fail a comparison
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MEMORY_THRESHOLD = 0.25
+
+SALES_BY_CATEGORY_QUERY = """
+SELECT
+    p.category,
+    c.segment,
+    SUM(s.total) AS total_sales,
+    COUNT(s.sale_id) AS total_orders,
+    SUM(s.total) / COUNT(DISTINCT s.customer_id) AS sales_per_customer
+FROM
+    sales s
+JOIN
+    products p ON s.product_id = p.product_id
+JOIN
+    customers c ON s.customer_id = c.customer_id
+GROUP BY
+    p.category, c.segment
+ORDER BY
+    total_sales DESC
+"""
+
+
+def generate_sales(rows, seed=0):
+    """
+    Generate sales transactions with the columns of the sales table, plus 'month'
+
+    Parameters:
+    -----------
+    rows : int
+        Number of rows
+    seed : int
+        Random seed
+
+    Returns:
+    --------
+    pd.DataFrame
+        Sales transactions
+    """
+    sales = SyntheticDataGenerator(seed=seed, n_customers=customers_for(rows)).sales(rows)
+    sales['month'] = sales['date'].dt.to_period('M').dt.to_timestamp()
+    return sales
+
+
+def customers_for(rows):
+    """Number of customers of a benchmark input, about 20 sales each"""
+    return max(2, rows // 20)
+
+
+def generate_series(rows, seed=0):
+    """
+    Generate a series with trend, daily seasonality and noise at minute frequency
+
+    Parameters:
+    -----------
+    rows : int
+        Number of observations
+    seed : int
+        Random seed
+
+    Returns:
+    --------
+    pd.DataFrame
+        'date' and 'value' columns
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(rows)
+    return pd.DataFrame({
+        'date': pd.date_range(start='2020-01-01', periods=rows, freq='min'),
+        'value': 100 + 0.001 * t + 10 * np.sin(2 * np.pi * t / 1440) + rng.normal(0, 2, rows)
+    })
+
+
+def setup_case(name, rows, seed, work_dir):
+    """Build the input of a benchmark; not timed"""
+    if name in ('trend', 'forecast'):
+        return generate_series(rows, seed)
+    if name == 'sql':
+        # The star schema of sql/create_tables.sql, so queries run their joins and indexes
+        connection = sqlite3.connect(':memory:')
+        SyntheticDataGenerator(seed=seed, n_customers=customers_for(rows)).load_sqlite(
+            connection, rows, tables=('products', 'customers', 'sales'))
+        return connection
+    data = generate_sales(rows, seed)
+    if name == 'excel':
+        path = os.path.join(work_dir, 'sales.xlsx')
+        data.to_excel(path, index=False)
+        return path
+    return data
+
+
+def clear_caches(name):
+    """Empty the result caches a benchmark would otherwise hit on every repeat"""
+    if name == 'trend':
+        from src.business_intelligence.trend_analyzer import _ANALYSIS_CACHE
+
+        _ANALYSIS_CACHE.clear()
+
+
+def run_case(name, platform, data, work_dir):
+    """Run one benchmark iteration"""
+    if name == 'pivot':
+        return platform.create_pivot(data, index='region', columns='channel', values='total', aggfunc='sum')
+    if name == 'kpi':
+        return platform.calculate_kpis(data, {
+            'revenue_growth': {'type': 'revenue_growth', 'period_col': 'month', 'revenue_col': 'total'},
+            'clv': {'type': 'customer_lifetime_value', 'customer_id_col': 'customer_id', 'revenue_col': 'total',
+                    'date_col': 'date'}
+        })
+    if name == 'trend':
+        return platform.analyze_trends(data, 'date', 'value', config={'decompose': False})
+    if name == 'forecast':
+        return platform.forecast(data, 'date', 'value', steps=10, model_type='arima',
+                                 model_params={'order': (1, 1, 1)})
+    if name == 'excel':
+        return platform.analyze_excel(data)
+    if name == 'dashboard':
+        dashboard = platform.create_dashboard(data, [
+            {'type': 'bar', 'title': 'Sales by region', 'x': 'region', 'y': 'total'},
+            {'type': 'line', 'title': 'Sales over time', 'x': 'date', 'y': 'total'}
+        ])
+        return dashboard.create_html_dashboard(os.path.join(work_dir, 'dashboard.html'))
+    if name == 'sql':
+        return pd.read_sql_query(SALES_BY_CATEGORY_QUERY, data)
+    raise ValueError(f"Unknown benchmark: {name}")
+
+
+def _proc_status(field):
+    """A memory field of /proc/self/status in bytes, or None off Linux"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss():
+    """Peak resident set size of the process in bytes, or None if unknown"""
+    peak = _proc_status('VmHWM')
+    if peak is not None or resource is None:
+        return peak
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def reset_peak_rss():
+    """
+    Reset the peak RSS to the current RSS where Linux allows it
+
+    Returns:
+    --------
+    int
+        RSS the peak now starts from in bytes, or the unchanged peak if it
+        cannot be reset
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return _proc_status('VmRSS')
+    except OSError:
+        return peak_rss()
+
+
+def time_stats(times):
+    """Summary statistics of repeated timings in seconds"""
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'max': max(times),
+        'runs': len(times)
+    }
+
+
+def measure(name, rows, repeat=5, warmup=1, seed=0):
+    """
+    Time a benchmark at one input size
+
+    Parameters:
+    -----------
+    name : str
+        Benchmark name (one of BENCHMARKS)
+    rows : int
+        Input size in rows
+    repeat : int
+        Number of timed runs
+    warmup : int
+        Number of untimed runs first, so imports and caches are warm
+    seed : int
+        Random seed of the input
+
+    Returns:
+    --------
+    dict
+        'benchmark', 'rows', time statistics under 'time', and the process's
+        'peak_rss' and its growth during the timed runs ('rss_growth') in
+        bytes
+    """
+    work_dir = tempfile.mkdtemp()
+    try:
+        with warnings.catch_warnings():
+            # Model fits warn about inferred frequencies on every run; statsmodels
+            # adds 'always' filters when imported, so warnings are dropped at display
+            warnings.showwarning = lambda *args, **kwargs: None
+            data = setup_case(name, rows, seed, work_dir)
+            times = []
+            baseline_rss = None
+            for iteration in range(warmup + repeat):
+                if iteration == warmup:
+                    # Imports done by the warmup do not count as the case's memory
+                    baseline_rss = reset_peak_rss()
+                # A fresh platform per run, as the CLI and the server use
+                platform = DataAnalystPlatform()
+                clear_caches(name)
+                start = time.perf_counter()
+                run_case(name, platform, data, work_dir)
+                elapsed = time.perf_counter() - start
+                if iteration >= warmup:
+                    times.append(elapsed)
+            rss = peak_rss()
+        if isinstance(data, sqlite3.Connection):
+            data.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'benchmark': name,
+        'rows': rows,
+        'time': time_stats(times),
+        'peak_rss': rss,
+        'rss_growth': None if rss is None or baseline_rss is None else rss - baseline_rss
+    }
+
+
+def run_suite(benchmarks=BENCHMARKS, sizes=DEFAULT_SIZES, repeat=5, warmup=1, seed=0, isolate=True,
+              callback=None):
+    """
+    Run benchmarks at scaling input sizes
+
+    Parameters:
+    -----------
+    benchmarks : list
+        Benchmark names
+    sizes : list
+        Input sizes in rows; sizes above a benchmark's MAX_ROWS are skipped
+    repeat : int
+        Number of timed runs per case
+    warmup : int
+        Number of untimed runs per case
+    seed : int
+        Random seed of the inputs
+    isolate : bool
+        Whether to run every case in a fresh process, so its peak RSS is
+        its own
+    callback : callable
+        Called with every case's result
+
+    Returns:
+    --------
+    dict
+        'environment' (Python, pandas, NumPy, machine and options) and
+        'results' (one dict per case, see measure)
+    """
+    unknown = [name for name in benchmarks if name not in MAX_ROWS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results = []
+    for name in benchmarks:
+        for rows in sizes:
+            if rows > MAX_ROWS[name]:
+                continue
+            if isolate:
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(measure, name, rows, repeat, warmup, seed).result()
+            else:
+                result = measure(name, rows, repeat=repeat, warmup=warmup, seed=seed)
+            results.append(result)
+            if callback is not None:
+                callback(result)
+
+    return {
+        'environment': {
+            'python': platform_info.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'machine': platform_info.machine(),
+            'cpus': os.cpu_count(),
+            'repeat': repeat,
+            'warmup': warmup,
+            'seed': seed
+        },
+        'results': results
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, memory_threshold=DEFAULT_MEMORY_THRESHOLD):
+    """
+    Compare benchmark results with a baseline
+
+    Parameters:
+    -----------
+    baseline : dict
+        Results of run_suite saved earlier
+    current : dict
+        Results of run_suite
+    threshold : float
+        Relative growth of the median time that counts as a regression
+    memory_threshold : float
+        Relative growth of the RSS growth that counts as a regression (if
+        None, memory is not compared)
+
+    Returns:
+    --------
+    list
+        One dict per case present in both: 'benchmark', 'rows', the baseline
+        and current median times, their 'ratio', and 'regression' (list of
+        'time' and/or 'memory')
+    """
+    previous = {(result['benchmark'], result['rows']): result for result in baseline['results']}
+    comparisons = []
+    for result in current['results']:
+        key = (result['benchmark'], result['rows'])
+        if key not in previous:
+            continue
+        before = previous[key]
+        ratio = result['time']['median'] / before['time']['median']
+        regression = []
+        if ratio > 1 + threshold:
+            regression.append('time')
+        # Growths below 1 MB are allocator noise
+        if (memory_threshold is not None and before.get('rss_growth') is not None
+                and result.get('rss_growth') is not None
+                and result['rss_growth'] > max(before['rss_growth'], 2 ** 20) * (1 + memory_threshold)):
+            regression.append('memory')
+        comparisons.append({
+            'benchmark': key[0],
+            'rows': key[1],
+            'baseline': before['time']['median'],
+            'current': result['time']['median'],
+            'ratio': ratio,
+            'regression': regression
+        })
+    return comparisons
+
+
+def parse_sizes(text):
+    """Parse comma-separated sizes such as '1e3,1e4,100000'"""
+    return [int(float(size)) for size in text.split(',')]
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description='IBM Data Analyst Platform benchmarks')
+    parser.add_argument('--benchmarks', default=','.join(BENCHMARKS),
+                        help=f"Comma-separated benchmarks ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES),
+                        help='Comma-separated input sizes in rows, e.g. 1e3,1e5,1e7')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case')
+    parser.add_argument('--warmup', type=int, default=1, help='Untimed runs per case')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the inputs')
+    parser.add_argument('--no-isolate', action='store_true', help='Run all cases in this process')
+    parser.add_argument('--save', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Compare with a baseline JSON file and fail on regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slowdown of the median time that fails the comparison')
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help='Relative growth of the peak memory that fails the comparison')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function"""
+    args = parse_args(argv)
+
+    def report(result):
+        stats = result['time']
+        rss = '' if result['rss_growth'] is None else f", +{result['rss_growth'] / 2 ** 20:.1f} MB RSS"
+        print(f"{result['benchmark']:>10} {result['rows']:>10} rows: median {stats['median']:.4f}s "
+              f"(min {stats['min']:.4f}s, stdev {stats['stdev']:.4f}s){rss}")
+
+    results = run_suite(args.benchmarks.split(','), args.sizes, repeat=args.repeat, warmup=args.warmup,
+                        seed=args.seed, isolate=not args.no_isolate, callback=report)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to: {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        comparisons = compare(baseline, results, threshold=args.threshold, memory_threshold=args.memory_threshold)
+        regressions = [comparison for comparison in comparisons if comparison['regression']]
+        for comparison in comparisons:
+            flag = f" REGRESSION ({', '.join(comparison['regression'])})" if comparison['regression'] else ''
+            print(f"{comparison['benchmark']:>10} {comparison['rows']:>10} rows: {comparison['ratio']:.2f}x "
+                  f"baseline{flag}")
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
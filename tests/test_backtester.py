@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Test Backtester Module"""
+import unittest
+import os
+import sys
+import warnings
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.backtester import Backtester, forecast_metrics
+
+class TestBacktester(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        rng = np.random.default_rng(11)
+        periods = 72
+        t = np.arange(periods)
+
+        # Two monthly series with trend and yearly seasonality
+        self.test_data = pd.DataFrame(
+            {f'product_{i}': 80 + i * t + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, periods)
+             for i in range(2)},
+            index=pd.date_range(start='2018-01-01', periods=periods, freq='MS')
+        )
+        self.models = {
+            'ets': {'type': 'fast', 'method': 'holt_winters', 'season_length': 12},
+            'arima': {'type': 'arima', 'order': (1, 1, 0)}
+        }
+
+    def test_forecast_metrics(self):
+        """Test the metric definitions"""
+        metrics = forecast_metrics([2.0, 4.0, 0.0], [1.0, 5.0, 0.0])
+
+        self.assertAlmostEqual(metrics['mse'], 2 / 3)
+        self.assertAlmostEqual(metrics['mae'], 2 / 3)
+        self.assertAlmostEqual(metrics['mape'], 100 * (0.5 + 0.25) / 2)
+        self.assertAlmostEqual(metrics['smape'], 100 * (2 / 3 + 2 / 9) / 2)
+
+    def test_cutoffs(self):
+        """Test the rolling forecast origins"""
+        backtester = Backtester(horizon=6, n_folds=4, step=3)
+
+        self.assertEqual(backtester.cutoffs(72), [57, 60, 63, 66])
+        self.assertEqual(Backtester(horizon=6, n_folds=20, initial=50).cutoffs(72), [54, 60, 66])
+        with self.assertRaises(ValueError):
+            backtester.cutoffs(10)
+
+    def test_run_reuses_fitted_models(self):
+        """Test the tidy results and that later folds update instead of refitting"""
+        results = Backtester(horizon=6, n_folds=4, step=3, n_jobs=1).run(self.test_data, self.models)
+
+        self.assertEqual(len(results), 2 * 2 * 4)
+        self.assertTrue(set(['series', 'model', 'fold', 'cutoff', 'mse', 'rmse', 'mae', 'mape', 'smape'])
+                        <= set(results.columns))
+        self.assertTrue(results['error'].isna().all())
+        self.assertEqual(list(results.groupby('fold')['refit'].sum()), [4, 0, 0, 0])
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool gives the same results"""
+        models = {'ets': self.models['ets']}
+        serial = Backtester(horizon=6, n_folds=3, n_jobs=1).run(self.test_data, models)
+        parallel = Backtester(horizon=6, n_folds=3, n_jobs=2).run(self.test_data, models)
+
+        pd.testing.assert_frame_equal(serial.drop(columns='time'), parallel.drop(columns='time'))
+
+    def test_failed_folds_are_recorded(self):
+        """Test that a failing model is reported instead of aborting the run"""
+        models = {'bad': {'type': 'fast', 'method': 'holt_winters', 'season_length': 60}}
+        results = Backtester(horizon=6, n_folds=2, n_jobs=1).run(self.test_data, models, columns=['product_0'])
+        summary = Backtester.summarize(results)
+
+        self.assertTrue(results['error'].notna().all())
+        self.assertEqual(summary['failed_folds'].iloc[0], 2)
+
+    def test_summarize_picks_best_model(self):
+        """Test model selection per series"""
+        results = Backtester(horizon=6, n_folds=3, n_jobs=1).run(self.test_data, self.models)
+        summary = Backtester.summarize(results, metric='mae')
+
+        self.assertEqual(summary.groupby('series')['best'].sum().tolist(), [1, 1])
+        self.assertEqual(len(summary), 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Test Batch Trend Analyzer Module"""
+import unittest
+import os
+import sys
+import warnings
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.batch_trend_analyzer import BatchTrendAnalyzer, SUMMARY_COLUMNS
+from src.business_intelligence.trend_analyzer import TrendAnalyzer
+
+class TestBatchTrendAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        rng = np.random.default_rng(8)
+        periods = 84
+        t = np.arange(periods)
+        dates = pd.date_range(start='2022-01-01', periods=periods, freq='D')
+
+        # Three daily product series with weekly seasonality, shuffled long format
+        frames = [
+            pd.DataFrame({
+                'product': f'product_{i}',
+                'date': dates,
+                'sales': 50 + i * t * 0.2 + 4 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 1, periods)
+            })
+            for i in range(3)
+        ]
+        self.test_data = pd.concat(frames).sample(frac=1, random_state=1).reset_index(drop=True)
+        self.test_data.loc[5, 'sales'] += 40
+
+    def _single_analysis(self, product, config=None):
+        """Analyze one product with TrendAnalyzer"""
+        series = self.test_data[self.test_data['product'] == product].drop(columns='product')
+        analyzer = TrendAnalyzer(use_cache=False)
+        analyzer.load_data(series.sort_values('date'), 'date', 'sales')
+        return analyzer.analyze(config=config)
+
+    def test_matches_single_series_analysis(self):
+        """Test that the batch features equal those of TrendAnalyzer per series"""
+        features, summary = BatchTrendAnalyzer(n_jobs=1).run(self.test_data, 'product', 'date', 'sales')
+
+        for product in ['product_0', 'product_2']:
+            expected = self._single_analysis(product)
+            rows = features[features['product'] == product]
+            stats = summary.set_index('product').loc[product]
+
+            np.testing.assert_allclose(rows['moving_average'], expected['moving_average'], equal_nan=True)
+            np.testing.assert_allclose(rows['exponential_smoothing'], expected['exponential_smoothing'])
+            np.testing.assert_array_equal(rows['outlier'], expected['outliers'])
+            np.testing.assert_allclose(rows['seasonal'], expected['decomposition']['seasonal'])
+            self.assertAlmostEqual(stats['test_statistic'], expected['stationarity']['test_statistic'])
+            self.assertEqual(stats['period'], 7)
+
+    def test_tidy_output(self):
+        """Test the layout of the features and summary frames"""
+        features, summary = BatchTrendAnalyzer(n_jobs=1).run(self.test_data, 'product', 'date', 'sales')
+
+        self.assertEqual(len(features), len(self.test_data))
+        self.assertTrue(features.groupby('product')['date'].apply(lambda d: d.is_monotonic_increasing).all())
+        self.assertEqual(list(summary.columns), ['product'] + list(SUMMARY_COLUMNS))
+        self.assertEqual(summary['n_obs'].tolist(), [84, 84, 84])
+        self.assertEqual(summary['n_outliers'].sum(), features['outlier'].sum())
+        self.assertTrue(summary['error'].isna().all())
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool gives the same results"""
+        serial = BatchTrendAnalyzer(n_jobs=1).run(self.test_data, 'product', 'date', 'sales')
+        parallel = BatchTrendAnalyzer(n_jobs=2).run(self.test_data, 'product', 'date', 'sales')
+
+        pd.testing.assert_frame_equal(serial[0], parallel[0])
+        pd.testing.assert_frame_equal(serial[1], parallel[1])
+
+    def test_iqr_and_disabled_analyses(self):
+        """Test the IQR method and skipping the per-series analyses"""
+        config = {'decompose': False, 'test_stationarity': False, 'outlier_method': 'iqr', 'outlier_threshold': 1.5}
+        features, summary = BatchTrendAnalyzer(config=config).run(self.test_data, 'product', 'date', 'sales')
+        expected = self._single_analysis('product_1', config)
+
+        np.testing.assert_array_equal(features.loc[features['product'] == 'product_1', 'outlier'],
+                                      expected['outliers'])
+        self.assertNotIn('trend', features.columns)
+        self.assertTrue(summary['p_value'].isna().all())
+
+    def test_robust_outlier_methods(self):
+        """Test that grouped rolling MAD and per-series seasonal outliers match TrendAnalyzer"""
+        for method in ('rolling_mad', 'seasonal'):
+            with self.subTest(method=method):
+                config = {'decompose': False, 'test_stationarity': False, 'outlier_method': method,
+                          'outlier_window': 11}
+                features, summary = BatchTrendAnalyzer(config=config, n_jobs=1).run(self.test_data, 'product',
+                                                                                    'date', 'sales')
+
+                for product in ['product_0', 'product_1']:
+                    expected = self._single_analysis(product, config)
+                    np.testing.assert_array_equal(features.loc[features['product'] == product, 'outlier'],
+                                                  expected['outliers'])
+                self.assertEqual(features['outlier'].dtype, bool)
+                self.assertGreaterEqual(summary['n_outliers'].sum(), 1)
+
+    def test_change_points(self):
+        """Test segment labels and segment statistics of all series"""
+        data = self.test_data.copy()
+        shifted = (data['product'] == 'product_0') & (data['date'] >= '2022-02-15')
+        data.loc[shifted, 'sales'] -= 30
+        config = {'decompose': False, 'test_stationarity': False, 'detect_change_points': True}
+        features, summary = BatchTrendAnalyzer(config=config, n_jobs=1).run(data, 'product', 'date', 'sales')
+        segments = BatchTrendAnalyzer.segment_statistics(features, 'product', 'date', 'sales')
+
+        self.assertEqual(summary.set_index('product').loc['product_0', 'n_change_points'], 1)
+        last = segments[segments['product'] == 'product_0'].iloc[-1]
+        self.assertEqual(last['start'], pd.Timestamp('2022-02-15'))
+        self.assertLess(last['change'], -20)
+        self.assertEqual(segments.groupby('product')['n_obs'].sum().tolist(), [84, 84, 84])
+
+    def test_kpss_columns(self):
+        """Test that the KPSS results are added to the summary"""
+        config = {'decompose': False, 'kpss': True, 'adf_max_lags': 3}
+        _, summary = BatchTrendAnalyzer(config=config, n_jobs=1).run(self.test_data, 'product', 'date', 'sales')
+
+        self.assertTrue(summary['kpss_p_value'].notna().all())
+        self.assertTrue(summary['conclusion'].notna().all())
+        self.assertTrue((summary['lags'] <= 3).all())
+
+    def test_failing_series_is_reported(self):
+        """Test that a series too short to analyze does not abort the batch"""
+        short = pd.DataFrame({'product': 'new', 'date': pd.date_range(start='2022-01-01', periods=5), 'sales': 1.0})
+        data = pd.concat([self.test_data, short])
+        features, summary = BatchTrendAnalyzer(n_jobs=1).run(data, 'product', 'date', 'sales')
+
+        errors = summary.set_index('product')['error']
+        self.assertTrue(isinstance(errors['new'], str))
+        self.assertTrue(errors.drop('new').isna().all())
+        self.assertTrue(features.loc[features['product'] == 'new', 'trend'].isna().all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test Benchmark Suite Module"""
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from tests.benchmark_suite import (MAX_ROWS, compare, generate_sales, generate_series, main, measure, run_suite,
+                                   time_stats)
+
+def suite_results(*cases):
+    """Results in the run_suite layout from (benchmark, rows, median, rss_growth) tuples"""
+    return {'results': [{'benchmark': name, 'rows': rows, 'time': {'median': median}, 'rss_growth': rss}
+                        for name, rows, median, rss in cases]}
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.test_dir)
+
+    def test_generators(self):
+        """Test that generated inputs are seeded and stay in range"""
+        sales = generate_sales(5000, seed=1)
+        pd.testing.assert_frame_equal(sales, generate_sales(5000, seed=1))
+        self.assertTrue(sales['date'].is_monotonic_increasing)
+        self.assertLess(sales['date'].max(), pd.Timestamp('2024-01-01'))
+        np.testing.assert_allclose(sales['total'], (sales['quantity'] * sales['price']).round(2))
+
+        series = generate_series(100)
+        self.assertEqual(len(series), 100)
+        self.assertEqual(pd.infer_freq(series['date']), 'min')
+
+    def test_time_stats(self):
+        """Test timing statistics"""
+        stats = time_stats([0.3, 0.1, 0.2])
+        self.assertEqual((stats['min'], stats['median'], stats['max'], stats['runs']), (0.1, 0.2, 0.3, 3))
+        self.assertAlmostEqual(stats['stdev'], 0.1)
+        self.assertEqual(time_stats([0.5])['stdev'], 0.0)
+
+    def test_measure(self):
+        """Test that cases are timed repeatedly"""
+        for name in ['pivot', 'sql']:
+            result = measure(name, 500, repeat=3, warmup=1)
+            self.assertEqual((result['benchmark'], result['rows'], result['time']['runs']), (name, 500, 3))
+            self.assertGreater(result['time']['median'], 0)
+
+    def test_run_suite_skips_large_sizes(self):
+        """Test that sizes above a benchmark's limit are skipped"""
+        large = MAX_ROWS['trend'] * 2
+        results = run_suite(['pivot', 'trend'], [200, large], repeat=1, warmup=0, isolate=False)
+
+        cases = [(result['benchmark'], result['rows']) for result in results['results']]
+        self.assertEqual(cases, [('pivot', 200), ('pivot', large), ('trend', 200)])
+        self.assertEqual(results['environment']['repeat'], 1)
+        with self.assertRaises(ValueError):
+            run_suite(['report'], [100])
+
+    def test_compare(self):
+        """Test regression detection on time and memory"""
+        baseline = suite_results(('pivot', 1000, 0.10, 10 * 2 ** 20), ('kpi', 1000, 0.20, 10 * 2 ** 20),
+                                 ('sql', 1000, 0.01, 0))
+        current = suite_results(('pivot', 1000, 0.13, 10 * 2 ** 20), ('kpi', 1000, 0.21, 20 * 2 ** 20),
+                                ('sql', 1000, 0.011, 2 ** 19), ('trend', 1000, 1.0, 0))
+
+        comparisons = {comparison['benchmark']: comparison for comparison in compare(baseline, current)}
+        self.assertEqual(set(comparisons), {'pivot', 'kpi', 'sql'})
+        self.assertEqual(comparisons['pivot']['regression'], ['time'])
+        self.assertAlmostEqual(comparisons['pivot']['ratio'], 1.3)
+        self.assertEqual(comparisons['kpi']['regression'], ['memory'])
+        # Small growths are noise
+        self.assertEqual(comparisons['sql']['regression'], [])
+        self.assertEqual(compare(baseline, current, memory_threshold=None)[1]['regression'], [])
+
+    def test_main_gates_on_regressions(self):
+        """Test saving a baseline and failing the comparison"""
+        baseline_path = os.path.join(self.test_dir, 'baseline.json')
+        args = ['--benchmarks', 'pivot', '--sizes', '2e2', '--repeat', '2', '--warmup', '0', '--no-isolate']
+
+        self.assertEqual(main(args + ['--save', baseline_path]), 0)
+        with open(baseline_path) as f:
+            self.assertEqual(json.load(f)['results'][0]['rows'], 200)
+        self.assertEqual(main(args + ['--compare', baseline_path, '--threshold', '100']), 0)
+        self.assertEqual(main(args + ['--compare', baseline_path, '--threshold', '-1']), 1)
+
+if __name__ == '__main__':
+    unittest.main()
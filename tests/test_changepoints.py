@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test Change Points Module"""
+import unittest
+import os
+import sys
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.changepoints import (
+    SegmentCost, pelt, binary_segmentation, detect_change_points, segment_statistics
+)
+
+class TestChangePoints(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = np.random.default_rng(12)
+
+        # Revenue level drops during an outage and recovers above the old level
+        self.values = np.r_[self.rng.normal(100, 2, 120), self.rng.normal(80, 2, 60), self.rng.normal(110, 2, 100)]
+
+    def test_segment_cost_matches_direct(self):
+        """Test the cumulative-sum costs against direct computation"""
+        cost = SegmentCost(self.values)
+        segment = self.values[30:90]
+
+        self.assertAlmostEqual(cost(30, 90), np.sum((segment - segment.mean()) ** 2) / cost.variance)
+        normal = SegmentCost(self.values, cost='normal')
+        self.assertAlmostEqual(normal(30, 90), 60 * np.log(segment.var()))
+        np.testing.assert_allclose(cost(np.array([0, 30]), 90), [cost(0, 90), cost(30, 90)])
+
+    def test_pelt_finds_shifts(self):
+        """Test that PELT finds the mean shifts exactly"""
+        self.assertEqual(pelt(self.values), [120, 180])
+        self.assertEqual(pelt(self.values, cost='normal'), [120, 180])
+
+    def test_binary_segmentation(self):
+        """Test greedy segmentation with a penalty and a fixed number of change points"""
+        self.assertEqual(binary_segmentation(self.values, n_bkps=1), [180])
+        self.assertEqual(binary_segmentation(self.values, n_bkps=2), [120, 180])
+        self.assertEqual(detect_change_points(self.values, method='binseg', penalty=50), [120, 180])
+
+    def test_no_change_in_noise(self):
+        """Test that noise is not segmented"""
+        for method in ('pelt', 'binseg'):
+            with self.subTest(method=method):
+                self.assertEqual(detect_change_points(self.rng.normal(0, 1, 300), method=method), [])
+
+    def test_variance_change(self):
+        """Test that the normal cost detects a change in volatility"""
+        values = np.r_[self.rng.normal(0, 1, 200), self.rng.normal(0, 5, 200)]
+        change_points = detect_change_points(values, cost='normal')
+
+        self.assertEqual(len(change_points), 1)
+        self.assertLess(abs(change_points[0] - 200), 10)
+
+    def test_long_series_default(self):
+        """Test that the default method segments long series with a rare change"""
+        values = np.r_[self.rng.normal(0, 1, 50000), self.rng.normal(1, 1, 50000)]
+        change_points = detect_change_points(values)
+
+        self.assertEqual(len(change_points), 1)
+        self.assertLess(abs(change_points[0] - 50000), 100)
+
+    def test_min_size_and_invalid_arguments(self):
+        """Test segment length limits and argument validation"""
+        change_points = pelt(self.values, penalty=0, min_size=40)
+
+        self.assertTrue(np.all(np.diff(np.r_[0, change_points, len(self.values)]) >= 40))
+        self.assertEqual(pelt(self.values[:5], min_size=3), [])
+        with self.assertRaises(ValueError):
+            detect_change_points(self.values, method='pelt', n_bkps=2)
+        with self.assertRaises(ValueError):
+            detect_change_points(self.values, method='window')
+        with self.assertRaises(ValueError):
+            SegmentCost(self.values, cost='poisson')
+
+    def test_segment_statistics(self):
+        """Test the summary of segments"""
+        series = pd.Series(self.values, index=pd.date_range(start='2024-01-01', periods=len(self.values), freq='D'))
+        stats = segment_statistics(series, [120, 180])
+
+        self.assertEqual(stats['n_obs'].tolist(), [120, 60, 100])
+        self.assertEqual(stats['start'].iloc[1], series.index[120])
+        self.assertEqual(stats['end'].iloc[1], series.index[179])
+        self.assertAlmostEqual(stats['mean'].iloc[2], self.values[180:].mean())
+        self.assertAlmostEqual(stats['change'].iloc[1], self.values[120:180].mean() - self.values[:120].mean())
+
+if __name__ == '__main__':
+    unittest.main()
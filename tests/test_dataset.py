@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test Dataset Module"""
+import unittest
+import os
+import sys
+from unittest import mock
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.utils.dataset import Dataset, copy_on_write_enabled, time_indexed
+from src.utils.ingestion import load_frame
+from src.business_intelligence.kpi_calculator import KPICalculator
+from src.data_analyst_platform import DataAnalystPlatform
+
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(3)
+        n = 120
+        self.data = pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=n, freq='D').strftime('%Y-%m-%d'),
+            'month': np.repeat(np.arange(1, 5), n // 4),
+            'customer_id': rng.integers(1, 20, n),
+            'revenue': 100 + np.arange(n) + rng.normal(0, 5, n),
+            'cost': rng.uniform(10, 50, n)
+        })
+        self.original = self.data.copy()
+        self.platform = DataAnalystPlatform()
+
+    def test_time_indexed(self):
+        """Test indexing by date without modifying or copying the frame"""
+        indexed = time_indexed(self.data, 'date', 'revenue')
+        self.assertIsInstance(indexed.index, pd.DatetimeIndex)
+        self.assertEqual(indexed.index.name, 'date')
+        self.assertEqual(list(indexed.columns), ['revenue'])
+        self.assertTrue(np.shares_memory(indexed['revenue'].to_numpy(), self.data['revenue'].to_numpy()))
+        pd.testing.assert_frame_equal(self.data, self.original)
+
+    def test_handle_is_read_only(self):
+        """Test that writes through a frame of the handle do not reach it or the caller"""
+        self.assertTrue(copy_on_write_enabled())
+        dataset = Dataset(self.data)
+        self.assertEqual(dataset.shape, self.data.shape)
+        self.assertEqual(dataset.column_names, list(self.data.columns))
+        self.assertEqual(len(dataset), len(self.data))
+
+        frame = dataset.frame
+        frame.loc[0, 'revenue'] = -1.0
+        frame['extra'] = 1
+        self.assertNotIn('extra', dataset.column_names)
+        self.assertEqual(dataset.frame.loc[0, 'revenue'], self.original.loc[0, 'revenue'])
+        pd.testing.assert_frame_equal(self.data, self.original)
+        pd.testing.assert_frame_equal(load_frame(dataset), self.original)
+        self.assertTrue(np.shares_memory(dataset.select(['cost'])['cost'].to_numpy(), self.data['cost'].to_numpy()))
+
+    def test_handle_copies_without_copy_on_write(self):
+        """Test that handles copy the data when pandas does not copy on write"""
+        with mock.patch('src.utils.dataset.copy_on_write_enabled', return_value=False):
+            dataset = Dataset(self.data)
+            frame = dataset.frame
+            indexed = dataset.time_indexed('date', 'revenue')
+
+        self.assertFalse(np.shares_memory(frame['cost'].to_numpy(), self.data['cost'].to_numpy()))
+        self.assertFalse(np.shares_memory(indexed['revenue'].to_numpy(), self.data['revenue'].to_numpy()))
+        frame.loc[0, 'revenue'] = -1.0
+        pd.testing.assert_frame_equal(dataset.frame, self.original)
+
+    def test_indexed_series_is_shared(self):
+        """Test that steps on a dataset parse and index its dates once"""
+        dataset = Dataset(self.data)
+        first = dataset.time_indexed('date', 'revenue')
+        second = dataset.time_indexed('date', 'revenue')
+        self.assertTrue(np.shares_memory(first.index.asi8, second.index.asi8))
+        self.assertTrue(np.shares_memory(first['revenue'].to_numpy(), second['revenue'].to_numpy()))
+
+        # Writes to one step's series do not reach the other
+        first.iloc[0, 0] = -1.0
+        self.assertEqual(second.iloc[0, 0], self.original.loc[0, 'revenue'])
+
+    def test_steps_do_not_modify_caller_data(self):
+        """Test that trends and forecasts leave string dates in the caller's frame"""
+        for data in (self.data, Dataset(self.data)):
+            with self.subTest(data=type(data).__name__):
+                trends = self.platform.analyze_trends(data, 'date', 'revenue', config={'detect_change_points': False})
+                forecast = self.platform.forecast(data, 'date', 'revenue', steps=5, model_type='fast')
+                self.assertIn('stationarity', trends)
+                self.assertEqual(len(forecast), 5)
+                pd.testing.assert_frame_equal(self.data, self.original)
+
+        expected = self.platform.analyze_trends(self.data, 'date', 'revenue', config={'detect_change_points': False})
+        shared = self.platform.analyze_trends(Dataset(self.data), 'date', 'revenue',
+                                              config={'detect_change_points': False})
+        pd.testing.assert_series_equal(shared['moving_average'], expected['moving_average'])
+
+    def test_kpis_do_not_modify_caller_data(self):
+        """Test that KPIs on a dataset equal KPIs on its frame"""
+        config = {
+            'growth': {'type': 'revenue_growth', 'period_col': 'month', 'revenue_col': 'revenue'},
+            'cac': {'type': 'customer_acquisition_cost', 'period_col': 'month', 'marketing_expense_col': 'cost',
+                    'new_customers_col': 'customer_id'},
+            'clv': {'type': 'customer_lifetime_value', 'customer_id_col': 'customer_id',
+                    'revenue_col': 'revenue', 'date_col': 'date'}
+        }
+        expected = self.platform.calculate_kpis(self.data, config)
+        shared = self.platform.calculate_kpis(Dataset(self.data), config)
+        for name in config:
+            pd.testing.assert_frame_equal(shared[name], expected[name])
+        self.assertEqual(list(expected['growth'].columns), ['month', 'revenue', 'revenue_growth'])
+        pd.testing.assert_frame_equal(self.data, self.original)
+
+        calculator = KPICalculator(self.data)
+        calculator.calculate_revenue_growth('month', 'revenue', periods=[2, 3])
+        pd.testing.assert_frame_equal(self.data, self.original)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Test Fast Forecasters Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.fast_forecasters import FastForecaster
+from src.business_intelligence.forecast_engine import ForecastEngine
+from src.business_intelligence.model_registry import ModelRegistry
+
+class TestFastForecasters(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(7)
+        periods = 84
+        t = np.arange(periods)
+
+        # Three daily series with trend and weekly seasonality
+        self.test_data = pd.DataFrame(
+            {f'store_{i}': 100 + (i + 1) * 0.2 * t + 10 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 1, periods)
+             for i in range(3)},
+            index=pd.date_range(start='2021-01-01', periods=periods, freq='D')
+        )
+
+    def test_seasonal_naive_repeats_last_season(self):
+        """Test that the seasonal naive forecast repeats the last season"""
+        values = self.test_data.to_numpy().T
+        forecast = FastForecaster('seasonal_naive', season_length=7).fit(values).forecast(10)
+
+        np.testing.assert_allclose(forecast[:, :7], values[:, -7:])
+        np.testing.assert_allclose(forecast[:, 7:], values[:, -7:-4])
+
+    def test_vectorized_fit_matches_single_series(self):
+        """Test that fitting many series at once equals fitting them one by one"""
+        values = self.test_data.to_numpy().T
+        batch = FastForecaster('holt_winters', season_length=7).fit(values)
+
+        for i, row in enumerate(values):
+            single = FastForecaster('holt_winters', season_length=7).fit(row)
+            self.assertEqual(single.alpha[0], batch.alpha[i])
+            np.testing.assert_allclose(single.forecast(5)[0], batch.forecast(5)[i])
+
+    def test_update_matches_full_fit(self):
+        """Test that updating continues the smoothing recursion exactly"""
+        values = self.test_data.to_numpy().T
+        grids = {'alpha': (0.3,), 'beta': (0.05,), 'gamma': (0.1,)}
+
+        full = FastForecaster('holt_winters', season_length=7, grids=grids).fit(values)
+        updated = FastForecaster('holt_winters', season_length=7, grids=grids).fit(values[:, :-5])
+        updated.update(values[:, -5:])
+
+        np.testing.assert_allclose(updated.forecast(7), full.forecast(7))
+        np.testing.assert_allclose(updated.sse, full.sse)
+
+    def test_engine_forecasts_all_series(self):
+        """Test fast-path forecasting and evaluation through the engine"""
+        train, test = self.test_data.iloc[:-7], self.test_data.iloc[-7:]
+        engine = ForecastEngine(train.copy())
+        engine.train_fast_model(method='holt_winters', season_length=7)
+
+        forecast = engine.forecast_future(steps=7)
+        metrics = engine.evaluate_forecast(test)
+
+        self.assertEqual(list(forecast.columns), list(self.test_data.columns))
+        self.assertTrue(forecast.index.equals(test.index))
+        self.assertEqual(list(metrics.index), list(self.test_data.columns))
+        self.assertTrue((metrics['rmse'] < 5).all())
+        self.assertEqual(engine.forecast_future(steps=7, column='store_1').name, 'store_1')
+
+    def test_engine_update_and_registry(self):
+        """Test incremental updates and registry round trip of fast-path models"""
+        root_dir = tempfile.mkdtemp()
+        try:
+            engine = ForecastEngine(self.test_data.iloc[:-3].copy())
+            engine.train_fast_model(columns=['store_0', 'store_2'], method='holt', grids={'alpha': (0.5,)})
+            status = engine.update(self.test_data)
+            engine.save_model(ModelRegistry(root_dir), 'stores')
+
+            restored = ForecastEngine()
+            restored.load_model(ModelRegistry(root_dir), 'stores')
+
+            self.assertEqual(status['reason'], None)
+            self.assertEqual(engine.model.nobs, len(self.test_data))
+            np.testing.assert_allclose(restored.forecast_future(5), engine.forecast_future(5))
+            self.assertTrue(restored.forecast.index.equals(engine.forecast.index))
+        finally:
+            shutil.rmtree(root_dir, ignore_errors=True)
+
+    def test_invalid_method(self):
+        """Test that unknown methods and missing season lengths are rejected"""
+        with self.assertRaises(ValueError):
+            FastForecaster('theta')
+        with self.assertRaises(ValueError):
+            FastForecaster('holt_winters')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Test Feature Builder Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.feature_builder import FeatureBuilder, LagRegressor
+from src.business_intelligence.forecast_engine import ForecastEngine
+from src.business_intelligence.model_registry import ModelRegistry
+
+class TestFeatureBuilder(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(3)
+        periods = 400
+        t = np.arange(periods)
+
+        # Daily series with trend and weekly seasonality
+        self.series = pd.Series(
+            200 + 0.3 * t + 15 * (t % 7 == 5) + rng.normal(0, 1, periods),
+            index=pd.date_range(start='2022-01-01', periods=periods, freq='D'),
+            name='sales'
+        )
+        self.builder = FeatureBuilder(lags=(1, 2, 7), windows=(7,), calendar=('dayofweek',), trend=True)
+
+    def test_history_row_matches_history_features(self):
+        """Test that single-origin features equal the vectorized ones"""
+        values = self.series.to_numpy()
+        history = self.builder.history_features(values)
+
+        np.testing.assert_allclose(self.builder.history_row(values[-7:]), history[-1])
+        self.assertEqual(len(self.builder.feature_names), history.shape[1] + 6 + 1)
+
+    def test_fit_matches_linear_regression(self):
+        """Test that the coefficients equal those of scikit-learn"""
+        model = LagRegressor(self.builder).fit(self.series)
+
+        n = len(self.series)
+        history = self.builder.history_features(self.series.to_numpy())
+        target = self.builder.target_features(self.series.index, np.arange(n))
+        X = np.hstack([history[6:n - 1], target[7:]])
+        expected = LinearRegression().fit(X, self.series.to_numpy()[7:])
+
+        np.testing.assert_allclose(model.coef_[0], expected.coef_, atol=1e-8)
+        self.assertAlmostEqual(model.intercept_[0], expected.intercept_, places=6)
+
+    def test_recursive_forecast_continues_linear_trend(self):
+        """Test that recursive forecasting extends an exact linear trend"""
+        series = pd.Series(5.0 + 2.0 * np.arange(50))
+        model = LagRegressor(FeatureBuilder(lags=(1, 2))).fit(series)
+
+        np.testing.assert_allclose(model.forecast(5), 5.0 + 2.0 * np.arange(50, 55))
+
+    def test_direct_forecast_horizon(self):
+        """Test that the direct strategy fits one model per step"""
+        model = LagRegressor(self.builder, strategy='direct', horizon=5).fit(self.series)
+        index = pd.date_range(self.series.index[-1], periods=6, freq='D')[1:]
+
+        self.assertEqual(model.coef_.shape[0], 5)
+        self.assertEqual(len(model.forecast(5, index=index)), 5)
+        with self.assertRaises(ValueError):
+            model.forecast(6, index=index)
+
+    def test_engine_linear_forecast(self):
+        """Test forecasting with linear regression through the engine"""
+        train, test = self.series.iloc[:-14], self.series.iloc[-14:]
+        engine = ForecastEngine(train.to_frame())
+        engine.train_linear_regression(lags=[1, 7], windows=[7], calendar=['dayofweek'], trend=True)
+
+        forecast = engine.forecast_future(steps=14)
+        metrics = engine.evaluate_forecast(test.to_frame())
+
+        self.assertTrue(forecast.index.equals(test.index))
+        self.assertLess(metrics['rmse'], 3)
+
+    def test_engine_update_extends_lags(self):
+        """Test that updating shifts the lag buffer without refitting"""
+        engine = ForecastEngine(self.series.iloc[:-3].to_frame())
+        engine.train_linear_regression(lags=[1, 7], calendar=['dayofweek'], strategy='direct', horizon=7)
+        coef = engine.model.coef_.copy()
+
+        status = engine.update(self.series.to_frame())
+        full = ForecastEngine(self.series.to_frame())
+        full.train_linear_regression(lags=[1, 7], calendar=['dayofweek'], strategy='direct', horizon=7)
+
+        self.assertFalse(status['refit'])
+        np.testing.assert_array_equal(engine.model.coef_, coef)
+        np.testing.assert_array_equal(engine.model.tail, full.model.tail)
+        self.assertTrue(engine.forecast_future(7).index.equals(full.forecast_future(7).index))
+
+    def test_engine_rejects_feature_columns_with_lags(self):
+        """Test that exogenous columns are not mixed with generated features"""
+        data = self.series.to_frame().assign(customers=1.0)
+        engine = ForecastEngine(data)
+        with self.assertRaises(ValueError):
+            engine.train_linear_regression(column='sales', features=['customers'], lags=[1])
+
+        engine.train_linear_regression(column='sales', features=['customers'])
+        with self.assertRaisesRegex(ValueError, 'lags, windows, calendar or trend'):
+            engine.forecast_future(steps=3)
+
+    def test_registry_round_trip(self):
+        """Test saving and restoring a lag-feature regression"""
+        root_dir = tempfile.mkdtemp()
+        try:
+            engine = ForecastEngine(self.series.to_frame())
+            engine.train_linear_regression(lags=[1, 2, 7], windows=[7], calendar=['dayofweek'])
+            engine.save_model(ModelRegistry(root_dir), 'sales')
+
+            registered = ModelRegistry(root_dir).load('sales')
+
+            np.testing.assert_allclose(registered.forecast(10), engine.forecast_future(10).to_numpy())
+        finally:
+            shutil.rmtree(root_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
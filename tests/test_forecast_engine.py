@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Test Forecast Engine Module"""
+import unittest
+import os
+import sys
+import warnings
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.forecast_engine import ForecastEngine
+from src.business_intelligence.order_selector import OrderSelector, _DIFFERENCING_CACHE
+
+class TestForecastEngine(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        rng = np.random.default_rng(42)
+        periods = 96
+        t = np.arange(periods)
+
+        # Monthly series with trend and yearly seasonality
+        self.test_data = pd.DataFrame({
+            'date': pd.date_range(start='2015-01-01', periods=periods, freq='MS'),
+            'value': 50 + 0.5 * t + 10 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 1, periods)
+        })
+
+        self.engine = ForecastEngine()
+        self.engine.load_data(self.test_data, 'date', 'value')
+
+    def test_auto_arima_order(self):
+        """Test automatic ARIMA order selection"""
+        self.engine.train_arima_model(order='auto', selector_params={'n_jobs': 1})
+
+        selection = self.engine.order_selection
+        self.assertEqual(len(selection['order']), 3)
+        self.assertTrue(np.isfinite(selection['aic']))
+        self.assertIsInstance(selection['candidates'], pd.DataFrame)
+        self.assertEqual(len(self.engine.forecast_future(steps=6)), 6)
+
+    def test_auto_sarima_order(self):
+        """Test automatic SARIMA order selection with the BIC"""
+        self.engine.train_sarima_model(
+            order='auto',
+            seasonal_order='auto',
+            seasonal_period=12,
+            criterion='bic',
+            selector_params={'n_jobs': 1, 'max_p': 2, 'max_q': 2, 'max_P': 1, 'max_Q': 1}
+        )
+
+        selection = self.engine.order_selection
+        self.assertEqual(selection['seasonal_order'][3], 12)
+        self.assertEqual(selection['seasonal_order'][1], 1)
+        self.assertEqual(selection['criterion'], 'bic')
+        self.assertEqual(len(self.engine.forecast_future(steps=12)), 12)
+
+    def test_auto_order_keeps_constant(self):
+        """Test that selections without differencing forecast around the series mean"""
+        rng = np.random.default_rng(7)
+        noise = rng.normal(0, 1, 121)
+        data = pd.DataFrame({
+            'date': pd.date_range(start='2010-01-01', periods=120, freq='MS'),
+            'value': 100 + noise[1:] + 0.5 * noise[:-1]
+        })
+        self.engine.load_data(data, 'date', 'value')
+        selector_params = {'n_jobs': 1, 'max_d': 0, 'max_D': 0}
+
+        self.engine.train_sarima_model(order='auto', seasonal_order='auto', selector_params=selector_params)
+        self.assertEqual(self.engine.order_selection['trend'], 'c')
+        self.assertIn('intercept', self.engine.model.model.param_names)
+        np.testing.assert_allclose(self.engine.forecast_future(steps=5), 100, atol=3)
+
+        self.engine.train_arima_model(order='auto', selector_params=selector_params)
+        self.assertIn('const', self.engine.model.model.param_names)
+        np.testing.assert_allclose(self.engine.forecast_future(steps=5), 100, atol=3)
+
+    def test_stepwise_search_fits_fewer_models(self):
+        """Test that the stepwise search prunes the brute-force grid"""
+        series = self.engine.data['value']
+        params = {'seasonal': False, 'n_jobs': 1, 'max_p': 3, 'max_q': 3}
+
+        stepwise = OrderSelector(stepwise=True, **params).select(series)
+        grid = OrderSelector(stepwise=False, **params).select(series)
+
+        self.assertLess(stepwise['n_fits'], grid['n_fits'])
+        self.assertTrue(np.isfinite(stepwise['aic']))
+
+    def test_differencing_is_cached(self):
+        """Test that differencing decisions are shared between searches"""
+        _DIFFERENCING_CACHE.clear()
+        selector = OrderSelector(seasonal_period=12, n_jobs=1)
+        values = self.engine.data['value'].values
+
+        first = selector.differencing(values)
+        second = selector.differencing(values)
+
+        self.assertEqual(first, second)
+        self.assertEqual(_DIFFERENCING_CACHE.hits, 1)
+
+    def test_update_filters_new_observations(self):
+        """Test that new observations are filtered in without re-estimation"""
+        history = self.engine.data.iloc[:-1]
+        engine = ForecastEngine(history.copy())
+        engine.train_arima_model(order=(1, 1, 1))
+        params = np.asarray(engine.model.params).copy()
+
+        status = engine.update(self.engine.data)
+
+        self.assertEqual(status, {'observations': 1, 'refit': False, 'reason': None})
+        np.testing.assert_allclose(np.asarray(engine.model.params), params)
+        forecast = engine.forecast_future(steps=3)
+        self.assertEqual(forecast.index[0], self.engine.data.index[-1] + pd.offsets.MonthBegin())
+
+    def test_update_defers_history_concatenation(self):
+        """Test that filtered updates append rows without copying the history"""
+        engine = ForecastEngine(self.engine.data.iloc[:-4].copy())
+        engine.train_arima_model(order=(1, 1, 1))
+        history = engine._data
+
+        statuses = [engine.update(self.engine.data.iloc[:i]) for i in (-3, -2, -1, None)]
+
+        self.assertEqual([s['observations'] for s in statuses], [1, 1, 1, 1])
+        self.assertIs(engine._data, history)
+        self.assertEqual(len(engine._new_rows), 4)
+        pd.testing.assert_frame_equal(engine.data, self.engine.data, check_freq=False)
+        self.assertEqual(engine._new_rows, [])
+
+    def test_update_refits_on_schedule(self):
+        """Test that the model is re-estimated every refit_every observations"""
+        engine = ForecastEngine(self.engine.data.iloc[:-4].copy(), refit_every=3)
+        engine.train_arima_model(order=(1, 1, 1))
+
+        statuses = [engine.update(self.engine.data.iloc[:i]) for i in range(-3, 0)]
+
+        self.assertEqual([s['refit'] for s in statuses], [False, False, True])
+        self.assertEqual(statuses[-1]['reason'], 'schedule')
+
+    def test_update_refits_on_drift(self):
+        """Test that a change in the error distribution triggers re-estimation"""
+        engine = ForecastEngine(self.engine.data.copy(), drift_window=12)
+        engine.train_arima_model(order=(1, 1, 1))
+
+        index = pd.date_range(self.engine.data.index[-1], periods=13, freq='MS')[1:]
+        noisy = pd.DataFrame({'value': 100 + np.random.default_rng(0).normal(0, 50, 12)}, index=index)
+        status = engine.update(noisy)
+
+        self.assertTrue(status['refit'])
+        self.assertEqual(status['reason'], 'drift')
+
+    def test_update_checks_whole_batch_for_drift(self):
+        """Test that drift early in a batch longer than the drift window is detected"""
+        engine = ForecastEngine(self.engine.data.copy(), drift_window=12)
+        engine.train_arima_model(order=(1, 1, 1))
+
+        # The series continues as before, apart from an outage in its first months
+        t = np.arange(96, 144)
+        values = 50 + 0.5 * t + 10 * np.sin(2 * np.pi * t / 12) + np.random.default_rng(1).normal(0, 1, len(t))
+        values[:6] -= 40
+        index = pd.date_range(self.engine.data.index[-1], periods=len(t) + 1, freq='MS')[1:]
+        status = engine.update(pd.DataFrame({'value': values}, index=index))
+
+        self.assertEqual(status['reason'], 'drift')
+
+    def test_invalid_order(self):
+        """Test that unknown order strings are rejected"""
+        with self.assertRaises(ValueError):
+            self.engine.train_arima_model(order='best')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test Forecast Renderer Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.visualization.forecast_renderer import ForecastRenderer, render_forecasts
+from src.business_intelligence.forecast_engine import ForecastEngine
+
+class TestForecastRenderer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.output_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(5)
+        self.test_data = pd.DataFrame(
+            rng.normal(0, 1, (60, 4)).cumsum(axis=0),
+            index=pd.date_range(start='2021-01-01', periods=60, freq='D'),
+            columns=['north', 'south', 'east', 'west']
+        )
+        self.engine = ForecastEngine(self.test_data.iloc[:-7].copy())
+        self.engine.train_fast_model(method='ses')
+        self.engine.forecast_future(steps=7)
+
+    def tearDown(self):
+        """Remove the output directory"""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_renderer_reuses_figure(self):
+        """Test that consecutive plots reuse the same figure and artists"""
+        with ForecastRenderer() as renderer:
+            for column in self.test_data.columns[:2]:
+                figure = renderer.draw(self.engine.data[column], self.engine.forecast[column])
+                renderer.save(os.path.join(self.output_dir, f'{column}.png'))
+
+            self.assertIs(figure, renderer.figure)
+            self.assertEqual(len(renderer.ax.lines), 3)
+            self.assertEqual(renderer.ax.get_ylabel(), 'south')
+
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_render_forecasts_writes_files(self):
+        """Test batch rendering to PNG and SVG without pyplot figures"""
+        png = self.engine.render_forecasts(self.output_dir, test_data=self.test_data.iloc[-7:], n_jobs=1)
+        svg = self.engine.render_forecasts(self.output_dir, columns=['east'], format='svg', n_jobs=1)
+
+        self.assertEqual([os.path.basename(p) for p in png], ['north.png', 'south.png', 'east.png', 'west.png'])
+        with open(png[0], 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+        with open(svg[0]) as f:
+            self.assertIn('<svg', f.read())
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_parallel_rendering_keeps_order(self):
+        """Test that worker processes return paths in job order"""
+        jobs = [{'name': column, 'history': self.engine.data[column], 'forecast': self.engine.forecast[column]}
+                for column in self.test_data.columns]
+
+        paths = render_forecasts(jobs, self.output_dir, n_jobs=3)
+
+        self.assertEqual(paths, [os.path.join(self.output_dir, f'{c}.png') for c in self.test_data.columns])
+        self.assertTrue(all(os.path.getsize(p) > 0 for p in paths))
+
+    def test_plot_forecast_is_not_tracked_by_pyplot(self):
+        """Test that plot_forecast does not register figures with pyplot"""
+        figure = self.engine.plot_forecast(test_data=self.test_data.iloc[-7:], column='west')
+
+        self.assertEqual(len(figure.axes[0].lines), 3)
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_unsupported_format(self):
+        """Test that unknown formats are rejected"""
+        with self.assertRaises(ValueError):
+            render_forecasts([], self.output_dir, format='gif')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Test Ingestion Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.utils.ingestion import (detect_format, sniff_delimiter, read_header, filter_mask, read_data, iter_chunks,
+                                  load_frame)
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+class TestIngestion(unittest.TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        np.random.seed(42)
+        self.data = pd.DataFrame({
+            'Region': np.random.choice(['North', 'South', 'East', 'West'], 50),
+            'Product': np.random.choice(['A', 'B', 'C'], 50),
+            'Sales': np.random.randint(100, 1000, 50),
+            'Profit': np.random.randint(10, 100, 50)
+        })
+
+    def tearDown(self):
+        """Clean up test files"""
+        shutil.rmtree(self.temp_dir)
+
+    def path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+    def test_detect_format_by_extension(self):
+        """Test that known extensions decide the format"""
+        self.assertEqual(detect_format('sales.csv'), 'csv')
+        self.assertEqual(detect_format('sales.TSV'), 'csv')
+        self.assertEqual(detect_format('sales.xlsx'), 'excel')
+        self.assertEqual(detect_format('sales.parquet'), 'parquet')
+        self.assertEqual(detect_format('sales.feather'), 'feather')
+        self.assertEqual(detect_format('sales.ndjson'), 'jsonl')
+
+    def test_detect_format_by_content(self):
+        """Test that files without a known extension are sniffed"""
+        csv_path = self.path('export.dat')
+        self.data.to_csv(csv_path, index=False)
+        self.assertEqual(detect_format(csv_path), 'csv')
+
+        jsonl_path = self.path('export.log')
+        self.data.to_json(jsonl_path, orient='records', lines=True)
+        self.assertEqual(detect_format(jsonl_path), 'jsonl')
+
+        excel_path = self.path('export.bin')
+        self.data.to_excel(self.path('export.xlsx'), index=False, engine='openpyxl')
+        os.rename(self.path('export.xlsx'), excel_path)
+        self.assertEqual(detect_format(excel_path), 'excel')
+
+        parquet_path = self.path('export.data')
+        with open(parquet_path, 'wb') as f:
+            f.write(b'PAR1' + b'\x00' * 16)
+        self.assertEqual(detect_format(parquet_path), 'parquet')
+
+        binary_path = self.path('export.raw')
+        with open(binary_path, 'wb') as f:
+            f.write(b'\xff\xfe\x00\x81' * 8)
+        with self.assertRaises(ValueError):
+            detect_format(binary_path)
+
+    def test_sniff_delimiter(self):
+        """Test CSV delimiter detection"""
+        for sep in [',', ';', '\t', '|']:
+            path = self.path('data.txt')
+            self.data.to_csv(path, index=False, sep=sep)
+            self.assertEqual(sniff_delimiter(path), sep)
+
+    def test_read_csv_variants(self):
+        """Test reading comma, semicolon and tab separated files"""
+        for name, sep in [('data.csv', ','), ('data_semicolon.csv', ';'), ('data.tsv', '\t')]:
+            path = self.path(name)
+            self.data.to_csv(path, index=False, sep=sep)
+            pd.testing.assert_frame_equal(read_data(path), self.data)
+
+    def test_read_jsonl(self):
+        """Test reading JSON lines"""
+        path = self.path('data.jsonl')
+        self.data.to_json(path, orient='records', lines=True)
+        pd.testing.assert_frame_equal(read_data(path), self.data)
+
+    def test_read_excel(self):
+        """Test reading Excel files with a projection"""
+        path = self.path('data.xlsx')
+        self.data.to_excel(path, index=False, engine='openpyxl')
+        result = read_data(path, columns=['Sales', 'Region'])
+        pd.testing.assert_frame_equal(result, self.data[['Sales', 'Region']])
+
+    def test_read_header(self):
+        """Test reading column names without rows"""
+        for name in ['data.csv', 'data.jsonl', 'data.xlsx']:
+            path = self.path(name)
+            if name.endswith('.csv'):
+                self.data.to_csv(path, index=False, sep=';')
+            elif name.endswith('.jsonl'):
+                self.data.to_json(path, orient='records', lines=True)
+            else:
+                self.data.to_excel(path, index=False, engine='openpyxl')
+            self.assertEqual(read_header(path), list(self.data.columns))
+
+    def test_projection(self):
+        """Test that only the requested columns are returned, in order"""
+        path = self.path('data.csv')
+        self.data.to_csv(path, index=False)
+        result = read_data(path, columns=['Profit', 'Region'])
+        self.assertEqual(list(result.columns), ['Profit', 'Region'])
+        pd.testing.assert_series_equal(result['Profit'], self.data['Profit'])
+
+    def test_filters(self):
+        """Test AND and OR filters, including columns outside the projection"""
+        path = self.path('data.csv')
+        self.data.to_csv(path, index=False)
+
+        result = read_data(path, columns=['Sales'], filters=[('Region', '==', 'North'), ('Sales', '>', 500)])
+        expected = self.data[(self.data['Region'] == 'North') & (self.data['Sales'] > 500)]
+        self.assertEqual(list(result.columns), ['Sales'])
+        self.assertEqual(result['Sales'].tolist(), expected['Sales'].tolist())
+
+        result = read_data(path, filters=[[('Region', 'in', ['North', 'South'])], [('Product', '==', 'A')]])
+        mask = self.data['Region'].isin(['North', 'South']) | (self.data['Product'] == 'A')
+        self.assertEqual(len(result), int(mask.sum()))
+
+        with self.assertRaises(ValueError):
+            filter_mask(self.data, [('Sales', '~', 1)])
+
+    def test_iter_chunks(self):
+        """Test that chunks cover the data in order"""
+        path = self.path('data.csv')
+        self.data.to_csv(path, index=False)
+
+        chunks = list(iter_chunks(path, chunksize=20))
+        self.assertEqual([len(chunk) for chunk in chunks], [20, 20, 10])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.data)
+
+        chunks = list(iter_chunks(path, chunksize=20, columns=['Sales'], filters=[('Region', '==', 'East')]))
+        combined = pd.concat(chunks, ignore_index=True)
+        self.assertEqual(list(combined.columns), ['Sales'])
+        self.assertEqual(combined['Sales'].tolist(), self.data.loc[self.data['Region'] == 'East', 'Sales'].tolist())
+
+    def test_iter_chunks_jsonl(self):
+        """Test chunked JSON-lines reading"""
+        path = self.path('data.jsonl')
+        self.data.to_json(path, orient='records', lines=True)
+        chunks = list(iter_chunks(path, chunksize=15))
+        self.assertEqual(len(chunks), 4)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.data)
+
+    def test_load_frame(self):
+        """Test that DataFrames pass through and paths are read"""
+        self.assertIs(load_frame(self.data), self.data)
+        path = self.path('data.csv')
+        self.data.to_csv(path, index=False)
+        pd.testing.assert_frame_equal(load_frame(path), self.data)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_and_feather(self):
+        """Test columnar formats with projection and pushdown filters"""
+        parquet_path = self.path('data.parquet')
+        self.data.to_parquet(parquet_path, index=False, row_group_size=10)
+        result = read_data(parquet_path, columns=['Sales'], filters=[('Region', '==', 'West')])
+        self.assertEqual(result['Sales'].tolist(), self.data.loc[self.data['Region'] == 'West', 'Sales'].tolist())
+        chunks = list(iter_chunks(parquet_path, chunksize=25))
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.data)
+
+        feather_path = self.path('data.feather')
+        self.data.to_feather(feather_path)
+        pd.testing.assert_frame_equal(read_data(feather_path, columns=['Region', 'Profit']),
+                                      self.data[['Region', 'Profit']])
+        self.assertEqual(read_header(parquet_path), list(self.data.columns))
+        self.assertEqual(read_header(feather_path), list(self.data.columns))
+
+if __name__ == '__main__':
+    unittest.main()
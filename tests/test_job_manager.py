@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Test Job Manager Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.job_manager import JobManager, estimate_memory, MEMORY_FACTORS
+
+def overlaps(jobs):
+    """Whether any two jobs ran at the same time"""
+    intervals = sorted((job['started'], job['finished']) for job in jobs)
+    return any(later[0] < earlier[1] for earlier, later in zip(intervals, intervals[1:]))
+
+class TestJobManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file = os.path.join(self.test_dir, 'sales.csv')
+        rng = np.random.default_rng(6)
+        pd.DataFrame({
+            'date': pd.date_range(start='2023-01-01', periods=90, freq='D').astype(str),
+            'region': np.tile(['north', 'south', 'east'], 30),
+            'revenue': rng.uniform(100, 200, 90).round(2)
+        }).to_csv(self.file, index=False)
+        self.trend = {'file': self.file, 'date_col': 'date', 'value_col': 'revenue', 'config': {'decompose': False}}
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.executor.shutdown()
+        shutil.rmtree(self.test_dir)
+
+    async def test_process_pool_jobs(self):
+        """Test pivot and trend jobs in the default process pool"""
+        async with JobManager(max_workers=2) as manager:
+            pivot = await manager.submit('pivot', {'file': self.file, 'index': 'region', 'values': 'revenue'})
+            trend = await manager.submit('trend', self.trend)
+
+            self.assertEqual((await manager.result(pivot)).index.tolist(), ['east', 'north', 'south'])
+            self.assertIn('stationarity', await manager.result(trend))
+            self.assertEqual([job['status'] for job in manager.jobs()], ['done', 'done'])
+
+    async def test_concurrency_limit(self):
+        """Test that jobs of a type beyond its limit wait for a slot"""
+        manager = JobManager(concurrency={'trend': 1, 'pivot': 3}, executor=self.executor)
+        trend_ids = [await manager.submit('trend', self.trend) for _ in range(3)]
+        pivot_ids = [await manager.submit('pivot', {'file': self.file, 'index': 'region', 'values': 'revenue'})
+                     for _ in range(3)]
+        self.assertEqual(manager.stats()['queued'], 6)
+        await manager.close()
+
+        self.assertFalse(overlaps([manager.status(job_id) for job_id in trend_ids]))
+        self.assertTrue(all(manager.status(job_id)['status'] == 'done' for job_id in trend_ids + pivot_ids))
+
+    async def test_memory_budget(self):
+        """Test that jobs wait until their memory fits the budget"""
+        manager = JobManager(memory_budget=1000, memory_budgets={'kpi': 10}, executor=self.executor)
+        job_ids = [await manager.submit('trend', dict(self.trend, memory=600)) for _ in range(3)]
+        await manager.close()
+
+        self.assertFalse(overlaps([manager.status(job_id) for job_id in job_ids]))
+        self.assertEqual(manager.stats()['reserved_memory']['trend'], 0)
+        with self.assertRaises(ValueError):
+            await manager.submit('trend', dict(self.trend, memory=2000))
+        with self.assertRaises(ValueError):
+            await manager.submit('kpi', {'file': self.file, 'kpi_config': {}, 'memory': 11})
+
+    async def test_failures_and_cancellation(self):
+        """Test failed, cancelled and invalid jobs"""
+        manager = JobManager(concurrency={'trend': 1}, executor=self.executor)
+        failing = await manager.submit('trend', dict(self.trend, value_col='missing'))
+        queued = await manager.submit('trend', self.trend)
+
+        self.assertTrue(manager.cancel(queued))
+        with self.assertRaises(RuntimeError):
+            await manager.result(failing)
+        with self.assertRaises(RuntimeError):
+            await manager.result(queued)
+        self.assertEqual(manager.status(failing)['status'], 'failed')
+        self.assertEqual(manager.status(queued)['status'], 'cancelled')
+        self.assertFalse(manager.cancel(failing))
+        with self.assertRaises(ValueError):
+            await manager.submit('report', {'file': self.file})
+        with self.assertRaises(ValueError):
+            await manager.submit('trend', {'file': self.file})
+        await manager.close()
+
+    def test_estimate_memory(self):
+        """Test the memory estimate from the input size"""
+        self.assertEqual(estimate_memory('forecast', {'file': self.file}),
+                         MEMORY_FACTORS['forecast'] * os.path.getsize(self.file))
+        self.assertEqual(estimate_memory('pivot', {'data': [{'a': 1}]}), MEMORY_FACTORS['pivot'] * len('[{"a": 1}]'))
+        self.assertEqual(estimate_memory('kpi', {'file': self.file, 'memory': 5}), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Test Memory Budget Module"""
+import unittest
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.utils.memory_budget import MemoryBudget, SpillPartitions, active_budget, estimate_bytes, parse_size
+from src.utils.profiling import Profiler
+from src.data_analyst_platform import DataAnalystPlatform
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+class TestMemoryBudget(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(5)
+        n = 20000
+        self.sales = pd.DataFrame({
+            'date': np.datetime64('2023-01-01') + np.sort(rng.integers(0, 365, n)).astype('timedelta64[D]'),
+            'customer_id': rng.integers(1, 2000, n),
+            'region': rng.choice(['North', 'South', 'East', 'West'], n),
+            'channel': rng.choice(['Online', 'Retail'], n),
+            'product_id': rng.integers(1, 100, n),
+            'revenue': rng.uniform(10, 500, n).round(2)
+        })
+        self.sales.loc[::97, 'revenue'] = np.nan
+        self.path = os.path.join(self.test_dir, 'sales.csv')
+        self.sales.to_csv(self.path, index=False)
+        self.platform = DataAnalystPlatform()
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.test_dir)
+
+    def test_parse_size(self):
+        """Test parsing sizes with units"""
+        self.assertEqual(parse_size('512MB'), 512 * 2 ** 20)
+        self.assertEqual(parse_size('2g'), 2 * 2 ** 30)
+        self.assertEqual(parse_size('1e6'), 10 ** 6)
+        self.assertEqual(parse_size(1000), 1000)
+        with self.assertRaises(ValueError):
+            parse_size('lots')
+
+    def test_budget_activation(self):
+        """Test that budgets nest and estimates respect projections"""
+        self.assertIsNone(active_budget())
+        with MemoryBudget('1GB') as outer:
+            with MemoryBudget(10) as inner:
+                self.assertIs(active_budget(), inner)
+            self.assertIs(active_budget(), outer)
+            self.assertFalse(outer.exceeds(self.sales))
+        self.assertIsNone(active_budget())
+
+        self.assertEqual(estimate_bytes(self.sales, ['revenue']), 8 * len(self.sales))
+        self.assertLess(estimate_bytes(self.path, ['revenue']), estimate_bytes(self.path))
+        with self.assertRaises(ValueError):
+            MemoryBudget(0)
+
+    def test_spill_partitions(self):
+        """Test that partitions keep all rows and never split a key"""
+        with SpillPartitions(['customer_id'], 4, directory=self.test_dir, buffer_bytes=2 ** 30) as partitions:
+            for start in range(0, len(self.sales), 3000):
+                chunk = self.sales.iloc[start:start + 3000]
+                # Files parse a key as float in chunks with missing values
+                partitions.add(chunk.astype({'customer_id': float}) if start == 0 else chunk)
+            parts = list(partitions)
+            directory = partitions.directory
+
+        self.assertEqual(sum(len(part) for part in parts), len(self.sales))
+        keys = [set(part['customer_id']) for part in parts]
+        self.assertEqual(sum(len(part_keys) for part_keys in keys), len(set().union(*keys)))
+        # Buffered rows are written once per partition
+        self.assertEqual(partitions.files, 4)
+        self.assertFalse(os.path.exists(directory))
+
+    def test_pivot(self):
+        """Test that spilled pivot tables equal in-memory ones"""
+        cases = [
+            ('region', 'channel', 'revenue', 'sum'),
+            (['region', 'product_id'], None, 'revenue', 'mean'),
+            ('product_id', ['region', 'channel'], 'revenue', 'count'),
+            ('region', 'channel', ['revenue', 'customer_id'], 'median')
+        ]
+        for index, columns, values, aggfunc in cases:
+            expected = self.platform.create_pivot(self.sales, index, columns, values, aggfunc)
+            with MemoryBudget(100000) as budget:
+                for data in (self.sales, self.path):
+                    with self.subTest(aggfunc=aggfunc, data=type(data).__name__):
+                        pivot = self.platform.create_pivot(data, index, columns, values, aggfunc)
+                        pd.testing.assert_frame_equal(pivot, expected)
+            self.assertEqual(list(budget.report()), ['create_pivot'])
+            self.assertEqual(budget.report()['create_pivot']['count'], 2)
+
+    def test_customer_lifetime_value(self):
+        """Test that spilled customer lifetime values equal in-memory ones"""
+        config = {'clv': {'type': 'customer_lifetime_value', 'customer_id_col': 'customer_id',
+                          'revenue_col': 'revenue', 'date_col': 'date'}}
+        expected = self.platform.calculate_kpis(self.sales, config)['clv']
+
+        with MemoryBudget(100000) as budget:
+            for data in (self.sales, self.path):
+                pd.testing.assert_frame_equal(self.platform.calculate_kpis(data, config)['clv'], expected)
+        self.assertEqual(budget.report()['customer_lifetime_value']['count'], 2)
+        self.assertEqual(len(expected), self.sales['customer_id'].nunique())
+
+    def test_trend_batch(self):
+        """Test that spilled batch trend analyses equal in-memory ones"""
+        data = self.sales.groupby(['region', 'channel', 'date'], as_index=False)['revenue'].sum()
+        config = {'decompose': False, 'detect_change_points': False}
+        features, summary = self.platform.analyze_trends_batch(data, ['region', 'channel'], 'date', 'revenue',
+                                                               config=config, n_jobs=1)
+
+        with MemoryBudget(20000) as budget:
+            spilled_features, spilled_summary = self.platform.analyze_trends_batch(
+                data, ['region', 'channel'], 'date', 'revenue', config=config, n_jobs=1)
+        pd.testing.assert_frame_equal(spilled_features, features)
+        pd.testing.assert_frame_equal(spilled_summary, summary)
+        self.assertEqual(budget.report()['analyze_trends_batch']['rows'], len(data))
+
+    def test_within_budget_does_not_spill(self):
+        """Test that operations within the budget run in memory"""
+        with MemoryBudget('1GB') as budget, Profiler() as profiler:
+            self.platform.create_pivot(self.path, 'region', 'channel', 'revenue')
+        self.assertEqual(budget.spills, [])
+        self.assertNotIn('spill', profiler.summary())
+
+        with MemoryBudget(100000) as budget, Profiler() as profiler:
+            self.platform.create_pivot(self.sales, 'region', 'channel', 'revenue')
+        spans = {record['name']: record for record in profiler.records}
+        self.assertEqual(spans['spill']['parent'], 'transform')
+        self.assertEqual(spans['spill']['operation'], 'create_pivot')
+        self.assertGreater(spans['spill']['bytes'], 0)
+
+    def test_cli_memory_budget(self):
+        """Test that the CLI reports spilled operations"""
+        result = subprocess.run([sys.executable, 'src/main_platform.py', '--mode', 'pivot', '--file', self.path,
+                                 '--index', 'region', '--values', 'revenue', '--memory-budget', '100KB',
+                                 '--spill-dir', self.test_dir], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertIn('Spilled to disk: create_pivot', result.stdout)
+        self.assertEqual(os.listdir(self.test_dir), ['sales.csv'])
+
+        # A missing spill directory is created
+        spill_dir = os.path.join(self.test_dir, 'spill', 'pivot')
+        subprocess.run([sys.executable, 'src/main_platform.py', '--mode', 'pivot', '--file', self.path,
+                        '--index', 'region', '--values', 'revenue', '--memory-budget', '100KB',
+                        '--spill-dir', spill_dir], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(os.listdir(spill_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
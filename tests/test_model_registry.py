@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test Model Registry Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import warnings
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.forecast_engine import ForecastEngine
+from src.business_intelligence.model_registry import ModelRegistry
+from src.utils.cache import data_fingerprint
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        self.root_dir = tempfile.mkdtemp()
+        self.registry = ModelRegistry(self.root_dir)
+
+        rng = np.random.default_rng(0)
+        self.test_data = pd.DataFrame({
+            'date': pd.date_range(start='2020-01-01', periods=120, freq='D'),
+            'value': np.cumsum(rng.normal(0, 1, 120)),
+            'customers': rng.integers(100, 500, 120).astype(float)
+        })
+
+        self.engine = ForecastEngine()
+        self.engine.load_data(self.test_data, 'date', 'value')
+
+    def tearDown(self):
+        """Remove the registry directory"""
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def test_save_and_load_sarima(self):
+        """Test that a restored SARIMA model forecasts like the original"""
+        self.engine.train_sarima_model(order=(1, 1, 1), seasonal_order=(1, 0, 0, 7))
+        version = self.engine.save_model(self.registry, 'revenue', metrics={'rmse': np.float64(1.5)})
+
+        registered = self.registry.load('revenue')
+
+        self.assertEqual(version, 1)
+        self.assertEqual(registered.metadata['order'], [1, 1, 1])
+        self.assertEqual(registered.metadata['metrics'], {'rmse': 1.5})
+        self.assertIsInstance(registered.array('params'), np.memmap)
+        pd.testing.assert_series_equal(registered.forecast(5), self.engine.forecast_future(5))
+
+    def test_versions_and_fingerprint_lookup(self):
+        """Test versioning and lookup by data fingerprint"""
+        self.engine.train_arima_model(order=(1, 1, 0))
+        self.engine.save_model(self.registry, 'revenue')
+        fingerprint = data_fingerprint(self.engine.data['value'])
+
+        self.engine.update(pd.DataFrame({'value': [1.0]}, index=[self.engine.data.index[-1] + pd.Timedelta(days=1)]))
+        self.engine.save_model(self.registry, 'revenue')
+
+        self.assertEqual(self.registry.list_versions('revenue'), [1, 2])
+        self.assertEqual(self.registry.list_models(), ['revenue'])
+        self.assertEqual(self.registry.load('revenue', data_fingerprint=fingerprint).version, 1)
+        with self.assertRaises(KeyError):
+            self.registry.load('revenue', data_fingerprint='unknown')
+
+    def test_load_model_into_engine(self):
+        """Test restoring an engine that can keep filtering new observations"""
+        self.engine.train_arima_model(order=(2, 1, 1))
+        self.engine.save_model(self.registry, 'revenue')
+
+        engine = ForecastEngine()
+        engine.load_model(self.registry, 'revenue')
+        new_obs = pd.DataFrame({'value': [2.0]}, index=[self.engine.data.index[-1] + pd.Timedelta(days=1)])
+        engine.update(new_obs)
+        self.engine.update(new_obs)
+
+        np.testing.assert_allclose(engine.forecast_future(3).values, self.engine.forecast_future(3).values)
+        self.assertEqual(len(engine.data), len(self.engine.data))
+
+    def test_linear_regression_round_trip(self):
+        """Test saving and restoring a linear regression model"""
+        engine = ForecastEngine()
+        engine.load_data(self.test_data.copy(), 'date')
+        engine.train_linear_regression(column='value', features=['customers'])
+        engine.save_model(self.registry, 'linear')
+
+        restored = self.registry.load('linear').model
+
+        np.testing.assert_allclose(restored.coef_, engine.model.coef_)
+        np.testing.assert_allclose(
+            restored.predict(self.test_data[['customers']]),
+            engine.model.predict(self.test_data[['customers']])
+        )
+        with self.assertRaisesRegex(ValueError, 'future values of the feature columns are unknown'):
+            self.registry.load('linear').forecast(steps=3)
+
+if __name__ == '__main__':
+    unittest.main()
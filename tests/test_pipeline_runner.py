@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Test Pipeline Runner Module"""
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import time
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.pipeline_runner import PipelineRunner, load_spec, run_pipeline, topological_order
+
+class SleepingRunner(PipelineRunner):
+    """Runner whose steps only sleep, recording how many run at once"""
+    def __init__(self, spec, max_workers=None):
+        super().__init__(spec, max_workers=max_workers)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _run_step(self, step, results):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.1)
+        with self.lock:
+            self.active -= 1
+        if step.get('fail'):
+            raise RuntimeError('step failed')
+        return step['name']
+
+class TestPipelineRunner(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(4)
+        pd.DataFrame({
+            'date': pd.date_range(start='2023-01-01', periods=90, freq='D').astype(str),
+            'region': np.tile(['north', 'south', 'east'], 30),
+            'revenue': rng.uniform(100, 200, 90).round(2)
+        }).to_csv(os.path.join(self.test_dir, 'sales.csv'), index=False)
+
+        self.spec = {
+            'datasets': {'sales': 'sales.csv'},
+            'steps': [
+                {'name': 'pivot', 'mode': 'pivot', 'data': 'sales', 'index': 'region', 'values': 'revenue'},
+                {'name': 'kpi', 'mode': 'kpi', 'data': 'sales', 'kpi_config': {
+                    'growth': {'type': 'revenue_growth', 'period_col': 'date', 'revenue_col': 'revenue'}}},
+                {'name': 'trend', 'mode': 'trend', 'data': 'sales', 'date_col': 'date', 'value_col': 'revenue',
+                 'config': {'decompose': False}},
+                {'name': 'forecast', 'mode': 'forecast', 'data': 'sales', 'date_col': 'date',
+                 'value_col': 'revenue', 'steps': 7, 'model_type': 'fast', 'depends_on': ['trend']},
+                {'name': 'dashboard', 'mode': 'dashboard', 'data': 'pivot', 'output': 'dashboard.html',
+                 'charts': [{'type': 'bar', 'title': 'Revenue by region', 'y': 'revenue'}]}
+            ]
+        }
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.test_dir)
+
+    def _write_spec(self, name, spec):
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w') as f:
+            if name.endswith('.json'):
+                json.dump(spec, f)
+            else:
+                import yaml
+                yaml.safe_dump(spec, f)
+        return path
+
+    def test_topological_order(self):
+        """Test dependency ordering and cycle detection"""
+        order = topological_order({'a': set(), 'b': {'a'}, 'c': {'a', 'b'}, 'd': set()})
+
+        self.assertLess(order.index('a'), order.index('b'))
+        self.assertLess(order.index('b'), order.index('c'))
+        with self.assertRaises(ValueError):
+            topological_order({'a': {'b'}, 'b': {'a'}, 'c': set()})
+
+    def test_run_pipeline(self):
+        """Test a pipeline sharing one dataset and feeding a step's output to another"""
+        finished = []
+        outcomes = run_pipeline(self._write_spec('pipeline.json', self.spec),
+                                callback=lambda name, outcome: finished.append(name))
+
+        self.assertTrue(all(outcome['status'] == 'success' for outcome in outcomes.values()))
+        self.assertLess(finished.index('trend'), finished.index('forecast'))
+        self.assertLess(list(outcomes).index('pivot'), list(outcomes).index('dashboard'))
+        self.assertEqual(len(outcomes['forecast']['result']), 7)
+        self.assertEqual(outcomes['pivot']['result'].index.tolist(), ['east', 'north', 'south'])
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'dashboard.html')))
+
+    def test_dataset_read_once(self):
+        """Test that steps reading the same dataset share one read"""
+        runner = PipelineRunner(dict(self.spec, base_dir=self.test_dir))
+        runner.run()
+
+        self.assertEqual(runner._cache.stats()['misses'], 1)
+        self.assertEqual(runner._cache.stats()['hits'], 3)
+        # The shared read covers the columns of all its readers and no others
+        self.assertEqual(runner.columns, {os.path.join(self.test_dir, 'sales.csv'): ['region', 'revenue', 'date']})
+
+    def test_yaml_spec(self):
+        """Test loading a YAML specification relative to its directory"""
+        spec = load_spec(self._write_spec('pipeline.yaml', self.spec))
+
+        self.assertEqual(spec['base_dir'], self.test_dir)
+        self.assertEqual([step['name'] for step in spec['steps']], [step['name'] for step in self.spec['steps']])
+
+    def test_independent_steps_run_concurrently(self):
+        """Test that steps without dependencies between them overlap"""
+        spec = {'steps': [{'name': name, 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}} for name in 'abc']}
+        spec['steps'].append({'name': 'd', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}, 'depends_on': 'a'})
+        runner = SleepingRunner(spec, max_workers=4)
+
+        start = time.perf_counter()
+        outcomes = runner.run()
+
+        self.assertEqual(runner.max_active, 3)
+        self.assertLess(time.perf_counter() - start, 0.35)
+        self.assertEqual(outcomes['d']['result'], 'd')
+
+    def test_failure_skips_dependents(self):
+        """Test that a failed step skips its dependents but not independent steps"""
+        spec = {'steps': [
+            {'name': 'a', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}, 'fail': True},
+            {'name': 'b', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}, 'depends_on': ['a']},
+            {'name': 'c', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}, 'depends_on': ['b']},
+            {'name': 'd', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}}
+        ]}
+        outcomes = SleepingRunner(spec).run()
+
+        self.assertEqual({name: outcome['status'] for name, outcome in outcomes.items()},
+                         {'a': 'failed', 'b': 'skipped', 'c': 'skipped', 'd': 'success'})
+        self.assertIn('step failed', outcomes['a']['error'])
+
+    def test_invalid_specs(self):
+        """Test validation of modes, parameters, data sources and dependencies"""
+        invalid = [
+            {'steps': [{'name': 'a', 'mode': 'report', 'file': 'x.csv'}]},
+            {'steps': [{'name': 'a', 'mode': 'trend', 'file': 'x.csv', 'date_col': 'date'}]},
+            {'steps': [{'name': 'a', 'mode': 'kpi', 'data': 'missing', 'kpi_config': {}}]},
+            {'steps': [{'name': 'a', 'mode': 'kpi', 'file': 'x.csv', 'kpi_config': {}, 'depends_on': ['b']}]},
+            {'steps': [{'name': 'a', 'mode': 'kpi', 'data': 'b', 'kpi_config': {}},
+                       {'name': 'b', 'mode': 'kpi', 'data': 'a', 'kpi_config': {}}]},
+            {'steps': [{'name': 'a', 'mode': 'excel', 'file': 'x.xlsx'}, {'name': 'a', 'mode': 'excel', 'file': 'y.xlsx'}]}
+        ]
+        for spec in invalid:
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    PipelineRunner(spec)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@
 import unittest
 import os
 import sys
+import subprocess
+import tempfile
 import pandas as pd
 import numpy as np
 
@@ -10,7 +12,10 @@ import numpy as np
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # Import modules
-from src.data_analyst_platform import DataAnalystPlatform
+from src.data_analyst_platform import DataAnalystPlatform, required_columns
+from src.business_intelligence.forecast_engine import ForecastEngine
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
 
 class TestDataAnalystPlatform(unittest.TestCase):
     def setUp(self):
@@ -86,5 +91,109 @@ class TestDataAnalystPlatform(unittest.TestCase):
         self.assertIsInstance(forecast, pd.Series)
         self.assertEqual(len(forecast), 10)
 
+    def test_linear_forecast_without_features(self):
+        """Test that linear forecasts default to a lag when no features are given"""
+        forecast = self.platform.forecast(self.test_data[['date', 'value']], 'date', 'value', steps=5,
+                                          model_type='linear')
+        self.assertEqual(len(forecast), 5)
+        self.assertEqual(self.platform.forecast_engine.model_spec['lags'], [1])
+
+        engine = ForecastEngine()
+        engine.load_data(self.test_data[['date', 'value']], 'date', 'value')
+        with self.assertRaisesRegex(ValueError, 'feature columns'):
+            engine.train_linear_regression(column='value')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.csv')
+            self.test_data.to_csv(path, index=False)
+            result = subprocess.run([sys.executable, 'src/main_platform.py', '--mode', 'forecast', '--file', path,
+                                     '--date-col', 'date', '--value-col', 'value', '--steps', '3',
+                                     '--model-type', 'linear'], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('Forecast:', result.stdout)
+
+    def test_fast_forecast_from_cli(self):
+        """Test that the fast-path models can be run from the command line"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.csv')
+            self.test_data.to_csv(path, index=False)
+            result = subprocess.run([sys.executable, 'src/main_platform.py', '--mode', 'forecast', '--file', path,
+                                     '--date-col', 'date', '--value-col', 'value', '--steps', '3',
+                                     '--model-type', 'fast', '--method', 'seasonal_naive', '--season-length', '7'],
+                                    cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('Forecast:', result.stdout)
+
+        # A seasonal naive forecast repeats the last season
+        forecast = self.platform.forecast(self.test_data, 'date', 'value', steps=3, model_type='fast',
+                                          model_params={'method': 'seasonal_naive', 'season_length': 7})
+        np.testing.assert_allclose(forecast.to_numpy(), self.test_data['value'].to_numpy()[-7:-4])
+
+    def test_incremental_forecast(self):
+        """Test forecast reusing the fitted model for new observations"""
+        params = {'order': (1, 1, 1)}
+        self.platform.forecast(self.test_data.iloc[:-5], 'date', 'value', steps=10,
+                               model_params=params, incremental=True)
+        engine = self.platform.forecast_engine
+
+        forecast = self.platform.forecast(self.test_data, 'date', 'value', steps=10,
+                                          model_params=params, incremental=True)
+
+        self.assertIs(self.platform.forecast_engine, engine)
+        self.assertEqual(len(forecast), 10)
+
+        # Data that cannot be loaded is an error, not an empty update
+        with self.assertRaises(ValueError):
+            self.platform.forecast(self.test_data.drop(columns='date'), 'date', 'value', steps=10,
+                                   model_params=params, incremental=True)
+        self.assertEqual(forecast.index[0], self.test_data['date'].iloc[-1] + pd.Timedelta(days=1))
+
+    def test_backtest(self):
+        """Test backtest method"""
+        models = {'ses': {'type': 'fast', 'method': 'ses'}, 'naive': {'type': 'fast', 'method': 'naive'}}
+        results, summary = self.platform.backtest(self.test_data, 'date', ['value', 'revenue'], models,
+                                                  horizon=7, n_folds=3, n_jobs=1)
+
+        self.assertEqual(len(results), 2 * 2 * 3)
+        self.assertEqual(summary['best'].sum(), 2)
+        self.assertIn('date', self.test_data.columns)
+
+    def test_analyze_trends_batch(self):
+        """Test analyze_trends_batch method"""
+        data = self.test_data.melt(id_vars='date', value_vars=['value', 'revenue'], var_name='series',
+                                   value_name='amount')
+        features, summary = self.platform.analyze_trends_batch(data, 'series', 'date', 'amount',
+                                                               config={'decompose': False}, n_jobs=1)
+
+        self.assertEqual(len(features), len(data))
+        self.assertEqual(summary['series'].tolist(), ['revenue', 'value'])
+        self.assertTrue(summary['p_value'].notna().all())
+
+    def test_test_stationarity_batch(self):
+        """Test test_stationarity_batch method"""
+        data = self.test_data.melt(id_vars='date', value_vars=['value', 'revenue'], var_name='series',
+                                   value_name='amount')
+        results = self.platform.test_stationarity_batch(data, 'series', 'date', 'amount', max_lags=2, kpss=True,
+                                                        n_jobs=1)
+
+        self.assertEqual(results['series'].tolist(), ['revenue', 'value'])
+        self.assertTrue((results['adf_lags'] <= 2).all())
+        self.assertTrue(results['conclusion'].notna().all())
+
+    def test_required_columns(self):
+        """Test the columns derived from operation parameters"""
+        self.assertEqual(required_columns('pivot', {'index': ['category', 'date'], 'columns': 'category',
+                                                    'values': 'revenue'}), ['category', 'date', 'revenue'])
+        self.assertIsNone(required_columns('pivot', {'index': 'category'}))
+        self.assertEqual(required_columns('trend', {'date_col': 'date', 'value_col': 'value'}), ['date', 'value'])
+        self.assertEqual(required_columns('kpi', {'kpi_config': {
+            'growth': {'type': 'revenue_growth', 'period_col': 'date', 'revenue_col': 'revenue', 'periods': 2},
+            'clv': {'type': 'customer_lifetime_value', 'customer_id_col': 'customers', 'revenue_col': 'revenue'}
+        }}), ['date', 'revenue', 'customers'])
+        self.assertEqual(required_columns('dashboard', {'charts': [
+            {'type': 'bar', 'x': 'category', 'y': 'revenue'}, {'type': 'pie', 'values': 'revenue', 'names': 'category'}
+        ]}), ['category', 'revenue'])
+        self.assertIsNone(required_columns('excel', {}))
+
 if __name__ == '__main__':
     unittest.main()
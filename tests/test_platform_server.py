@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Test Platform Server Module"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.platform_server import PlatformServer, DatasetCache, call_server, to_json_compatible
+
+class TestPlatformServer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file = os.path.join(self.test_dir, 'sales.csv')
+        rng = np.random.default_rng(3)
+        self.test_data = pd.DataFrame({
+            'date': pd.date_range(start='2023-01-01', periods=60, freq='D').astype(str),
+            'region': np.tile(['north', 'south', 'east'], 20),
+            'revenue': rng.uniform(100, 200, 60).round(2)
+        })
+        self.test_data.to_csv(self.file, index=False)
+        self.server = PlatformServer(max_datasets=2)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.server.shutdown()
+        shutil.rmtree(self.test_dir)
+
+    def _start(self, **address):
+        """Serve in a background thread and return the bound server"""
+        httpd = self.server.create_server(**address)
+        self.server._server = httpd
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(httpd.server_close)
+        return httpd
+
+    def test_dataset_cache(self):
+        """Test that datasets are read once and reread when the file changes"""
+        cache = DatasetCache(max_datasets=2)
+        first = cache.get(self.file)
+        first.loc[0, 'revenue'] = -1
+        second = cache.get(self.file)
+
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertNotEqual(second.loc[0, 'revenue'], -1)
+
+        # Rewriting the file changes its size and modification time
+        time.sleep(0.01)
+        self.test_data.iloc[:30].to_csv(self.file, index=False)
+        self.assertEqual(len(cache.get(self.file)), 30)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+        projected = cache.get(self.file, columns=['revenue', 'region'])
+        self.assertEqual(list(projected.columns), ['revenue', 'region'])
+        self.assertEqual(cache.stats()['misses'], 3)
+
+    def test_handle_requests(self):
+        """Test the pivot, kpi and trend requests"""
+        pivot = self.server.handle('pivot', {'file': self.file, 'index': 'region', 'values': 'revenue'})
+        expected = self.test_data.groupby('region')['revenue'].sum()
+        self.assertEqual(pivot['result']['index'], expected.index.tolist())
+        np.testing.assert_allclose(np.ravel(pivot['result']['data']), expected.to_numpy())
+
+        trend = self.server.handle('trend', {'file': self.file, 'date_col': 'date', 'value_col': 'revenue',
+                                             'config': {'decompose': False}})
+        self.assertIn('p_value', trend['result']['stationarity'])
+        self.assertEqual(len(trend['result']['moving_average']['data']), 60)
+
+        kpi = self.server.handle('kpi', {'data': self.test_data.to_dict(orient='records'), 'kpi_config': {
+            'growth': {'type': 'revenue_growth', 'period_col': 'date', 'revenue_col': 'revenue'}}})
+        self.assertIn('growth', kpi['result'])
+
+        # Requests read only their columns, cached per column set
+        again = self.server.handle('pivot', {'file': self.file, 'index': 'region', 'values': 'revenue'})
+        self.assertEqual(again, pivot)
+        self.assertEqual(self.server.status()['datasets'], {'datasets': 2, 'hits': 1, 'misses': 2})
+
+        with self.assertRaises(ValueError):
+            self.server.handle('trend', {'file': self.file, 'date_col': 'date'})
+        with self.assertRaises(ValueError):
+            self.server.handle('report', {'file': self.file})
+
+    def test_http_roundtrip(self):
+        """Test forecast requests and errors over HTTP"""
+        httpd = self._start(port=0)
+        port = httpd.server_address[1]
+
+        response = call_server('forecast', {'file': self.file, 'date_col': 'date', 'value_col': 'revenue',
+                                            'steps': 5, 'model_type': 'fast'}, port=port)
+        self.assertEqual(len(response['result']['data']), 5)
+        self.assertEqual(call_server('health', port=port)['requests'], 1)
+
+        with self.assertRaises(RuntimeError):
+            call_server('pivot', {'file': os.path.join(self.test_dir, 'missing.csv'), 'index': 'region',
+                                  'values': 'revenue'}, port=port)
+        with self.assertRaises(RuntimeError):
+            call_server('report', {}, port=port)
+
+    @unittest.skipUnless(hasattr(__import__('socket'), 'AF_UNIX'), 'Unix sockets are not available')
+    def test_unix_socket(self):
+        """Test requests over a Unix socket"""
+        socket_path = os.path.join(self.test_dir, 'platform.sock')
+        self._start(socket_path=socket_path)
+
+        response = call_server('pivot', {'file': self.file, 'index': 'region', 'values': 'revenue'},
+                               socket_path=socket_path)
+        self.assertEqual(len(response['result']['index']), 3)
+
+    def test_to_json_compatible(self):
+        """Test the conversion of results to JSON values"""
+        value = {'series': pd.Series([1.5, np.nan], index=pd.date_range('2024-01-01', periods=2)),
+                 'flag': np.bool_(True), 'count': np.int64(3), 'items': (1, 2)}
+
+        self.assertEqual(to_json_compatible(value), {
+            'series': {'index': ['2024-01-01T00:00:00', '2024-01-02T00:00:00'], 'data': [1.5, None]},
+            'flag': True, 'count': 3, 'items': [1, 2]
+        })
+
+if __name__ == '__main__':
+    unittest.main()
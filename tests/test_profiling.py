@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Test Profiling Module"""
+import unittest
+import os
+import sys
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.utils.profiling import Profiler, profile_span, profiled
+from src.data_analyst_platform import DataAnalystPlatform
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+@profiled('double')
+def double(data):
+    return pd.concat([data, data])
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(3)
+        self.test_data = pd.DataFrame({
+            'date': pd.date_range(start='2023-01-01', periods=60, freq='D'),
+            'region': np.tile(['north', 'south', 'east'], 20),
+            'revenue': rng.uniform(100, 200, 60)
+        })
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        shutil.rmtree(self.test_dir)
+
+    def test_nested_spans(self):
+        """Test span nesting, times and row counts"""
+        with Profiler() as profiler:
+            with profile_span('outer', mode='test') as span:
+                result = double(self.test_data)
+                span['rows_out'] = len(result)
+
+        spans = {record['name']: record for record in profiler.report()['spans']}
+        self.assertEqual(spans['outer']['depth'], 0)
+        self.assertEqual(spans['outer']['mode'], 'test')
+        self.assertEqual(spans['double']['parent'], 'outer')
+        self.assertEqual((spans['double']['rows_in'], spans['double']['rows_out']), (60, 120))
+        self.assertGreaterEqual(spans['outer']['wall'], spans['double']['wall'])
+        self.assertGreaterEqual(spans['double']['cpu'], 0)
+        self.assertNotIn('peak_memory', spans['outer'])
+
+    def test_inactive_spans_are_not_recorded(self):
+        """Test that spans outside a profiler are not recorded"""
+        profiler = Profiler()
+        with profile_span('ignored') as span:
+            span['rows_out'] = 1
+        self.assertEqual(double(self.test_data).shape[0], 120)
+        self.assertEqual(profiler.records, [])
+
+    def test_peak_memory(self):
+        """Test that peaks of nested spans reach the enclosing span"""
+        with Profiler(memory=True) as profiler:
+            with profile_span('outer'):
+                with profile_span('allocate'):
+                    block = np.ones(2_000_000)
+                    del block
+                with profile_span('small'):
+                    np.ones(10)
+
+        spans = {record['name']: record for record in profiler.records}
+        self.assertGreaterEqual(spans['allocate']['peak_memory'], 16_000_000)
+        self.assertGreaterEqual(spans['outer']['peak_memory'], 16_000_000)
+        self.assertLess(spans['small']['peak_memory'], 1_000_000)
+
+    def test_threads(self):
+        """Test that spans of other threads are recorded on their own stacks"""
+        def work(name):
+            with profile_span(name):
+                double(self.test_data)
+
+        with Profiler() as profiler:
+            threads = [threading.Thread(target=work, args=(f"worker-{i}",)) for i in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        summary = profiler.summary()
+        self.assertEqual(summary['double']['count'], 3)
+        parents = sorted(record['parent'] for record in profiler.records if record['name'] == 'double')
+        self.assertEqual(parents, ['worker-0', 'worker-1', 'worker-2'])
+
+    def test_platform_operations(self):
+        """Test the spans of platform operations and their inner steps"""
+        path = os.path.join(self.test_dir, 'sales.csv')
+        self.test_data.to_csv(path, index=False)
+        platform = DataAnalystPlatform()
+
+        with Profiler() as profiler:
+            platform.create_pivot(platform.load_data(path), index='region', columns=None, values='revenue')
+            platform.forecast(self.test_data, 'date', 'revenue', steps=5, model_type='fast')
+
+        names = [(record['name'], record['parent']) for record in profiler.report()['spans']]
+        self.assertEqual(names, [('load', None), ('create_pivot', None), ('transform', 'create_pivot'),
+                                 ('forecast', None), ('transform', 'forecast'), ('fit', 'forecast'),
+                                 ('predict', 'forecast')])
+        summary = profiler.summary()
+        self.assertEqual(summary['load']['rows_out'], 60)
+        self.assertEqual(summary['create_pivot']['rows_out'], 3)
+
+    def test_save(self):
+        """Test the JSON report and the Chrome trace"""
+        with Profiler() as profiler:
+            with profile_span('outer'):
+                double(self.test_data)
+
+        report_path = os.path.join(self.test_dir, 'profile.json')
+        trace_path = os.path.join(self.test_dir, 'trace.json')
+        profiler.save(report_path)
+        profiler.save(trace_path, format='chrome')
+
+        with open(report_path) as f:
+            report = json.load(f)
+        with open(trace_path) as f:
+            trace = json.load(f)
+        self.assertEqual(report['summary']['outer']['count'], 1)
+        self.assertEqual([event['name'] for event in trace['traceEvents']], ['outer', 'double'])
+        self.assertTrue(all(event['ph'] == 'X' and event['dur'] >= 0 for event in trace['traceEvents']))
+        with self.assertRaises(ValueError):
+            profiler.save(trace_path, format='csv')
+
+    def test_cli_profile(self):
+        """Test the --profile flag of the CLI"""
+        path = os.path.join(self.test_dir, 'sales.csv')
+        profile_path = os.path.join(self.test_dir, 'trace.json')
+        self.test_data.to_csv(path, index=False)
+
+        subprocess.run([sys.executable, 'src/main_platform.py', '--mode', 'pivot', '--file', path, '--index',
+                        'region', '--values', 'revenue', '--profile', profile_path, '--profile-format', 'chrome'],
+                       cwd=ROOT, capture_output=True, check=True)
+
+        with open(profile_path) as f:
+            names = [event['name'] for event in json.load(f)['traceEvents']]
+        self.assertEqual(names, ['run', 'load', 'create_pivot', 'transform'])
+
+if __name__ == '__main__':
+    unittest.main()
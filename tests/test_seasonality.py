@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test Seasonality Module"""
+import unittest
+import os
+import sys
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.seasonality import (
+    infer_sampling_interval, regularize, autocorrelation, detect_seasonal_period, infer_period
+)
+
+class TestSeasonality(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rng = np.random.default_rng(3)
+
+    def _series(self, periods, freq, period):
+        """Trending series with a sinusoidal seasonal component"""
+        t = np.arange(periods)
+        values = 50 + 0.1 * t + 5 * np.sin(2 * np.pi * t / period) + self.rng.normal(0, 1, periods)
+        return pd.Series(values, index=pd.date_range(start='2020-01-01', periods=periods, freq=freq))
+
+    def test_sampling_interval(self):
+        """Test interval inference for regular, frequency-less and irregular indices"""
+        daily = pd.date_range(start='2020-01-01', periods=30, freq='D')
+        gappy = daily.delete([3, 4, 10])
+
+        self.assertEqual(infer_sampling_interval(daily), 'D')
+        self.assertEqual(infer_sampling_interval(pd.DatetimeIndex(list(daily))), 'D')
+        self.assertEqual(infer_sampling_interval(gappy), 'D')
+        self.assertEqual(infer_sampling_interval(pd.date_range(start='2020-01-01', periods=10, freq='MS')), 'MS')
+        self.assertIsNone(infer_sampling_interval(pd.RangeIndex(10)))
+
+    def test_regularize_fills_gaps(self):
+        """Test that gappy series are put on a regular grid without missing values"""
+        series = self._series(100, 'D', 7)
+        gappy = series.drop(series.index[[5, 6, 40]])
+        regular = regularize(gappy)
+
+        self.assertEqual(len(regular), 100)
+        self.assertFalse(regular.isna().any())
+        self.assertEqual(regular.index.freqstr, 'D')
+
+    def test_autocorrelation_matches_direct(self):
+        """Test the FFT autocorrelation against the direct definition"""
+        values = self.rng.normal(0, 1, 50)
+        centered = values - values.mean()
+        direct = [np.sum(centered[:50 - k] * centered[k:]) / np.sum(centered ** 2) for k in range(6)]
+
+        np.testing.assert_allclose(autocorrelation(values, max_lag=5), direct)
+
+    def test_detects_calendar_periods(self):
+        """Test detection for common sampling intervals"""
+        for periods, freq, period in [(200, 'D', 7), (120, 'MS', 12), (24 * 30, 'h', 24), (40, 'QS', 4)]:
+            with self.subTest(freq=freq):
+                self.assertEqual(infer_period(self._series(periods, freq, period))['period'], period)
+
+    def test_detects_non_calendar_period(self):
+        """Test that the periodogram finds periods outside the calendar candidates"""
+        series = self._series(500, 'D', 30)
+
+        self.assertEqual(detect_seasonal_period(series.to_numpy(), freq='D'), 30)
+
+    def test_prefers_shortest_equivalent_period(self):
+        """Test that multiples of the true period are not selected"""
+        values = self._series(24 * 7 * 8, 'h', 24).to_numpy()
+
+        self.assertEqual(detect_seasonal_period(values, freq='h'), 24)
+
+    def test_no_seasonality(self):
+        """Test that noise is not reported as seasonal"""
+        noise = pd.Series(self.rng.normal(0, 1, 200), index=pd.date_range(start='2020-01-01', periods=200, freq='D'))
+        result = infer_period(noise)
+
+        self.assertIsNone(result['period'])
+        self.assertEqual(result['default_period'], 7)
+        self.assertIsNone(detect_seasonal_period(np.ones(100)))
+
+    def test_gappy_index(self):
+        """Test detection on an irregular index with missing days"""
+        series = self._series(300, 'D', 7)
+        gappy = series.drop(series.index[self.rng.choice(300, 60, replace=False)])
+        result = infer_period(gappy)
+
+        self.assertEqual(result['freq'], 'D')
+        self.assertEqual(result['period'], 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test CLI Startup Module"""
+import unittest
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Heavy packages that no mode needs before it runs
+HEAVY_PACKAGES = ('matplotlib', 'seaborn', 'plotly', 'dash', 'statsmodels', 'sklearn', 'scipy', 'openpyxl')
+
+# Import-time budget of the CLI module in seconds, far above the few
+# milliseconds it takes without the analysis modules
+STARTUP_BUDGET = 0.25
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its JSON output"""
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+def loaded_packages(imports, packages=HEAVY_PACKAGES):
+    """Return the import time and which of packages were loaded by imports"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{imports}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([elapsed, sorted(p for p in {packages!r} if p in sys.modules)]))\n"
+    )
+    return run_python(code)
+
+class TestStartup(unittest.TestCase):
+    def test_cli_import_is_fast(self):
+        """Test that importing the CLI loads no analysis packages"""
+        elapsed, packages = loaded_packages("import src.main_platform", HEAVY_PACKAGES + ('pandas',))
+
+        self.assertEqual(packages, [])
+        self.assertLess(elapsed, STARTUP_BUDGET)
+
+    def test_help(self):
+        """Test that --help works without loading the analysis modules"""
+        result = subprocess.run([sys.executable, '-X', 'importtime', 'src/main_platform.py', '--help'], cwd=ROOT,
+                                capture_output=True, text=True)
+        imported = {line.split('|')[-1].strip().split('.')[0] for line in result.stderr.splitlines()
+                    if line.startswith('import time:')}
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn('--mode', result.stdout)
+        self.assertFalse(imported & set(HEAVY_PACKAGES + ('pandas',)))
+
+    def test_modes_load_only_their_modules(self):
+        """Test that the modules of each mode import only what the mode needs"""
+        modes = {
+            'pivot': ("from src.excel.pivot_generator import PivotGenerator", ()),
+            'kpi': ("from src.business_intelligence.kpi_calculator import KPICalculator", ()),
+            'trend': ("from src.business_intelligence.trend_analyzer import TrendAnalyzer", ('scipy', 'statsmodels')),
+            'forecast': ("from src.business_intelligence.forecast_engine import ForecastEngine",
+                         ('scipy', 'statsmodels'))
+        }
+        for mode, (imports, allowed) in modes.items():
+            with self.subTest(mode=mode):
+                _, packages = loaded_packages(imports)
+                self.assertEqual(packages, sorted(allowed))
+
+if __name__ == '__main__':
+    unittest.main()
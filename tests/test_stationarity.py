@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Test Stationarity Module"""
+import unittest
+import os
+import sys
+import warnings
+import pandas as pd
+import numpy as np
+from statsmodels.tsa.stattools import adfuller
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.stationarity import (
+    StationarityTester, adf_test, kpss_test, stationarity_tests, stationarity_conclusion, _STATIONARITY_CACHE
+)
+
+class TestStationarity(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        _STATIONARITY_CACHE.clear()
+        rng = np.random.default_rng(4)
+        self.noise = rng.normal(0, 1, 200)
+        self.random_walk = rng.normal(0, 1, 200).cumsum()
+
+        # Long format: two stationary and two random-walk series
+        dates = pd.date_range(start='2023-01-01', periods=150, freq='D')
+        frames = [
+            pd.DataFrame({'store': f'store_{i}', 'date': dates,
+                          'sales': rng.normal(0, 1, 150) if i < 2 else rng.normal(0, 1, 150).cumsum()})
+            for i in range(4)
+        ]
+        self.test_data = pd.concat(frames).sample(frac=1, random_state=2).reset_index(drop=True)
+
+    def test_adf_matches_statsmodels(self):
+        """Test that the fast lag search gives the adfuller results"""
+        for values in (self.noise, self.random_walk):
+            for regression in ('c', 'ct', 'n'):
+                for autolag in ('AIC', 'BIC', 't-stat', None):
+                    with self.subTest(regression=regression, autolag=autolag):
+                        expected = adfuller(values, regression=regression, autolag=autolag)
+                        result = adf_test(values, regression=regression, autolag=autolag)
+
+                        self.assertAlmostEqual(result['test_statistic'], expected[0])
+                        self.assertAlmostEqual(result['p_value'], expected[1])
+                        self.assertEqual(result['lags'], expected[2])
+                        self.assertEqual(result['observations'], expected[3])
+                        self.assertAlmostEqual(result['critical_values']['5%'], expected[4]['5%'])
+
+    def test_capped_lag_search(self):
+        """Test that max_lags caps the search like adfuller's maxlag"""
+        result = adf_test(self.random_walk, max_lags=3)
+        expected = adfuller(self.random_walk, maxlag=3)
+
+        self.assertLessEqual(result['lags'], 3)
+        self.assertAlmostEqual(result['test_statistic'], expected[0])
+        with self.assertRaises(ValueError):
+            adf_test(self.noise[:10], max_lags=8)
+        with self.assertRaises(ValueError):
+            adf_test(self.noise, autolag='HQIC')
+
+    def test_kpss_and_conclusion(self):
+        """Test the KPSS companion and the combined verdict"""
+        self.assertTrue(kpss_test(self.noise)['is_stationary'])
+        self.assertFalse(kpss_test(self.random_walk)['is_stationary'])
+
+        results = stationarity_tests(self.random_walk, kpss=True)
+        self.assertEqual(results['conclusion'], 'non-stationary')
+        self.assertEqual(set(results['timings']), {'adf', 'kpss'})
+        self.assertEqual(stationarity_tests(self.noise, kpss=True)['conclusion'], 'stationary')
+        self.assertEqual(stationarity_conclusion(False, True), 'trend-stationary')
+        self.assertNotIn('kpss', stationarity_tests(self.noise))
+
+    def test_tester_runs_and_caches(self):
+        """Test batch testing of long-format series and the fingerprint cache"""
+        tester = StationarityTester(max_lags=4, kpss=True, n_jobs=1)
+        first = tester.run(self.test_data, 'store', 'date', 'sales')
+
+        self.assertEqual(first['store'].tolist(), ['store_0', 'store_1', 'store_2', 'store_3'])
+        self.assertEqual(first['is_stationary'].tolist(), [True, True, False, False])
+        self.assertFalse(first['cached'].any())
+        self.assertTrue(first['error'].isna().all())
+        series = self.test_data[self.test_data['store'] == 'store_2'].sort_values('date')['sales']
+        self.assertAlmostEqual(first['adf_statistic'].iloc[2], adfuller(series, maxlag=4)[0])
+
+        # Only the changed series is tested again
+        changed = self.test_data.copy()
+        changed.loc[changed['store'] == 'store_3', 'sales'] += np.arange(150)
+        second = tester.run(changed, 'store', 'date', 'sales')
+        self.assertEqual(second['cached'].tolist(), [True, True, True, False])
+        pd.testing.assert_frame_equal(first.iloc[:3].drop(columns='cached'), second.iloc[:3].drop(columns='cached'))
+
+        # Other options are cached separately
+        self.assertFalse(StationarityTester(n_jobs=1).run(self.test_data, 'store', 'date', 'sales')['cached'].any())
+
+    def test_parallel_matches_serial(self):
+        """Test that the process pool gives the same results"""
+        serial = StationarityTester(n_jobs=1, use_cache=False).run(self.test_data, 'store', 'date', 'sales')
+        parallel = StationarityTester(n_jobs=2, use_cache=False).run(self.test_data, 'store', 'date', 'sales')
+
+        columns = ['store', 'adf_statistic', 'adf_p_value', 'adf_lags', 'is_stationary']
+        pd.testing.assert_frame_equal(serial[columns], parallel[columns])
+
+    def test_failing_series_is_reported(self):
+        """Test that a series too short to test does not abort the batch"""
+        short = pd.DataFrame({'store': 'new', 'date': pd.date_range(start='2023-01-01', periods=4), 'sales': 1.0})
+        results = StationarityTester(n_jobs=1).run(pd.concat([self.test_data, short]), 'store', 'date', 'sales')
+
+        errors = results.set_index('store')['error']
+        self.assertTrue(isinstance(errors['new'], str))
+        self.assertTrue(errors.drop('new').isna().all())
+
+if __name__ == '__main__':
+    unittest.main()
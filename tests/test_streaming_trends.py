@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Test Streaming Trends Module"""
+import unittest
+import os
+import sys
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.streaming_trends import (
+    P2Quantile, OnlineTrendDetector, StreamingTrendMonitor, EVENT_COLUMNS
+)
+
+class TestStreamingTrends(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        rng = np.random.default_rng(4)
+
+        # Flat revenue, a spike, then an upward trend
+        self.values = np.r_[rng.normal(100, 2, 200), 100 + 0.5 * np.arange(100) + rng.normal(0, 2, 100)]
+        self.values[60] = 140
+        self.dates = pd.date_range(start='2024-01-01', periods=len(self.values), freq='h')
+
+    def test_p2_quantile_accuracy(self):
+        """Test the streaming quantiles against exact ones"""
+        values = np.random.default_rng(0).normal(0, 1, 20000)
+        for p in (0.25, 0.5, 0.9):
+            estimator = P2Quantile(p)
+            for value in values:
+                estimator.update(value)
+            self.assertAlmostEqual(estimator.value, np.quantile(values, p), delta=0.02)
+
+    def test_p2_quantile_few_observations(self):
+        """Test exact quantiles before the markers are initialized"""
+        estimator = P2Quantile(0.25)
+        self.assertTrue(np.isnan(estimator.value))
+        for value in [4.0, 1.0, 3.0]:
+            estimator.update(value)
+
+        self.assertEqual(estimator.value, np.quantile([4.0, 1.0, 3.0], 0.25))
+        with self.assertRaises(ValueError):
+            P2Quantile(1.5)
+
+    def test_detects_outlier_and_trend(self):
+        """Test the events of a spike followed by a trend"""
+        for method in ('zscore', 'iqr'):
+            with self.subTest(method=method):
+                detector = OnlineTrendDetector(name='revenue', outlier_method=method)
+                events = detector.update_batch(self.values, self.dates)
+
+                outliers = [e for e in events if e['type'] == 'outlier']
+                trends = [e for e in events if e['type'] == 'trend_change']
+                self.assertIn(self.dates[60], [e['timestamp'] for e in outliers])
+                self.assertEqual(trends[-1]['direction'], 'up')
+                self.assertGreater(trends[-1]['timestamp'], self.dates[200])
+                # A single spike does not register as a trend
+                self.assertFalse(any(e['direction'] == 'up' and e['timestamp'] < self.dates[200] for e in trends))
+                self.assertEqual(events[0]['series'], 'revenue')
+
+    def test_constant_state(self):
+        """Test that the state does not grow with the number of observations"""
+        detector = OnlineTrendDetector(outlier_method='iqr')
+        detector.update_batch(self.values[:50])
+        size = len(vars(detector)) + len(detector.q1.heights)
+        detector.update_batch(self.values[50:])
+
+        self.assertEqual(len(vars(detector)) + len(detector.q1.heights), size)
+        self.assertEqual(detector.get_state()['count'], len(self.values))
+
+    def test_batch_matches_single_updates(self):
+        """Test that micro-batches give the same events as single observations"""
+        single = OnlineTrendDetector()
+        events = [e for value, date in zip(self.values, self.dates) for e in single.update(value, date)]
+        batched = OnlineTrendDetector()
+        batch_events = batched.update_batch(self.values[:120], self.dates[:120])
+        batch_events += batched.update_batch(self.values[120:], self.dates[120:])
+
+        self.assertEqual(events, batch_events)
+        self.assertEqual(single.get_state(), batched.get_state())
+
+    def test_warmup_and_missing_values(self):
+        """Test that no events are emitted during warm-up and NaNs are skipped"""
+        detector = OnlineTrendDetector(min_periods=20)
+        events = detector.update_batch([1.0, 1.1, 0.9] * 5 + [50.0, np.nan])
+
+        self.assertEqual(events, [])
+        self.assertEqual(detector.count, 16)
+
+    def test_invalid_parameters(self):
+        """Test parameter validation"""
+        with self.assertRaises(ValueError):
+            OnlineTrendDetector(outlier_method='mad')
+        with self.assertRaises(ValueError):
+            StreamingTrendMonitor(alpha=0.05, slow_alpha=0.1)
+
+    def test_monitor_long_format(self):
+        """Test that the monitor keeps one detector per series"""
+        data = pd.concat([
+            pd.DataFrame({'store': 'north', 'date': self.dates, 'revenue': self.values}),
+            pd.DataFrame({'store': 'south', 'date': self.dates, 'revenue': self.values[::-1].copy()})
+        ]).sample(frac=1, random_state=2).sort_values('date', kind='mergesort')
+        monitor = StreamingTrendMonitor()
+
+        events = monitor.update_batch(data.iloc[:300], 'store', 'date', 'revenue')
+        events = pd.concat([events, monitor.update_batch(data.iloc[300:], 'store', 'date', 'revenue')])
+        expected = OnlineTrendDetector(name='north').update_batch(self.values, self.dates)
+
+        self.assertEqual(list(events.columns), list(EVENT_COLUMNS))
+        self.assertEqual(set(events['series']), {'north', 'south'})
+        self.assertEqual(monitor.get_state()['count'].tolist(), [300, 300])
+        # Interleaved rows of both series are routed to their own detector
+        self.assertEqual(len(events[events['series'] == 'north']), len(expected))
+
+if __name__ == '__main__':
+    unittest.main()
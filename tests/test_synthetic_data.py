@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test Synthetic Data Module"""
+import unittest
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+from unittest import mock
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.utils import synthetic_data
+from src.utils.synthetic_data import SyntheticDataGenerator, TABLES, table_columns, main
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+class TestSyntheticData(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.generator = SyntheticDataGenerator(seed=7, start_date='2023-01-01', end_date='2023-03-31',
+                                                n_products=50, n_customers=200, n_campaigns=3)
+
+    def tearDown(self):
+        """Clean up test files"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_columns_match_schema(self):
+        """Test that every table has the columns of sql/create_tables.sql"""
+        columns = table_columns()
+        self.assertEqual(set(columns), set(TABLES))
+        for table in TABLES:
+            chunk = next(iter(self.generator.iter_table(table, rows=100)))
+            self.assertEqual(list(chunk.columns), columns[table], table)
+
+    def test_deterministic_across_chunk_sizes(self):
+        """Test that the seed and row count alone determine the data"""
+        with mock.patch.object(synthetic_data, 'BLOCK_ROWS', 1000):
+            whole = self.generator.sales(3500)
+            chunks = list(self.generator.iter_sales(3500, chunksize=600))
+            other_seed = SyntheticDataGenerator(seed=8, start_date='2023-01-01', end_date='2023-03-31',
+                                                n_products=50, n_customers=200).sales(3500)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [600] * 5 + [500])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
+        self.assertFalse(whole['product_id'].equals(other_seed['product_id']))
+        pd.testing.assert_frame_equal(self.generator.products(), SyntheticDataGenerator(
+            seed=7, n_products=50).products())
+
+    def test_referential_integrity(self):
+        """Test keys, value ranges and first purchase dates"""
+        products = self.generator.products()
+        customers = self.generator.customers()
+        sales = self.generator.sales(5000)
+
+        self.assertEqual(sales['sale_id'].tolist(), list(range(1, 5001)))
+        self.assertTrue(sales['date'].is_monotonic_increasing)
+        self.assertEqual((sales['date'].min(), sales['date'].max()),
+                         (pd.Timestamp('2023-01-01'), pd.Timestamp('2023-03-31')))
+        self.assertTrue(sales['product_id'].isin(products['product_id']).all())
+        self.assertTrue(sales['customer_id'].isin(customers['customer_id']).all())
+        self.assertTrue((products['price'] > products['cost']).all())
+        self.assertTrue((sales['quantity'] >= 1).all())
+        np.testing.assert_allclose(sales['total'], (sales['quantity'] * sales['price']).round(2))
+
+        # No customer buys before becoming active
+        first_sale = sales.groupby('customer_id')['date'].min()
+        first_purchase = customers.set_index('customer_id')['first_purchase_date']
+        self.assertTrue((first_sale >= first_purchase[first_sale.index]).all())
+
+        marketing = pd.concat(self.generator.iter_marketing(chunksize=100), ignore_index=True)
+        self.assertEqual(len(marketing), 90 * 3)
+        self.assertTrue(marketing['marketing_id'].is_unique)
+        self.assertTrue((marketing['clicks'] <= marketing['impressions']).all())
+        self.assertTrue((marketing['conversions'] <= marketing['clicks']).all())
+
+        inventory = pd.concat(self.generator.iter_inventory(), ignore_index=True)
+        self.assertEqual(len(inventory), 13 * 50 * 3)
+        self.assertTrue(inventory['inventory_id'].is_unique)
+
+    def test_write_csv(self):
+        """Test writing tables to CSV in chunks"""
+        paths = self.generator.write(self.temp_dir, 1234, format='csv', chunksize=500,
+                                     tables=['products', 'sales'])
+
+        sales = pd.read_csv(paths['sales'], parse_dates=['date'])
+        self.assertEqual(len(sales), 1234)
+        pd.testing.assert_series_equal(sales['total'], self.generator.sales(1234)['total'])
+        self.assertEqual(len(pd.read_csv(paths['products'])), 50)
+        with self.assertRaises(ValueError):
+            self.generator.write(self.temp_dir, 10, format='json')
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_write_parquet(self):
+        """Test writing tables to Parquet in row groups"""
+        paths = self.generator.write(self.temp_dir, 1234, format='parquet', chunksize=500, tables=['sales'])
+        sales = pd.read_parquet(paths['sales'])
+        self.assertEqual(len(sales), 1234)
+        self.assertEqual(pyarrow.parquet.ParquetFile(paths['sales']).num_row_groups, 3)
+
+    def test_load_sqlite(self):
+        """Test loading the star schema into SQLite with its indexes"""
+        connection = sqlite3.connect(':memory:')
+        counts = self.generator.load_sqlite(connection, 1000, chunksize=300)
+
+        self.assertEqual(counts['sales'], 1000)
+        self.assertEqual(counts['customers'], 200)
+        orphans = connection.execute("""
+            SELECT COUNT(*) FROM sales s
+            LEFT JOIN customers c ON s.customer_id = c.customer_id
+            LEFT JOIN products p ON s.product_id = p.product_id
+            WHERE c.customer_id IS NULL OR p.product_id IS NULL""").fetchone()[0]
+        self.assertEqual(orphans, 0)
+        self.assertEqual(connection.execute("SELECT MIN(date) FROM sales").fetchone()[0], '2023-01-01')
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('idx_sales_date', indexes)
+        connection.close()
+
+    def test_cli(self):
+        """Test the command-line entry point"""
+        database = os.path.join(self.temp_dir, 'sales.db')
+        with mock.patch('builtins.print'):
+            self.assertEqual(main(['--rows', '2e2', '--sqlite', database, '--customers', '50',
+                                   '--tables', 'products,customers,sales']), 0)
+        with sqlite3.connect(database) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM sales").fetchone()[0], 200)
+
+if __name__ == '__main__':
+    unittest.main()
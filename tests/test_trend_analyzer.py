@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Test Trend Analyzer Module"""
+import unittest
+import os
+import sys
+import warnings
+import pandas as pd
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import modules
+from src.business_intelligence.trend_analyzer import TrendAnalyzer, _ANALYSIS_CACHE
+
+class TestTrendAnalyzer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures"""
+        warnings.simplefilter('ignore')
+        _ANALYSIS_CACHE.clear()
+        rng = np.random.default_rng(21)
+        periods = 140
+        t = np.arange(periods)
+
+        # Daily series with trend and weekly seasonality
+        self.test_data = pd.DataFrame({
+            'date': pd.date_range(start='2023-01-01', periods=periods, freq='D'),
+            'value': 20 + 0.1 * t + 5 * np.sin(2 * np.pi * t / 7) + rng.normal(0, 1, periods)
+        })
+
+        self.analyzer = TrendAnalyzer()
+        self.analyzer.load_data(self.test_data.copy(), 'date', 'value')
+
+    def test_analyze_is_cached(self):
+        """Test that analyzing unchanged data again is served from the cache"""
+        first = self.analyzer.analyze()
+
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(self.test_data.copy(), 'date', 'value')
+        second = analyzer.analyze()
+
+        self.assertIsNot(first, second)
+        pd.testing.assert_series_equal(first['moving_average'], second['moving_average'])
+        self.assertEqual(_ANALYSIS_CACHE.hits, 1)
+
+    def test_cached_results_are_copies(self):
+        """Test that changing a result does not change later cache hits"""
+        first = self.analyzer.analyze()
+        expected = first['moving_average'].copy()
+        first['moving_average'].iloc[:] = 0.0
+        first['decomposition']['trend'].iloc[:] = 0.0
+        first['stationarity']['test_statistic'] = None
+        first['timings'].clear()
+
+        second = self.analyzer.analyze()
+        pd.testing.assert_series_equal(second['moving_average'], expected)
+        self.assertFalse((second['decomposition']['trend'].dropna() == 0).all())
+        self.assertIsNotNone(second['stationarity']['test_statistic'])
+        self.assertTrue(second['timings'])
+
+        decomposition = self.analyzer.decompose_time_series()
+        decomposition.seasonal.iloc[:] = 0.0
+        self.assertFalse((self.analyzer.decompose_time_series().seasonal == 0).all())
+
+    def test_cache_key_includes_data_and_config(self):
+        """Test that changed data or configuration is recomputed"""
+        first = self.analyzer.analyze()
+        window = self.analyzer.analyze(config={'ma_window': 14})
+
+        changed = self.test_data.copy()
+        changed.loc[0, 'value'] += 1
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(changed, 'date', 'value')
+        other = analyzer.analyze()
+
+        self.assertIsNot(first, window)
+        self.assertIsNot(first, other)
+        # The decomposition and ADF test are shared between configurations
+        self.assertEqual(first['stationarity']['test_statistic'], window['stationarity']['test_statistic'])
+        self.assertGreater(_ANALYSIS_CACHE.hits, 0)
+        self.assertNotEqual(first['stationarity']['test_statistic'], other['stationarity']['test_statistic'])
+
+    def test_reassigned_data_is_recomputed(self):
+        """Test that data set without load_data is not served stale results"""
+        rng = np.random.default_rng(4)
+        index = pd.date_range(start='2020-01-01', periods=200, freq='D')
+        before = pd.DataFrame({'v': rng.normal(0, 1, 200)}, index=index)
+        after = before.copy()
+        after.iloc[100:, 0] += 10
+
+        analyzer = TrendAnalyzer(before)
+        self.assertEqual(analyzer.detect_change_points('v')['change_points'], [])
+        analyzer.data = after
+        self.assertEqual(analyzer.detect_change_points('v')['change_points'], [index[100]])
+
+    def test_disabled_cache(self):
+        """Test that the cache can be turned off"""
+        analyzer = TrendAnalyzer(use_cache=False)
+        analyzer.load_data(self.test_data.copy(), 'date', 'value')
+
+        self.assertIsNot(analyzer.analyze(), analyzer.analyze())
+        self.assertEqual(len(_ANALYSIS_CACHE), 0)
+
+    def test_decompose_infers_period(self):
+        """Test that decomposition infers the period when the index has no frequency"""
+        data = self.test_data.drop(index=[10, 11, 50])
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(data, 'date', 'value')
+
+        decomposition = analyzer.decompose_time_series()
+        results = analyzer.analyze()
+
+        self.assertEqual(analyzer.infer_period()['period'], 7)
+        self.assertEqual(results['decomposition']['period'], 7)
+        self.assertEqual(len(decomposition.seasonal), len(self.test_data))
+        self.assertFalse(decomposition.observed.isna().any())
+
+    def test_yearly_series_skips_decomposition(self):
+        """Test that series without a seasonal period are analyzed without decomposition"""
+        data = pd.DataFrame({
+            'date': pd.date_range(start='1990-01-01', periods=30, freq='YS'),
+            'value': np.arange(30.0) + np.random.default_rng(3).normal(0, 1, 30)
+        })
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(data, 'date', 'value')
+        results = analyzer.analyze()
+
+        self.assertNotIn('decomposition', results)
+        self.assertIn('period', results['skipped']['decomposition'])
+        self.assertIn('stationarity', results)
+        self.assertEqual(analyzer.analyze(config={'period': 5})['decomposition']['period'], 5)
+        with self.assertRaises(ValueError):
+            analyzer.decompose_time_series()
+
+    def test_robust_outlier_methods(self):
+        """Test that rolling and seasonal baselines ignore trend and seasonal peaks"""
+        t = np.arange(364)
+        values = 100 + 0.2 * t + 20 * ((t % 7) >= 5) + np.random.default_rng(2).normal(0, 1, 364)
+        values[[100, 250]] += [15, -15]
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(pd.DataFrame({'date': pd.date_range(start='2023-01-01', periods=364), 'value': values}),
+                           'date', 'value')
+
+        seasonal = analyzer.detect_outliers(method='seasonal', threshold=4)
+        self.assertEqual(np.flatnonzero(seasonal.to_numpy()).tolist(), [100, 250])
+        # The global z-score misses both spikes against the weekend peaks and the trend
+        self.assertFalse(analyzer.detect_outliers(method='zscore').iloc[[100, 250]].any())
+
+        smooth = TrendAnalyzer(pd.DataFrame({'value': 100 + 0.2 * t + np.random.default_rng(3).normal(0, 1, 364)}))
+        smooth.data.iloc[[100, 250], 0] += [10, -10]
+        rolling = smooth.detect_outliers(method='rolling_mad', threshold=5)
+        self.assertEqual(np.flatnonzero(rolling.to_numpy()).tolist(), [100, 250])
+        self.assertFalse(smooth.detect_outliers(method='zscore').any())
+
+    def test_outlier_method_from_config(self):
+        """Test that the outlier method is selected through the analysis configuration"""
+        results = self.analyzer.analyze(config={'outlier_method': 'rolling_mad', 'outlier_window': 21})
+        expected = self.analyzer.detect_outliers(method='rolling_mad', window=21)
+
+        pd.testing.assert_series_equal(results['outliers'], expected)
+        with self.assertRaises(ValueError):
+            self.analyzer.detect_outliers(method='hampel')
+
+    def test_detect_change_points(self):
+        """Test change-point detection with dated breakpoints and segment statistics"""
+        data = self.test_data.copy()
+        data.loc[90:, 'value'] += 30
+        analyzer = TrendAnalyzer()
+        analyzer.load_data(data, 'date', 'value')
+
+        result = analyzer.detect_change_points(method='binseg', n_bkps=1)
+        results = analyzer.analyze(config={'detect_change_points': True, 'change_point_cost': 'normal'})
+
+        self.assertEqual(result['change_points'], [data['date'].iloc[90]])
+        self.assertEqual(result['segments']['n_obs'].tolist(), [90, 50])
+        self.assertIn(data['date'].iloc[90], results['change_points']['change_points'])
+
+    def test_stationarity_options(self):
+        """Test the capped lag search, the KPSS companion and the timings of analyze"""
+        default = self.analyzer.test_stationarity()
+        results = self.analyzer.analyze(config={'adf_max_lags': 2, 'kpss': True})
+        stationarity = results['stationarity']
+
+        self.assertNotIn('kpss', default)
+        self.assertLessEqual(stationarity['lags'], 2)
+        # The trend makes KPSS reject level stationarity while ADF rejects a unit root
+        self.assertTrue(stationarity['is_stationary'])
+        self.assertEqual(stationarity['conclusion'], 'difference-stationary')
+        self.assertEqual(set(stationarity['timings']), {'adf', 'kpss'})
+        self.assertEqual(set(results['timings']), {'decomposition', 'stationarity', 'moving_average',
+                                                   'exponential_smoothing', 'outliers'})
+
+    def test_analyze_respects_config(self):
+        """Test that disabled analyses are skipped"""
+        results = self.analyzer.analyze(config={'decompose': False, 'detect_outliers': False})
+
+        self.assertEqual(set(results), {'stationarity', 'moving_average', 'exponential_smoothing', 'timings'})
+        self.assertEqual(set(results['timings']), {'stationarity', 'moving_average', 'exponential_smoothing'})
+
+if __name__ == '__main__':
+    unittest.main()